@@ -256,6 +256,60 @@ def parse_arguments():
                              "This argument only applies if both '--source' and '--target' arguments are given.\n"
                              "(default: True).")
 
+    PARSER.add_argument("-resume", "--resume",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=False,
+                        type=str2bool,
+                        help="Resume an interrupted Automatic Migration between the same '--source' and '--target'. "
+                             "Assets that the migration journal records as already pushed (and associated to their album) are skipped. "
+                             "Without this flag the journal is reset and every asset is migrated again.\n"
+                             "(default: False).")
+
+    PARSER.add_argument("-preflight", "--preflight-target-diff",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=False,
+                        type=str2bool,
+                        help="Download the Immich/Synology target inventory once before an Automatic Migration and skip "
+                             "source assets already present on the target (same checksum, or same name, size and capture time) "
+                             "without pulling or uploading them. Assets in albums are still added to their target album.\n"
+                             "(default: False).")
+
+    PARSER.add_argument("-planOnly", "--plan-only",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=False,
+                        type=str2bool,
+                        help="Only report how many assets and MB an Automatic Migration would actually move, using the "
+                             "pre-flight target diff, without pulling or pushing anything.\n"
+                             "(default: False).")
+
+    PARSER.add_argument("-stream", "--streaming-transfer",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=False,
+                        type=str2bool,
+                        help="During an Automatic Migration from Immich, Synology or NextCloud Photos to Immich Photos, "
+                             "upload each asset while it is being downloaded, without staging it on disk. Live Photos and "
+                             "assets that cannot be streamed are staged on disk as usual.\n"
+                             "(default: False).")
+
+    PARSER.add_argument("-incrementalListing", "--incremental-source-listing",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=False,
+                        type=str2bool,
+                        help="Start an Automatic Migration without listing every source asset first. Assets are pulled "
+                             "while the source is listed page by page, and the dashboard totals grow as they are found. "
+                             "Ignored together with --preflight-target-diff and --plan-only.\n"
+                             "(default: False).")
+
     PARSER.add_argument("-pushMaxMB", "--push-asset-max-size-mb", metavar="<MEGABYTES>", default=0,
                         type=_non_negative_int,
                         help="Maximum asset size eligible for Automatic Migration push retries, in MB. "
@@ -266,6 +320,36 @@ def parse_arguments():
                         help="Immich upload read timeout in seconds for Upload All, Upload Albums, and Automatic Migration "
                              "when Immich is the target (default: 900).")
 
+    PARSER.add_argument("-pullWorkers", "--pull-workers", metavar="<COUNT>", default=0,
+                        type=_non_negative_int,
+                        help="Number of Pull workers used by Automatic Migration to download/stage source assets in parallel. "
+                             "Each source asset is claimed by a single worker, so it is never pulled twice. "
+                             "Use 0 to select it automatically from the CPU count, up to 4 (default: 0).")
+
+    PARSER.add_argument("-adaptivePush", "--adaptive-push-concurrency",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=True,
+                        type=str2bool,
+                        help="Adapt the number of Automatic Migration Push workers to the target latency and errors, "
+                             "from 2 x CPU threads up to 32. Set to false to keep 2 x CPU threads Push workers (default: True).")
+
+    PARSER.add_argument("-stagingMaxMB", "--staging-budget-mb", metavar="<MEGABYTES>", default=0,
+                        type=_non_negative_int,
+                        help="Maximum size of the assets staged by Automatic Migration in the temp folder and not pushed yet, in MB. "
+                             "Pull workers wait while the budget is used up. Use 0 for no limit (default: 0).")
+
+    PARSER.add_argument("-stagingMaxFiles", "--staging-budget-files", metavar="<COUNT>", default=0,
+                        type=_non_negative_int,
+                        help="Maximum number of files staged by Automatic Migration in the temp folder and not pushed yet. "
+                             "Pull workers wait while the budget is used up. Use 0 for no limit (default: 0).")
+
+    PARSER.add_argument("-metricsFile", "--metrics-file", metavar="<METRICS_FILE>", default="", type=clean_path,
+                        help="Write the per-stage latency percentiles, throughput and queue depths of an Automatic Migration "
+                             "to this file at the end of the run. A '.prom' file is written in the Prometheus textfile "
+                             "format, any other extension as JSON (default: no file).")
+
     PARSER.add_argument("-iPeople", "--import-people",
                         metavar="= [true,false]",
                         nargs="?",
@@ -364,6 +448,25 @@ def parse_arguments():
                         help="Keep an untouched copy of original Takeout (requires double space).\n"
                             "TIP: If <TAKEOUT_FOLDER> contains the original zip files, you will preserve them anyway.")
 
+    PARSER.add_argument("-gUnzipWorkers", "--google-unzip-workers", metavar="<COUNT>", default=0,
+                        type=_non_negative_int,
+                        help="Number of Takeout ZIP files extracted in parallel when <TAKEOUT_FOLDER> contains ZIP files. "
+                             "Use 0 to select it automatically from the CPU count, up to 8 (default: 0).")
+
+    PARSER.add_argument("-gUnzipDedup", "--google-unzip-dedup",
+                        metavar="= [true,false]",
+                        nargs="?",
+                        const=True,
+                        default=True,
+                        type=str2bool,
+                        help="Extract only once the files repeated across the Takeout ZIP files (same CRC32 and size, confirmed by hash). "
+                             "The other copies are created as hard links to it, so album folders keep all their files (default: True).")
+
+    PARSER.add_argument("-gIncremental", "--google-incremental", action="store_true",
+                        help="Process only the new content of a zipped Takeout downloaded again with extra ZIP files.\n"
+                             "The ZIP files and media files already processed are recorded in a manifest, and the new\n"
+                             "content is merged into the output folder of the previous run.")
+
     PARSER.add_argument("-gPeople", "--google-process-people",
                         metavar="= [true,false]",
                         nargs="?",
@@ -931,6 +1034,29 @@ def checkArgs(ARGS, PARSER):
         )
         exit(1)
 
+    # Check if --resume was provided but source/target are missing
+    resume_provided = any(
+        re.match(r"^-{1,2}resume(?:$|=)", tok)
+        for tok in sys.argv[1:]
+    )
+    if resume_provided and not (ARGS['source'] or ARGS['target']):
+        PARSER.error(
+            f"\n\n❌ {GV.MSG_TAGS_COLORED['ERROR']}"
+            f"Argument '--resume' can only be used with Automatic Migration. "
+            f"Arguments --source and --target are required.\n{Style.RESET_ALL}"
+        )
+        exit(1)
+
+    # -gIncremental merges its output after the post-processing, so the steps that need the whole output can't run
+    if ARGS['google-incremental'] and (ARGS['google-rename-albums-folders'] or ARGS['google-remove-duplicates-files']):
+        PARSER.error(
+            f"\n\n❌ {GV.MSG_TAGS_COLORED['ERROR']}"
+            f"Argument '-gIncremental, --google-incremental' cannot be combined with "
+            f"'-graf, --google-rename-albums-folders' or '-grdf, --google-remove-duplicates-files', "
+            f"because they would only see the new files of the incremental run.\n{Style.RESET_ALL}"
+        )
+        exit(1)
+
     # download-albums requires output-folder
     if ARGS['download-albums'] != "" and ARGS['output-folder'] == "":
         PARSER.error(
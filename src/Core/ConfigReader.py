@@ -96,6 +96,9 @@ def load_config(config_file=CONFIGURATION_FILE, section_to_load='all'):
             'SYNOLOGY_PASSWORD_2',
             'SYNOLOGY_USERNAME_3',
             'SYNOLOGY_PASSWORD_3',
+            'SYNOLOGY_MAX_PARALLEL_UPLOADS',
+            'SYNOLOGY_MAX_PARALLEL_DOWNLOADS',
+            'SYNOLOGY_HTTP_POOL_SIZE',
         ],
         'Immich Photos': [
             'IMMICH_URL',
@@ -109,12 +112,19 @@ def load_config(config_file=CONFIGURATION_FILE, section_to_load='all'):
             'IMMICH_API_KEY_USER_3',
             'IMMICH_USERNAME_3',
             'IMMICH_PASSWORD_3',
+            'IMMICH_HTTP_POOL_SIZE',
+            'IMMICH_HTTP_MAX_RETRIES',
+            'IMMICH_INVENTORY_CACHE',
+            'IMMICH_MAX_PARALLEL_UPLOADS',
+            'IMMICH_MAX_PARALLEL_DOWNLOADS',
         ],
         'NextCloud Photos': [
             'NEXTCLOUD_URL',
             'NEXTCLOUD_MAX_PARALLEL_UPLOADS',
             'NEXTCLOUD_MAX_PARALLEL_DOWNLOADS',
             'NEXTCLOUD_USE_SYSTEM_PROXY',
+            'NEXTCLOUD_LISTING_WORKERS',
+            'NEXTCLOUD_LISTING_CACHE',
             'NEXTCLOUD_USERNAME_1',
             'NEXTCLOUD_PASSWORD_1',
             'NEXTCLOUD_PHOTOS_FOLDER_1',
@@ -141,6 +151,7 @@ def load_config(config_file=CONFIGURATION_FILE, section_to_load='all'):
             'GOOGLE_PHOTOS_CLIENT_ID_3',
             'GOOGLE_PHOTOS_CLIENT_SECRET_3',
             'GOOGLE_PHOTOS_REFRESH_TOKEN_3',
+            'GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS',
         ],
         'Apple Photos': [
             'max_photos',
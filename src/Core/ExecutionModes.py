@@ -262,6 +262,8 @@ def mode_google_takeout(user_confirmation=True, log_level=None):
     LOGGER.info(f"Skip Pre-Processing Steps                 : '{ARGS['google-skip-preprocess']}'")
     LOGGER.info(f"Skip Processing with GPTH Tool            : '{ARGS['google-skip-gpth-tool']}'")
     LOGGER.info(f"Skip Post-Processing Steps                : '{ARGS['google-skip-postprocess']}'")
+    LOGGER.info(f"Deduplicate Files across ZIP files        : '{ARGS.get('google-unzip-dedup', True)}'")
+    LOGGER.info(f"Incremental Processing (zipped Takeout)   : '{ARGS.get('google-incremental', False)}'")
     LOGGER.info(f"Show GPTH Progress                        : '{ARGS['show-gpth-info']}'")
     LOGGER.info(f"Show GPTH Errors                          : '{ARGS['show-gpth-errors']}'")
     LOGGER.info(f"")
@@ -295,6 +297,8 @@ def mode_google_takeout(user_confirmation=True, log_level=None):
             LOGGER.warning(f"Flag detected '-grdf, --google-remove-duplicates-files'. All duplicates files within OUTPUT_TAKEOUT_FOLDER will be removed after fixing them...")
         if ARGS['google-rename-albums-folders']:
             LOGGER.warning(f"Flag detected '-graf, --google-rename-albums-folders'. All albums subfolders within OUTPUT_TAKEOUT_FOLDER will be renamed after fixing them based on their content data...")
+        if ARGS.get('google-incremental'):
+            LOGGER.warning(f"Flag detected '-gIncremental, --google-incremental'. Only the ZIP files and media files not processed by a previous run will be processed, and merged into its output folder...")
         if ARGS['no-log-file']:
             LOGGER.warning(f"Flag detected '-noLog, --no-log-file'. Skipping saving output into log file...")
 
@@ -34,11 +34,11 @@ from Utils.StandaloneUtils import get_exif_tool_path, custom_print, change_worki
 # 📂 FolderAnalyzer CLASS
 # ========================
 class FolderAnalyzer:
-    def __init__(self, folder_path=None, metadata_json_file=None, extracted_dates=None, force_date_extraction=True, logger=None, step_name='', filter_ext=None, filter_from_epoch=None, filter_to_epoch=None, log_level=None):
+    def __init__(self, folder_path=None, metadata_json_file=None, extracted_dates=None, force_date_extraction=True, logger=None, step_name='', filter_ext=None, filter_from_epoch=None, filter_to_epoch=None, log_level=None, tree_index=None):
     # def __init__(self, folder_path=None, extracted_dates=None, logger=None, step_name=''):
         """
         Initialize the FolderAnalyzer from a given folder or existing extracted_dates.
-        If folder_path is provided, walk through all files.
+        If folder_path is provided, walk through all files (from tree_index, a FolderTreeIndex of folder_path, if given).
         """
         self.folder_path_input = os.path.abspath(folder_path) if folder_path else None
         self.folder_path = Path(folder_path).resolve().as_posix() if folder_path else None
@@ -83,7 +83,7 @@ class FolderAnalyzer:
             self._initialized_with_valid_input = True
         # 3) if folder_path is given
         elif self.folder_path:
-            self._build_file_list_from_disk(step_name=step_name)
+            self._build_file_list_from_disk(step_name=step_name, tree_index=tree_index)
             if not self.extracted_dates and force_date_extraction:
                 self.extract_dates(step_name=step_name)
             self._apply_filters(step_name=step_name, log_level=log_level)
@@ -93,7 +93,7 @@ class FolderAnalyzer:
         if self._initialized_with_valid_input:
             self._compute_folder_sizes(step_name)
 
-    def _build_file_list_from_disk(self, step_name='', log_level=None):
+    def _build_file_list_from_disk(self, step_name='', log_level=None, tree_index=None):
         with set_log_level(self.logger, log_level):
             # Gather all file paths under folder_path
             if not os.path.isdir(self.folder_path):
@@ -110,7 +110,16 @@ class FolderAnalyzer:
 
             # Build raw list of files, excluding internal temp files and user-selected patterns.
             self.file_list = []
-            for root, dirs, files in os.walk(self.folder_path, followlinks=True):
+            # The index can stand in for the walk only if it covers the same folder and has no symlinked folders to follow
+            if (
+                tree_index is not None
+                and not tree_index.has_symlinked_dirs
+                and Path(tree_index.root).resolve().as_posix() == self.folder_path
+            ):
+                walker = tree_index.walk(root=self.folder_path)
+            else:
+                walker = os.walk(self.folder_path, followlinks=True)
+            for root, dirs, files in walker:
                 dirs[:] = [d for d in dirs if not matches_any_pattern(d, folder_patterns)]
                 for name in files:
                     if name.startswith("PhotoMigrator_") or name.startswith("gpth_"):
@@ -17,6 +17,8 @@ from pathlib import Path
 from queue import Queue, Empty, PriorityQueue
 from typing import Union, cast
 
+import requests
+
 from Core.CustomLogger import set_log_level, CustomInMemoryLogHandler, CustomConsoleFormatter, get_logger_filename
 from Core.GlobalVariables import TOOL_NAME_VERSION, TOOL_VERSION, ARGS, HELP_TEXTS, MSG_TAGS, TIMESTAMP, LOGGER, FOLDERNAME_LOGS, TOOL_DATE, FOLDERNAME_EXTRACTED_DATES, PROJECT_ROOT
 from Features.GoogleTakeout.ClassTakeoutFolder import ClassTakeoutFolder, contains_takeout_structure
@@ -26,6 +28,9 @@ from Features.ImmichPhotos.ClassImmichPhotos import ClassImmichPhotos
 from Features.GooglePhotos.ClassGooglePhotos import ClassGooglePhotos
 from Features.NextCloudPhotos.ClassNextCloudPhotos import ClassNextCloudPhotos
 from Features.SynologyPhotos.ClassSynologyPhotos import ClassSynologyPhotos
+from Features.AutomaticMigration.MigrationMetrics import MigrationMetrics
+from Features.AutomaticMigration.MigrationJournal import MIGRATION_JOURNAL_FOLDER, MigrationJournal, build_migration_journal_path
+from Features.AutomaticMigration.TargetInventory import TargetInventoryIndex, source_asset_size
 from Features.AutomaticMigration.LiveDashboard import _compute_dashboard_estimated_end, _compute_dashboard_estimated_time, _compute_dashboard_estimated_time_with_rolling_average, _compute_dashboard_media_type_estimated_time, _format_hms_from_seconds, _normalize_bg_progress_desc, _parse_dashboard_progress_line, _parse_int, _select_visible_bg_progress_rows, _update_dashboard_eta_display, start_dashboard
 from Utils.FileUtils import DEFAULT_FILE_EXCLUSION_PATTERNS, DEFAULT_FOLDER_EXCLUSION_PATTERNS, merge_exclusion_patterns, remove_dir_if_effectively_empty, remove_effectively_empty_dirs, remove_empty_dirs, contains_zip_files, normalize_path, sanitize_and_unpack_zips
 from Utils.GeneralUtils import confirm_continue, TQDM_DASHBOARD_PREFIX, TQDM_DASHBOARD_META_PREFIX, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, has_any_filter
@@ -39,13 +44,17 @@ AUTOMATIC_MIGRATION_PUSH_FAILED_FOLDER = "Push_Failed"
 AUTOMATIC_MIGRATION_PULL_FAILED_FOLDER = "Pull_Failed"
 AUTOMATIC_MIGRATION_ALBUM_ASSOC_QUEUE_FOLDER = "Album_Association_Queue"
 AUTOMATIC_MIGRATION_ALBUM_ASSOC_FAILED_FOLDER = "Album_Association_Failed"
+AUTOMATIC_MIGRATION_MAX_AUTO_PULL_WORKERS = 4
+AUTOMATIC_MIGRATION_MAX_ADAPTIVE_PUSH_WORKERS = 32
+AUTOMATIC_MIGRATION_THROTTLING_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
 
 class SharedData:
-    def __init__(self, info, counters, logs_queue):
+    def __init__(self, info, counters, logs_queue, metrics=None):
         self.info = info
         self.counters = counters
         self.logs_queue = logs_queue
+        self.metrics = metrics if metrics is not None else MigrationMetrics()
 
 
 def _ensure_album_stats_entry(album_stats_by_name, album_stats_lock, album_name):
@@ -133,6 +142,8 @@ def _build_web_dashboard_snapshot(shared_data, parallel=None):
         "albumAssocQueueTotal": int(counters.get("total_album_assoc_queue_assets", 0) or 0),
         "delayedRetriesQueue": int(info.get("delayed_assets_pending", 0) or 0),
         "delayedRetriesQueueTotal": int(counters.get("total_delayed_queue_assets", 0) or 0),
+        "pushConcurrency": int(info.get("push_concurrency", 0) or 0),
+        "pushConcurrencyMax": int(info.get("push_concurrency_max", 0) or 0),
         "pulledAssets": int(counters.get("total_pulled_assets", 0) or 0),
         "pulledPhotos": int(counters.get("total_pulled_photos", 0) or 0),
         "pulledVideos": int(counters.get("total_pulled_videos", 0) or 0),
@@ -166,6 +177,11 @@ def _build_web_dashboard_snapshot(shared_data, parallel=None):
         "albumAssocUnconfirmed": int(counters.get("total_album_assoc_failed_assets", 0) or 0),
         "updatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
     }
+    metrics = getattr(shared_data, "metrics", None)
+    if metrics is not None:
+        metrics_snapshot = metrics.snapshot()
+        snapshot["stageMetrics"] = metrics_snapshot["stages"]
+        snapshot["queueDepths"] = metrics_snapshot["queues"]
     return snapshot
 
 
@@ -245,6 +261,16 @@ def _pull_has_content(pulled_result) -> bool:
     return bool(pulled_result)
 
 
+def _local_files_size(paths):
+    total_size = 0
+    for path in paths or ():
+        try:
+            total_size += os.path.getsize(path)
+        except OSError:
+            continue
+    return total_size
+
+
 def _is_nextcloud_photo_not_found_error(error: Exception) -> bool:
     return "photo not found for user" in str(error or "").lower()
 
@@ -277,6 +303,26 @@ def _build_physical_transfer_stats(asset_type, include_live_companion=False):
     return {"assets": 1, "photos": 1, "videos": 0}
 
 
+def _live_photo_pair_stems(assets):
+    """
+    Return the casefolded file stems shared by a photo and a video of one source listing.
+
+    Such pairs are staged together so the disk path can detect and link the Live
+    Photo companion, therefore they must not be streamed one file at a time.
+    """
+    kinds_by_stem = {}
+    for asset in assets or ():
+        if not isinstance(asset, dict):
+            continue
+        stem = os.path.splitext(os.path.basename(str(asset.get('filename') or '')))[0].casefold()
+        if not stem:
+            continue
+        asset_type = str(asset.get('type') or '').strip().lower()
+        kind = 'video' if asset_type in ('video', 'videos', 'live') else 'photo'
+        kinds_by_stem.setdefault(stem, set()).add(kind)
+    return {stem for stem, kinds in kinds_by_stem.items() if len(kinds) > 1}
+
+
 def _safe_asset_relative_path(source_root, source_path, fallback_name):
     fallback_name = str(fallback_name or os.path.basename(str(source_path or "")) or "asset").strip()
     try:
@@ -321,7 +367,72 @@ def _dedupe_destination_path(destination_path):
         counter += 1
 
 
-def _stage_local_asset_for_automatic_migration(source_client, source_asset_id, asset_filename, asset_time, queue_root, move_assets=False):
+def _can_hardlink_staged_file(source_path, asset_time):
+    # A hardlink shares the inode with the source, so the staged copy cannot get its
+    # own mtime; only link when the source already carries the asset time.
+    if not asset_time:
+        return True
+    try:
+        return abs(os.stat(source_path).st_mtime - float(asset_time)) < 1
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+# Linux FICLONE ioctl: share the extents of a file on CoW filesystems (btrfs, XFS, bcachefs).
+_FICLONE_IOCTL = 0x40049409
+
+
+def _reflink_file(source_path, destination_path):
+    import fcntl
+    with open(source_path, "rb") as source_file, open(destination_path, "wb") as destination_file:
+        fcntl.ioctl(destination_file.fileno(), _FICLONE_IOCTL, source_file.fileno())
+
+
+def _copy_file_range_file(source_path, destination_path):
+    with open(source_path, "rb") as source_file, open(destination_path, "wb") as destination_file:
+        remaining = os.fstat(source_file.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(source_file.fileno(), destination_file.fileno(), min(remaining, 1 << 30))
+            if copied == 0:
+                break
+            remaining -= copied
+        if remaining > 0:
+            raise OSError(f"copy_file_range stopped with {remaining} bytes left")
+
+
+def _stage_local_file(source_path, destination_path, allow_hardlink=True):
+    """
+    Stage a local file with the cheapest method available and return its name.
+
+    Tries a hardlink (same filesystem), then a reflink, then copy_file_range (which
+    lets the kernel copy or share blocks without going through user space), and
+    finally a plain copy.
+    """
+    source_path = str(source_path)
+    destination_path = str(destination_path)
+    if allow_hardlink:
+        try:
+            os.link(source_path, destination_path)
+            return "hardlink"
+        except (OSError, NotImplementedError):
+            pass
+    for method_name, copy_function in (("reflink", _reflink_file), ("copy_file_range", _copy_file_range_file)):
+        if method_name == "copy_file_range" and not hasattr(os, "copy_file_range"):
+            continue
+        try:
+            copy_function(source_path, destination_path)
+            shutil.copystat(source_path, destination_path)
+            return method_name
+        except (ImportError, OSError):
+            try:
+                os.remove(destination_path)
+            except OSError:
+                pass
+    shutil.copy2(source_path, destination_path)
+    return "copy"
+
+
+def _stage_local_asset_for_automatic_migration(source_client, source_asset_id, asset_filename, asset_time, queue_root, move_assets=False, on_staged=None):
     source_path = Path(str(source_asset_id))
     relative_path = _build_automatic_migration_relative_asset_path(
         source_client=source_client,
@@ -347,15 +458,18 @@ def _stage_local_asset_for_automatic_migration(source_client, source_asset_id, a
                 pass
         if not copy_source.is_file():
             raise FileNotFoundError(f"Symlink target is not available for staging: '{source_path}'")
-        shutil.copy2(copy_source, destination_path, follow_symlinks=True)
+        staging_method = _stage_local_file(copy_source, destination_path, allow_hardlink=_can_hardlink_staged_file(copy_source, asset_time))
         if move_assets:
             source_path.unlink()
     elif move_assets:
         shutil.move(str(source_path), str(destination_path))
+        staging_method = "move"
     else:
-        shutil.copy2(source_path, destination_path)
-    if asset_time:
+        staging_method = _stage_local_file(source_path, destination_path, allow_hardlink=_can_hardlink_staged_file(source_path, asset_time))
+    if asset_time and staging_method != "hardlink":
         os.utime(destination_path, (asset_time, asset_time))
+    if on_staged is not None:
+        on_staged(staging_method)
     return str(destination_path)
 
 
@@ -665,19 +779,55 @@ def _normalized_asset_path_key(path: str) -> str:
     return os.path.normpath(str(path or "")).replace("\\", "/").lower()
 
 
+def _queued_asset_path_key(queued) -> str:
+    queued_item = queued[2] if isinstance(queued, tuple) and len(queued) == 3 else queued
+    if not isinstance(queued_item, dict):
+        return ""
+    return _normalized_asset_path_key(queued_item.get("asset_file_path", ""))
+
+
+class _AssetPathIndexMixin:
+    """
+    Keeps a count of the normalized asset paths held by a Queue/PriorityQueue.
+
+    `_put` and `_get` are the storage hooks that Queue calls with its mutex held, so the
+    index is always in sync with the queued items and a lookup never walks the queue.
+    """
+
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self._asset_path_counts = Counter()
+
+    def _put(self, item):
+        super()._put(item)
+        path_key = _queued_asset_path_key(item)
+        if path_key:
+            self._asset_path_counts[path_key] += 1
+
+    def _get(self):
+        item = super()._get()
+        path_key = _queued_asset_path_key(item)
+        if path_key:
+            remaining = self._asset_path_counts[path_key] - 1
+            if remaining > 0:
+                self._asset_path_counts[path_key] = remaining
+            else:
+                del self._asset_path_counts[path_key]
+        return item
+
+    def contains_asset_path_key(self, path_key: str) -> bool:
+        with self.mutex:
+            return path_key in self._asset_path_counts
+
+
 def _queue_contains_asset_path(queue, path: str) -> bool:
     wanted_key = _normalized_asset_path_key(path)
     if not wanted_key:
         return False
+    if isinstance(queue, _AssetPathIndexMixin):
+        return queue.contains_asset_path_key(wanted_key)
     with queue.mutex:
-        for queued in list(queue.queue):
-            queued_item = queued[2] if isinstance(queued, tuple) and len(queued) == 3 else queued
-            if not isinstance(queued_item, dict):
-                continue
-            queued_key = _normalized_asset_path_key(queued_item.get("asset_file_path", ""))
-            if queued_key == wanted_key:
-                return True
-        return False
+        return any(_queued_asset_path_key(queued) == wanted_key for queued in queue.queue)
 
 
 def _asset_path_is_reserved(queue, in_flight_paths, in_flight_lock, path: str) -> bool:
@@ -690,6 +840,335 @@ def _asset_path_is_reserved(queue, in_flight_paths, in_flight_lock, path: str) -
         return wanted_key in in_flight_paths
 
 
+def _resolve_pull_worker_count(configured_workers=None, cpu_total_threads=None):
+    """Return the number of pull workers to launch; 0/None selects an automatic value."""
+    try:
+        configured_workers = int(configured_workers or 0)
+    except (TypeError, ValueError):
+        configured_workers = 0
+    if configured_workers > 0:
+        return configured_workers
+    return max(1, min(AUTOMATIC_MIGRATION_MAX_AUTO_PULL_WORKERS, int(cpu_total_threads or 1)))
+
+
+def _group_albums_for_pull_workers(albums):
+    """Group source albums by name, preserving order, so one puller owns each staging folder."""
+    album_groups = {}
+    for album in albums or []:
+        album_groups.setdefault(str((album or {}).get('albumName') or ""), []).append(album)
+    return list(album_groups.values())
+
+
+def _iter_pages_with_neighbour_context(pages):
+    """
+    Yield (page, context_assets) for each page of a paged source listing.
+
+    context_assets holds the page plus its previous and next pages, so Live Photo pairs
+    and local companions listed across a page boundary are still seen together. This
+    delays each page until the next one has been listed.
+    """
+    previous_page, current_page = [], None
+    for next_page in pages:
+        next_page = list(next_page or [])
+        if current_page is not None:
+            yield current_page, previous_page + current_page + next_page
+            previous_page = current_page
+        current_page = next_page
+    if current_page is not None:
+        yield current_page, previous_page + current_page
+
+
+class PullClaimTracker:
+    """Thread-safe registry that hands each source asset to exactly one pull worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._claimed_keys = set()
+        self._stem_locks = {}
+
+    @staticmethod
+    def _claim_key(scope, asset_id):
+        return str(scope or ""), _normalized_asset_path_key(asset_id)
+
+    def claim(self, scope, asset_id) -> bool:
+        """Claim asset_id inside scope (album name or None). Return False if already claimed."""
+        claim_key = self._claim_key(scope, asset_id)
+        if not claim_key[1]:
+            return True
+        with self._lock:
+            if claim_key in self._claimed_keys:
+                return False
+            self._claimed_keys.add(claim_key)
+            return True
+
+    def is_claimed(self, scope, asset_id) -> bool:
+        with self._lock:
+            return self._claim_key(scope, asset_id) in self._claimed_keys
+
+    def stem_lock(self, filename):
+        """Return the lock that serializes pulls of assets sharing a filename stem."""
+        stem_key = os.path.splitext(os.path.basename(str(filename or "")))[0].lower()
+        with self._lock:
+            return self._stem_locks.setdefault(stem_key, threading.Lock())
+
+
+def _staging_budget_key(temp_folder, path):
+    """Key a staged file by its path relative to its queue folder, so moves between queues keep the key."""
+    if not path:
+        return ""
+    abs_path = os.path.abspath(str(path))
+    for queue_folder_name in (
+        AUTOMATIC_MIGRATION_PUSH_QUEUE_FOLDER,
+        AUTOMATIC_MIGRATION_DELAYED_QUEUE_FOLDER,
+        AUTOMATIC_MIGRATION_ALBUM_ASSOC_QUEUE_FOLDER,
+        AUTOMATIC_MIGRATION_ALBUM_ASSOC_FAILED_FOLDER,
+        AUTOMATIC_MIGRATION_PUSH_FAILED_FOLDER,
+    ):
+        queue_root = os.path.abspath(os.path.join(str(temp_folder), queue_folder_name))
+        if abs_path.startswith(queue_root + os.sep):
+            return _normalized_asset_path_key(os.path.relpath(abs_path, queue_root))
+    return _normalized_asset_path_key(abs_path)
+
+
+class StagingBudget:
+    """
+    Bounds the bytes and files staged under the temp folder that are still waiting to be pushed.
+
+    Pullers call acquire() before downloading/staging an asset and block while the
+    budget is exhausted; register() records each staged file before it is handed to
+    the pushers, commit() ends the reservation, and release() frees the files once
+    they leave the push pipeline. A limit of 0 disables
+    that dimension. The byte limit is checked before the pull (the asset size is not
+    known yet), so a single asset may overshoot it.
+    """
+
+    def __init__(self, max_bytes=0, max_files=0):
+        self.max_bytes = max(0, int(max_bytes or 0))
+        self.max_files = max(0, int(max_files or 0))
+        self.used_bytes = 0
+        self.pending_pulls = 0
+        self._entries = {}
+        self._condition = threading.Condition()
+
+    @property
+    def enabled(self):
+        return bool(self.max_bytes or self.max_files)
+
+    @property
+    def used_files(self):
+        return len(self._entries)
+
+    def _is_exhausted_locked(self):
+        if not self._entries and not self.pending_pulls:
+            # Nothing is staged, so blocking could never be released.
+            return False
+        if self.max_files and self.used_files + self.pending_pulls >= self.max_files:
+            return True
+        return bool(self.max_bytes and self.used_bytes >= self.max_bytes)
+
+    def acquire(self, can_bypass=None, poll_seconds=1.0):
+        """
+        Reserve room for one pull, blocking while the budget is exhausted.
+
+        can_bypass is polled while waiting; when it returns True (e.g. the push
+        pipeline is idle and cannot release anything) the reservation is granted.
+        Returns True if the caller waited.
+        """
+        if not self.enabled:
+            return False
+        waited = False
+        with self._condition:
+            while self._is_exhausted_locked():
+                if waited and can_bypass is not None and can_bypass():
+                    break
+                waited = True
+                self._condition.wait(timeout=poll_seconds)
+            self.pending_pulls += 1
+        return waited
+
+    def register(self, staged_files):
+        """
+        Register staged files as {key: size_bytes}.
+
+        Call it before the files are queued for push: a pusher may release them as soon as
+        they are queued, and a release of keys not registered yet is ignored.
+        """
+        if not self.enabled:
+            return
+        with self._condition:
+            self._register_locked(staged_files)
+            self._condition.notify_all()
+
+    def commit(self, staged_files=None):
+        """Finish a reservation, registering the staged files as {key: size_bytes} if given."""
+        if not self.enabled:
+            return
+        with self._condition:
+            self.pending_pulls = max(0, self.pending_pulls - 1)
+            self._register_locked(staged_files)
+            self._condition.notify_all()
+
+    def _register_locked(self, staged_files):
+        for key, size_bytes in (staged_files or {}).items():
+            if not key:
+                continue
+            self.used_bytes -= self._entries.get(key, 0)
+            self._entries[key] = max(0, int(size_bytes or 0))
+            self.used_bytes += self._entries[key]
+
+    def release(self, keys):
+        if not self.enabled:
+            return
+        with self._condition:
+            released = False
+            for key in keys or []:
+                if key in self._entries:
+                    self.used_bytes -= self._entries.pop(key)
+                    released = True
+            if released:
+                self._condition.notify_all()
+
+
+def _is_throttling_push_error(error) -> bool:
+    """Return True when a push error shows the target is overloaded: a 408/429/5xx HTTP status or a timeout."""
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if status_code is not None:
+        try:
+            return int(status_code) in AUTOMATIC_MIGRATION_THROTTLING_STATUS_CODES
+        except (TypeError, ValueError):
+            pass
+    return isinstance(error, (requests.exceptions.Timeout, TimeoutError))
+
+
+class AdaptivePushConcurrency:
+    """
+    AIMD limiter for the number of pushers allowed to upload at the same time.
+
+    All pusher threads are started up front, but each one must hold a slot while it
+    takes and pushes an asset. Every `window_size` recorded pushes the limit is
+    re-evaluated: it grows by one while uploads are healthy (additive increase),
+    is halved when the window saw throttling (429/5xx/timeouts) or too many
+    failures/retries, and shrinks by a quarter when the size-normalized upload
+    latency rises well above the best latency observed so far (multiplicative
+    decrease).
+    """
+
+    def __init__(
+        self,
+        initial_limit,
+        min_limit=1,
+        max_limit=None,
+        enabled=True,
+        window_size=20,
+        error_rate_threshold=0.1,
+        latency_tolerance=2.5,
+        on_change=None,
+    ):
+        self.min_limit = max(1, int(min_limit or 1))
+        self.max_limit = max(self.min_limit, int(max_limit or initial_limit or 1))
+        self.limit = max(self.min_limit, min(self.max_limit, int(initial_limit or 1)))
+        self.enabled = bool(enabled)
+        self.window_size = max(1, int(window_size or 1))
+        self.error_rate_threshold = float(error_rate_threshold)
+        self.latency_tolerance = float(latency_tolerance)
+        self.on_change = on_change
+        self.active = 0
+        self.baseline_latency_ms = None
+        self._condition = threading.Condition()
+        self._reset_window()
+
+    def configure(self, initial_limit, max_limit):
+        """Reset the limits once the number of pusher threads is known."""
+        with self._condition:
+            self.max_limit = max(self.min_limit, int(max_limit or 1))
+            self.limit = max(self.min_limit, min(self.max_limit, int(initial_limit or 1)))
+            self._condition.notify_all()
+
+    def _reset_window(self):
+        self._window_latencies = []
+        self._window_samples = 0
+        self._window_failures = 0
+        self._window_throttled = 0
+        self._window_retries = 0
+
+    def acquire(self):
+        with self._condition:
+            while self.active >= self.limit:
+                self._condition.wait()
+            self.active += 1
+
+    def release(self):
+        with self._condition:
+            self.active = max(0, self.active - 1)
+            self._condition.notify_all()
+
+    def record_push(self, latency_ms=None, size_bytes=None, failed=False, throttled=False):
+        """Record the outcome of one upload attempt."""
+        with self._condition:
+            self._window_samples += 1
+            if failed or throttled:
+                self._window_failures += 1
+            if throttled:
+                self._window_throttled += 1
+            if latency_ms is not None and not failed:
+                size_mb = float(size_bytes or 0) / (1024 * 1024)
+                self._window_latencies.append(float(latency_ms) / max(1.0, size_mb))
+            self._maybe_adjust_locked()
+
+    def record_retry(self):
+        """Record that an asset had to be scheduled for a delayed retry."""
+        with self._condition:
+            self._window_retries += 1
+
+    def _maybe_adjust_locked(self):
+        if self._window_samples < self.window_size:
+            return
+        previous_limit = self.limit
+        error_rate = (self._window_failures + self._window_retries) / float(self._window_samples)
+        window_latency = None
+        if self._window_latencies:
+            window_latency = sorted(self._window_latencies)[len(self._window_latencies) // 2]
+        latency_degraded = (
+            window_latency is not None
+            and self.baseline_latency_ms is not None
+            and window_latency > self.baseline_latency_ms * self.latency_tolerance
+        )
+        if self.enabled:
+            if self._window_throttled or error_rate >= self.error_rate_threshold:
+                self.limit = max(self.min_limit, self.limit // 2)
+            elif latency_degraded:
+                self.limit = max(self.min_limit, (self.limit * 3) // 4)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1)
+        if window_latency is not None and not latency_degraded:
+            if self.baseline_latency_ms is None or window_latency < self.baseline_latency_ms:
+                self.baseline_latency_ms = window_latency
+        elif latency_degraded:
+            # Let the baseline drift up so a permanently slower target does not keep shrinking the limit.
+            self.baseline_latency_ms *= 1.25
+        self._reset_window()
+        if self.limit != previous_limit:
+            self._condition.notify_all()
+            if self.on_change is not None:
+                self.on_change(previous_limit, self.limit)
+
+
+def _open_migration_journal(source_name, target_name, resume=False, plan_only=False):
+    """
+    Open the resume journal of a migration from source_name to target_name.
+
+    A --plan-only run returns None without touching the journal: opening it without --resume
+    would reset the progress recorded by a previous interrupted migration.
+    """
+    if plan_only:
+        return None
+    return MigrationJournal(
+        build_migration_journal_path(resolve_external_path(f'./{MIGRATION_JOURNAL_FOLDER}'), source_name, target_name),
+        resume=resume,
+    )
+
+
 def _mark_album_pushed_if_ready(
     album_name,
     album_folder_path,
@@ -886,6 +1365,10 @@ def mode_AUTOMATIC_MIGRATION(source=None, target=None, show_dashboard=None, show
             'total_consolidated_albums': 0,
             'total_canonicalized_albums': 0,
             'total_target_empty_albums_removed': 0,
+            'total_resume_skipped_assets': 0,
+            'total_staging_budget_waits': 0,
+            'total_preflight_skipped_assets': 0,
+            'total_streamed_assets': 0,
         }
 
         # Input INFO
@@ -908,6 +1391,8 @@ def mode_AUTOMATIC_MIGRATION(source=None, target=None, show_dashboard=None, show
             "assets_in_queue": 0,
             "album_assoc_queue_size": 0,
             "delayed_assets_pending": 0,
+            "push_concurrency": 0,
+            "push_concurrency_max": 0,
             "elapsed_time": 0,
             "estimated_time": "-",
             "estimated_end": "-",
@@ -1329,6 +1814,9 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
     # Protector para que no se pisen las actualizaciones de métricas
     metrics_lock = threading.Lock()
+    # Per-stage latency histograms and queue depths, exported with --metrics-file.
+    migration_metrics = getattr(SHARED_DATA, "metrics", None) or MigrationMetrics()
+    metrics_file = str(ARGS.get('metrics-file', '') or '').strip()
     retry_delay_seconds = max(60, int(ARGS.get("push-failed-asset-retry-delay-seconds", 300) or 300))
     max_push_retries = max(0, int(ARGS.get("push-failed-asset-retries", 3) or 3))
     retry_backoff_factor = max(1, int(ARGS.get("push-failed-asset-retry-backoff-factor", 1) or 1))
@@ -1458,10 +1946,13 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 )
                 SHARED_DATA.info['album_assoc_queue_size'] = album_assoc_queue_size
                 SHARED_DATA.info['delayed_assets_pending'] = delayed_assets
+                migration_metrics.record_queue_depth("album_association", album_assoc_queue_size)
+                migration_metrics.record_queue_depth("retry", delayed_assets)
                 queue_depth_last_scan_monotonic = now
             SHARED_DATA.info['assets_in_queue'] = queue_size
+            migration_metrics.record_queue_depth("push", queue_size)
 
-    class MonitoredQueue(Queue):
+    class MonitoredQueue(_AssetPathIndexMixin, Queue):
         def put(self, item, *args, **kwargs):
             super().put(item, *args, **kwargs)
             _refresh_queue_depth()
@@ -1515,6 +2006,125 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     in_flight_asset_paths_lock = threading.Lock()
     consumed_live_companion_paths = set()
     consumed_live_companion_paths_lock = threading.Lock()
+    pull_claims = PullClaimTracker()
+    staging_budget = StagingBudget(
+        max_bytes=int(ARGS.get('staging-budget-mb', 0) or 0) * 1024 * 1024,
+        max_files=int(ARGS.get('staging-budget-files', 0) or 0),
+    )
+    if staging_budget.enabled and not (ARGS.get('parallel-migration', True) if parallel is None else parallel):
+        # Pushers only start once pulling has finished, so a blocked puller would wait forever.
+        LOGGER.warning(f"{MSG_TAGS['WARNING']}Staging budget ignored because parallel migration is disabled.")
+        staging_budget = StagingBudget()
+
+    local_staging_methods = Counter()
+    local_staging_methods_lock = threading.Lock()
+
+    def _record_local_staging_method(method_name):
+        with local_staging_methods_lock:
+            local_staging_methods[method_name] += 1
+
+    def _staging_budget_files(*paths):
+        staged_files = {}
+        for path in paths:
+            if not path:
+                continue
+            try:
+                staged_files[_staging_budget_key(temp_folder, path)] = os.lstat(path).st_size
+            except OSError:
+                continue
+        return staged_files
+
+    def _register_staging_budget(asset):
+        # Registered before the asset is queued, so a pusher that finishes first can release it.
+        if staging_budget.enabled:
+            staging_budget.register(_staging_budget_files(asset.get('asset_file_path'), asset.get('live_photo_video_path')))
+
+    def _release_staging_budget(*paths):
+        if staging_budget.enabled:
+            staging_budget.release([_staging_budget_key(temp_folder, path) for path in paths if path])
+
+    def _acquire_staging_budget():
+        waited = staging_budget.acquire(
+            can_bypass=lambda: push_queue.qsize() == 0 and not in_flight_asset_paths,
+        )
+        if waited:
+            SHARED_DATA.counters['total_staging_budget_waits'] += 1
+
+    adaptive_push_concurrency_enabled = bool(ARGS.get("adaptive-push-concurrency", True))
+
+    # Pusher threads are started on demand: the initial concurrency first, then one more each time the
+    # adaptive limit grows past the running threads, up to AUTOMATIC_MIGRATION_MAX_ADAPTIVE_PUSH_WORKERS.
+    push_threads = []
+    push_threads_lock = threading.Lock()
+    push_threads_state = {"started": False, "closed": False, "log_level": log_level}
+
+    def _start_push_threads(count):
+        with push_threads_lock:
+            if push_threads_state["closed"]:
+                return
+            push_threads_state["started"] = True
+            while len(push_threads) < count:
+                thread = threading.Thread(
+                    target=pusher_worker,
+                    kwargs={
+                        "processed_albums": push_threads_state["processed_albums"],
+                        "processed_albums_lock": push_threads_state["processed_albums_lock"],
+                        "worker_id": len(push_threads) + 1,
+                        "log_level": push_threads_state["log_level"],
+                    },
+                    daemon=True,
+                )
+                push_threads.append(thread)
+                thread.start()
+
+    def _close_push_threads():
+        """Stop starting new pushers and return how many are running."""
+        with push_threads_lock:
+            push_threads_state["closed"] = True
+            return len(push_threads)
+
+    def _publish_push_concurrency(previous_limit=None, new_limit=None):
+        SHARED_DATA.info['push_concurrency'] = push_concurrency.limit
+        SHARED_DATA.info['push_concurrency_max'] = push_concurrency.max_limit
+        if previous_limit is not None and new_limit is not None:
+            LOGGER.info(f"Push Concurrency: {previous_limit} -> {new_limit} active Push workers")
+            if push_threads_state["started"] and new_limit > len(push_threads):
+                _start_push_threads(new_limit)
+
+    push_concurrency = AdaptivePushConcurrency(
+        initial_limit=1,
+        enabled=adaptive_push_concurrency_enabled,
+        on_change=_publish_push_concurrency,
+    )
+    resume_migration = bool(ARGS.get('resume', False))
+    preflight_target_diff = bool(ARGS.get('preflight-target-diff', False))
+    plan_only = bool(ARGS.get('plan-only', False))
+    migration_journal = None
+    try:
+        migration_journal = _open_migration_journal(
+            ARGS.get('source') or source_client.get_client_name(),
+            ARGS.get('target') or target_client.get_client_name(),
+            resume=resume_migration,
+            plan_only=plan_only,
+        )
+        if resume_migration and migration_journal is not None:
+            LOGGER.info(f"Resuming Automatic Migration from journal '{migration_journal.journal_path}' ({migration_journal.count_completed()} asset(s) already migrated).")
+    except Exception as e:
+        LOGGER.warning(f"{MSG_TAGS['WARNING']}Migration journal disabled - {e}")
+        if resume_migration:
+            LOGGER.warning(f"{MSG_TAGS['WARNING']}--resume requested but the journal could not be opened. All assets will be migrated again.")
+    target_inventory_index = None
+    # Disk-less transfers need a target that uploads from a stream and a cloud source that can open one.
+    streaming_transfer = bool(ARGS.get('streaming-transfer', False))
+    if streaming_transfer and not (
+        isinstance(target_client, ClassImmichPhotos)
+        and isinstance(source_client, (ClassImmichPhotos, ClassSynologyPhotos, ClassNextCloudPhotos))
+    ):
+        LOGGER.warning(f"{MSG_TAGS['WARNING']}Streaming transfer is only supported from Immich, Synology or NextCloud Photos to Immich Photos. All assets will be staged on disk.")
+        streaming_transfer = False
+    # Skip the up-front asset inventory and count the source assets while the pullers list them.
+    incremental_source_listing = bool(ARGS.get('incremental-source-listing', False))
+    enumerated_assets_lock = threading.Lock()
     prefer_canonical_album_names = prefer_canonical_album_names_enabled(ARGS)
     consolidate_similar_albums = consolidate_similar_albums_enabled(ARGS)
     target_exact_album_match_case_sensitive = isinstance(target_client, (ClassImmichPhotos, ClassSynologyPhotos))
@@ -1637,6 +2247,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             asset_time=asset_datetime,
             queue_root=push_queue_folder,
             move_assets=bool(ARGS.get('move-assets', False)),
+            on_staged=_record_local_staging_method,
         )
         _mark_source_live_companion_consumed(source_companion_path)
         return source_companion_path, staged_companion_path
@@ -1757,6 +2368,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
         return album_id_dest, album_name
 
     def _cleanup_local_artifacts(asset_file_path, live_photo_video_path=None):
+        _release_staging_budget(asset_file_path, live_photo_video_path)
         safe_remove_local_file(asset_file_path)
         if live_photo_video_path:
             safe_remove_local_file(live_photo_video_path)
@@ -1796,6 +2408,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 log_level=log_level,
             )
             removed_source_asset_ids.add(source_live_photo_video_path)
+        _release_staging_budget(asset_file_path, live_photo_video_path)
         moved_paths = _move_to_album_association_failed_folder(
             temp_folder=temp_folder,
             album_name=album_name,
@@ -1840,6 +2453,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
         cleanup_delay_seconds=0.0,
         source_asset_already_moved=False,
         source_live_companion_already_moved=False,
+        source_album_name=None,
     ):
         cleanup_started_at = time.perf_counter()
         if cleanup_delay_seconds > 0:
@@ -1859,6 +2473,16 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             )
             removed_source_asset_ids.add(source_live_photo_video_path)
         _cleanup_local_artifacts(asset_file_path, live_photo_video_path)
+        if migration_journal is not None:
+            journal_album_name = source_album_name if source_album_name is not None else album_name
+            for journal_source_asset_id in (source_asset_id, source_live_photo_video_path):
+                if journal_source_asset_id:
+                    migration_journal.record_pushed(
+                        journal_album_name,
+                        journal_source_asset_id,
+                        target_asset_id=asset_id,
+                        album_associated=bool(journal_album_name and asset_id),
+                    )
         if retry_attempt > 0:
             SHARED_DATA.counters['total_push_retry_recovered_assets'] += _physical_file_count(
                 asset_type=asset_type,
@@ -2938,6 +3562,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                             logger=logger,
                             source_asset_already_moved=bool(item.get("source_asset_already_moved")),
                             source_live_companion_already_moved=bool(item.get("source_live_companion_already_moved")),
+                            source_album_name=album_name,
                         )
                     if unresolved_items:
                         _set_pending_duplicate_resolution_items(album_name, unresolved_items)
@@ -3002,6 +3627,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             SHARED_DATA.counters['total_push_failed_photos'] += int(stats.get("photos", 0) or 0)
             SHARED_DATA.counters['total_push_failed_videos'] += int(stats.get("videos", 0) or 0)
         if isinstance(asset, dict):
+            _release_staging_budget(asset.get("asset_file_path"), asset.get("live_photo_video_path"))
             moved_asset = _move_staged_asset_to_queue_folder(
                 temp_folder=temp_folder,
                 asset=asset,
@@ -3020,6 +3646,9 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     def _record_queue_admission(asset, counter_name, marker_name):
         if not isinstance(asset, dict) or asset.get(marker_name):
             return
+        if counter_name == 'total_album_assoc_queue_assets':
+            # The upload is done; parked files must not hold back pulls until the album finishes.
+            _release_staging_budget(asset.get('asset_file_path'), asset.get('live_photo_video_path'))
         physical_stats = asset.get('physical_stats') or _build_physical_transfer_stats(asset.get('asset_type'))
         admitted_files = int(physical_stats.get('assets', 1) or 1)
         SHARED_DATA.counters[counter_name] += admitted_files
@@ -3033,7 +3662,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             SHARED_DATA.counters['total_push_retry_scheduled_assets'] += admitted_files
         asset[marker_name] = True
 
-    def _schedule_asset_retry(asset, reason, resolved_target_asset_id=None, skip_target_push=False):
+    def _schedule_asset_retry(asset, reason, resolved_target_asset_id=None, skip_target_push=False, failure_recorded=False):
         if max_push_retries <= 0:
             _move_staged_asset_to_queue_folder(temp_folder, asset, AUTOMATIC_MIGRATION_PUSH_FAILED_FOLDER)
             return False
@@ -3072,8 +3701,12 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             retry_asset.pop('resolved_target_asset_id', None)
             retry_asset.pop('skip_target_push', None)
 
+        if not failure_recorded:
+            # A failed upload was already counted by record_push(); only count retries with another cause.
+            push_concurrency.record_retry()
         delay_seconds = _compute_push_retry_delay_seconds(next_attempt)
         ready_at = time.time() + delay_seconds
+        retry_asset['retry_delayed_at_monotonic'] = time.perf_counter()
 
         with retry_condition:
             retry_sequence['value'] += 1
@@ -3139,6 +3772,9 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                     heapq.heappop(retry_heap)
                     SHARED_DATA.info['delayed_assets_pending'] = len(retry_heap)
                 _refresh_queue_depth()
+                retry_delayed_at = retry_asset.pop('retry_delayed_at_monotonic', None)
+                if isinstance(retry_delayed_at, (int, float)):
+                    migration_metrics.observe_stage("retry_delay", (time.perf_counter() - retry_delayed_at) * 1000.0)
                 retry_asset = _move_staged_asset_to_queue_folder(
                     temp_folder, retry_asset, AUTOMATIC_MIGRATION_PUSH_QUEUE_FOLDER,
                 )
@@ -3318,6 +3954,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             )
 
             album_assoc_elapsed_ms = (time.perf_counter() - album_assoc_started_at) * 1000.0
+            migration_metrics.observe_stage("album_association", album_assoc_elapsed_ms)
             for item, target_asset_id in normalized_items:
                 asset_started_at = item.get("asset_started_at_perf") or time.perf_counter()
                 push_elapsed_ms = item.get("push_elapsed_ms")
@@ -3326,6 +3963,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 assoc_enqueued_at = item.get("album_assoc_enqueued_at_monotonic")
                 if isinstance(assoc_enqueued_at, (int, float)):
                     assoc_queue_wait_ms = max(0.0, (album_assoc_started_at - float(assoc_enqueued_at)) * 1000.0)
+                    migration_metrics.observe_stage("album_association_queue_wait", assoc_queue_wait_ms)
                 asset_confirmed = target_asset_id in confirmed_ids
                 cleanup_elapsed_ms = None
                 scheduled_retry = False
@@ -3615,10 +4253,11 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     # ----------------------------------------------------------------------------------------
     # function to ensure that the puller put only 1 asset with the same filepath to the queue
     # ----------------------------------------------------------------------------------------
-    def enqueue_unique(push_queue, item_dict, parallel=True):
+    def enqueue_unique(push_queue, item_dict, parallel=True, on_enqueue=None):
         """
         Añade item_dict a la cola si su asset_file_path no ha sido añadido previamente.
         Thread-safe gracias al lock global.
+        on_enqueue() se llama justo antes de añadirlo, cuando ya se sabe que no es un duplicado.
         """
         with file_paths_lock:
             asset_file_path = item_dict['asset_file_path']
@@ -3643,6 +4282,8 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                     pass
 
             # Añadir a la cola y al registro global
+            if on_enqueue is not None:
+                on_enqueue()
             _push_queue_put(item_dict)
             added_file_paths.add(asset_file_key)
             return True
@@ -3796,12 +4437,16 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
         source_video_exts = [e.lower() for e in getattr(source_client, "ALLOWED_VIDEO_EXTENSIONS", [])]
         stem_lower = stem.lower()
+        lower_entries = set(lower_to_real)
         for entry in entries:
             entry_base, entry_ext = os.path.splitext(entry)
             if entry_base.lower() != stem_lower:
                 continue
             if entry_ext.lower() not in source_video_exts:
                 continue
+            if f"{entry.lower()}.lock" in lower_entries:
+                # Still being written by another pull worker.
+                continue
             companion = os.path.join(download_folder, entry)
             if companion.lower() != primary_path.lower():
                 found.append(companion)
@@ -3905,16 +4550,17 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 return None
         return None
 
-    def _record_immich_burst_candidate(asset_id, asset_file_path, asset_datetime, asset_type):
+    def _record_immich_burst_candidate(asset_id, asset_file_path, asset_datetime, asset_type, file_size=None):
         """Retain fresh and duplicate photo candidates for end-of-job burst stacking."""
         if not isinstance(target_client, ClassImmichPhotos):
             return
         if str(asset_type or "").lower() not in image_labels:
             return
-        try:
-            file_size = os.path.getsize(asset_file_path) if os.path.exists(asset_file_path) else 0
-        except OSError:
-            file_size = 0
+        if file_size is None:
+            try:
+                file_size = os.path.getsize(asset_file_path) if os.path.exists(asset_file_path) else 0
+            except OSError:
+                file_size = 0
         record = target_client._build_burst_record(
             asset_id=asset_id,
             file_path=asset_file_path,
@@ -3928,6 +4574,8 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     # 1) HILO PRINCIPAL
     # ------------------
     def main_thread(parallel=None, log_level=logging.INFO):
+        nonlocal target_inventory_index, streaming_transfer, incremental_source_listing
+
         def is_unsupported_source(client) -> bool:
             return isinstance(client, (ClassTakeoutFolder, ClassLocalPhotosFolder))
 
@@ -3997,6 +4645,11 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             LOGGER.info(f"Starting Pulling/Pushing Workers...")
             LOGGER.info(f"Analyzing Source client and Applying filters. This process may take some time, please be patient...")
 
+            if incremental_source_listing and (preflight_target_diff or plan_only):
+                # Both need the whole source inventory before anything is pulled.
+                LOGGER.warning(f"{MSG_TAGS['WARNING']}Incremental source listing ignored because --preflight-target-diff or --plan-only is enabled.")
+                incremental_source_listing = False
+
             # Get source client statistics:
             blocked_assets = []
             total_albums_blocked_count = 0
@@ -4056,19 +4709,23 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                         LOGGER.error(f"Error Retrieving Shared Albums's Assets from '{source_client_name}' - {e}")
             # Get all assets and filter out those blocked assets (from blocked shared albums) if any
             all_no_albums_assets = []
-            try:
-                all_no_albums_assets = source_client.get_all_assets_without_albums(log_level=logging.INFO)
-            except Exception as e:
-                LOGGER.error(f"Error Retrieving Assets without albums from '{source_client_name}' - {e}")
             all_albums_assets = []
-            try:
-                # The puller lists every album when no filters are active, so the
-                # initial inventory must do the same. In particular, managed
-                # Takeout albums can contain only manifest-backed members (such
-                # as a Live Photo MOV) and would otherwise be missed here.
-                all_albums_assets = source_client.get_all_assets_from_all_albums(log_level=logging.INFO)
-            except Exception as e:
-                LOGGER.error(f"Error Retrieving Albums's Assets from '{source_client_name}' - {e}")
+            if incremental_source_listing:
+                # The pullers count the assets while they list them (see _record_enumerated_assets).
+                LOGGER.info(f"Incremental source listing enabled: asset totals will be refined while '{source_client_name}' is listed.")
+            else:
+                try:
+                    all_no_albums_assets = source_client.get_all_assets_without_albums(log_level=logging.INFO)
+                except Exception as e:
+                    LOGGER.error(f"Error Retrieving Assets without albums from '{source_client_name}' - {e}")
+                try:
+                    # The puller lists every album when no filters are active, so the
+                    # initial inventory must do the same. In particular, managed
+                    # Takeout albums can contain only manifest-backed members (such
+                    # as a Live Photo MOV) and would otherwise be missed here.
+                    all_albums_assets = source_client.get_all_assets_from_all_albums(log_level=logging.INFO)
+                except Exception as e:
+                    LOGGER.error(f"Error Retrieving Albums's Assets from '{source_client_name}' - {e}")
 
             all_supported_assets = all_no_albums_assets + all_albums_assets
             blocked_assets_ids = {asset["id"] for asset in blocked_assets}
@@ -4107,6 +4764,20 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             for key, value in SHARED_DATA.info.items():
                 LOGGER.info(f"   {key}: {value}")
 
+            if preflight_target_diff or plan_only:
+                target_inventory_index = _build_target_inventory_index()
+            if plan_only:
+                _log_migration_plan(all_assets)
+                return
+            if target_inventory_index is not None and move_assets:
+                # Skipped assets would never be removed from the source.
+                LOGGER.warning(f"{MSG_TAGS['WARNING']}Pre-flight target diff ignored because --move-assets is enabled.")
+                target_inventory_index = None
+            if streaming_transfer and move_assets:
+                # Source removal after push is driven by the staged files.
+                LOGGER.warning(f"{MSG_TAGS['WARNING']}Streaming transfer ignored because --move-assets is enabled.")
+                streaming_transfer = False
+
             # Delete unneeded vars to clean memory
             del all_albums
             del all_supported_assets
@@ -4126,10 +4797,20 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             cpu_total_threads = os.cpu_count()
             LOGGER.info(f"")
             LOGGER.info(f"CPU Total Cores Detected = {cpu_total_threads}")
-            num_pull_threads = 1  # no Iniciar más de 1 hilo de descarga, de lo contrario los assets se descargarán multiples veces.
-            LOGGER.info(f"Launching {num_pull_threads} Pull worker in parallel...")
-            num_push_threads = max(1, int(cpu_total_threads * 2))
-            LOGGER.info(f"Launching {num_push_threads} Push workers in parallel...")
+            # Each source asset is claimed by exactly one puller, so several pull workers never download the same asset twice.
+            num_pull_threads = _resolve_pull_worker_count(ARGS.get("pull-workers", 0), cpu_total_threads)
+            LOGGER.info(f"Launching {num_pull_threads} Pull workers in parallel...")
+            initial_push_concurrency = max(1, int(cpu_total_threads * 2))
+            if adaptive_push_concurrency_enabled:
+                max_push_threads = max(initial_push_concurrency, AUTOMATIC_MIGRATION_MAX_ADAPTIVE_PUSH_WORKERS)
+            else:
+                max_push_threads = initial_push_concurrency
+            push_concurrency.configure(initial_limit=initial_push_concurrency, max_limit=max_push_threads)
+            _publish_push_concurrency()
+            if adaptive_push_concurrency_enabled:
+                LOGGER.info(f"Launching {initial_push_concurrency} Push workers with adaptive concurrency (up to {max_push_threads})...")
+            else:
+                LOGGER.info(f"Launching {initial_push_concurrency} Push workers in parallel...")
             SHARED_DATA.info["asset_transfer_start_time"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
             configured_album_assoc_threads = int(ARGS.get("album-association-workers", 0) or 0)
             if configured_album_assoc_threads > 0:
@@ -4142,8 +4823,9 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
             pull_threads = [
                 threading.Thread(
-                    target=puller_worker,
+                    target=pull_coordinator,
                     kwargs={
+                        "num_pull_workers": num_pull_threads,
                         "parallel": parallel,
                         "log_level": log_level,
                         "processed_albums": processed_albums,
@@ -4151,21 +4833,12 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                     },
                     daemon=True,
                 )
-                for _ in range(num_pull_threads)
-            ]
-            push_threads = [
-                threading.Thread(
-                    target=pusher_worker,
-                    kwargs={
-                        "processed_albums": processed_albums,
-                        "processed_albums_lock": processed_albums_lock,
-                        "worker_id": worker_id + 1,
-                        "log_level": log_level,
-                    },
-                    daemon=True,
-                )
-                for worker_id in range(num_push_threads)
             ]
+            push_threads_state.update(
+                processed_albums=processed_albums,
+                processed_albums_lock=processed_albums_lock,
+                log_level=log_level,
+            )
             album_assoc_threads = [
                 threading.Thread(
                     target=album_association_worker,
@@ -4197,8 +4870,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
             # 2) Si modo paralelo, arranca ya los pushers
             if parallel:
-                for t in push_threads:
-                    t.start()
+                _start_push_threads(push_concurrency.limit)
 
             # 3) Esperar a que terminen los pullers
             for t in pull_threads:
@@ -4206,8 +4878,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
             # 4) Si modo secuencial, ahora sí arranca los pushers
             if not parallel:
-                for t in push_threads:
-                    t.start()
+                _start_push_threads(push_concurrency.limit)
 
             # 5) Esperar a que la cola se vacíe (assets reales y todos los re‑enqueues)
             _wait_until_push_pipeline_drains()
@@ -4219,7 +4890,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 retry_thread.join()
 
             # 6) Inyectar un None por cada pusher para que lean la señal de fin
-            for _ in range(num_push_threads):
+            for _ in range(_close_push_threads()):
                 _push_queue_put(None)
 
             # 7) Esperar a que los pushers consuman su None y terminen
@@ -4310,6 +4981,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             LOGGER.info(f"Push Retry Scheduled        : {SHARED_DATA.counters['total_push_retry_scheduled_assets']}")
             LOGGER.info(f"Push Retry Recovered        : {SHARED_DATA.counters['total_push_retry_recovered_assets']}")
             LOGGER.info(f"Push Retry Failed           : {SHARED_DATA.counters['total_push_retry_failed_assets']}")
+            LOGGER.info(f"Push Concurrency (final)    : {push_concurrency.limit}/{push_concurrency.max_limit}")
             LOGGER.info(f"Album Assoc Retry Scheduled : {SHARED_DATA.counters['total_album_assoc_retry_scheduled_assets']}")
             LOGGER.info(f"Album Assoc Retry Recovered : {SHARED_DATA.counters['total_album_assoc_retry_recovered_assets']}")
             LOGGER.info(f"Album Assoc Failed          : {SHARED_DATA.counters['total_album_assoc_failed_assets']}")
@@ -4325,6 +4997,31 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                 LOGGER.info(f"Canonicalized Albums       : {SHARED_DATA.counters['total_canonicalized_albums']}")
             if SHARED_DATA.counters['total_target_empty_albums_removed'] > 0:
                 LOGGER.info(f"Target Empty Albums Removed : {SHARED_DATA.counters['total_target_empty_albums_removed']}")
+            if resume_migration:
+                LOGGER.info(f"Resume Skipped Assets       : {SHARED_DATA.counters['total_resume_skipped_assets']}")
+            if target_inventory_index is not None:
+                LOGGER.info(f"Pre-flight Skipped Assets   : {SHARED_DATA.counters['total_preflight_skipped_assets']}")
+            if streaming_transfer:
+                LOGGER.info(f"Streamed Assets             : {SHARED_DATA.counters['total_streamed_assets']}")
+            if local_staging_methods:
+                LOGGER.info(f"Local Staging Methods       : {', '.join(f'{method_name}: {count}' for method_name, count in local_staging_methods.most_common())}")
+            if staging_budget.enabled:
+                LOGGER.info(f"Staging Budget Waits        : {SHARED_DATA.counters['total_staging_budget_waits']}")
+            stage_metrics = migration_metrics.snapshot()["stages"]
+            if stage_metrics:
+                LOGGER.info(f"")
+                LOGGER.info(f"Stage Latency p50 / p95 / p99 (ms):")
+                for stage_name, stage_stats in stage_metrics.items():
+                    stage_throughput = f", {stage_stats['bytesPerSecond'] / (1024 * 1024):.2f} MB/s" if stage_stats['bytes'] else ""
+                    LOGGER.info(
+                        f"   {stage_name:<25}: {stage_stats['p50Ms']} / {stage_stats['p95Ms']} / {stage_stats['p99Ms']} "
+                        f"({stage_stats['count']} samples{stage_throughput})"
+                    )
+            if metrics_file:
+                try:
+                    LOGGER.info(f"Metrics File                : {migration_metrics.write(metrics_file)}")
+                except OSError as e:
+                    LOGGER.warning(f"{MSG_TAGS['WARNING']}Unable to write the metrics file '{metrics_file}' - {e}")
             LOGGER.info(f"")
             LOGGER.info(f"Migration Job completed in  : {migration_formatted_duration}")
             LOGGER.info(f"Total Elapsed Time          : {total_formatted_duration}")
@@ -4335,602 +5032,1070 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     # --------------------------------------------------------------------------------
     # 1) PULLER: Función puller_worker para descargar assets y poner en la cola
     # --------------------------------------------------------------------------------
-    def puller_worker(
-        parallel=None,
-        log_level=logging.INFO,
-        album_stats_by_name_ref=album_stats_by_name,
-        album_stats_lock_ref=album_stats_lock,
-        processed_albums=None,
-        processed_albums_lock=None,
-    ):
-        # # 1) Creamos un logger hijo para este hilo y lo asignamos a la variable LOGGER local
-        # from Core.GlobalVariables import LOGGER as GV_LOGGER
-        # thread_id = threading.get_ident()
-        # LOGGER = GV_LOGGER.getChild(f"puller-{thread_id}")
+    def _record_claimed_pull_duplicate(asset_filename, asset_type, album_name=None, album_stats_by_name_ref=None, album_stats_lock_ref=None, resumed=False, preflight=False):
+        """
+        Account for a source asset that was listed again after another puller already claimed it,
+        that (resumed=True) the migration journal reports as migrated by a previous run, or that
+        (preflight=True) the pre-flight target diff found on the target.
+        """
+        asset_stats = _build_physical_transfer_stats(asset_type)
+        if preflight:
+            log_tag, log_reason = "Asset Present   ", "Already on target. Skipped"
+        elif resumed:
+            log_tag, log_reason = "Asset Resumed   ", "Already migrated by a previous run. Skipped"
+        else:
+            log_tag, log_reason = "Asset Duplicated", "Skipped"
+        if album_name:
+            LOGGER.info(f"{log_tag}: '{os.path.basename(str(asset_filename or ''))}' from Album '{album_name}'. {log_reason}")
+            _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "total_assets", 1)
+            _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "duplicated_assets", 1)
+        else:
+            LOGGER.info(f"{log_tag}: '{os.path.basename(str(asset_filename or ''))}'. {log_reason}")
+        if resumed:
+            SHARED_DATA.counters['total_resume_skipped_assets'] += int(asset_stats.get("assets", 1) or 1)
+        if preflight:
+            SHARED_DATA.counters['total_preflight_skipped_assets'] += int(asset_stats.get("assets", 1) or 1)
+        _increment_pull_counters(SHARED_DATA.counters, asset_type=asset_type, asset_stats=asset_stats)
+        _increment_push_duplicate_counters(SHARED_DATA.counters, asset_type, asset_stats)
+        _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, asset_type)
+
+    def _build_target_inventory_index():
+        """Download the target inventory once and index it for the pre-flight diff."""
+        if not isinstance(target_client, (ClassImmichPhotos, ClassSynologyPhotos)):
+            LOGGER.warning(f"{MSG_TAGS['WARNING']}Pre-flight target diff is only supported for Immich and Synology Photos targets. All assets will be migrated.")
+            return None
+        try:
+            LOGGER.info(f"Retrieving the inventory of '{target_client.get_client_name()}' for the pre-flight target diff...")
+            inventory_index = TargetInventoryIndex(target_client.get_asset_inventory_identities(log_level=logging.INFO))
+        except Exception as e:
+            LOGGER.warning(f"{MSG_TAGS['WARNING']}Pre-flight target diff disabled - {e}")
+            return None
+        LOGGER.info(f"Pre-flight target diff: {inventory_index.total_assets} target asset(s) indexed.")
+        return inventory_index
 
-        with_filters = bool(has_any_filter())
+    def _source_asset_identity(asset):
+        size = source_asset_size(asset)
+        if size is None and isinstance(source_client, ClassLocalPhotosFolder):
+            try:
+                size = os.path.getsize(str(asset.get('id')))
+            except OSError:
+                size = None
+        return {
+            "filename": asset.get('filename'),
+            "size": size,
+            "capture_epoch": parse_capture_epoch(asset.get('asset_datetime') or asset.get('time')),
+            "checksum": asset.get('checksum'),
+        }
 
-        with set_log_level(LOGGER, log_level):
+    def _find_preflight_target_asset_id(asset):
+        """Return the target asset id of a source asset already present on the target, or None."""
+        if target_inventory_index is None:
+            return None
+        asset_id = asset.get('id')
+        if isinstance(source_client, ClassLocalPhotosFolder) and (
+            _find_local_source_live_video_companion(asset_id) or _find_local_source_live_photo_companion(asset_id)
+        ):
+            # Live Photo pairs are pushed together; let push_live_photo handle them.
+            return None
+        return target_inventory_index.find(**_source_asset_identity(asset))
 
-            # 1.1) Descarga de álbumes
-            albums = []
-            try:
-                albums = source_client.get_albums_including_shared_with_user(filter_assets=with_filters, log_level=logging.ERROR)
-            except Exception as e:
-                LOGGER.error(f"Error Retrieving All Albums - {e} \n{traceback.format_exc()}")
-                LOGGER.info(f"Albums Assets Skipped")
+    def _associate_existing_target_asset_to_album(album_name, target_asset_id, album_is_shared=False):
+        """Add an asset already present on the target to its album. Returns True when confirmed."""
+        try:
+            album_id_dest, album_name_to_query = _ensure_target_album_ready(
+                album_name=album_name,
+                album_is_shared=album_is_shared,
+                log_level=logging.ERROR,
+            )
+            confirmed_ids = _add_assets_to_target_album(
+                album_id_dest=album_id_dest,
+                album_name=album_name_to_query,
+                asset_ids=[target_asset_id],
+                log_level=logging.ERROR,
+            )
+        except Exception as e:
+            LOGGER.warning(f"Album association failed for album '{album_name}'. The asset will be migrated through the staging folder. {e}")
+            return False
+        if target_asset_id not in confirmed_ids:
+            return False
+        _mark_target_album_asset_present(album_id_dest, target_asset_id)
+        return True
 
-            pulled_assets = 0
-            for album in albums:
-                if isinstance(source_client, ClassSynologyPhotos):
-                    album = source_client.ensure_shared_album_access(album, log_level=logging.ERROR)
-                    if hasattr(source_client, "_hydrate_album_payload"):
-                        album = source_client._hydrate_album_payload(album)
-                album_assets = []
-                album_id = album['id']
-                album_name = album['albumName']
-                if isinstance(source_client, ClassLocalPhotosFolder) and album_id:
-                    with source_album_paths_lock:
-                        source_album_paths_by_name.setdefault(album_name, set()).add(str(album_id))
-                album_passphrase = album.get('passphrase')  # Obtiene el valor si existe, si no, devuelve None
-                album_scope = album.get("_synology_album_scope")
-                if isinstance(source_client, ClassSynologyPhotos):
-                    is_shared = source_client.is_shared_with_me_album(album)
+    def _journal_target_asset_migrated(album_name, asset_id, target_asset_id):
+        if migration_journal is not None:
+            migration_journal.record_pulled(album_name, asset_id, variants=1)
+            migration_journal.record_pushed(album_name, asset_id, target_asset_id=target_asset_id, album_associated=bool(album_name))
+
+    def _log_migration_plan(source_assets):
+        """Report how many assets and bytes a migration would actually move (--plan-only)."""
+        planned_assets = {}
+        for asset in source_assets:
+            planned_assets.setdefault(_normalized_asset_path_key(asset.get('id')), asset)
+        present_count = present_bytes = migrate_count = migrate_bytes = unknown_size_count = 0
+        for asset in planned_assets.values():
+            asset_size = _source_asset_identity(asset)["size"]
+            if _find_preflight_target_asset_id(asset):
+                present_count += 1
+                present_bytes += asset_size or 0
+            else:
+                migrate_count += 1
+                if asset_size is None:
+                    unknown_size_count += 1
                 else:
-                    is_shared = album_passphrase is not None and album_passphrase != ""  # Si tiene passphrase, es compartido
+                    migrate_bytes += asset_size
+        LOGGER.info(f"")
+        LOGGER.info(f"Migration Plan (--plan-only). Nothing will be pulled or pushed.")
+        LOGGER.info(f"Source Assets               : {len(planned_assets)}")
+        LOGGER.info(f"Already on Target           : {present_count} ({present_bytes / (1024 * 1024):.1f} MB)")
+        LOGGER.info(f"Assets to Migrate           : {migrate_count} ({migrate_bytes / (1024 * 1024):.1f} MB)")
+        if unknown_size_count:
+            LOGGER.info(f"Assets with Unknown Size    : {unknown_size_count} (not included in the MB to migrate)")
+        return {
+            "source_assets": len(planned_assets),
+            "present_assets": present_count,
+            "present_bytes": present_bytes,
+            "migrate_assets": migrate_count,
+            "migrate_bytes": migrate_bytes,
+            "unknown_size_assets": unknown_size_count,
+        }
 
-                # Descargar todos los assets de este álbum
-                try:
-                    if not is_shared:
-                        album_kwargs = {
-                            "album_id": album_id,
-                            "album_name": album_name,
-                            "log_level": logging.ERROR,
-                        }
-                        if isinstance(source_client, ClassSynologyPhotos):
-                            album_kwargs["album_scope"] = album_scope
-                            album_kwargs["album_expected_count"] = album.get("item_count")
-                        album_assets = source_client.get_all_assets_from_album(**album_kwargs)
-                    else:
-                        if not _is_blocked_synology_shared_album(source_client, album):
-                            album_shared_kwargs = {
-                                "album_id": album_id,
-                                "album_name": album_name,
-                                "album_passphrase": album_passphrase,
-                                "log_level": logging.ERROR,
-                            }
-                            if isinstance(source_client, ClassSynologyPhotos):
-                                album_shared_kwargs["album_scope"] = album_scope
-                                album_shared_kwargs["album_expected_count"] = album.get("item_count")
-                            album_assets = source_client.get_all_assets_from_album_shared(**album_shared_kwargs)
-                    if not album_assets:
-                        # SHARED_DATA.counters['total_pull_failed_albums'] += 1     # If we uncomment this line, it will count as failed Empties albums
-                        continue
-                except Exception as e:
-                    LOGGER.error(f"Error Retrieving All Assets from album {album_name} - {e} \n{traceback.format_exc()}")
-                    SHARED_DATA.counters['total_pull_failed_albums'] += 1
-                    continue
+    def _stream_transfer_asset(
+        asset,
+        album_name=None,
+        album_is_shared=False,
+        album_passphrase=None,
+        album_id=None,
+        album_scope=None,
+        live_pair_stems=None,
+        album_stats_by_name_ref=None,
+        album_stats_lock_ref=None,
+    ):
+        """
+        Upload one source asset straight to the target without staging it on disk (--streaming-transfer).
 
-                album_source_asset_keys = {
-                    _normalized_asset_path_key(item.get('id'))
-                    for item in album_assets
-                    if isinstance(item, dict)
-                    and item.get('type') not in ['metadata', 'sidecar']
-                    and _normalized_asset_path_key(item.get('id'))
-                }
+        Returns True when the asset was uploaded and added to its album, or False when it must go
+        through the staging folder instead (Live Photos, unknown size, or any failure).
+        """
+        if not streaming_transfer:
+            return False
+        asset_id = asset.get('id')
+        asset_type = str(asset.get('type') or '').strip().lower()
+        asset_filename = os.path.basename(str(asset.get('filename') or ''))
+        asset_stem, asset_extension = os.path.splitext(asset_filename)
+        if (
+            asset_type not in image_labels + ['video']
+            or asset.get('livePhotoVideoId')
+            or asset_stem.casefold() in (live_pair_stems or ())
+            or asset_extension.lower() not in target_client.ALLOWED_IMMICH_MEDIA_EXTENSIONS
+        ):
+            return False
+        capture_epoch = parse_capture_epoch(asset.get('asset_datetime') or asset.get('time'))
+        if capture_epoch is None:
+            return False
 
-                # Crear carpeta del álbum dentro de temp_folder, y bloquea su eliminación hasta que terminen las descargas del album
-                album_folder = _get_album_staging_folder(album_name)
-                os.makedirs(album_folder, exist_ok=True)
-                # Crear archivo `.active` para marcar que la carpeta está en uso
-                active_file = os.path.join(album_folder, ".active")
-                with open(active_file, 'w') as lock_album_folder:
-                    lock_album_folder.write("Pulling Album")
-                try:
-                    _ensure_album_stats_entry(album_stats_by_name_ref, album_stats_lock_ref, album_name)
-                    for asset in album_assets:
-                        asset_perf_started = time.perf_counter()
-                        asset_id = asset['id']
-                        asset_type = asset['type']
-                        asset_datetime = asset.get('asset_datetime') or asset.get('time')
-                        asset_filename = asset.get('filename')
-
-                        if _is_source_live_companion_consumed(asset_id):
-                            LOGGER.info(_format_live_companion_consumed_log(asset_id, album_name=album_name))
-                            continue
+        # No pusher slot is taken: idle pushers hold theirs while waiting on the push queue.
+        # The number of streams is bounded by the Pull workers, and their latency still
+        # feeds the adaptive push concurrency.
+        asset_stream = None
+        target_asset_id = is_duplicated = None
+        try:
+            asset_stream = source_client.open_asset_stream(
+                asset_id=asset_id,
+                asset_filename=asset_filename,
+                album_passphrase=album_passphrase if album_is_shared else None,
+                album_id=album_id,
+                album_scope=album_scope,
+                log_level=logging.ERROR,
+            )
+            if asset_stream is None:
+                return False
+            push_started_at = time.perf_counter()
+            target_asset_id, is_duplicated = target_client.push_asset_stream(
+                asset_stream,
+                asset_filename,
+                capture_epoch,
+                log_level=logging.ERROR,
+            )
+            stream_elapsed_ms = (time.perf_counter() - push_started_at) * 1000.0
+            push_concurrency.record_push(
+                latency_ms=stream_elapsed_ms,
+                size_bytes=asset_stream.len,
+                failed=not target_asset_id,
+            )
+            migration_metrics.observe_stage("stream", stream_elapsed_ms, size_bytes=asset_stream.len if target_asset_id else 0)
+        except Exception as e:
+            LOGGER.warning(f"Asset Stream Fail: '{asset_filename}' - {e}. It will be staged on disk.")
+            return False
+        finally:
+            if asset_stream is not None:
+                asset_stream.close()
 
-                        # Skip pull metadata and sidecar for the time being
-                        if asset_type in ['metadata', 'sidecar']:
-                            continue
+        if not target_asset_id:
+            return False
+        if album_name and not _associate_existing_target_asset_to_album(album_name, target_asset_id, album_is_shared=album_is_shared):
+            return False
 
-                        source_photo_path = _find_local_source_live_photo_companion(asset_id)
-                        if (
-                            source_photo_path
-                            and _normalized_asset_path_key(source_photo_path) in album_source_asset_keys
-                        ):
-                            # The photo stages and uploads this physical MOV in the same
-                            # push_live_photo operation, irrespective of source traversal order.
-                            continue
+        asset_stats = _build_physical_transfer_stats(asset_type)
+        asset_count = int(asset_stats.get("assets", 1) or 1)
+        _increment_pull_counters(SHARED_DATA.counters, asset_type=asset_type, asset_stats=asset_stats)
+        _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, asset_type)
+        _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "total_assets", asset_count)
+        if is_duplicated:
+            _increment_push_duplicate_counters(SHARED_DATA.counters, asset_type, asset_stats)
+            _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "duplicated_assets", asset_count)
+        else:
+            _increment_transfer_counters(SHARED_DATA.counters, 'total_pushed', asset_stats, asset_type)
+            _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "pushed_assets", asset_count)
+        SHARED_DATA.counters['total_streamed_assets'] += asset_count
+        album_suffix = f" to Album '{album_name}'" if album_name else ""
+        duplicate_suffix = " (already on target)" if is_duplicated else ""
+        LOGGER.info(f"Asset Streamed  : '{asset_filename}'{album_suffix}{duplicate_suffix}")
+        _journal_target_asset_migrated(album_name, asset_id, target_asset_id)
+        _record_immich_burst_candidate(
+            asset_id=target_asset_id,
+            asset_file_path=os.path.join(_get_album_staging_folder(album_name) if album_name else push_queue_folder, asset_filename),
+            asset_datetime=capture_epoch,
+            asset_type=asset_type,
+            file_size=asset_stream.len,
+        )
+        return True
 
-                        # Stage every pending upload under Push_Queue. Local-folder
-                        # sources retain their full path relative to the source root.
-                        download_folder = album_folder
-                        staged_filename = asset_filename
-                        if isinstance(source_client, ClassLocalPhotosFolder):
-                            relative_path = _build_automatic_migration_relative_asset_path(
-                                source_client, asset_id, asset_filename, album_name,
-                            )
-                            download_folder = os.path.join(push_queue_folder, str(relative_path.parent))
-                            staged_filename = relative_path.name
-                        local_file_path = os.path.join(download_folder, staged_filename)
-                        os.makedirs(download_folder, exist_ok=True)
-
-                        # Archivo de bloqueo temporal para que el pusher no borre el fichero mientras que el puller lo está creando
-                        lock_file = local_file_path + ".lock"
-                        # Crear archivo de bloqueo antes de la descarga
-                        with open(lock_file, 'w') as lock:
-                            lock.write("Pulling Asset")
-                        # Descargar el asset (tolerante por-asset para no abortar todo el álbum).
-                        skipped_not_found = False
-                        pull_failure_reason = "pull did not return content"
-                        pull_started_at = time.perf_counter()
-                        try:
-                            source_live_companion_path = None
-                            staged_live_companion_path = None
-                            if not isinstance(source_client, ClassLocalPhotosFolder):
-                                pull_kwargs = {
-                                    "asset_id": asset_id,
-                                    "asset_filename": staged_filename,
-                                    "asset_time": asset_datetime,
-                                    "download_folder": download_folder,
-                                    "album_passphrase": album_passphrase if is_shared else None,
-                                    "log_level": logging.ERROR,
-                                }
-                                if isinstance(source_client, ClassSynologyPhotos):
-                                    pull_kwargs["album_id"] = album_id
-                                    pull_kwargs["album_scope"] = album_scope
-                            if isinstance(source_client, ClassLocalPhotosFolder):
-                                staged_path = _stage_local_asset_for_automatic_migration(
-                                    source_client=source_client,
-                                    source_asset_id=asset_id,
-                                    asset_filename=asset_filename,
-                                    asset_time=asset_datetime,
-                                    queue_root=push_queue_folder,
-                                    move_assets=bool(ARGS.get('move-assets', False)),
-                                )
-                                pulled_assets = [staged_path]
-                                local_file_path = staged_path
-                                download_folder = os.path.dirname(staged_path)
-                                staged_filename = os.path.basename(staged_path)
-                                (
-                                    source_live_companion_path,
-                                    staged_live_companion_path,
-                                ) = _stage_local_live_photo_companion(
-                                    source_asset_id=asset_id,
-                                    asset_datetime=asset_datetime,
-                                    source_asset_keys=album_source_asset_keys,
-                                )
-                                if source_live_companion_path:
-                                    _remember_live_companion_context(
-                                        companion_path=source_live_companion_path,
-                                        primary_path=asset_id,
-                                        album_name=album_name,
-                                    )
-                            else:
-                                pulled_assets = source_client.pull_asset(**pull_kwargs)
-                        except Exception as e:
-                            if _is_nextcloud_photo_not_found_error(e):
-                                skipped_not_found = True
-                                LOGGER.warning(
-                                    f"Asset Pull Skip : '{os.path.basename(asset_filename)}' from Album '{album_name}' - "
-                                    f"Photo not found for user"
-                                )
-                            else:
-                                LOGGER.error(
-                                    f"Asset Pull Error: '{os.path.basename(asset_filename)}' from Album '{album_name}' - {e}"
-                                )
-                            pull_failure_reason = str(e)
-                            pulled_assets = 0
-                        finally:
-                            # Eliminar archivo de bloqueo después de la descarga
-                            if os.path.exists(lock_file):
-                                os.remove(lock_file)
-
-                        # Actualizamos Contadores de descargas
-                        if _pull_has_content(pulled_assets):
-                            is_local_source = isinstance(source_client, ClassLocalPhotosFolder)
-                            pulled_file_paths = collect_pulled_asset_paths(
-                                download_folder,
-                                staged_filename,
-                                discover_live_companions=not is_local_source,
-                            )
-                            if not pulled_file_paths:
-                                pulled_file_paths = [local_file_path]
-                            collect_finished_at = time.perf_counter()
-
-                            immich_live_companion = (
-                                staged_live_companion_path
-                                if is_local_source
-                                else find_immich_live_video_companion(local_file_path, pulled_file_paths)
-                            )
-                            for idx, pulled_file_path in enumerate(pulled_file_paths):
-                                if immich_live_companion and path_key(pulled_file_path) == path_key(immich_live_companion):
-                                    continue
-                                if _is_live_companion_consumed(pulled_file_path):
-                                    LOGGER.info(_format_live_companion_consumed_log(pulled_file_path, album_name=album_name))
-                                    if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
-                                        safe_remove_local_file(pulled_file_path)
-                                    continue
-                                normalized_asset_type = infer_asset_type_from_path(pulled_file_path, asset_type)
-                                include_live_companion = bool(
-                                    immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path)
-                                )
-                                asset_stats = _build_physical_transfer_stats(
-                                    normalized_asset_type,
-                                    include_live_companion=include_live_companion,
-                                )
-                                _increment_album_stat_counter(
-                                    album_stats_by_name_ref,
-                                    album_stats_lock_ref,
-                                    album_name,
-                                    "total_assets",
-                                    int(asset_stats.get("assets", 1) or 1),
-                                )
-                                count_push_stats = True
-                                LOGGER.info(f"Asset Pulled    : '{os.path.basename(pulled_file_path)}'")
-                                _increment_pull_counters(
-                                    SHARED_DATA.counters,
-                                    asset_type=normalized_asset_type,
-                                    asset_stats=asset_stats,
-                                )
+    def _journal_live_companion_pulled(album_name, asset_dict):
+        """Journal the source Live Photo companion that travels inside asset_dict, so --resume skips it too."""
+        source_companion_path = asset_dict.get('source_live_photo_video_path')
+        if migration_journal is not None and source_companion_path:
+            migration_journal.record_pulled(album_name, source_companion_path, variants=1)
 
-                                # Enviar a la cola con la información necesaria para la subida
-                                asset_dict = {
-                                    'asset_id': asset_id,
-                                    'asset_file_path': pulled_file_path,
-                                    'asset_datetime': asset_datetime,
-                                    'asset_type': normalized_asset_type,
-                                    'album_name': album_name,
-                                    'album_is_shared': is_shared,
-                                    'count_push_stats': count_push_stats,
-                                    'physical_stats': asset_stats,
-                                    'enqueued_at_monotonic': time.perf_counter(),
-                                    'source_asset_already_moved': bool(ARGS.get('move-assets', None)) and isinstance(source_client, ClassLocalPhotosFolder),
-                                }
-                                if immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path):
-                                    asset_dict['live_photo_video_path'] = immich_live_companion
-                                    source_companion_path = source_live_companion_path or _find_local_source_live_video_companion(asset_id)
-                                    if source_companion_path:
-                                        asset_dict['source_live_photo_video_path'] = source_companion_path
-                                        asset_dict['source_live_companion_already_moved'] = bool(
-                                            ARGS.get('move-assets', False) and is_local_source
-                                        )
-                                    _remember_live_companion_context(
-                                        companion_path=immich_live_companion,
-                                        primary_path=pulled_file_path,
-                                        album_name=album_name,
-                                    )
-                                # añadimos el asset a la cola solo si no se había añadido ya un asset con el mismo 'asset_file_path'
-                                unique = enqueue_unique(push_queue, asset_dict, parallel=parallel)
-                                if unique and asset_dict.get('live_photo_video_path'):
-                                    _mark_live_companion_consumed(asset_dict.get('live_photo_video_path'))
-                                if unique and asset_dict.get('source_live_photo_video_path'):
-                                    _mark_source_live_companion_consumed(asset_dict.get('source_live_photo_video_path'))
-                                if not unique:
-                                    LOGGER.info(f"Asset Duplicated: '{os.path.basename(pulled_file_path)}' from Album '{album_name}'. Skipped")
-                                    _increment_push_duplicate_counters(SHARED_DATA.counters, normalized_asset_type, asset_stats)
-                                    _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, normalized_asset_type)
-                                    _increment_album_stat_counter(
-                                        album_stats_by_name_ref,
-                                        album_stats_lock_ref,
-                                        album_name,
-                                        "duplicated_assets",
-                                        int(asset_stats.get("assets", 1) or 1),
-                                    )
-                                    # Solo borramos si el fichero ya no está reservado por la cola ni por un pusher en curso.
-                                    if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
-                                        safe_remove_local_file(pulled_file_path)
-                                    companion_to_cleanup = asset_dict.get('live_photo_video_path')
-                                    if companion_to_cleanup and os.path.exists(companion_to_cleanup):
-                                        companion_lock = companion_to_cleanup + ".lock"
-                                        if (not is_asset_reserved(companion_to_cleanup)) and (not os.path.exists(companion_lock)):
-                                            safe_remove_local_file(companion_to_cleanup)
-                            _debug_perf_log(
-                                LOGGER,
-                                "automatic_migration.pull.album_asset",
-                                asset_perf_started,
-                                worker="puller",
-                                album=album_name,
-                                asset=os.path.basename(local_file_path),
-                                asset_id=asset_id,
-                                pulled_variants=len(pulled_file_paths),
-                                pull_ms=f"{(collect_finished_at - pull_started_at) * 1000.0:.2f}",
-                            )
-                        else:
-                            _record_pull_failure(
-                                asset_id=asset_id,
-                                asset_filename=asset_filename,
-                                album_name=album_name,
-                                local_file_path=local_file_path,
-                                reason=pull_failure_reason,
-                            )
-                            if skipped_not_found:
-                                SHARED_DATA.counters['total_pull_failed_assets'] += 1
-                                _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "failed_assets", 1)
-                                if asset_type.lower() in video_labels:
-                                    SHARED_DATA.counters['total_pull_failed_videos'] += 1
-                                else:
-                                    SHARED_DATA.counters['total_pull_failed_photos'] += 1
-                                continue
-                            LOGGER.warning(f"Asset Pull Fail : '{os.path.basename(local_file_path)}' from Album '{album_name}'")
-                            SHARED_DATA.counters['total_pull_failed_assets'] += 1
-                            _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "failed_assets", 1)
-                            if asset_type.lower() in video_labels:
-                                SHARED_DATA.counters['total_pull_failed_videos'] += 1
-                            else:
-                                SHARED_DATA.counters['total_pull_failed_photos'] += 1
+    def _pull_album(
+        album,
+        parallel=None,
+        log_level=logging.INFO,
+        album_stats_by_name_ref=album_stats_by_name,
+        album_stats_lock_ref=album_stats_lock,
+        processed_albums=None,
+        processed_albums_lock=None,
+    ):
+        """Pull every asset of one source album into its staging folder and enqueue it for push."""
+        if isinstance(source_client, ClassSynologyPhotos):
+            album = source_client.ensure_shared_album_access(album, log_level=logging.ERROR)
+            if hasattr(source_client, "_hydrate_album_payload"):
+                album = source_client._hydrate_album_payload(album)
+        album_assets = []
+        album_id = album['id']
+        album_name = album['albumName']
+        if isinstance(source_client, ClassLocalPhotosFolder) and album_id:
+            with source_album_paths_lock:
+                source_album_paths_by_name.setdefault(album_name, set()).add(str(album_id))
+        album_passphrase = album.get('passphrase')  # Obtiene el valor si existe, si no, devuelve None
+        album_scope = album.get("_synology_album_scope")
+        if isinstance(source_client, ClassSynologyPhotos):
+            is_shared = source_client.is_shared_with_me_album(album)
+        else:
+            is_shared = album_passphrase is not None and album_passphrase != ""  # Si tiene passphrase, es compartido
 
-                except Exception as e:
-                    LOGGER.error(f"Album Pull Error: '{album_name}' - {e}")
-                    SHARED_DATA.counters['total_pull_failed_albums'] += 1
+        # Descargar todos los assets de este álbum
+        try:
+            if not is_shared:
+                album_kwargs = {
+                    "album_id": album_id,
+                    "album_name": album_name,
+                    "log_level": logging.ERROR,
+                }
+                if isinstance(source_client, ClassSynologyPhotos):
+                    album_kwargs["album_scope"] = album_scope
+                    album_kwargs["album_expected_count"] = album.get("item_count")
+                album_assets = source_client.get_all_assets_from_album(**album_kwargs)
+            else:
+                if not _is_blocked_synology_shared_album(source_client, album):
+                    album_shared_kwargs = {
+                        "album_id": album_id,
+                        "album_name": album_name,
+                        "album_passphrase": album_passphrase,
+                        "log_level": logging.ERROR,
+                    }
+                    if isinstance(source_client, ClassSynologyPhotos):
+                        album_shared_kwargs["album_scope"] = album_scope
+                        album_shared_kwargs["album_expected_count"] = album.get("item_count")
+                    album_assets = source_client.get_all_assets_from_album_shared(**album_shared_kwargs)
+            if not album_assets:
+                # SHARED_DATA.counters['total_pull_failed_albums'] += 1     # If we uncomment this line, it will count as failed Empties albums
+                return
+        except Exception as e:
+            LOGGER.error(f"Error Retrieving All Assets from album {album_name} - {e} \n{traceback.format_exc()}")
+            SHARED_DATA.counters['total_pull_failed_albums'] += 1
+            return
+        _record_enumerated_assets(album_assets)
+
+        album_source_asset_keys = {
+            _normalized_asset_path_key(item.get('id'))
+            for item in album_assets
+            if isinstance(item, dict)
+            and item.get('type') not in ['metadata', 'sidecar']
+            and _normalized_asset_path_key(item.get('id'))
+        }
+        album_live_pair_stems = _live_photo_pair_stems(album_assets)
+
+        # Crear carpeta del álbum dentro de temp_folder, y bloquea su eliminación hasta que terminen las descargas del album
+        album_folder = _get_album_staging_folder(album_name)
+        os.makedirs(album_folder, exist_ok=True)
+        # Crear archivo `.active` para marcar que la carpeta está en uso
+        active_file = os.path.join(album_folder, ".active")
+        with open(active_file, 'w') as lock_album_folder:
+            lock_album_folder.write("Pulling Album")
+        try:
+            _ensure_album_stats_entry(album_stats_by_name_ref, album_stats_lock_ref, album_name)
+            for asset in album_assets:
+                asset_perf_started = time.perf_counter()
+                asset_id = asset['id']
+                asset_type = asset['type']
+                asset_datetime = asset.get('asset_datetime') or asset.get('time')
+                asset_filename = asset.get('filename')
+
+                if _is_source_live_companion_consumed(asset_id):
+                    LOGGER.info(_format_live_companion_consumed_log(asset_id, album_name=album_name))
                     continue
-                finally:
-                    # Eliminar archivo .active después de la descarga
-                    if os.path.exists(active_file):
-                        os.remove(active_file)
 
-                # Incrementamos contador de álbumes descargados
-                SHARED_DATA.counters['total_pulled_albums'] += 1
-                if defer_album_association_until_album_end:
-                    album_assoc_queue.put({
-                        "album_name": album_name,
-                        "_album_done": True,
-                    })
-                LOGGER.info(f"Album Pulled    : '{album_name}'")
-                _maybe_finalize_album(
-                    album_name=album_name,
-                    processed_albums=processed_albums,
-                    processed_albums_lock=processed_albums_lock,
-                    worker_id=0,
-                    logger=LOGGER,
-                    log_level=log_level,
-                )
+                # Skip pull metadata and sidecar for the time being
+                if asset_type in ['metadata', 'sidecar']:
+                    continue
 
-            # 1.2) Descarga de assets sin álbum
-            assets_no_album = []
-            try:
-                assets_no_album = source_client.get_all_assets_without_albums(log_level=logging.ERROR)
-            except Exception as e:
-                LOGGER.error(f"Error Retrieving All Assets without Albums - {e} \n{traceback.format_exc()}")
+                # Another listing of this album may already have handed the asset to a puller.
+                if not pull_claims.claim(album_name, asset_id):
+                    _record_claimed_pull_duplicate(asset_filename, asset_type, album_name, album_stats_by_name_ref, album_stats_lock_ref)
+                    continue
 
-            no_album_source_asset_keys = {
-                _normalized_asset_path_key(item.get('id'))
-                for item in assets_no_album
-                if isinstance(item, dict)
-                and item.get('type') not in ['metadata', 'sidecar']
-                and _normalized_asset_path_key(item.get('id'))
-            }
+                if resume_migration and migration_journal is not None and migration_journal.is_completed(album_name, asset_id):
+                    _record_claimed_pull_duplicate(asset_filename, asset_type, album_name, album_stats_by_name_ref, album_stats_lock_ref, resumed=True)
+                    continue
 
-            # Crear carpeta temp_folder si no existe, y bloquea su eliminación hasta que terminen las descargas
-            os.makedirs(push_queue_folder, exist_ok=True)
-            # Crear archivo `.active` para marcar que la carpeta está en uso
-            active_file = os.path.join(push_queue_folder, ".active")
-            with open(active_file, 'w') as lock_temp_folder:
-                lock_temp_folder.write("Pulling Asset")
-            try:
-                pulled_assets = 0
-                for asset in assets_no_album:
-                    asset_perf_started = time.perf_counter()
-                    asset_id = asset['id']
-                    asset_type = asset['type']
-                    asset_datetime = asset.get('asset_datetime') or asset.get('time')
-                    asset_filename = asset.get('filename')
-                    lock_file = None
-
-                    if _is_source_live_companion_consumed(asset_id):
-                        LOGGER.info(_format_live_companion_consumed_log(asset_id))
-                        continue
+                source_photo_path = _find_local_source_live_photo_companion(asset_id)
+                if (
+                    source_photo_path
+                    and _normalized_asset_path_key(source_photo_path) in album_source_asset_keys
+                ):
+                    # The photo stages and uploads this physical MOV in the same
+                    # push_live_photo operation, irrespective of source traversal order.
+                    continue
 
-                    # Skip pull metadata and sidecar for the time being
-                    if asset_type in ['metadata', 'sidecar']:
-                        continue
+                preflight_target_asset_id = _find_preflight_target_asset_id(asset)
+                if preflight_target_asset_id and _associate_existing_target_asset_to_album(album_name, preflight_target_asset_id, album_is_shared=is_shared):
+                    _record_claimed_pull_duplicate(asset_filename, asset_type, album_name, album_stats_by_name_ref, album_stats_lock_ref, preflight=True)
+                    _journal_target_asset_migrated(album_name, asset_id, preflight_target_asset_id)
+                    continue
 
-                    source_photo_path = _find_local_source_live_photo_companion(asset_id)
-                    if (
-                        source_photo_path
-                        and _normalized_asset_path_key(source_photo_path) in no_album_source_asset_keys
-                    ):
-                        # The matching photo uploads this MOV through push_live_photo.
-                        continue
+                if _stream_transfer_asset(
+                    asset,
+                    album_name=album_name,
+                    album_is_shared=is_shared,
+                    album_passphrase=album_passphrase,
+                    album_id=album_id if isinstance(source_client, ClassSynologyPhotos) else None,
+                    album_scope=album_scope,
+                    live_pair_stems=album_live_pair_stems,
+                    album_stats_by_name_ref=album_stats_by_name_ref,
+                    album_stats_lock_ref=album_stats_lock_ref,
+                ):
+                    continue
 
-                    try:
-                        source_live_companion_path = None
-                        staged_live_companion_path = None
-                        download_folder = push_queue_folder
-                        staged_filename = asset_filename
-                        if isinstance(source_client, ClassLocalPhotosFolder):
-                            relative_path = _build_automatic_migration_relative_asset_path(
-                                source_client, asset_id, asset_filename,
-                            )
-                            download_folder = os.path.join(push_queue_folder, str(relative_path.parent))
-                            staged_filename = relative_path.name
-                        local_file_path = os.path.join(download_folder, staged_filename)
-                        os.makedirs(download_folder, exist_ok=True)
-
-                        # Archivo de bloqueo temporal para que el pusher no borre el fichero mientras que el puller lo está creando
-                        lock_file = local_file_path + ".lock"
-                        # Crear archivo de bloqueo antes de la descarga
-                        with open(lock_file, 'w') as lock:
-                            lock.write("Pulling")
-                        # Descargar directamente en temp_folder
-                        pull_started_at = time.perf_counter()
-                        if isinstance(source_client, ClassLocalPhotosFolder):
-                            staged_path = _stage_local_asset_for_automatic_migration(
-                                source_client=source_client,
-                                source_asset_id=asset_id,
-                                asset_filename=asset_filename,
-                                asset_time=asset_datetime,
-                                queue_root=push_queue_folder,
-                                move_assets=bool(ARGS.get('move-assets', False)),
-                            )
-                            pulled_assets = [staged_path]
-                            local_file_path = staged_path
-                            download_folder = os.path.dirname(staged_path)
-                            staged_filename = os.path.basename(staged_path)
-                            (
-                                source_live_companion_path,
-                                staged_live_companion_path,
-                            ) = _stage_local_live_photo_companion(
-                                source_asset_id=asset_id,
-                                asset_datetime=asset_datetime,
-                                source_asset_keys=no_album_source_asset_keys,
+                # Stage every pending upload under Push_Queue. Local-folder
+                # sources retain their full path relative to the source root.
+                download_folder = album_folder
+                staged_filename = asset_filename
+                if isinstance(source_client, ClassLocalPhotosFolder):
+                    relative_path = _build_automatic_migration_relative_asset_path(
+                        source_client, asset_id, asset_filename, album_name,
+                    )
+                    download_folder = os.path.join(push_queue_folder, str(relative_path.parent))
+                    staged_filename = relative_path.name
+                local_file_path = os.path.join(download_folder, staged_filename)
+                os.makedirs(download_folder, exist_ok=True)
+
+                staging_budget_reserved = False
+                # Archivo de bloqueo temporal para que el pusher no borre el fichero mientras que el puller lo está creando
+                lock_file = local_file_path + ".lock"
+                # Descargar el asset (tolerante por-asset para no abortar todo el álbum).
+                skipped_not_found = False
+                pull_failure_reason = "pull did not return content"
+                try:
+                    # Block while the staged-but-not-pushed files exceed the staging budget.
+                    _acquire_staging_budget()
+                    staging_budget_reserved = True
+                    # Crear archivo de bloqueo antes de la descarga
+                    with open(lock_file, 'w') as lock:
+                        lock.write("Pulling Asset")
+                    pull_started_at = time.perf_counter()
+                    source_live_companion_path = None
+                    staged_live_companion_path = None
+                    if not isinstance(source_client, ClassLocalPhotosFolder):
+                        pull_kwargs = {
+                            "asset_id": asset_id,
+                            "asset_filename": staged_filename,
+                            "asset_time": asset_datetime,
+                            "download_folder": download_folder,
+                            "album_passphrase": album_passphrase if is_shared else None,
+                            "log_level": logging.ERROR,
+                        }
+                        if isinstance(source_client, ClassSynologyPhotos):
+                            pull_kwargs["album_id"] = album_id
+                            pull_kwargs["album_scope"] = album_scope
+                    if isinstance(source_client, ClassLocalPhotosFolder):
+                        staged_path = _stage_local_asset_for_automatic_migration(
+                            source_client=source_client,
+                            source_asset_id=asset_id,
+                            asset_filename=asset_filename,
+                            asset_time=asset_datetime,
+                            queue_root=push_queue_folder,
+                            move_assets=bool(ARGS.get('move-assets', False)),
+                            on_staged=_record_local_staging_method,
+                        )
+                        pulled_assets = [staged_path]
+                        local_file_path = staged_path
+                        download_folder = os.path.dirname(staged_path)
+                        staged_filename = os.path.basename(staged_path)
+                        (
+                            source_live_companion_path,
+                            staged_live_companion_path,
+                        ) = _stage_local_live_photo_companion(
+                            source_asset_id=asset_id,
+                            asset_datetime=asset_datetime,
+                            source_asset_keys=album_source_asset_keys,
+                        )
+                        if source_live_companion_path:
+                            _remember_live_companion_context(
+                                companion_path=source_live_companion_path,
+                                primary_path=asset_id,
+                                album_name=album_name,
                             )
-                            if source_live_companion_path:
-                                _remember_live_companion_context(
-                                    companion_path=source_live_companion_path,
-                                    primary_path=asset_id,
-                                    album_name=None,
+                    else:
+                        pulled_assets = source_client.pull_asset(**pull_kwargs)
+                except Exception as e:
+                    if _is_nextcloud_photo_not_found_error(e):
+                        skipped_not_found = True
+                        LOGGER.warning(
+                            f"Asset Pull Skip : '{os.path.basename(asset_filename)}' from Album '{album_name}' - "
+                            f"Photo not found for user"
+                        )
+                    else:
+                        LOGGER.error(
+                            f"Asset Pull Error: '{os.path.basename(asset_filename)}' from Album '{album_name}' - {e}"
+                        )
+                    pull_failure_reason = str(e)
+                    pulled_assets = 0
+                finally:
+                    # Eliminar archivo de bloqueo después de la descarga
+                    if os.path.exists(lock_file):
+                        os.remove(lock_file)
+
+                # Actualizamos Contadores de descargas
+                if _pull_has_content(pulled_assets):
+                    is_local_source = isinstance(source_client, ClassLocalPhotosFolder)
+                    pulled_file_paths = collect_pulled_asset_paths(
+                        download_folder,
+                        staged_filename,
+                        discover_live_companions=not is_local_source,
+                    )
+                    if not pulled_file_paths:
+                        pulled_file_paths = [local_file_path]
+                    collect_finished_at = time.perf_counter()
+
+                    immich_live_companion = (
+                        staged_live_companion_path
+                        if is_local_source
+                        else find_immich_live_video_companion(local_file_path, pulled_file_paths)
+                    )
+                    journal_variants = 0
+                    for idx, pulled_file_path in enumerate(pulled_file_paths):
+                        if immich_live_companion and path_key(pulled_file_path) == path_key(immich_live_companion):
+                            continue
+                        if _is_live_companion_consumed(pulled_file_path):
+                            LOGGER.info(_format_live_companion_consumed_log(pulled_file_path, album_name=album_name))
+                            if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
+                                safe_remove_local_file(pulled_file_path)
+                            continue
+                        normalized_asset_type = infer_asset_type_from_path(pulled_file_path, asset_type)
+                        include_live_companion = bool(
+                            immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path)
+                        )
+                        asset_stats = _build_physical_transfer_stats(
+                            normalized_asset_type,
+                            include_live_companion=include_live_companion,
+                        )
+                        _increment_album_stat_counter(
+                            album_stats_by_name_ref,
+                            album_stats_lock_ref,
+                            album_name,
+                            "total_assets",
+                            int(asset_stats.get("assets", 1) or 1),
+                        )
+                        count_push_stats = True
+                        LOGGER.info(f"Asset Pulled    : '{os.path.basename(pulled_file_path)}'")
+                        _increment_pull_counters(
+                            SHARED_DATA.counters,
+                            asset_type=normalized_asset_type,
+                            asset_stats=asset_stats,
+                        )
+
+                        # Enviar a la cola con la información necesaria para la subida
+                        asset_dict = {
+                            'asset_id': asset_id,
+                            'asset_file_path': pulled_file_path,
+                            'asset_datetime': asset_datetime,
+                            'asset_type': normalized_asset_type,
+                            'album_name': album_name,
+                            'album_is_shared': is_shared,
+                            'count_push_stats': count_push_stats,
+                            'physical_stats': asset_stats,
+                            'enqueued_at_monotonic': time.perf_counter(),
+                            'source_asset_already_moved': bool(ARGS.get('move-assets', None)) and isinstance(source_client, ClassLocalPhotosFolder),
+                        }
+                        if immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path):
+                            asset_dict['live_photo_video_path'] = immich_live_companion
+                            source_companion_path = source_live_companion_path or _find_local_source_live_video_companion(asset_id)
+                            if source_companion_path:
+                                asset_dict['source_live_photo_video_path'] = source_companion_path
+                                asset_dict['source_live_companion_already_moved'] = bool(
+                                    ARGS.get('move-assets', False) and is_local_source
                                 )
-                        else:
-                            pulled_assets = source_client.pull_asset(asset_id=asset_id, asset_filename=staged_filename, asset_time=asset_datetime, download_folder=download_folder, log_level=logging.ERROR)
-                    except Exception as e:
-                        if _is_nextcloud_photo_not_found_error(e):
-                            LOGGER.warning(
-                                f"Asset Pull Skip : '{os.path.basename(local_file_path)}' - Photo not found for user"
+                            _remember_live_companion_context(
+                                companion_path=immich_live_companion,
+                                primary_path=pulled_file_path,
+                                album_name=album_name,
                             )
-                        else:
-                            LOGGER.error(f"Asset Pull Error: '{os.path.basename(local_file_path)}' - {e}")
-                        _record_pull_failure(
-                            asset_id=asset_id,
-                            asset_filename=asset_filename,
-                            album_name=None,
-                            local_file_path=local_file_path,
-                            reason=str(e),
+                        # añadimos el asset a la cola solo si no se había añadido ya un asset con el mismo 'asset_file_path'
+                        unique = enqueue_unique(
+                            push_queue,
+                            asset_dict,
+                            parallel=parallel,
+                            on_enqueue=lambda: _register_staging_budget(asset_dict),
                         )
+                        if unique:
+                            journal_variants += 1
+                            _journal_live_companion_pulled(album_name, asset_dict)
+                        if unique and asset_dict.get('live_photo_video_path'):
+                            _mark_live_companion_consumed(asset_dict.get('live_photo_video_path'))
+                        if unique and asset_dict.get('source_live_photo_video_path'):
+                            _mark_source_live_companion_consumed(asset_dict.get('source_live_photo_video_path'))
+                        if not unique:
+                            LOGGER.info(f"Asset Duplicated: '{os.path.basename(pulled_file_path)}' from Album '{album_name}'. Skipped")
+                            _increment_push_duplicate_counters(SHARED_DATA.counters, normalized_asset_type, asset_stats)
+                            _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, normalized_asset_type)
+                            _increment_album_stat_counter(
+                                album_stats_by_name_ref,
+                                album_stats_lock_ref,
+                                album_name,
+                                "duplicated_assets",
+                                int(asset_stats.get("assets", 1) or 1),
+                            )
+                            # Solo borramos si el fichero ya no está reservado por la cola ni por un pusher en curso.
+                            if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
+                                safe_remove_local_file(pulled_file_path)
+                            companion_to_cleanup = asset_dict.get('live_photo_video_path')
+                            if companion_to_cleanup and os.path.exists(companion_to_cleanup):
+                                companion_lock = companion_to_cleanup + ".lock"
+                                if (not is_asset_reserved(companion_to_cleanup)) and (not os.path.exists(companion_lock)):
+                                    safe_remove_local_file(companion_to_cleanup)
+                    staging_budget.commit()
+                    if migration_journal is not None and journal_variants:
+                        migration_journal.record_pulled(album_name, asset_id, variants=journal_variants)
+                    migration_metrics.observe_stage(
+                        "pull",
+                        (collect_finished_at - pull_started_at) * 1000.0,
+                        size_bytes=_local_files_size(pulled_file_paths),
+                    )
+                    _debug_perf_log(
+                        LOGGER,
+                        "automatic_migration.pull.album_asset",
+                        asset_perf_started,
+                        worker="puller",
+                        album=album_name,
+                        asset=os.path.basename(local_file_path),
+                        asset_id=asset_id,
+                        pulled_variants=len(pulled_file_paths),
+                        pull_ms=f"{(collect_finished_at - pull_started_at) * 1000.0:.2f}",
+                    )
+                else:
+                    if staging_budget_reserved:
+                        staging_budget.commit()
+                    _record_pull_failure(
+                        asset_id=asset_id,
+                        asset_filename=asset_filename,
+                        album_name=album_name,
+                        local_file_path=local_file_path,
+                        reason=pull_failure_reason,
+                    )
+                    if skipped_not_found:
                         SHARED_DATA.counters['total_pull_failed_assets'] += 1
+                        _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "failed_assets", 1)
                         if asset_type.lower() in video_labels:
                             SHARED_DATA.counters['total_pull_failed_videos'] += 1
                         else:
                             SHARED_DATA.counters['total_pull_failed_photos'] += 1
                         continue
-                    finally:
-                        if lock_file and os.path.exists(lock_file):
-                            safe_remove_local_file(lock_file)
-
-                    # Si se ha hecho correctamente el pull del asset, actualizamos contadores y enviamos el asset a la cola de push
-                    if _pull_has_content(pulled_assets):
-                        is_local_source = isinstance(source_client, ClassLocalPhotosFolder)
-                        pulled_file_paths = collect_pulled_asset_paths(
-                            download_folder,
-                            staged_filename,
-                            discover_live_companions=not is_local_source,
-                        )
-                        if not pulled_file_paths:
-                            pulled_file_paths = [local_file_path]
-                        collect_finished_at = time.perf_counter()
-
-                        immich_live_companion = (
-                            staged_live_companion_path
-                            if is_local_source
-                            else find_immich_live_video_companion(local_file_path, pulled_file_paths)
+                    LOGGER.warning(f"Asset Pull Fail : '{os.path.basename(local_file_path)}' from Album '{album_name}'")
+                    SHARED_DATA.counters['total_pull_failed_assets'] += 1
+                    _increment_album_stat_counter(album_stats_by_name_ref, album_stats_lock_ref, album_name, "failed_assets", 1)
+                    if asset_type.lower() in video_labels:
+                        SHARED_DATA.counters['total_pull_failed_videos'] += 1
+                    else:
+                        SHARED_DATA.counters['total_pull_failed_photos'] += 1
+
+        except Exception as e:
+            LOGGER.error(f"Album Pull Error: '{album_name}' - {e}")
+            SHARED_DATA.counters['total_pull_failed_albums'] += 1
+            return
+        finally:
+            # Eliminar archivo .active después de la descarga
+            if os.path.exists(active_file):
+                os.remove(active_file)
+
+        # Incrementamos contador de álbumes descargados
+        SHARED_DATA.counters['total_pulled_albums'] += 1
+        if defer_album_association_until_album_end:
+            album_assoc_queue.put({
+                "album_name": album_name,
+                "_album_done": True,
+            })
+        LOGGER.info(f"Album Pulled    : '{album_name}'")
+        _maybe_finalize_album(
+            album_name=album_name,
+            processed_albums=processed_albums,
+            processed_albums_lock=processed_albums_lock,
+            worker_id=0,
+            logger=LOGGER,
+            log_level=log_level,
+        )
+
+    def _pull_no_album_asset(asset, no_album_source_asset_keys, parallel=None, live_pair_stems=None):
+        """Pull one source asset without album into the Push_Queue root and enqueue it for push."""
+        asset_perf_started = time.perf_counter()
+        asset_id = asset['id']
+        asset_type = asset['type']
+        asset_datetime = asset.get('asset_datetime') or asset.get('time')
+        asset_filename = asset.get('filename')
+        lock_file = None
+        local_file_path = str(asset_filename or "")
+
+        if _is_source_live_companion_consumed(asset_id):
+            LOGGER.info(_format_live_companion_consumed_log(asset_id))
+            return
+
+        # Skip pull metadata and sidecar for the time being
+        if asset_type in ['metadata', 'sidecar']:
+            return
+
+        if not pull_claims.claim(None, asset_id):
+            _record_claimed_pull_duplicate(asset_filename, asset_type)
+            return
+
+        if resume_migration and migration_journal is not None and migration_journal.is_completed(None, asset_id):
+            _record_claimed_pull_duplicate(asset_filename, asset_type, resumed=True)
+            return
+
+        source_photo_path = _find_local_source_live_photo_companion(asset_id)
+        if (
+            source_photo_path
+            and _normalized_asset_path_key(source_photo_path) in no_album_source_asset_keys
+        ):
+            # The matching photo uploads this MOV through push_live_photo.
+            return
+
+        preflight_target_asset_id = _find_preflight_target_asset_id(asset)
+        if preflight_target_asset_id:
+            _record_claimed_pull_duplicate(asset_filename, asset_type, preflight=True)
+            _journal_target_asset_migrated(None, asset_id, preflight_target_asset_id)
+            return
+
+        if _stream_transfer_asset(asset, live_pair_stems=live_pair_stems):
+            return
+
+        # Block while the staged-but-not-pushed files exceed the staging budget.
+        _acquire_staging_budget()
+        try:
+            source_live_companion_path = None
+            staged_live_companion_path = None
+            download_folder = push_queue_folder
+            staged_filename = asset_filename
+            if isinstance(source_client, ClassLocalPhotosFolder):
+                relative_path = _build_automatic_migration_relative_asset_path(
+                    source_client, asset_id, asset_filename,
+                )
+                download_folder = os.path.join(push_queue_folder, str(relative_path.parent))
+                staged_filename = relative_path.name
+            local_file_path = os.path.join(download_folder, staged_filename)
+            os.makedirs(download_folder, exist_ok=True)
+
+            # Archivo de bloqueo temporal para que el pusher no borre el fichero mientras que el puller lo está creando
+            lock_file = local_file_path + ".lock"
+            # Crear archivo de bloqueo antes de la descarga
+            with open(lock_file, 'w') as lock:
+                lock.write("Pulling")
+            # Descargar directamente en temp_folder
+            pull_started_at = time.perf_counter()
+            if isinstance(source_client, ClassLocalPhotosFolder):
+                staged_path = _stage_local_asset_for_automatic_migration(
+                    source_client=source_client,
+                    source_asset_id=asset_id,
+                    asset_filename=asset_filename,
+                    asset_time=asset_datetime,
+                    queue_root=push_queue_folder,
+                    move_assets=bool(ARGS.get('move-assets', False)),
+                    on_staged=_record_local_staging_method,
+                )
+                pulled_assets = [staged_path]
+                local_file_path = staged_path
+                download_folder = os.path.dirname(staged_path)
+                staged_filename = os.path.basename(staged_path)
+                (
+                    source_live_companion_path,
+                    staged_live_companion_path,
+                ) = _stage_local_live_photo_companion(
+                    source_asset_id=asset_id,
+                    asset_datetime=asset_datetime,
+                    source_asset_keys=no_album_source_asset_keys,
+                )
+                if source_live_companion_path:
+                    _remember_live_companion_context(
+                        companion_path=source_live_companion_path,
+                        primary_path=asset_id,
+                        album_name=None,
+                    )
+            else:
+                pulled_assets = source_client.pull_asset(asset_id=asset_id, asset_filename=staged_filename, asset_time=asset_datetime, download_folder=download_folder, log_level=logging.ERROR)
+        except Exception as e:
+            if _is_nextcloud_photo_not_found_error(e):
+                LOGGER.warning(
+                    f"Asset Pull Skip : '{os.path.basename(local_file_path)}' - Photo not found for user"
+                )
+            else:
+                LOGGER.error(f"Asset Pull Error: '{os.path.basename(local_file_path)}' - {e}")
+            staging_budget.commit()
+            _record_pull_failure(
+                asset_id=asset_id,
+                asset_filename=asset_filename,
+                album_name=None,
+                local_file_path=local_file_path,
+                reason=str(e),
+            )
+            SHARED_DATA.counters['total_pull_failed_assets'] += 1
+            if asset_type.lower() in video_labels:
+                SHARED_DATA.counters['total_pull_failed_videos'] += 1
+            else:
+                SHARED_DATA.counters['total_pull_failed_photos'] += 1
+            return
+        finally:
+            if lock_file and os.path.exists(lock_file):
+                safe_remove_local_file(lock_file)
+
+        # Si se ha hecho correctamente el pull del asset, actualizamos contadores y enviamos el asset a la cola de push
+        if _pull_has_content(pulled_assets):
+            is_local_source = isinstance(source_client, ClassLocalPhotosFolder)
+            pulled_file_paths = collect_pulled_asset_paths(
+                download_folder,
+                staged_filename,
+                discover_live_companions=not is_local_source,
+            )
+            if not pulled_file_paths:
+                pulled_file_paths = [local_file_path]
+            collect_finished_at = time.perf_counter()
+
+            immich_live_companion = (
+                staged_live_companion_path
+                if is_local_source
+                else find_immich_live_video_companion(local_file_path, pulled_file_paths)
+            )
+            journal_variants = 0
+            for idx, pulled_file_path in enumerate(pulled_file_paths):
+                if immich_live_companion and path_key(pulled_file_path) == path_key(immich_live_companion):
+                    continue
+                if _is_live_companion_consumed(pulled_file_path):
+                    LOGGER.info(_format_live_companion_consumed_log(pulled_file_path))
+                    if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
+                        safe_remove_local_file(pulled_file_path)
+                    continue
+                normalized_asset_type = infer_asset_type_from_path(pulled_file_path, asset_type)
+                include_live_companion = bool(
+                    immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path)
+                )
+                asset_stats = _build_physical_transfer_stats(
+                    normalized_asset_type,
+                    include_live_companion=include_live_companion,
+                )
+                count_push_stats = True
+                # Actualizamos Contadores de descargas
+                LOGGER.info(f"Asset Pulled    : '{os.path.basename(pulled_file_path)}'")
+                _increment_pull_counters(
+                    SHARED_DATA.counters,
+                    asset_type=normalized_asset_type,
+                    asset_stats=asset_stats,
+                )
+
+                # Enviar a la cola de push con la información necesaria para la subida (sin album_name)
+                asset_dict = {
+                    'asset_id': asset_id,
+                    'asset_file_path': pulled_file_path,
+                    'asset_datetime': asset_datetime,
+                    'asset_type': normalized_asset_type,
+                    'album_name': None,
+                    'count_push_stats': count_push_stats,
+                    'physical_stats': asset_stats,
+                    'enqueued_at_monotonic': time.perf_counter(),
+                    'source_asset_already_moved': bool(ARGS.get('move-assets', None)) and isinstance(source_client, ClassLocalPhotosFolder),
+                }
+                if immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path):
+                    asset_dict['live_photo_video_path'] = immich_live_companion
+                    source_companion_path = source_live_companion_path or _find_local_source_live_video_companion(asset_id)
+                    if source_companion_path:
+                        asset_dict['source_live_photo_video_path'] = source_companion_path
+                        asset_dict['source_live_companion_already_moved'] = bool(
+                            ARGS.get('move-assets', False) and is_local_source
                         )
-                        for idx, pulled_file_path in enumerate(pulled_file_paths):
-                            if immich_live_companion and path_key(pulled_file_path) == path_key(immich_live_companion):
-                                continue
-                            if _is_live_companion_consumed(pulled_file_path):
-                                LOGGER.info(_format_live_companion_consumed_log(pulled_file_path))
-                                if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
-                                    safe_remove_local_file(pulled_file_path)
-                                continue
-                            normalized_asset_type = infer_asset_type_from_path(pulled_file_path, asset_type)
-                            include_live_companion = bool(
-                                immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path)
-                            )
-                            asset_stats = _build_physical_transfer_stats(
-                                normalized_asset_type,
-                                include_live_companion=include_live_companion,
-                            )
-                            count_push_stats = True
-                            # Actualizamos Contadores de descargas
-                            LOGGER.info(f"Asset Pulled    : '{os.path.basename(pulled_file_path)}'")
-                            _increment_pull_counters(
-                                SHARED_DATA.counters,
-                                asset_type=normalized_asset_type,
-                                asset_stats=asset_stats,
+                    _remember_live_companion_context(
+                        companion_path=immich_live_companion,
+                        primary_path=pulled_file_path,
+                        album_name=None,
+                    )
+                unique = enqueue_unique(
+                    push_queue,
+                    asset_dict,
+                    parallel=parallel,
+                    on_enqueue=lambda: _register_staging_budget(asset_dict),
+                )
+                if unique:
+                    journal_variants += 1
+                    _journal_live_companion_pulled(None, asset_dict)
+                if unique and asset_dict.get('live_photo_video_path'):
+                    _mark_live_companion_consumed(asset_dict.get('live_photo_video_path'))
+                if unique and asset_dict.get('source_live_photo_video_path'):
+                    _mark_source_live_companion_consumed(asset_dict.get('source_live_photo_video_path'))
+                if not unique:
+                    LOGGER.info(f"Asset Duplicated: '{os.path.basename(pulled_file_path)}'. Skipped")
+                    _increment_push_duplicate_counters(SHARED_DATA.counters, normalized_asset_type, asset_stats)
+                    _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, normalized_asset_type)
+                    # Solo borramos si el fichero ya no está reservado por la cola ni por un pusher en curso.
+                    if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
+                        safe_remove_local_file(pulled_file_path)
+                    companion_to_cleanup = asset_dict.get('live_photo_video_path')
+                    if companion_to_cleanup and os.path.exists(companion_to_cleanup):
+                        companion_lock = companion_to_cleanup + ".lock"
+                        if (not is_asset_reserved(companion_to_cleanup)) and (not os.path.exists(companion_lock)):
+                            safe_remove_local_file(companion_to_cleanup)
+            staging_budget.commit()
+            if migration_journal is not None and journal_variants:
+                migration_journal.record_pulled(None, asset_id, variants=journal_variants)
+            migration_metrics.observe_stage(
+                "pull",
+                (collect_finished_at - pull_started_at) * 1000.0,
+                size_bytes=_local_files_size(pulled_file_paths),
+            )
+            _debug_perf_log(
+                LOGGER,
+                "automatic_migration.pull.no_album_asset",
+                asset_perf_started,
+                worker="puller",
+                album="-",
+                asset=os.path.basename(local_file_path),
+                asset_id=asset_id,
+                pulled_variants=len(pulled_file_paths),
+                pull_ms=f"{(collect_finished_at - pull_started_at) * 1000.0:.2f}",
+            )
+        else:
+            staging_budget.commit()
+            LOGGER.warning(f"Asset Pull Fail : '{os.path.basename(local_file_path)}'")
+            _record_pull_failure(
+                asset_id=asset_id,
+                asset_filename=asset_filename,
+                album_name=None,
+                local_file_path=local_file_path,
+                reason="pull did not return content",
+            )
+            SHARED_DATA.counters['total_pull_failed_assets'] += 1
+            if asset_type.lower() in video_labels:
+                SHARED_DATA.counters['total_pull_failed_videos'] += 1
+            else:
+                SHARED_DATA.counters['total_pull_failed_photos'] += 1
+
+    def _record_enumerated_assets(assets):
+        """Add the assets just listed by a puller to the dashboard totals (incremental source listing only)."""
+        if not incremental_source_listing or not assets:
+            return
+        kind_counts = Counter()
+        for asset in assets:
+            asset_type = str((asset or {}).get('type') or "").lower()
+            if asset_type in image_labels:
+                kind_counts['total_photos'] += 1
+            elif asset_type in video_labels:
+                kind_counts['total_videos'] += 1
+            elif asset_type in metadata_labels:
+                kind_counts['total_metadata'] += 1
+            elif asset_type in sidecar_labels:
+                kind_counts['total_sidecar'] += 1
+            elif asset_type == 'unknown':
+                kind_counts['total_invalid'] += 1
+        kind_counts['total_assets'] = kind_counts['total_photos'] + kind_counts['total_videos']
+        with enumerated_assets_lock:
+            for key, count in kind_counts.items():
+                SHARED_DATA.info[key] = int(SHARED_DATA.info.get(key, 0) or 0) + count
+
+    def puller_worker(
+        pull_work_queue,
+        worker_id=1,
+        parallel=None,
+        log_level=logging.INFO,
+        album_stats_by_name_ref=album_stats_by_name,
+        album_stats_lock_ref=album_stats_lock,
+        processed_albums=None,
+        processed_albums_lock=None,
+    ):
+        """
+        Consume pull work items until a None sentinel is received.
+
+        Work items are ("albums", [album, ...]) groups sharing one staging folder, or
+        ("asset", asset, no_album_source_asset_keys, live_pair_stems) for assets without album.
+        """
+        with set_log_level(LOGGER, log_level):
+            while True:
+                work_item = pull_work_queue.get()
+                migration_metrics.record_queue_depth("pull", pull_work_queue.qsize())
+                try:
+                    if work_item is None:
+                        break
+                    work_kind = work_item[0]
+                    if work_kind == "albums":
+                        for album in work_item[1]:
+                            _pull_album(
+                                album,
+                                parallel=parallel,
+                                log_level=log_level,
+                                album_stats_by_name_ref=album_stats_by_name_ref,
+                                album_stats_lock_ref=album_stats_lock_ref,
+                                processed_albums=processed_albums,
+                                processed_albums_lock=processed_albums_lock,
                             )
+                    elif work_kind == "asset":
+                        asset, no_album_source_asset_keys, live_pair_stems = work_item[1], work_item[2], work_item[3]
+                        # Same-stem assets share Live Photo companion discovery and staged
+                        # filenames, so only one puller may handle each stem at a time.
+                        with pull_claims.stem_lock(asset.get('filename') or asset.get('id')):
+                            _pull_no_album_asset(asset, no_album_source_asset_keys, parallel=parallel, live_pair_stems=live_pair_stems)
+                except Exception as e:
+                    LOGGER.error(f"Pull Worker {worker_id} Error: {e} \n{traceback.format_exc()}")
+                finally:
+                    pull_work_queue.task_done()
+            LOGGER.debug(f"Pull Worker {worker_id} - Task Finished!")
 
-                            # Enviar a la cola de push con la información necesaria para la subida (sin album_name)
-                            asset_dict = {
-                                'asset_id': asset_id,
-                                'asset_file_path': pulled_file_path,
-                                'asset_datetime': asset_datetime,
-                                'asset_type': normalized_asset_type,
-                                'album_name': None,
-                                'count_push_stats': count_push_stats,
-                                'physical_stats': asset_stats,
-                                'enqueued_at_monotonic': time.perf_counter(),
-                                'source_asset_already_moved': bool(ARGS.get('move-assets', None)) and isinstance(source_client, ClassLocalPhotosFolder),
-                            }
-                            if immich_live_companion and path_key(pulled_file_path) == path_key(local_file_path):
-                                asset_dict['live_photo_video_path'] = immich_live_companion
-                                source_companion_path = source_live_companion_path or _find_local_source_live_video_companion(asset_id)
-                                if source_companion_path:
-                                    asset_dict['source_live_photo_video_path'] = source_companion_path
-                                    asset_dict['source_live_companion_already_moved'] = bool(
-                                        ARGS.get('move-assets', False) and is_local_source
-                                    )
-                                _remember_live_companion_context(
-                                    companion_path=immich_live_companion,
-                                    primary_path=pulled_file_path,
-                                    album_name=None,
-                                )
-                            unique = enqueue_unique(push_queue, asset_dict, parallel=parallel)
-                            if unique and asset_dict.get('live_photo_video_path'):
-                                _mark_live_companion_consumed(asset_dict.get('live_photo_video_path'))
-                            if unique and asset_dict.get('source_live_photo_video_path'):
-                                _mark_source_live_companion_consumed(asset_dict.get('source_live_photo_video_path'))
-                            if not unique:
-                                LOGGER.info(f"Asset Duplicated: '{os.path.basename(pulled_file_path)}'. Skipped")
-                                _increment_push_duplicate_counters(SHARED_DATA.counters, normalized_asset_type, asset_stats)
-                                _increment_transfer_counters(SHARED_DATA.counters, 'total_push_queued', asset_stats, normalized_asset_type)
-                                # Solo borramos si el fichero ya no está reservado por la cola ni por un pusher en curso.
-                                if not is_asset_reserved(pulled_file_path) and os.path.exists(pulled_file_path):
-                                    safe_remove_local_file(pulled_file_path)
-                                companion_to_cleanup = asset_dict.get('live_photo_video_path')
-                                if companion_to_cleanup and os.path.exists(companion_to_cleanup):
-                                    companion_lock = companion_to_cleanup + ".lock"
-                                    if (not is_asset_reserved(companion_to_cleanup)) and (not os.path.exists(companion_lock)):
-                                        safe_remove_local_file(companion_to_cleanup)
-                        _debug_perf_log(
-                            LOGGER,
-                            "automatic_migration.pull.no_album_asset",
-                            asset_perf_started,
-                            worker="puller",
-                            album="-",
-                            asset=os.path.basename(local_file_path),
-                            asset_id=asset_id,
-                            pulled_variants=len(pulled_file_paths),
-                            pull_ms=f"{(collect_finished_at - pull_started_at) * 1000.0:.2f}",
-                        )
-                    else:
-                        LOGGER.warning(f"Asset Pull Fail : '{os.path.basename(local_file_path)}'")
-                        _record_pull_failure(
-                            asset_id=asset_id,
-                            asset_filename=asset_filename,
-                            album_name=None,
-                            local_file_path=local_file_path,
-                            reason="pull did not return content",
-                        )
-                        SHARED_DATA.counters['total_pull_failed_assets'] += 1
-                        if asset_type.lower() in video_labels:
-                            SHARED_DATA.counters['total_pull_failed_videos'] += 1
-                        else:
-                            SHARED_DATA.counters['total_pull_failed_photos'] += 1
+    def _run_pull_workers(work_items, num_workers, parallel=None, log_level=logging.INFO, processed_albums=None, processed_albums_lock=None):
+        """
+        Distribute pull work items across num_workers pullers and wait for all of them.
+
+        work_items may be a generator: the workers start first and pull each item as soon
+        as it is produced, so a paged source listing overlaps with the transfers.
+        """
+        pull_work_queue = Queue()
+        workers = [
+            threading.Thread(
+                target=puller_worker,
+                kwargs={
+                    "pull_work_queue": pull_work_queue,
+                    "worker_id": worker_id + 1,
+                    "parallel": parallel,
+                    "log_level": log_level,
+                    "processed_albums": processed_albums,
+                    "processed_albums_lock": processed_albums_lock,
+                },
+                daemon=True,
+            )
+            for worker_id in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for work_item in work_items:
+                pull_work_queue.put(work_item)
+        finally:
+            for _ in range(num_workers):
+                pull_work_queue.put(None)
+            for worker in workers:
+                worker.join()
+
+    def pull_coordinator(num_pull_workers=1, parallel=None, log_level=logging.INFO, processed_albums=None, processed_albums_lock=None):
+        """
+        List the source once and shard the pull stage across num_pull_workers workers.
+
+        Albums sharing a name are handed to a single worker because they share a staging
+        folder. Assets without album are only pulled after every album finished, so album
+        symlinks are staged before a move-assets run relocates their targets.
+        """
+        with_filters = bool(has_any_filter())
+
+        with set_log_level(LOGGER, log_level):
+
+            # 1.1) Descarga de álbumes
+            albums = []
+            try:
+                albums = source_client.get_albums_including_shared_with_user(filter_assets=with_filters, log_level=logging.ERROR)
+            except Exception as e:
+                LOGGER.error(f"Error Retrieving All Albums - {e} \n{traceback.format_exc()}")
+                LOGGER.info(f"Albums Assets Skipped")
+
+            _run_pull_workers(
+                work_items=[("albums", album_group) for album_group in _group_albums_for_pull_workers(albums)],
+                num_workers=num_pull_workers,
+                parallel=parallel,
+                log_level=log_level,
+                processed_albums=processed_albums,
+                processed_albums_lock=processed_albums_lock,
+            )
+
+            # 1.2) Descarga de assets sin álbum
+            if incremental_source_listing:
+                # Pages are pulled while the next ones are still being listed.
+                assets_no_album_pages = source_client.iter_all_assets_without_albums_pages(log_level=logging.ERROR)
+            else:
+                assets_no_album = []
+                try:
+                    assets_no_album = source_client.get_all_assets_without_albums(log_level=logging.ERROR)
+                except Exception as e:
+                    LOGGER.error(f"Error Retrieving All Assets without Albums - {e} \n{traceback.format_exc()}")
+                assets_no_album_pages = [assets_no_album]
+
+            def _iter_no_album_work_items():
+                for page, context_assets in _iter_pages_with_neighbour_context(assets_no_album_pages):
+                    _record_enumerated_assets(page)
+                    no_album_source_asset_keys = {
+                        _normalized_asset_path_key(item.get('id'))
+                        for item in context_assets
+                        if isinstance(item, dict)
+                        and item.get('type') not in ['metadata', 'sidecar']
+                        and _normalized_asset_path_key(item.get('id'))
+                    }
+                    no_album_live_pair_stems = _live_photo_pair_stems(context_assets)
+                    for asset in page:
+                        yield "asset", asset, no_album_source_asset_keys, no_album_live_pair_stems
+
+            # Crear carpeta temp_folder si no existe, y bloquea su eliminación hasta que terminen las descargas
+            os.makedirs(push_queue_folder, exist_ok=True)
+            # Crear archivo `.active` para marcar que la carpeta está en uso
+            active_file = os.path.join(push_queue_folder, ".active")
+            with open(active_file, 'w') as lock_temp_folder:
+                lock_temp_folder.write("Pulling Asset")
+            try:
+                _run_pull_workers(
+                    work_items=_iter_no_album_work_items(),
+                    num_workers=num_pull_workers,
+                    parallel=parallel,
+                    log_level=log_level,
+                )
+            except Exception as e:
+                LOGGER.error(f"Error Retrieving All Assets without Albums - {e} \n{traceback.format_exc()}")
             finally:
                 # Eliminar archivo .active después de la descarga
                 if os.path.exists(active_file):
                     os.remove(active_file)
 
+            if incremental_source_listing:
+                LOGGER.info(
+                    f"Source Listing Finished: {SHARED_DATA.info.get('total_assets', 0)} assets "
+                    f"(Photos: {SHARED_DATA.info.get('total_photos', 0)}, Videos: {SHARED_DATA.info.get('total_videos', 0)})"
+                )
             LOGGER.info(f"Puller Task Finished!")
 
     # ----------------------------------------------------------------------------
@@ -4960,6 +6125,8 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
             while True:
                 asset = None
                 asset_queue_scope = None
+                # Only push_concurrency.limit pushers take and push assets at the same time.
+                push_concurrency.acquire()
                 try:
                     # Extraemos el siguiente asset de la cola
                     # time.sleep(0.7)  # Esto es por si queremos ralentizar el worker de subidas
@@ -5050,6 +6217,10 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                         if skip_target_push and asset_id:
                             treat_as_consumed = True
                         else:
+                            try:
+                                push_size_bytes = os.path.getsize(asset_file_path)
+                            except OSError:
+                                push_size_bytes = 0
                             push_started_at = time.perf_counter()
                             if isinstance(target_client, ClassImmichPhotos) and live_photo_video_path:
                                 asset_id, isDuplicated = target_client.push_live_photo(
@@ -5067,7 +6238,14 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                             else:
                                 asset_id, isDuplicated = target_client.push_asset(file_path=asset_file_path, log_level=logging.ERROR)
                             push_elapsed_ms = (time.perf_counter() - push_started_at) * 1000.0
+                            push_concurrency.record_push(
+                                latency_ms=push_elapsed_ms,
+                                size_bytes=push_size_bytes,
+                                failed=not asset_id and not isDuplicated,
+                            )
                             queue_wait_ms = max(0.0, (asset_started_at - float(enqueued_at_monotonic)) * 1000.0) if isinstance(enqueued_at_monotonic, (int, float)) else None
+                            migration_metrics.observe_stage("push_queue_wait", queue_wait_ms)
+                            migration_metrics.observe_stage("upload", push_elapsed_ms, size_bytes=push_size_bytes if asset_id else 0)
                             _debug_perf_log_elapsed(
                                 LOGGER,
                                 "automatic_migration.asset.upload",
@@ -5203,6 +6381,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                                     scheduled_retry = _schedule_asset_retry(
                                         asset=asset,
                                         reason="upload did not return a reusable target asset id",
+                                        failure_recorded=True,
                                     )
                                     if not scheduled_retry:
                                         if album_name:
@@ -5223,9 +6402,11 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                         # 1) Restaura el nivel a INFO
                         LOGGER.setLevel(logging.INFO)
 
+                        push_concurrency.record_push(failed=True, throttled=_is_throttling_push_error(e))
                         scheduled_retry = _schedule_asset_retry(
                             asset=asset,
                             reason=f"upload exception: {str(e)}",
+                            failure_recorded=True,
                         )
                         if not scheduled_retry:
                             if album_name:
@@ -5405,6 +6586,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
                         _unmark_asset_path_in_flight(asset.get('live_photo_video_path'))
                     if asset is not None:
                         push_queue.task_done()
+                    push_concurrency.release()
 
             LOGGER.info(f"Pusher {worker_id} - Task Finished!")
 
@@ -5417,7 +6599,7 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
 
     # Preparar la cola que compartiremos entre descargas y subidas
     # push_queue = Queue()
-    class MonitoredPriorityQueue(PriorityQueue):
+    class MonitoredPriorityQueue(_AssetPathIndexMixin, PriorityQueue):
         def put(self, item, *args, **kwargs):
             super().put(item, *args, **kwargs)
             _refresh_queue_depth()
@@ -5465,8 +6647,12 @@ def parallel_automatic_migration(source_client, target_client, temp_folder, SHAR
     # Check if parallel=None, and in that case, get it from ARGS
     if parallel is None: parallel = ARGS['parallel-migration']
 
-    # Llamada al hilo principal
-    main_thread(parallel=parallel, log_level=log_level)
+    # Llamada al hilo principal. The journal is also closed when the migration fails, so --resume can use it.
+    try:
+        main_thread(parallel=parallel, log_level=log_level)
+    finally:
+        if migration_journal is not None:
+            migration_journal.close()
 
 
 ######################
@@ -786,9 +786,13 @@ def start_dashboard(migration_finished, SHARED_DATA, parallel=True, step_name=''
                 for label, counter_label in delayed_pushs.items():
                     value = SHARED_DATA.counters[counter_label]
                     delayed_table.add_row(f"[green]{label:<16}:[/green]", f"[green]{value}[/green]")
+                push_title = f'📤 To: {SHARED_DATA.info.get("target_client_name", "Source Client")}'
+                push_concurrency_max = int(SHARED_DATA.info.get('push_concurrency_max', 0) or 0)
+                if push_concurrency_max:
+                    push_title += f" (🚦 {int(SHARED_DATA.info.get('push_concurrency', 0) or 0)}/{push_concurrency_max} pushers)"
                 return Panel(
                     Group(progress_table, Text(""), Rule(style="green dim"), delayed_table),
-                    title=f'📤 To: {SHARED_DATA.info.get("target_client_name", "Source Client")}',
+                    title=push_title,
                     border_style="green",
                     expand=True,
                 )
@@ -1024,7 +1028,7 @@ def start_dashboard(migration_finished, SHARED_DATA, parallel=True, step_name=''
                 failed_keys = outcome_keys + list(delayed_pushs.values())
                 return (
                     tuple(SHARED_DATA.counters.get(k, 0) for k in completed_keys + failed_keys),
-                    tuple(SHARED_DATA.info.get(k, 0) for k in total_keys),
+                    tuple(SHARED_DATA.info.get(k, 0) for k in total_keys + ["push_concurrency", "push_concurrency_max"]),
                 )
 
             def _sync_terminal_size():
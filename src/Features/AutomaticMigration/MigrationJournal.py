@@ -0,0 +1,180 @@
+"""SQLite-backed journal used to resume interrupted Automatic Migration runs."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+MIGRATION_JOURNAL_FOLDER = "Automatic_Migration_Journal"
+
+MIGRATION_JOURNAL_STATE_PULLED = "pulled"
+MIGRATION_JOURNAL_STATE_PUSHED = "pushed"
+MIGRATION_JOURNAL_STATE_COMPLETED = "completed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal_assets (
+    album_scope TEXT NOT NULL,
+    source_asset_key TEXT NOT NULL,
+    source_asset_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    pulled_variants INTEGER NOT NULL DEFAULT 0,
+    pushed_variants INTEGER NOT NULL DEFAULT 0,
+    target_asset_id TEXT,
+    album_associated INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (album_scope, source_asset_key)
+);
+CREATE TABLE IF NOT EXISTS journal_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def build_migration_journal_path(journal_folder, source, target):
+    """
+    Return the journal file for a source/target pair.
+
+    The name only depends on the source and target given on the command line, so
+    a later run with the same pair (and --resume) finds the journal of the
+    interrupted one.
+    """
+    identity = f"{str(source or '').strip()}\n{str(target or '').strip()}"
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+    return str(Path(journal_folder) / f"migration_journal_{digest}.sqlite")
+
+
+def _journal_asset_key(source_asset_id):
+    normalized = unicodedata.normalize("NFC", str(source_asset_id or "").strip())
+    if not normalized:
+        return ""
+    return os.path.normcase(normalized)
+
+
+class MigrationJournal:
+    """
+    Records the state of each source asset handled by an Automatic Migration run.
+
+    Assets are keyed by (album scope, source asset id), because the same source
+    asset is pulled and pushed once per album that contains it. One source asset
+    may stage several files (e.g. Live Photo companions), so the journal tracks
+    how many variants were enqueued and how many were pushed, and only reports
+    the asset as completed once every enqueued variant has been pushed.
+    """
+
+    def __init__(self, journal_path, resume=False):
+        self.journal_path = str(journal_path)
+        self.resume = bool(resume)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.journal_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if not self.resume:
+            self._conn.execute("DELETE FROM journal_assets")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO journal_meta (key, value) VALUES ('last_started_at', ?)",
+            (str(time.time()),),
+        )
+        self._conn.commit()
+
+    def record_pulled(self, album_name, source_asset_id, variants=1):
+        """Record that `variants` staged files of a source asset were enqueued for push."""
+        key = _journal_asset_key(source_asset_id)
+        if not key:
+            return
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO journal_assets (album_scope, source_asset_key, source_asset_id, state, pulled_variants, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(album_scope, source_asset_key) DO UPDATE SET
+                    pulled_variants = excluded.pulled_variants,
+                    state = CASE
+                        WHEN journal_assets.pushed_variants >= excluded.pulled_variants AND excluded.pulled_variants > 0
+                        THEN ? ELSE journal_assets.state END,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    str(album_name or ""), key, str(source_asset_id), MIGRATION_JOURNAL_STATE_PULLED,
+                    max(0, int(variants or 0)), time.time(), MIGRATION_JOURNAL_STATE_COMPLETED,
+                ),
+            )
+            self._conn.commit()
+
+    def record_pushed(self, album_name, source_asset_id, target_asset_id=None, album_associated=False):
+        """Record one pushed variant of a source asset and its target asset id."""
+        key = _journal_asset_key(source_asset_id)
+        if not key:
+            return
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO journal_assets (
+                    album_scope, source_asset_key, source_asset_id, state, pushed_variants,
+                    target_asset_id, album_associated, updated_at
+                )
+                VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+                ON CONFLICT(album_scope, source_asset_key) DO UPDATE SET
+                    pushed_variants = journal_assets.pushed_variants + 1,
+                    target_asset_id = COALESCE(excluded.target_asset_id, journal_assets.target_asset_id),
+                    album_associated = MAX(journal_assets.album_associated, excluded.album_associated),
+                    state = CASE
+                        WHEN journal_assets.pulled_variants > 0 AND journal_assets.pushed_variants + 1 >= journal_assets.pulled_variants
+                        THEN ? ELSE ? END,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    str(album_name or ""), key, str(source_asset_id), MIGRATION_JOURNAL_STATE_PUSHED,
+                    str(target_asset_id) if target_asset_id else None, 1 if album_associated else 0, time.time(),
+                    MIGRATION_JOURNAL_STATE_COMPLETED, MIGRATION_JOURNAL_STATE_PUSHED,
+                ),
+            )
+            self._conn.commit()
+
+    def get_state(self, album_name, source_asset_id):
+        """Return the journal row of a source asset as a dict, or None when it is unknown."""
+        key = _journal_asset_key(source_asset_id)
+        if not key:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT state, pulled_variants, pushed_variants, target_asset_id, album_associated
+                FROM journal_assets WHERE album_scope = ? AND source_asset_key = ?
+                """,
+                (str(album_name or ""), key),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "state": row[0],
+            "pulled_variants": int(row[1] or 0),
+            "pushed_variants": int(row[2] or 0),
+            "target_asset_id": row[3],
+            "album_associated": bool(row[4]),
+        }
+
+    def is_completed(self, album_name, source_asset_id):
+        """Return True when a previous run already pushed every staged file of the asset."""
+        state = self.get_state(album_name, source_asset_id)
+        return bool(state and state["state"] == MIGRATION_JOURNAL_STATE_COMPLETED)
+
+    def count_completed(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM journal_assets WHERE state = ?",
+                (MIGRATION_JOURNAL_STATE_COMPLETED,),
+            ).fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.commit()
+            finally:
+                self._conn.close()
@@ -0,0 +1,204 @@
+"""Per-stage latency histograms, throughput and queue depths of an Automatic Migration run."""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Upper bounds (ms) of the latency buckets. They are fixed so the memory used by a
+# stage does not grow with the number of assets, and they match the Prometheus
+# histogram exported at the end of the run.
+LATENCY_BUCKETS_MS = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000, 300000, 600000, 1800000,
+)
+QUEUE_DEPTH_SAMPLE_INTERVAL_SECONDS = 1.0
+QUEUE_DEPTH_MAX_SAMPLES = 3600
+
+
+class LatencyHistogram:
+    """Bucketed latency histogram of one stage, with the bytes it moved."""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.bucket_counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.bytes = 0
+
+    def observe(self, elapsed_ms, size_bytes=0):
+        elapsed_ms = max(0.0, float(elapsed_ms))
+        self.bucket_counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.bytes += max(0, int(size_bytes or 0))
+
+    def percentile(self, quantile):
+        """Estimate a percentile (0-1) by interpolating inside the bucket that contains it."""
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if not bucket_count:
+                continue
+            if cumulative + bucket_count >= rank:
+                lower = self.buckets_ms[index - 1] if index > 0 else 0.0
+                upper = self.buckets_ms[index] if index < len(self.buckets_ms) else self.max_ms
+                upper = min(upper, self.max_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (max(upper, lower) - lower) * fraction
+            cumulative += bucket_count
+        return self.max_ms
+
+
+class QueueDepthTracker:
+    """Current, maximum and time-weighted mean depth of one queue, plus a sampled history."""
+
+    def __init__(self, started_at):
+        self.current = 0
+        self.max = 0
+        self._weighted_sum = 0.0
+        self._last_change_at = started_at
+        self._started_at = started_at
+        self._last_sample_at = None
+        self.samples = deque(maxlen=QUEUE_DEPTH_MAX_SAMPLES)
+
+    def update(self, depth, now):
+        depth = max(0, int(depth or 0))
+        self._weighted_sum += self.current * max(0.0, now - self._last_change_at)
+        self._last_change_at = now
+        self.current = depth
+        self.max = max(self.max, depth)
+        if self._last_sample_at is None or now - self._last_sample_at >= QUEUE_DEPTH_SAMPLE_INTERVAL_SECONDS:
+            self.samples.append((round(now - self._started_at, 3), depth))
+            self._last_sample_at = now
+
+    def mean(self, now):
+        elapsed = now - self._started_at
+        if elapsed <= 0:
+            return float(self.current)
+        return (self._weighted_sum + self.current * max(0.0, now - self._last_change_at)) / elapsed
+
+
+class MigrationMetrics:
+    """
+    Thread-safe collector of the per-stage latencies and queue depths of a migration.
+
+    Stages are free-form names (e.g. 'pull', 'upload', 'album_association'). Each
+    observation records how long one asset spent in the stage and, optionally, how
+    many bytes it moved, so the snapshot can report p50/p95/p99 and bytes/sec.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = clock()
+        self._stages = {}
+        self._queues = {}
+
+    def observe_stage(self, stage, elapsed_ms, size_bytes=0):
+        if elapsed_ms is None:
+            return
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = LatencyHistogram()
+            histogram.observe(elapsed_ms, size_bytes=size_bytes)
+
+    def record_queue_depth(self, queue_name, depth):
+        with self._lock:
+            now = self._clock()
+            tracker = self._queues.get(queue_name)
+            if tracker is None:
+                tracker = self._queues[queue_name] = QueueDepthTracker(self._started_at)
+            tracker.update(depth, now)
+
+    def snapshot(self, include_queue_history=False):
+        """Return the metrics as a JSON-serializable dict."""
+        with self._lock:
+            now = self._clock()
+            elapsed_seconds = max(0.0, now - self._started_at)
+            stages = {}
+            for stage, histogram in sorted(self._stages.items()):
+                busy_seconds = histogram.sum_ms / 1000.0
+                stages[stage] = {
+                    "count": histogram.count,
+                    "p50Ms": _round_ms(histogram.percentile(0.50)),
+                    "p95Ms": _round_ms(histogram.percentile(0.95)),
+                    "p99Ms": _round_ms(histogram.percentile(0.99)),
+                    "meanMs": _round_ms(histogram.sum_ms / histogram.count if histogram.count else None),
+                    "maxMs": _round_ms(histogram.max_ms),
+                    "bytes": histogram.bytes,
+                    "bytesPerSecond": round(histogram.bytes / elapsed_seconds, 1) if elapsed_seconds > 0 else 0.0,
+                    "bytesPerBusySecond": round(histogram.bytes / busy_seconds, 1) if busy_seconds > 0 else 0.0,
+                }
+            queues = {}
+            for queue_name, tracker in sorted(self._queues.items()):
+                queues[queue_name] = {
+                    "current": tracker.current,
+                    "max": tracker.max,
+                    "mean": round(tracker.mean(now), 2),
+                }
+                if include_queue_history:
+                    queues[queue_name]["samples"] = [list(sample) for sample in tracker.samples]
+        return {"elapsedSeconds": round(elapsed_seconds, 3), "stages": stages, "queues": queues}
+
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format (node_exporter textfile)."""
+        lines = [
+            "# HELP photomigrator_stage_latency_seconds Time spent by one asset in an Automatic Migration stage.",
+            "# TYPE photomigrator_stage_latency_seconds histogram",
+        ]
+        with self._lock:
+            now = self._clock()
+            for stage, histogram in sorted(self._stages.items()):
+                cumulative = 0
+                for upper_bound, bucket_count in zip(_prometheus_bucket_bounds(histogram), histogram.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f'photomigrator_stage_latency_seconds_bucket{{stage="{stage}",le="{upper_bound}"}} {cumulative}')
+                lines.append(f'photomigrator_stage_latency_seconds_sum{{stage="{stage}"}} {histogram.sum_ms / 1000.0:.6f}')
+                lines.append(f'photomigrator_stage_latency_seconds_count{{stage="{stage}"}} {histogram.count}')
+            lines.append("# HELP photomigrator_stage_bytes_total Bytes moved by an Automatic Migration stage.")
+            lines.append("# TYPE photomigrator_stage_bytes_total counter")
+            for stage, histogram in sorted(self._stages.items()):
+                lines.append(f'photomigrator_stage_bytes_total{{stage="{stage}"}} {histogram.bytes}')
+            for metric, description, attribute in (
+                ("queue_depth", "Current number of items in an Automatic Migration queue.", "current"),
+                ("queue_depth_max", "Maximum number of items seen in an Automatic Migration queue.", "max"),
+            ):
+                lines.append(f"# HELP photomigrator_{metric} {description}")
+                lines.append(f"# TYPE photomigrator_{metric} gauge")
+                for queue_name, tracker in sorted(self._queues.items()):
+                    lines.append(f'photomigrator_{metric}{{queue="{queue_name}"}} {getattr(tracker, attribute)}')
+            lines.append("# HELP photomigrator_queue_depth_mean Time-weighted mean number of items in an Automatic Migration queue.")
+            lines.append("# TYPE photomigrator_queue_depth_mean gauge")
+            for queue_name, tracker in sorted(self._queues.items()):
+                lines.append(f'photomigrator_queue_depth_mean{{queue="{queue_name}"}} {tracker.mean(now):.2f}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, file_path):
+        """Write the metrics to file_path: Prometheus textfile for '.prom', JSON otherwise."""
+        file_path = str(file_path)
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        if file_path.lower().endswith(".prom"):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.snapshot(include_queue_history=True), indent=2)
+        # Write then rename, so a textfile collector never reads a partial file.
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(content)
+        os.replace(tmp_path, file_path)
+        return file_path
+
+
+def _prometheus_bucket_bounds(histogram):
+    return [f"{upper_ms / 1000.0:g}" for upper_ms in histogram.buckets_ms] + ["+Inf"]
+
+
+def _round_ms(value):
+    return None if value is None else round(float(value), 2)
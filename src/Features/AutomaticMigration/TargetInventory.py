@@ -0,0 +1,108 @@
+"""Index of the assets already present on an Automatic Migration target."""
+
+import base64
+import binascii
+import os
+import unicodedata
+
+# Capture times of the same asset may be reported in different time zones by the
+# source and the target, so whole quarter-hour offsets up to 14 hours still match.
+_TIMEZONE_SHIFT_MAX_SECONDS = 14 * 3600
+_TIMEZONE_SHIFT_STEP_SECONDS = 15 * 60
+_CAPTURE_TIME_TOLERANCE_SECONDS = 1
+
+
+def normalize_asset_checksum(checksum):
+    """Return a checksum as lowercase hex, accepting hex or base64 (Immich) encodings."""
+    value = str(checksum or "").strip()
+    if not value:
+        return ""
+    lowered = value.lower()
+    if len(lowered) in (40, 64) and all(char in "0123456789abcdef" for char in lowered):
+        return lowered
+    try:
+        return base64.b64decode(value, validate=True).hex()
+    except (binascii.Error, ValueError):
+        return ""
+
+
+def source_asset_size(asset):
+    """Return the file size advertised by a source listing entry, or None when it is unknown."""
+    asset = asset or {}
+    exif_info = asset.get("exifInfo") or {}
+    for size in (
+        asset.get("filesize"),
+        asset.get("size"),
+        asset.get("fileSize"),
+        exif_info.get("fileSizeInByte"),
+    ):
+        try:
+            if size is not None and size != "":
+                return int(size)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _name_key(filename):
+    name = os.path.basename(str(filename or "").strip())
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _capture_times_match(source_epoch, target_epoch):
+    if source_epoch is None or target_epoch is None:
+        # Without both capture times, name and size alone are not enough evidence.
+        return False
+    delta = abs(float(source_epoch) - float(target_epoch))
+    if delta <= _CAPTURE_TIME_TOLERANCE_SECONDS:
+        return True
+    if delta > _TIMEZONE_SHIFT_MAX_SECONDS + _CAPTURE_TIME_TOLERANCE_SECONDS:
+        return False
+    remainder = delta % _TIMEZONE_SHIFT_STEP_SECONDS
+    return min(remainder, _TIMEZONE_SHIFT_STEP_SECONDS - remainder) <= _CAPTURE_TIME_TOLERANCE_SECONDS
+
+
+class TargetInventoryIndex:
+    """
+    Looks up source assets in a snapshot of the target library.
+
+    Entries are dicts with 'id', 'filename', 'size', 'time' (epoch) and 'checksum'.
+    A source asset matches by checksum, or by file name plus exact file size when
+    the capture times agree (allowing a time zone shift). Name alone never matches,
+    and an asset without a capture time on either side only matches by checksum.
+    """
+
+    def __init__(self, entries=()):
+        self._by_checksum = {}
+        self._by_name_and_size = {}
+        self.total_assets = 0
+        for entry in entries or ():
+            self.add(entry)
+
+    def add(self, entry):
+        target_asset_id = str((entry or {}).get("id") or "").strip()
+        if not target_asset_id:
+            return
+        self.total_assets += 1
+        checksum = normalize_asset_checksum(entry.get("checksum"))
+        if checksum:
+            self._by_checksum.setdefault(checksum, target_asset_id)
+        name_key = _name_key(entry.get("filename"))
+        size = entry.get("size")
+        if name_key and size is not None:
+            self._by_name_and_size.setdefault((name_key, int(size)), []).append(
+                (entry.get("time"), target_asset_id)
+            )
+
+    def find(self, filename=None, size=None, capture_epoch=None, checksum=None):
+        """Return the id of the target asset matching the source asset, or None."""
+        checksum = normalize_asset_checksum(checksum)
+        if checksum and checksum in self._by_checksum:
+            return self._by_checksum[checksum]
+        name_key = _name_key(filename)
+        if not name_key or size is None:
+            return None
+        for target_epoch, target_asset_id in self._by_name_and_size.get((name_key, int(size)), ()):
+            if _capture_times_match(capture_epoch, target_epoch):
+                return target_asset_id
+        return None
@@ -61,6 +61,17 @@ class BaseMediaClient(ABC):
     def get_all_assets_without_albums(self, type="all", log_level=logging.WARNING):
         raise NotImplementedError
 
+    def iter_all_assets_without_albums_pages(self, type="all", log_level=logging.WARNING):
+        """
+        Yield the assets not associated to any album as a sequence of pages (lists).
+
+        Callers can start working on a page while the next one is still being listed.
+        Backends that cannot page their listing yield get_all_assets_without_albums() as a single page.
+        """
+        assets = self.get_all_assets_without_albums(log_level=log_level) or []
+        if assets:
+            yield list(assets)
+
     @abstractmethod
     def get_all_assets_from_all_albums(self, log_level=logging.WARNING):
         raise NotImplementedError
@@ -126,6 +137,22 @@ class BaseMediaClient(ABC):
     ):
         raise NotImplementedError
 
+    def open_asset_stream(
+        self,
+        asset_id,
+        asset_filename,
+        album_passphrase=None,
+        album_id=None,
+        album_scope=None,
+        log_level=None,
+    ):
+        """
+        Open the original file of an asset as a ResponseBodyStream for disk-less transfers.
+
+        Backends that cannot stream an asset return None, and callers fall back to pull_asset().
+        """
+        return None
+
     @abstractmethod
     def push_albums(
         self,
@@ -1,6 +1,7 @@
 import logging
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -29,6 +30,9 @@ class ClassGooglePhotos(BaseMediaClient):
     API_BASE = "https://photoslibrary.googleapis.com/v1"
     UPLOADS_URL = f"{API_BASE}/uploads"
     FULL_LIBRARY_READ_REMOVAL_DATE = "2025-04-01"
+    # mediaItems:batchCreate accepts at most 50 new media items per call.
+    GOOGLE_PHOTOS_BATCH_CREATE_SIZE = 50
+    GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS = 8
 
     def __init__(self, account_id: int = 1):
         self.account_id = int(account_id or 1)
@@ -87,6 +91,10 @@ class ClassGooglePhotos(BaseMediaClient):
             self.client_id = section.get(f"GOOGLE_PHOTOS_CLIENT_ID_{suffix}", "").strip()
             self.client_secret = section.get(f"GOOGLE_PHOTOS_CLIENT_SECRET_{suffix}", "").strip()
             self.refresh_token = section.get(f"GOOGLE_PHOTOS_REFRESH_TOKEN_{suffix}", "").strip()
+            try:
+                self.GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS = max(1, min(32, int(str(section.get("GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS", self.GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS)).strip())))
+            except (TypeError, ValueError):
+                self.GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS = ClassGooglePhotos.GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS
 
             if not self.client_id:
                 raise ValueError(f"Missing GOOGLE_PHOTOS_CLIENT_ID_{suffix} in [Google Photos]")
@@ -304,8 +312,6 @@ class ClassGooglePhotos(BaseMediaClient):
 
     def _create_upload_token(self, file_path: str) -> str:
         self._require_session()
-        with open(file_path, "rb") as fp:
-            file_bytes = fp.read()
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/octet-stream",
@@ -313,7 +319,9 @@ class ClassGooglePhotos(BaseMediaClient):
             "X-Goog-Upload-File-Name": os.path.basename(file_path),
             "X-Goog-Upload-Protocol": "raw",
         }
-        response = requests.post(self.UPLOADS_URL, headers=headers, data=file_bytes, timeout=self.timeout_seconds)
+        # The file object is streamed, so parallel uploads do not hold whole files in memory.
+        with open(file_path, "rb") as fp:
+            response = requests.post(self.UPLOADS_URL, headers=headers, data=fp, timeout=self.timeout_seconds)
         if response.status_code != 200:
             raise RuntimeError(f"Google Photos upload token creation failed (status={response.status_code}, body={response.text[:350]})")
         token = response.text.strip()
@@ -392,7 +400,19 @@ class ClassGooglePhotos(BaseMediaClient):
             self._remember_uploaded_media_item_id(file_path, best_media_id)
         return best_media_id
 
-    def _batch_create_media_item(self, upload_token: str, file_name: str, album_id: str = "", file_path: str = "", resolve_duplicate_id: bool = True) -> Tuple[Optional[str], bool]:
+    def _batch_create_media_items(self, uploads: List[Tuple[str, str, str]], album_id: str = "", resolve_duplicate_id: bool = True) -> List[Tuple[Optional[str], bool, Optional[str]]]:
+        """
+        Create the media items of up to GOOGLE_PHOTOS_BATCH_CREATE_SIZE uploads with one mediaItems:batchCreate call.
+
+        Args:
+            uploads: (upload_token, file_name, file_path) of each uploaded file.
+            album_id: Album the new media items are added to (optional).
+            resolve_duplicate_id: Look up the existing media item id of the uploads rejected as duplicates.
+
+        Returns:
+            One (media_item_id, is_duplicate, error) tuple per upload, in the same order, so per-item
+            failures can be reported against their files. error is None when the item was created.
+        """
         payload = {
             "newMediaItems": [
                 {
@@ -402,6 +422,7 @@ class ClassGooglePhotos(BaseMediaClient):
                         "fileName": file_name,
                     },
                 }
+                for upload_token, file_name, _ in uploads
             ]
         }
         if album_id:
@@ -411,28 +432,136 @@ class ClassGooglePhotos(BaseMediaClient):
         results = data.get("newMediaItemResults", []) or []
         if not results:
             raise RuntimeError("Google Photos batchCreate returned no results.")
-        result = results[0] or {}
-        status = result.get("status", {}) or {}
-        code = int(status.get("code", 0) or 0)
-        if code and code != 0:
-            message = str(status.get("message", "Unknown error")).strip()
-            lower = message.lower()
-            is_dup = "already exists" in lower or "duplicate" in lower
-            if is_dup:
-                if not resolve_duplicate_id:
-                    return None, True
-                existing_media_id = self._resolve_existing_media_item_id(file_path=file_path, file_name=file_name) if file_path else None
-                if existing_media_id:
-                    return existing_media_id, True
-                return None, True
-            raise RuntimeError(f"Google Photos batchCreate failed: {message}")
-        media_item = result.get("mediaItem", {}) or {}
-        media_item_id = str(media_item.get("id", "")).strip()
-        if not media_item_id:
-            raise RuntimeError("Google Photos batchCreate did not return mediaItem id.")
-        if file_path:
-            self._remember_uploaded_media_item_id(file_path, media_item_id)
-        return media_item_id, False
+        results_by_token = {
+            str(result.get("uploadToken")): result
+            for result in results
+            if isinstance(result, dict) and result.get("uploadToken")
+        }
+
+        outcomes = []
+        for index, (upload_token, file_name, file_path) in enumerate(uploads):
+            result = results_by_token.get(str(upload_token))
+            if result is None and index < len(results) and not (results[index] or {}).get("uploadToken"):
+                result = results[index]
+            if result is None:
+                outcomes.append((None, False, "batchCreate returned no result for this item."))
+                continue
+            status = result.get("status", {}) or {}
+            code = int(status.get("code", 0) or 0)
+            if code and code != 0:
+                message = str(status.get("message", "Unknown error")).strip()
+                lower = message.lower()
+                is_dup = "already exists" in lower or "duplicate" in lower
+                if is_dup:
+                    existing_media_id = None
+                    if resolve_duplicate_id and file_path:
+                        existing_media_id = self._resolve_existing_media_item_id(file_path=file_path, file_name=file_name)
+                    outcomes.append((existing_media_id, True, None))
+                else:
+                    outcomes.append((None, False, message))
+                continue
+            media_item = result.get("mediaItem", {}) or {}
+            media_item_id = str(media_item.get("id", "")).strip()
+            if not media_item_id:
+                outcomes.append((None, False, "batchCreate did not return mediaItem id."))
+                continue
+            if file_path:
+                self._remember_uploaded_media_item_id(file_path, media_item_id)
+            outcomes.append((media_item_id, False, None))
+        return outcomes
+
+    def _batch_create_media_item(self, upload_token: str, file_name: str, album_id: str = "", file_path: str = "", resolve_duplicate_id: bool = True) -> Tuple[Optional[str], bool]:
+        media_item_id, is_dup, error = self._batch_create_media_items(
+            [(upload_token, file_name, file_path)],
+            album_id=album_id,
+            resolve_duplicate_id=resolve_duplicate_id,
+        )[0]
+        if error:
+            raise RuntimeError(f"Google Photos batchCreate failed: {error}")
+        return media_item_id, is_dup
+
+    def _push_assets(self, file_paths: List[str], album_id: str = "", desc: str = "", log_level=None) -> List[Tuple[Optional[str], bool]]:
+        """
+        Upload the bytes of file_paths in parallel and create their media items in batches.
+
+        Up to GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS files are uploaded at the same time. Their upload
+        tokens are committed in file order, GOOGLE_PHOTOS_BATCH_CREATE_SIZE per batchCreate call
+        (and added to album_id by that same call), while the next files keep uploading.
+        If a batchCreate with album_id fails as a whole (e.g. the album was not created by this
+        app), the same upload tokens are committed again without the album and the new items are
+        added to it with add_assets_to_album, so an album problem does not lose the uploads.
+        A file that cannot be uploaded or created is logged and gets (None, False).
+
+        Returns:
+            One (media_item_id, is_duplicate) tuple per file, in the same order. Duplicates are not
+            added to album_id by batchCreate, so the caller must add them itself.
+        """
+        with set_log_level(LOGGER, log_level):
+            file_paths = list(file_paths)
+            results: List[Tuple[Optional[str], bool]] = [(None, False)] * len(file_paths)
+            if not file_paths:
+                return results
+
+            def upload(file_path):
+                try:
+                    return self._create_upload_token(file_path), None
+                except Exception as error:
+                    return None, error
+
+            def commit(batch):
+                uploads = [(token, os.path.basename(file_paths[index]), file_paths[index]) for index, token in batch]
+                added_to_album = bool(album_id)
+                try:
+                    outcomes = self._batch_create_media_items(uploads, album_id=album_id or "")
+                except Exception as error:
+                    outcomes = None
+                    batch_error = error
+                if outcomes is None and album_id:
+                    LOGGER.warning(f"Google Photos batchCreate into album '{album_id}' failed ({batch_error}). Creating the {len(batch)} media items without the album and adding them afterwards.")
+                    try:
+                        outcomes = self._batch_create_media_items(uploads)
+                        added_to_album = False
+                    except Exception as error:
+                        batch_error = error
+                if outcomes is None:
+                    outcomes = [(None, False, str(batch_error))] * len(batch)
+                for (index, _), (media_item_id, is_dup, error) in zip(batch, outcomes):
+                    if error:
+                        LOGGER.error(f"Failed to create Google Photos media item for '{file_paths[index]}': {error}")
+                        continue
+                    results[index] = (media_item_id, is_dup)
+                if album_id and not added_to_album:
+                    # Duplicates are left to the caller, as when batchCreate adds the new items itself.
+                    created_ids = [results[index][0] for index, _ in batch if results[index][0] and not results[index][1]]
+                    if created_ids:
+                        try:
+                            self.add_assets_to_album(album_id=album_id, asset_ids=created_ids)
+                        except Exception as error:
+                            LOGGER.error(f"Failed to add {len(created_ids)} Google Photos media items to album '{album_id}': {error}")
+
+            self._require_session()
+            batch_size = max(1, min(50, int(self.GOOGLE_PHOTOS_BATCH_CREATE_SIZE or 50)))
+            workers = max(1, min(int(self.GOOGLE_PHOTOS_MAX_PARALLEL_UPLOADS or 1), len(file_paths)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(upload, file_path) for file_path in file_paths]
+                try:
+                    batch = []
+                    for index, future in enumerate(tqdm(futures, desc=desc, unit=" assets")):
+                        upload_token, error = future.result()
+                        if error is not None:
+                            LOGGER.error(f"Failed to upload '{file_paths[index]}' to Google Photos: {error}")
+                            continue
+                        batch.append((index, upload_token))
+                        if len(batch) >= batch_size:
+                            commit(batch)
+                            batch = []
+                    if batch:
+                        commit(batch)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            return results
 
     def _download_media_item(self, media_item: Dict, output_file: str) -> str:
         base_url = str(media_item.get("baseUrl", "")).strip()
@@ -937,21 +1066,23 @@ class ClassGooglePhotos(BaseMediaClient):
                     if album_id:
                         existing_albums.append({"id": album_id, "albumName": album_name_to_create})
                         total_albums_uploaded += 1
-                album_media_ids = []
-                for file_path in tqdm(
+                # New media items are added to the album by batchCreate itself; duplicates already
+                # exist in the library, so their resolved ids are added afterwards.
+                duplicate_media_ids = []
+                for media_id, is_dup in self._push_assets(
                     media_files,
+                    album_id=album_id,
                     desc=f"{MSG_TAGS['INFO']}   Uploading '{album_name}' Assets",
-                    unit=" assets",
+                    log_level=log_level,
                 ):
-                    media_id, is_dup = self.push_asset(file_path, log_level=log_level)
                     if is_dup:
                         total_duplicates_skipped += 1
+                        if media_id:
+                            duplicate_media_ids.append(media_id)
                     elif media_id:
                         total_assets_uploaded += 1
-                    if media_id:
-                        album_media_ids.append(media_id)
-                if album_media_ids:
-                    self.add_assets_to_album(album_id=album_id, asset_ids=album_media_ids, album_name=album_name, log_level=log_level)
+                if duplicate_media_ids and album_id:
+                    self.add_assets_to_album(album_id=album_id, asset_ids=duplicate_media_ids, album_name=album_name, log_level=log_level)
             return total_albums_uploaded, total_albums_skipped, total_assets_uploaded, 0, total_duplicates_skipped
 
     def push_no_albums(self, input_folder, subfolders_exclusion=f"{FOLDERNAME_ALBUMS}", subfolders_inclusion=None, remove_duplicates=True, log_level=logging.WARNING):
@@ -970,8 +1101,7 @@ class ClassGooglePhotos(BaseMediaClient):
             ]
             uploaded = 0
             duplicates = 0
-            for file_path in tqdm(files, desc=f"{MSG_TAGS['INFO']}Uploading Assets without Albums to Google Photos", unit=" asset"):
-                media_id, is_dup = self.push_asset(file_path, log_level=log_level)
+            for media_id, is_dup in self._push_assets(files, desc=f"{MSG_TAGS['INFO']}Uploading Assets without Albums to Google Photos", log_level=log_level):
                 if is_dup:
                     duplicates += 1
                 elif media_id:
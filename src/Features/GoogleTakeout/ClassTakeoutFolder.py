@@ -29,14 +29,16 @@ from Core.FolderAnalyzer import FolderAnalyzer
 from Core.GlobalVariables import ARGS, LOG_LEVEL, LOGGER, START_TIME, FOLDERNAME_ALBUMS, FOLDERNAME_ALL_PHOTOS, TIMESTAMP, SUPPLEMENTAL_METADATA, MSG_TAGS, SPECIAL_SUFFIXES, EDITTED_SUFFIXES, PHOTO_EXT, VIDEO_EXT, GPTH_VERSION, FOLDERNAME_GPTH, TAKEOUT_SPECIAL_FOLDER_NAMES, \
     PIL_SUPPORTED_EXTENSIONS, FOLDERNAME_EXIFTOOL, GOOGLE_PHOTOS_CONTAINER_NAMES, TAKEOUT_YEAR_FOLDER_PATTERNS
 from Features.LocalPhotosFolder.ClassLocalPhotosFolder import ClassLocalPhotosFolder
-from Features.GoogleTakeout.PeopleMetadata import build_people_map, PEOPLE_MAP_FILENAME
+from Features.GoogleTakeout.PeopleMetadata import build_people_map, merge_people_map_files, PEOPLE_MAP_FILENAME
+from Features.GoogleTakeout.TakeoutManifest import TAKEOUT_MANIFEST_FOLDER, TakeoutManifest, build_takeout_manifest_path, fingerprint_archive, member_key
+from Features.GoogleTakeout.TakeoutZipInventory import TakeoutZipInventory
 from Features.StandAloneFeatures.AutoRenameAlbumsFolders import rename_album_folders
 from Features.StandAloneFeatures.Duplicates import find_duplicates
 from Features.StandAloneFeatures.FixSymLinks import fix_symlinks_broken
 from Utils.DateUtils import normalize_datetime_utc
-from Utils.FileUtils import build_generated_output_folder, delete_subfolders, remove_empty_dirs, is_valid_path, sanitize_and_unpack_zips
+from Utils.FileUtils import build_generated_output_folder, delete_subfolders, remove_empty_dirs, is_valid_path, sanitize_and_unpack_zips, merge_folders, FolderTreeIndex
 from Utils.GeneralUtils import print_dict_pretty, tqdm, get_os, get_arch, ensure_executable, print_arguments_pretty, profile_and_print, TQDM_DASHBOARD_PREFIX
-from Utils.StandaloneUtils import change_working_dir, get_gpth_tool_path, custom_print, get_exif_tool_path
+from Utils.StandaloneUtils import change_working_dir, get_gpth_tool_path, custom_print, get_exif_tool_path, resolve_external_path
 
 CREATEFILE_FAILED_RE = re.compile(r'CreateFile failed for "(?P<path>.+?)" \(error=(?P<error>\d+)\)')
 VIDEO_XMP_DATE_TAGS = (
@@ -1367,6 +1369,16 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
         # Backup_folder in case of needed
         self.backup_takeout_folder = None
 
+        # In-memory index of the Takeout tree shared by the pre-process steps and the initial analysis
+        self.takeout_tree_index = None
+
+        # Inventory read from the Takeout ZIP files (only when the Takeout needs to be unzipped)
+        self.takeout_zip_inventory = None
+
+        # Manifest of the archives already processed and plan of this run (only with '-gIncremental')
+        self.takeout_manifest = None
+        self.incremental_plan = None
+
         # Verificar si la carpeta necesita ser procesada
         self.needs_process = self.check_if_needs_process(log_level=logging.WARNING)
 
@@ -1440,6 +1452,10 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
                 )
         else:
             self.output_folder = self.takeout_folder
+        # An incremental run never writes into the previous output directly; it is merged into it at the end
+        incremental_plan = getattr(self, 'incremental_plan', None)
+        if incremental_plan and incremental_plan.get('previous_output') and os.path.abspath(self.output_folder) == os.path.abspath(incremental_plan['previous_output']):
+            self.output_folder = Path(f"{self.output_folder}_incremental_{self.TIMESTAMP}")
         # Call get_albums_folder to update it with the new output_folder
         self.get_albums_folder()
         self._sync_local_folder_view()
@@ -1515,7 +1531,10 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
         step_name_cleaned = ' '.join(step_name.replace(' : ', '').split()).replace(' ]', ']')
         sub_step_start_time = datetime.now()
         if folder_type.lower() == 'input':
-            self.initial_takeout_folder_analyzer = FolderAnalyzer(folder_path=folder_to_analyze, force_date_extraction=False, logger=LOGGER, step_name=step_name)
+            # Reuse the tree index kept up to date by pre_process() (if it ran) instead of walking the Takeout again
+            tree_index = getattr(self, 'takeout_tree_index', None)
+            self.takeout_tree_index = None
+            self.initial_takeout_folder_analyzer = FolderAnalyzer(folder_path=folder_to_analyze, force_date_extraction=False, logger=LOGGER, step_name=step_name, tree_index=tree_index)
             # self.initial_takeout_folder_analyzer.extract_dates(use_fallback_to_filename=False, step_name=step_name) # Avoid to use filename to guess dates from filename to do a fair comparison between pre/post
             self.initial_takeout_folder_analyzer.extract_dates(step_name=step_name) # Use filename to guess dates and save them in the JSON, but does not count GUESS dates in the count_files function
             counters = self.initial_takeout_folder_analyzer.count_files(exclude_fallbacks=True, step_name=step_name) # Avoid to use filename to guess dates from filename to do a fair comparison between pre/post
@@ -1600,6 +1619,127 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
         LOGGER.info(f"{step_name}Step {self.step}: {step_name_cleaned} completed in {formatted_duration}.")
         self.steps_duration.append({'step_id': f"{self.step}", 'step_name': step_name_cleaned, 'duration': formatted_duration})
 
+    def inventory_takeout_zips(self, unzip_folder, step_name=""):
+        """
+        Build the Takeout inventory straight from the ZIP files and check that unzip_folder has room for them.
+
+        Returns the TakeoutZipInventory, or None if the ZIP files could not be listed.
+        """
+        try:
+            inventory = TakeoutZipInventory(self.takeout_folder)
+        except OSError as e:
+            LOGGER.warning(f"{step_name}Could not read the Takeout ZIP files inventory: {e}")
+            return None
+        total_bytes = inventory.total_uncompressed_bytes
+        LOGGER.info(f"{step_name}📦 ZIP inventory: {len(inventory.zip_paths)} ZIP files, {len(inventory.members)} files ({total_bytes / (1024 ** 3):.2f} GB uncompressed), {len(inventory.sidecar_members())} JSON sidecars, {len(inventory.album_folders())} albums.")
+        for zip_path in inventory.unreadable_zips:
+            LOGGER.warning(f"{step_name}Could not read ZIP file (BadZipFile): {os.path.basename(zip_path)}")
+        try:
+            free_bytes = shutil.disk_usage(Path(unzip_folder).parent).free
+        except OSError:
+            free_bytes = None
+        if free_bytes is not None and free_bytes < total_bytes:
+            LOGGER.warning(f"{step_name}⚠️ Only {free_bytes / (1024 ** 3):.2f} GB free in '{Path(unzip_folder).parent}', but the Takeout needs {total_bytes / (1024 ** 3):.2f} GB once unzipped.")
+        return inventory
+
+    def plan_incremental_unzip(self, step_name=""):
+        """
+        Compare the Takeout ZIP files with the manifest of the previous runs and plan what to unzip.
+
+        Media of archives whose fingerprint is recorded are skipped. From the other archives, media
+        members already recorded (same path, CRC32 and size) are skipped too, so a Takeout exported
+        again and split into different parts only brings its new files. JSON sidecars are always
+        kept, even from recorded archives, because the sidecar of a new media file may sit in a part
+        that was already processed and GPTH needs it next to the media.
+
+        Returns a dict with the archives fingerprints, the zip_names and (zip_name, ZipInfo) members
+        to unzip, the previous_output folder and a nothing_new flag, or None if there is no manifest.
+        """
+        inventory = self.takeout_zip_inventory
+        if inventory is None:
+            LOGGER.warning(f"{step_name}Incremental processing disabled because the Takeout ZIP files could not be listed.")
+            return None
+        manifest_path = build_takeout_manifest_path(resolve_external_path(f"./{TAKEOUT_MANIFEST_FOLDER}"), self.takeout_folder)
+        try:
+            self.takeout_manifest = TakeoutManifest(manifest_path)
+        except Exception as e:
+            LOGGER.warning(f"{step_name}Unable to open the Takeout manifest '{manifest_path}'; the whole Takeout will be processed: {e}")
+            return None
+        processed_members = self.takeout_manifest.processed_member_keys()
+        previous_output = self.takeout_manifest.get_output_folder()
+        if previous_output and not os.path.isdir(previous_output):
+            LOGGER.warning(f"{step_name}The previous output folder '{previous_output}' does not exist anymore. The whole Takeout will be processed again.")
+            previous_output = None
+            processed_members = set()
+
+        infos_by_zip = {}
+        for zip_path, info in inventory.members:
+            infos_by_zip.setdefault(zip_path, []).append(info)
+        archives, zip_names, members = [], [], []
+        skipped_archives = skipped_members = 0
+        for zip_path in inventory.zip_paths:
+            zip_name = os.path.basename(zip_path)
+            infos = infos_by_zip.get(zip_path, [])
+            fingerprint = fingerprint_archive(zip_path, infos)
+            archives.append(fingerprint)
+            archive_processed = bool(previous_output) and self.takeout_manifest.is_archive_processed(fingerprint)
+            if archive_processed:
+                skipped_archives += 1
+            archive_members = []
+            for info in infos:
+                if not info.filename.lower().endswith('.json'):
+                    if archive_processed:
+                        continue
+                    if member_key(info) in processed_members:
+                        skipped_members += 1
+                        continue
+                archive_members.append((zip_name, info))
+            if archive_members:
+                zip_names.append(zip_name)
+                members.extend(archive_members)
+        new_media = sum(1 for _, info in members if not info.filename.lower().endswith('.json'))
+        if previous_output:
+            LOGGER.info(f"{step_name}🧩 Incremental run: {skipped_archives} ZIP files (except their JSON sidecars) and {skipped_members} files of the other ZIP files were already processed into '{previous_output}'. {new_media} new media files will be processed.")
+        else:
+            LOGGER.info(f"{step_name}🧩 Incremental run: no previous run recorded for this Takeout. The whole Takeout will be processed and recorded in '{manifest_path}'.")
+        return {
+            'archives': archives,
+            'zip_names': zip_names,
+            'members': members,
+            'previous_output': previous_output,
+            'nothing_new': bool(previous_output) and new_media == 0,
+        }
+
+    def merge_incremental_output(self, output_folder, step_name=""):
+        """
+        Merge the output of this run into the output of the previous runs and record the run in the manifest.
+
+        Returns the folder that holds the merged output.
+        """
+        step_name_cleaned = ' '.join(step_name.replace(' : ', '').split()).replace(' ]', ']')
+        step_start_time = datetime.now()
+        previous_output = self.incremental_plan.get('previous_output')
+        merged_folder = Path(output_folder)
+        if previous_output and os.path.abspath(previous_output) != os.path.abspath(output_folder):
+            new_people_map = Path(output_folder) / PEOPLE_MAP_FILENAME
+            previous_people_map = Path(previous_output) / PEOPLE_MAP_FILENAME
+            if new_people_map.is_file() and previous_people_map.is_file():
+                merge_people_map_files(previous_people_map, new_people_map)
+            merge_folders(src_folder=output_folder, dst_folder=previous_output, step_name=step_name, log_level=self.log_level)
+            if not self.ARGS['google-no-symbolic-albums']:
+                fix_symlinks_broken(input_folder=previous_output, step_name=step_name, log_level=LOG_LEVEL)
+            merged_folder = Path(previous_output)
+        self.takeout_manifest.record(self.incremental_plan['archives'], self.incremental_plan['members'], merged_folder)
+        LOGGER.info(f"{step_name}{len(self.incremental_plan['members'])} files of {len(self.incremental_plan['zip_names'])} ZIP files recorded in the Takeout manifest '{self.takeout_manifest.manifest_path}'.")
+        self.output_folder = merged_folder
+        self.get_albums_folder()
+        self._sync_local_folder_view()
+        formatted_duration = str(timedelta(seconds=round((datetime.now() - step_start_time).total_seconds())))
+        LOGGER.info(f"")
+        LOGGER.info(f"{step_name}Step {self.step}: {step_name_cleaned} completed in {formatted_duration}.")
+        self.steps_duration.append({'step_id': f"{self.step}", 'step_name': step_name_cleaned, 'duration': formatted_duration})
+        return merged_folder
+
     def pre_checks(self, log_level=None):
         with (set_log_level(LOGGER, log_level)):  # Temporarily adjust log level
             # Start Pre-Checking
@@ -1628,8 +1768,21 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
                 LOGGER.info(f"{step_name}📦 Unzipping Takeout Folder...Be patient... 🙂")
                 # Make the 'Unzipped' folder as the new takeout_folder for the object
                 self.unzipped_folder= Path(f"{self.takeout_folder}_unzipped_{self.TIMESTAMP}")
+                # Read the ZIP central directories first: sizes, sidecars and albums are known before extracting anything
+                self.takeout_zip_inventory = self.inventory_takeout_zips(unzip_folder=self.unzipped_folder, step_name=step_name)
+                # With '-gIncremental', only the archives and members not processed by a previous run are unzipped
+                zip_names, member_filter = None, None
+                if self.ARGS.get('google-incremental'):
+                    self.incremental_plan = self.plan_incremental_unzip(step_name=step_name)
+                    if self.incremental_plan:
+                        selected_members = {(zip_name, info.filename) for zip_name, info in self.incremental_plan['members']}
+                        zip_names = self.incremental_plan['zip_names']
+                        member_filter = lambda zip_file, info: (zip_file, info.filename) in selected_members
                 # Unzip the files into unzip_folder
-                sanitize_and_unpack_zips(input_folder=self.takeout_folder, unzip_folder=self.unzipped_folder, step_name=step_name, log_level=self.log_level)
+                if self.incremental_plan and self.incremental_plan['nothing_new']:
+                    LOGGER.info(f"{step_name}Nothing new to unzip: every media file of this Takeout was already processed into '{self.incremental_plan['previous_output']}'.")
+                else:
+                    sanitize_and_unpack_zips(input_folder=self.takeout_folder, unzip_folder=self.unzipped_folder, step_name=step_name, log_level=self.log_level, max_workers=self.ARGS.get('google-unzip-workers', 0), zip_names=zip_names, member_filter=member_filter, dedupe=self.ARGS.get('google-unzip-dedup', True))
                 # Update input_folder to take the new unzipped folder as reference
                 self.input_folder = self.unzipped_folder
                 # Change flag self.check_if_needs_unzip to False
@@ -1641,9 +1794,13 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
                 LOGGER.info(f"")
                 LOGGER.info(f"{step_name}Sub-Step {self.step}.{self.substep}: {step_name_cleaned} completed in {formatted_duration}.")
             else:
+                if self.ARGS.get('google-incremental'):
+                    LOGGER.warning(f"{step_name}Flag '-gIncremental, --google-incremental' detected, but Takeout is not zipped. Incremental processing only applies to Takeout ZIP files, so the whole folder will be processed.")
                 formatted_duration = f"Skipped"
                 LOGGER.info(f"{step_name}Step Skipped: '{step_name[step_name.rfind('[')+1 : step_name.rfind(']')].strip()}'")
             self.steps_duration.append({'step_id': f"{self.step}.{self.substep}", 'step_name': step_name_cleaned, 'duration': formatted_duration})
+            if self.incremental_plan and self.incremental_plan['nothing_new']:
+                return
 
 
             # Sub-Step 2: create_backup_if_needed
@@ -1719,6 +1876,9 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             # Determine the input_folder deppending if the Takeout have been unzipped or not
             input_folder = self.get_input_folder()
 
+            # List the Takeout tree once; every pre-process step walks (and updates) this index instead of the disk
+            self.takeout_tree_index = FolderTreeIndex(input_folder)
+
             # Sub-Step 1: Delete hidden subfolders '@eaDir'
             # ----------------------------------------------------------------------------------------------------------------------
             step_name = '🪛 [PRE-PROCESS]-[Sanitize Takeout Folder]   : '
@@ -1729,9 +1889,9 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             LOGGER.info(f"================================================================================================================================================")
             LOGGER.info(f"")
             LOGGER.info(f"{step_name}Sanitizing input folder (fix folders/files ending with spaces or dosts to avoid SMB mingling names)...")
-            sanitize_names(input_folder=input_folder, step_name=step_name, log_level=log_level)
+            sanitize_names(input_folder=input_folder, step_name=step_name, log_level=log_level, tree_index=self.takeout_tree_index)
             LOGGER.info(f"{step_name}Cleaning hidden subfolders '@eaDir' (Synology metadata folders) from Takeout Folder if exists...")
-            delete_subfolders(input_folder=input_folder, folder_name_to_delete="@eaDir", step_name=step_name, log_level=LOG_LEVEL)
+            delete_subfolders(input_folder=input_folder, folder_name_to_delete="@eaDir", step_name=step_name, log_level=LOG_LEVEL, tree_index=self.takeout_tree_index)
             sub_step_end_time = datetime.now()
             formatted_duration = str(timedelta(seconds=round((sub_step_end_time - sub_step_start_time).total_seconds())))
             LOGGER.info(f"")
@@ -1750,7 +1910,7 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             LOGGER.info(f"================================================================================================================================================")
             LOGGER.info(f"")
             LOGGER.info(f"{step_name}Looking for .MP4 files from live pictures and asociate date and time with live picture file...")
-            total_mp4_files_fixed = fix_mp4_files(input_folder=input_folder, step_name=step_name, log_level=LOG_LEVEL)
+            total_mp4_files_fixed = fix_mp4_files(input_folder=input_folder, step_name=step_name, log_level=LOG_LEVEL, tree_index=self.takeout_tree_index)
             LOGGER.info(f"{step_name}Fixing MP4 from live pictures metadata finished!")
             LOGGER.info(f"{step_name}Total MP4 from live pictures Files fixed         : {total_mp4_files_fixed}")
             sub_step_end_time = datetime.now()
@@ -1771,7 +1931,7 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             LOGGER.info(f"================================================================================================================================================")
             LOGGER.info(f"")
             LOGGER.info(f"{step_name}Fixing Truncated Special Suffixes from Google Photos and rename files to include complete special suffix...")
-            fix_truncations_output = fix_truncations(input_folder=input_folder, step_name=step_name, log_level=LOG_LEVEL)
+            fix_truncations_output = fix_truncations(input_folder=input_folder, step_name=step_name, log_level=LOG_LEVEL, tree_index=self.takeout_tree_index)
 
             # Clean input dict
             self.result['fix_truncations'].clear()
@@ -1831,6 +1991,17 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             # STEP 1: Pre-check the object with skip_process=True to just unzip files in case they are zipped
             # ----------------------------------------------------------------------------------------------------------------------
             self.pre_checks(log_level=log_level)
+            if self.incremental_plan and self.incremental_plan['nothing_new']:
+                previous_output = self.incremental_plan['previous_output']
+                LOGGER.info(f"")
+                LOGGER.info(f"================================================================================================================================================")
+                LOGGER.info(f"✅ TAKEOUT PROCESSING FINISHED!!! No new content since the last incremental run.")
+                LOGGER.info(f"")
+                LOGGER.info(f"{'Takeout Precessed Folder'.ljust(55)}  : '{previous_output}'.")
+                LOGGER.info(f"================================================================================================================================================")
+                if create_localfolder_object:
+                    super().__init__(previous_output)
+                return self.result
 
             # Normalize input root for GPTH before any pre-process/analyze step.
             # This ensures extracted dates JSON paths match GPTH input paths.
@@ -1904,7 +2075,13 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             LOGGER.info(f"")
             if self.ARGS.get("google-process-people", True):
                 LOGGER.info(f"{step_name}Capturing Google Takeout person labels before GPTH processing.")
-                self.takeout_people_map = build_people_map(input_folder)
+                zip_inventory = getattr(self, 'takeout_zip_inventory', None)
+                if zip_inventory is not None:
+                    # The sidecars are read from the ZIP members instead of walking and reading the extracted Takeout again
+                    LOGGER.info(f"{step_name}Reading person labels from the JSON sidecars inside the Takeout ZIP files.")
+                    self.takeout_people_map = zip_inventory.build_people_map()
+                else:
+                    self.takeout_people_map = build_people_map(input_folder)
                 unique_people = {
                     str(person).strip().casefold()
                     for entries in self.takeout_people_map.values()
@@ -2164,6 +2341,18 @@ class ClassTakeoutFolder(ClassLocalPhotosFolder):
             self.final_steps(input_folder=input_folder, output_folder=output_folder)
 
 
+            # STEP 8: Merge this run into the output of the previous runs (only with '-gIncremental')
+            # ----------------------------------------------------------------------------------------------------------------------
+            if self.incremental_plan:
+                self.step += 1
+                LOGGER.info(f"")
+                LOGGER.info(f"================================================================================================================================================")
+                LOGGER.info(f"{self.step}. MERGE INCREMENTAL RUN INTO PREVIOUS OUTPUT FOLDER...")
+                LOGGER.info(f"================================================================================================================================================")
+                LOGGER.info(f"")
+                output_folder = self.merge_incremental_output(output_folder=output_folder, step_name='🧩 [INCREMENTAL]-[Merge Output] : ')
+
+
             # FINISH & PRINT RESULTS
             # ----------------------------------------------------------------------------------------------------------------------
             processing_end_time = datetime.now()
@@ -2812,7 +3001,7 @@ def contains_takeout_structure(input_folder, step_name="", log_level=None):
 # ---------------------------------------------------------------------------------------------------------------------------
 # GOOGLE TAKEOUT PRE-PROCESSING FUNCTIONS:
 # ---------------------------------------------------------------------------------------------------------------------------
-def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
+def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None, tree_index=None):
     """
     Sanitize file and directory names to be SMB/Windows-friendly while keeping visible characters (including accents).
     Operations performed (in this order), component-wise (never across directories):
@@ -2831,6 +3020,7 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
       dry_run: If True, only logs intended changes (no rename on disk).
       step_name: Prefix to prepend to all log lines.
       log_level: Log level context to apply within set_log_level.
+      tree_index: FolderTreeIndex of input_folder to walk instead of the disk (optional). Renames are applied to it.
     Returns:
       dict with counters:
         - total_entries_scanned
@@ -2953,8 +3143,8 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
         # -------------------- 1) Directories first (post-order) --------------------
         # Walk once to collect all directories with depth, then rename deepest first
         dir_entries = []
-        for current_root, dirnames, _ in os.walk(root, topdown=True, followlinks=False):
-            base_depth = Path(current_root).relative_to(root).parts
+        walker = tree_index.walk() if tree_index is not None else os.walk(root, topdown=True, followlinks=False)
+        for current_root, dirnames, _ in walker:
             for d in dirnames:
                 p = Path(current_root) / d
                 depth = len(Path(current_root).relative_to(root).parts) + 1
@@ -2980,6 +3170,8 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
                 if not ok:
                     counters['errors'] += 1
                     continue
+                if tree_index is not None:
+                    tree_index.rename_dir(dir_path, dst_path)
             counters['dirs_renamed'] += 1
             counters['nfc_normalized'] += int(flags['nfc'])
             counters['trailing_fixed'] += int(flags['trailing'])
@@ -2987,7 +3179,8 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
             counters['reserved_names_fixed'] += int(flags['reserved'])
 
         # -------------------- 2) Files inside all directories --------------------
-        for current_root, _, filenames in os.walk(root, topdown=True, followlinks=False):
+        walker = tree_index.walk() if tree_index is not None else os.walk(root, topdown=True, followlinks=False)
+        for current_root, _, filenames in walker:
             for fname in filenames:
                 counters['total_entries_scanned'] += 1
                 file_path = Path(current_root) / fname
@@ -3010,6 +3203,8 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
                         if not ok:
                             counters['errors'] += 1
                             continue
+                        if tree_index is not None:
+                            tree_index.rename_file(parent, fname, target_name)
                     except Exception as e:
                         counters['errors'] += 1
                         LOGGER.warning(f"{step_name}⚠️ Rename failed: {file_path} → {dst_path} | {e}")
@@ -3024,7 +3219,7 @@ def sanitize_names(input_folder, dry_run=False, step_name="", log_level=None):
         LOGGER.debug(f"{step_name}Sanitize completed. Dirs: {counters['dirs_renamed']}, Files: {counters['files_renamed']}, Collisions: {counters['collisions_resolved']}, Errors: {counters['errors']}")
         return counters
 
-def fix_mp4_files(input_folder, step_name="", log_level=None):
+def fix_mp4_files(input_folder, step_name="", log_level=None, tree_index=None):
     """
     Busca archivos .MP4/.MOV/.AVI sin su JSON correspondiente. Si existe un archivo .HEIC/.JPG/.JPEG
     con el mismo nombre base y sí tiene JSON (posiblemente truncado con .supplemental-metadata),
@@ -3034,6 +3229,7 @@ def fix_mp4_files(input_folder, step_name="", log_level=None):
         input_folder: Carpeta raíz donde buscar.
         step_name: Prefijo de mensajes de log.
         log_level: Nivel de log.
+        tree_index: FolderTreeIndex de input_folder para recorrer en lugar del disco (opcional). Los JSON copiados se añaden a él.
     """
     with set_log_level(LOGGER, log_level):
         counter_mp4_files_changed = 0
@@ -3042,15 +3238,18 @@ def fix_mp4_files(input_folder, step_name="", log_level=None):
         supplemental = SUPPLEMENTAL_METADATA  # ya definido globalmente como 'supplemental-metadata'
         disable_tqdm = log_level < logging.WARNING
 
-        all_video_files = []
-        for _, _, files in os.walk(input_folder):
-            all_video_files += [f for f in files if os.path.splitext(f)[1].lower() in video_exts]
+        if tree_index is not None:
+            total_video_files = tree_index.count_files(extensions=video_exts)
+        else:
+            total_video_files = 0
+            for _, _, files in os.walk(input_folder):
+                total_video_files += sum(1 for f in files if os.path.splitext(f)[1].lower() in video_exts)
 
-        if not all_video_files:
+        if not total_video_files:
             return 0
 
-        with tqdm(total=len(all_video_files), smoothing=0.1, desc=f"{MSG_TAGS['INFO']}{step_name}Fixing video JSONs", unit=" files", disable=disable_tqdm) as pbar:
-            for root, _, files in os.walk(input_folder):
+        with tqdm(total=total_video_files, smoothing=0.1, desc=f"{MSG_TAGS['INFO']}{step_name}Fixing video JSONs", unit=" files", disable=disable_tqdm) as pbar:
+            for root, _, files in (tree_index.walk() if tree_index is not None else os.walk(input_folder)):
                 file_set = set(files)
 
                 video_files = [f for f in files if os.path.splitext(f)[1].lower() in video_exts]
@@ -3093,13 +3292,15 @@ def fix_mp4_files(input_folder, step_name="", log_level=None):
                         src_path = os.path.join(root, matched_candidate)
                         dst_path = os.path.join(root, target_json)
                         shutil.copy(src_path, dst_path)
+                        if tree_index is not None:
+                            tree_index.add_file(root, target_json)
                         LOGGER.debug(f"{step_name}Copied: {matched_candidate} → {target_json}")
                         counter_mp4_files_changed += 1
 
         return counter_mp4_files_changed
 
 
-def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_length_threshold=46):
+def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_length_threshold=46, tree_index=None):
     """
     Recursively traverses `input_folder` and fixes:
       1) .json files with a truncated '.supplemental-metadata' suffix.
@@ -3115,6 +3316,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
         step_name (str): Prefix for log messages (e.g. "DEBUG   : ").
         log_level (int): Logging level for this operation.
         name_length_threshold (int): Minimum length of the base filename (sans extension) to consider.
+        tree_index (FolderTreeIndex): Index of input_folder to walk instead of the disk (optional). Renames are applied to it.
 
     Returns:
         dict: Counters of changes made, with keys:
@@ -3140,10 +3342,20 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
                 variants.add(s[:i])
         # sort longest first so regex matches the largest truncation before smaller ones
         return '|'.join(sorted(map(re.escape, variants), key=len, reverse=True))
+
+    def walk_input_folder():
+        return tree_index.walk() if tree_index is not None else os.walk(input_folder)
+
+    def track_rename(root, old_name, new_name):
+        if tree_index is not None:
+            tree_index.rename_file(root, old_name, new_name)
     # -------------------------------------------------------------- END OF AUXILIARY FUNCTIONS ---------------------------------------------------------------
 
     # Pre-count all files for reporting
-    total_files = sum(len(files) for _, _, files in os.walk(input_folder))
+    if tree_index is not None:
+        total_files = tree_index.count_files()
+    else:
+        total_files = sum(len(files) for _, _, files in os.walk(input_folder))
     variants_specials_pattern = make_variant_pattern(SPECIAL_SUFFIXES)
     variants_editted_pattern = make_variant_pattern(EDITTED_SUFFIXES)
     optional_counter = r'(?:\(\d+\))?'  # allow "(n)" counters
@@ -3172,7 +3384,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
         )
 
         # Walk through all subdirectories to process only JSON files
-        for root, _, files in os.walk(input_folder):
+        for root, _, files in walk_input_folder():
             files_set = set(files)  # for matching JSON sidecars
             for file in files:
                 name, ext = os.path.splitext(file)
@@ -3192,13 +3404,14 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
                         new_path = Path(root) / new_name
                         if str(old_path).lower() != str(new_path).lower():
                             os.rename(old_path, new_path)
+                            track_rename(root, file, new_name)
                             LOGGER.verbose(f"{step_name}Fixed JSON Supplemental Ext: {file} → {new_name}")
                             counters["supplemental_metadata_fixed"] += 1
                             # We need to medify file and old_path for next steps
                             file = new_name
                             old_path = new_path
                             name, ext = os.path.splitext(file)  # Refresh name and ext
-                            files_set = set(os.listdir(root))   # Refresh to include any renamed files
+                            files_set = set(tree_index.files(root)) if tree_index is not None else set(os.listdir(root))   # Refresh to include any renamed files
                             if not file_modified:
                                 counters["json_files_fixed"] += 1
                                 counters["total_files_fixed"] += 1
@@ -3245,6 +3458,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
                             new_path = Path(root) / new_name
                             if not new_path.exists() and str(old_path).lower() != str(new_path).lower():
                                 os.rename(old_path, new_path)
+                                track_rename(root, file, new_name)
                                 LOGGER.verbose(f"{step_name}Fixed JSON Origin File Ext : {file} → {new_name}")
                                 counters["extensions_fixed"] += 1
                                 if not file_modified:
@@ -3260,7 +3474,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
         # --- Case B: Non-JSON files (special suffixes or editted) ---
         # ------------------------------------------------------------
         # Walk through all subdirectories to process only Non-JSON files
-        for root, _, files in os.walk(input_folder):
+        for root, _, files in walk_input_folder():
             for file in files:
                 name, ext = os.path.splitext(file)
                 if ext.lower() != '.json' and len(name) >= name_length_threshold:
@@ -3289,6 +3503,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
                                     new_path = Path(root) / new_name
                                     if str(old_path).lower() != str(new_path).lower():
                                         os.rename(old_path, new_path)
+                                        track_rename(root, file, new_name)
                                         LOGGER.verbose(f"{step_name}Fixed ORIGIN Special Suffix: {file} → {new_name}")
                                         counters["special_suffixes_fixed"] += 1
                                         # We need to modify file and old_path for next steps and to keep changes if other suffixes are found
@@ -3317,6 +3532,7 @@ def fix_truncations(input_folder, step_name="", log_level=logging.INFO, name_len
                                 new_path = Path(root) / new_name
                                 if str(old_path).lower() != str(new_path).lower():
                                     os.rename(old_path, new_path)
+                                    track_rename(root, file, new_name)
                                     LOGGER.verbose(f"{step_name}Fixed ORIGIN Edited Suffix : {file} → {new_name}")
                                     counters["edited_suffixes_fixed"] += 1
                                     # We need to medify file and old_path for next steps and to keep changes if other suffixes are found
@@ -44,14 +44,23 @@ def build_people_map(takeout_root):
     labels must not be merged: consumers use ``taken_at`` to select the one
     belonging to the physical file being uploaded.
     """
+    def iter_sidecars():
+        for json_path in sorted(Path(takeout_root).rglob("*.json"), key=lambda path: str(path).casefold()):
+            if json_path.name == PEOPLE_MAP_FILENAME:
+                continue
+            try:
+                payload = json.loads(json_path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            yield json_path, payload
+
+    return build_people_map_from_sidecars(iter_sidecars())
+
+
+def build_people_map_from_sidecars(sidecars):
+    """Build the people map from (json_path, payload) pairs, wherever the sidecars were read from."""
     entries = {}
-    for json_path in sorted(Path(takeout_root).rglob("*.json"), key=lambda path: str(path).casefold()):
-        if json_path.name == PEOPLE_MAP_FILENAME:
-            continue
-        try:
-            payload = json.loads(json_path.read_text(encoding="utf-8"))
-        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
-            continue
+    for json_path, payload in sidecars:
         names = _people_from_sidecar(payload) if isinstance(payload, dict) else []
         if not names:
             continue
@@ -155,3 +164,23 @@ def load_people_map(input_folder):
             except (OSError, UnicodeDecodeError, json.JSONDecodeError):
                 return {}
     return {}
+
+
+def merge_people_map_files(target_path, source_path):
+    """Merge the people map at source_path into the one at target_path and remove source_path."""
+    merged = {}
+    for path in (target_path, source_path):
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        assets = payload.get("assets", {}) if isinstance(payload, dict) else {}
+        for asset_name, entries in _normalize_loaded_people_map(assets).items():
+            merged.setdefault(asset_name, []).extend(entries)
+    merged = _normalize_loaded_people_map(merged)
+    Path(target_path).write_text(
+        json.dumps({"version": 2, "assets": merged}, ensure_ascii=False, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    Path(source_path).unlink(missing_ok=True)
+    return len(merged)
@@ -0,0 +1,140 @@
+"""SQLite-backed manifest of the Google Takeout ZIP archives and members already processed."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+TAKEOUT_MANIFEST_FOLDER = "Takeout_Manifest"
+TAKEOUT_MANIFEST_SCHEMA_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifest_archives (
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    cd_hash TEXT NOT NULL,
+    output_folder TEXT NOT NULL,
+    processed_at TEXT NOT NULL,
+    PRIMARY KEY (name, size, cd_hash)
+);
+CREATE TABLE IF NOT EXISTS manifest_members (
+    member TEXT NOT NULL,
+    crc INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    archive TEXT NOT NULL,
+    output_folder TEXT NOT NULL,
+    PRIMARY KEY (member, crc, size)
+);
+CREATE TABLE IF NOT EXISTS manifest_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def build_takeout_manifest_path(manifest_folder, takeout_folder):
+    """Return the manifest file of one Takeout folder (the folder holding the ZIP files)."""
+    identity = os.path.normcase(os.path.abspath(os.path.expanduser(str(takeout_folder))))
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+    return str(Path(manifest_folder) / f"takeout_manifest_{digest}.sqlite")
+
+
+def fingerprint_archive(zip_path, infos):
+    """
+    Return (name, size, cd_hash) of a ZIP archive.
+
+    cd_hash is a SHA-1 of the central directory entries (name, CRC32 and sizes of every member),
+    so a part downloaded again with the same content keeps its fingerprint even if its file
+    dates change, while a part with the same name but different content does not.
+    """
+    digest = hashlib.sha1()
+    for info in sorted(infos, key=lambda item: item.filename):
+        digest.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\0{info.compress_size}\n".encode("utf-8"))
+    return os.path.basename(str(zip_path)), os.path.getsize(zip_path), digest.hexdigest()
+
+
+def member_key(info):
+    """Key of a ZIP member in the manifest: its path inside the Takeout, CRC32 and uncompressed size."""
+    return info.filename, info.CRC, info.file_size
+
+
+class TakeoutManifest:
+    """
+    Remembers which Takeout ZIP archives and members have been processed, and into which output folder.
+
+    A Takeout downloaded again with a few extra parts can then be processed incrementally:
+    archives whose fingerprint is recorded are skipped, and from the remaining archives only
+    members not recorded yet are extracted, so parts split differently by a new export do not
+    bring back the files that were already processed.
+    """
+
+    def __init__(self, manifest_path):
+        self.manifest_path = str(manifest_path)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.manifest_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT value FROM manifest_meta WHERE key = 'schema_version'").fetchone()
+        if not row or row[0] != TAKEOUT_MANIFEST_SCHEMA_VERSION:
+            self._conn.execute("DELETE FROM manifest_archives")
+            self._conn.execute("DELETE FROM manifest_members")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manifest_meta (key, value) VALUES ('schema_version', ?)",
+                (TAKEOUT_MANIFEST_SCHEMA_VERSION,),
+            )
+        self._conn.commit()
+
+    def is_archive_processed(self, fingerprint):
+        """Return True if an archive with this (name, size, cd_hash) fingerprint was already processed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM manifest_archives WHERE name = ? AND size = ? AND cd_hash = ?",
+                tuple(fingerprint),
+            ).fetchone()
+        return row is not None
+
+    def processed_member_keys(self):
+        """Return the set of (member, crc, size) keys of every member already processed."""
+        with self._lock:
+            rows = self._conn.execute("SELECT member, crc, size FROM manifest_members").fetchall()
+        return {(member, crc, size) for member, crc, size in rows}
+
+    def get_output_folder(self):
+        """Return the output folder the processed content was merged into, or None on the first run."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM manifest_meta WHERE key = 'output_folder'").fetchone()
+        return row[0] if row and row[0] else None
+
+    def record(self, archives, members, output_folder):
+        """
+        Record a successful run.
+
+        archives is an iterable of (name, size, cd_hash) fingerprints and members an iterable of
+        (archive name, ZipInfo) for the members that were processed into output_folder.
+        """
+        output_folder = str(output_folder)
+        processed_at = datetime.now().isoformat(timespec="seconds")
+        archive_rows = [(name, size, cd_hash, output_folder, processed_at) for name, size, cd_hash in archives]
+        member_rows = [(*member_key(info), archive, output_folder) for archive, info in members]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO manifest_archives (name, size, cd_hash, output_folder, processed_at) VALUES (?, ?, ?, ?, ?)",
+                archive_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO manifest_members (member, crc, size, archive, output_folder) VALUES (?, ?, ?, ?, ?)",
+                member_rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manifest_meta (key, value) VALUES ('output_folder', ?)",
+                (output_folder,),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
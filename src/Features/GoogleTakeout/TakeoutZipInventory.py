@@ -0,0 +1,111 @@
+"""Google Takeout inventory read straight from the ZIP central directories and member streams."""
+
+import json
+import os
+import re
+import zipfile
+from pathlib import PurePosixPath
+
+from Core.GlobalVariables import GOOGLE_PHOTOS_CONTAINER_NAMES, TAKEOUT_YEAR_FOLDER_PATTERNS
+from Features.GoogleTakeout.PeopleMetadata import PEOPLE_MAP_FILENAME, build_people_map_from_sidecars
+
+
+def _normalize_folder_name(value):
+    return re.sub(r"\s+", " ", str(value or "").strip()).casefold()
+
+
+class TakeoutZipInventory:
+    """
+    Inventory of a zipped Google Takeout, built without extracting anything.
+
+    Only the central directory of every ZIP part is read to list the members, and the JSON
+    sidecars are decoded from their member streams, so the sidecar count, album folders,
+    people labels and the space needed to extract the Takeout are known before the first
+    byte is written to disk.
+    """
+
+    def __init__(self, zip_folder):
+        self.zip_folder = str(zip_folder)
+        self.zip_paths = []
+        self.unreadable_zips = []
+        self.members = []  # (zip_path, ZipInfo) of every file member, in archive name order
+        self._scan()
+
+    def _scan(self):
+        zip_names = sorted(
+            (name for name in os.listdir(self.zip_folder) if name.lower().endswith(".zip")),
+            key=lambda name: (name.casefold(), name),
+        )
+        for zip_name in zip_names:
+            zip_path = os.path.join(self.zip_folder, zip_name)
+            try:
+                with zipfile.ZipFile(zip_path, "r", allowZip64=True) as zip_ref:
+                    infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+            except (zipfile.BadZipFile, OSError):
+                self.unreadable_zips.append(zip_path)
+                continue
+            self.zip_paths.append(zip_path)
+            self.members.extend((zip_path, info) for info in infos)
+
+    @property
+    def total_uncompressed_bytes(self):
+        return sum(info.file_size for _, info in self.members)
+
+    @property
+    def total_compressed_bytes(self):
+        return sum(info.compress_size for _, info in self.members)
+
+    def sidecar_members(self):
+        return [
+            (zip_path, info)
+            for zip_path, info in self.members
+            if info.filename.lower().endswith(".json") and PurePosixPath(info.filename).name != PEOPLE_MAP_FILENAME
+        ]
+
+    def album_folders(self):
+        """Names of the folders found directly inside a Google Photos container that are not year folders."""
+        albums = set()
+        for _, info in self.members:
+            parts = PurePosixPath(info.filename).parts
+            for index, part in enumerate(parts[:-2]):
+                if _normalize_folder_name(part) not in GOOGLE_PHOTOS_CONTAINER_NAMES:
+                    continue
+                album = parts[index + 1]
+                normalized = _normalize_folder_name(album)
+                if not any(pattern.match(normalized) for pattern in TAKEOUT_YEAR_FOLDER_PATTERNS):
+                    albums.add(album)
+                break
+        return sorted(albums, key=str.casefold)
+
+    def iter_sidecars(self):
+        """
+        Yield (member_path, payload) for every JSON sidecar, decoded from the archive without extracting it.
+
+        Sidecars are yielded in case-insensitive path order across all the parts, like
+        PeopleMetadata.build_people_map() walks the extracted Takeout, so both build the same map.
+        """
+        open_zips = {}
+        try:
+            for zip_path, info in sorted(self.sidecar_members(), key=lambda member: member[1].filename.casefold()):
+                if zip_path not in open_zips:
+                    try:
+                        open_zips[zip_path] = zipfile.ZipFile(zip_path, "r", allowZip64=True)
+                    except (zipfile.BadZipFile, OSError):
+                        open_zips[zip_path] = None
+                zip_ref = open_zips[zip_path]
+                if zip_ref is None:
+                    continue
+                try:
+                    with zip_ref.open(info, "r") as stream:
+                        payload = json.loads(stream.read().decode("utf-8"))
+                except (OSError, UnicodeDecodeError, json.JSONDecodeError, zipfile.BadZipFile):
+                    continue
+                yield PurePosixPath(info.filename), payload
+        finally:
+            for zip_ref in open_zips.values():
+                if zip_ref is not None:
+                    zip_ref.close()
+
+    def build_people_map(self):
+        """Same map as PeopleMetadata.build_people_map() on the extracted Takeout, read from the ZIP files."""
+        return build_people_map_from_sidecars(self.iter_sidecars())
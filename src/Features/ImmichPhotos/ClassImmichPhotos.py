@@ -8,6 +8,7 @@ import re
 import sys
 import threading
 import time
+import weakref
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
 from datetime import datetime, timedelta, timezone
@@ -17,6 +18,8 @@ import mimetypes
 import piexif
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dateutil import parser
 from halo import Halo
 from requests_toolbelt.multipart.encoder import MultipartEncoder
@@ -25,10 +28,13 @@ from tabulate import tabulate
 from Core.CustomLogger import set_log_level
 from Core.GlobalVariables import LOGGER, ARGS, MSG_TAGS, FOLDERNAME_NO_ALBUMS, CONFIGURATION_FILE, FOLDERNAME_ALBUMS
 from Features.BaseMediaClient import BaseMediaClient
+from Features.ImmichPhotos.ImmichInventoryCache import IMMICH_INVENTORY_CACHE_FOLDER, ImmichInventoryCache, build_immich_inventory_cache_path, parse_server_date
 from Utils.DateUtils import parse_text_datetime_to_epoch, is_date_outside_range, is_date_outside_calendar_range
 from Utils.FileUtils import matches_any_pattern, merge_exclusion_patterns
-from Utils.GeneralUtils import update_metadata, convert_to_list, tqdm, match_pattern, replace_pattern, has_any_filter, confirm_continue, sha1_checksum, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, scan_album_consolidation_groups, print_album_consolidation_preview, print_remove_albums_preview, extract_asset_capture_years, extract_asset_capture_datetimes
-from Utils.StandaloneUtils import change_working_dir
+from Utils.GeneralUtils import update_metadata, convert_to_list, tqdm, match_pattern, replace_pattern, has_any_filter, confirm_continue, sha1_checksum, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, scan_album_consolidation_groups, print_album_consolidation_preview, print_remove_albums_preview, extract_asset_capture_years, extract_asset_capture_datetimes, run_transfers_in_pool, run_downloads_in_pool
+from Utils.StandaloneUtils import change_working_dir, resolve_external_path
+from Utils.DownloadUtils import DOWNLOAD_PARALLEL_SEGMENTS, download_to_file
+from Utils.StreamUtils import ResponseBodyStream, get_response_content_length
 from Utils.DuplicateUtils import duplicate_asset_people_count, duplicate_asset_tag_count, run_duplicate_asset_cleanup, select_people_then_chronology_keeper
 from Features.GoogleTakeout.PeopleMetadata import build_people_map, load_people_map
 
@@ -53,11 +59,65 @@ Python module with example functions to interact with Immich Photos, including f
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Guards the lazy creation of the per-client thread-local session store.
+_WORKER_SESSIONS_INIT_LOCK = threading.Lock()
+
 
 class ImmichAssetInventoryError(RuntimeError):
     """Raised when PhotoMigrator cannot obtain a complete Immich asset inventory."""
 
 
+class _BulkUploadCheckBatcher:
+    """
+    Coalesce the pre-upload checks of concurrent pushers into bulk requests.
+
+    Each caller adds its checksum to a shared batch. One caller at a time acts as
+    leader: it waits up to max_wait_seconds for the batch to fill, sends it with
+    send_batch(checksums) -> {checksum: asset_id} and hands every caller its result.
+    """
+
+    def __init__(self, send_batch, batch_size, max_wait_seconds):
+        self._send_batch = send_batch
+        self._batch_size = max(1, int(batch_size))
+        self._max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self._condition = threading.Condition()
+        self._pending = []
+        self._leader_active = False
+
+    def lookup(self, checksum):
+        entry = {"checksum": checksum, "asset_id": None, "done": False}
+        with self._condition:
+            self._pending.append(entry)
+            self._condition.notify_all()
+            while not entry["done"]:
+                if self._leader_active:
+                    self._condition.wait()
+                    continue
+                self._leader_active = True
+                deadline = time.monotonic() + self._max_wait_seconds
+                while len(self._pending) < self._batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._pending[:self._batch_size]
+                del self._pending[:self._batch_size]
+                self._condition.release()
+                try:
+                    found = self._send_batch([item["checksum"] for item in batch]) or {}
+                except Exception as error:
+                    LOGGER.debug(f"Immich bulk upload check failed; uploading the batch without it: {error}")
+                    found = {}
+                finally:
+                    self._condition.acquire()
+                for item in batch:
+                    item["asset_id"] = found.get(item["checksum"])
+                    item["done"] = True
+                self._leader_active = False
+                self._condition.notify_all()
+        return entry["asset_id"]
+
+
 ##############################################################################
 #                              START OF CLASS                                #
 ##############################################################################
@@ -73,12 +133,24 @@ class ClassImmichPhotos(BaseMediaClient):
     DUPLICATE_METADATA_REVIEW_WORKERS = 100
     IMMICH_AUTH_TIMEOUT = (10, 30)
     IMMICH_ASSET_UPLOAD_TIMEOUT = (10, 900)
+    IMMICH_ASSET_DOWNLOAD_TIMEOUT = (10, 300)
     IMMICH_DUPLICATES_TIMEOUT = (10, 300)
     IMMICH_DUPLICATES_RESOLVE_BATCH_SIZE = 100
     IMMICH_MANUAL_DUPLICATE_DELETE_BATCH_SIZE = 250
     IMMICH_METADATA_MERGE_TIMEOUT = (10, 60)
     IMMICH_METADATA_MERGE_RETRIES = 5
     IMMICH_BURST_STACK_TIMEOUT = (10, 30)
+    IMMICH_HTTP_POOL_SIZE = 32
+    IMMICH_HTTP_MAX_RETRIES = 3
+    IMMICH_HTTP_RETRY_BACKOFF = 0.5
+    IMMICH_HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+    IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE = 500
+    IMMICH_BULK_UPLOAD_CHECK_MAX_WAIT_SECONDS = 0.05
+    IMMICH_BULK_UPLOAD_CHECK_TIMEOUT = (10, 120)
+    IMMICH_INVENTORY_CACHE = False
+    IMMICH_MAX_PARALLEL_UPLOADS = 8
+    IMMICH_MAX_PARALLEL_DOWNLOADS = 8
+    _worker_local = None
     def __init__(self, account_id=1):
         """
         Constructor that initializes what used to be global variables.
@@ -100,6 +172,8 @@ class ClassImmichPhotos(BaseMediaClient):
         self.SESSION_TOKEN = None
         self.API_KEY_LOGIN = False
         self.HEADERS_WITH_CREDENTIALS = {}
+        self._worker_local = threading.local()
+        self._worker_sessions = weakref.WeakSet()
 
         self.ALLOWED_IMMICH_MEDIA_EXTENSIONS = []
         self.ALLOWED_IMMICH_PHOTO_EXTENSIONS = []
@@ -181,6 +255,24 @@ class ClassImmichPhotos(BaseMediaClient):
             self.IMMICH_USER_API_KEY = self.CONFIG.get(section_to_load).get(f'IMMICH_API_KEY_USER_{self.ACCOUNT_ID}', None)      # Read the configuration for the user account given by the suffix ACCAUNT_ID
             self.IMMICH_USERNAME = self.CONFIG.get(section_to_load).get(f'IMMICH_USERNAME_{self.ACCOUNT_ID}', None)              # Read the configuration for the user account given by the suffix ACCAUNT_ID
             self.IMMICH_PASSWORD = self.CONFIG.get(section_to_load).get(f'IMMICH_PASSWORD_{self.ACCOUNT_ID}', None)              # Read the configuration for the user account given by the suffix ACCAUNT_ID
+            try:
+                self.IMMICH_HTTP_POOL_SIZE = max(1, min(256, int(str(self.CONFIG.get(section_to_load).get('IMMICH_HTTP_POOL_SIZE', self.IMMICH_HTTP_POOL_SIZE)).strip())))
+            except (TypeError, ValueError):
+                self.IMMICH_HTTP_POOL_SIZE = ClassImmichPhotos.IMMICH_HTTP_POOL_SIZE
+            try:
+                self.IMMICH_HTTP_MAX_RETRIES = max(0, min(10, int(str(self.CONFIG.get(section_to_load).get('IMMICH_HTTP_MAX_RETRIES', self.IMMICH_HTTP_MAX_RETRIES)).strip())))
+            except (TypeError, ValueError):
+                self.IMMICH_HTTP_MAX_RETRIES = ClassImmichPhotos.IMMICH_HTTP_MAX_RETRIES
+            try:
+                self.IMMICH_MAX_PARALLEL_UPLOADS = max(1, min(32, int(str(self.CONFIG.get(section_to_load).get('IMMICH_MAX_PARALLEL_UPLOADS', self.IMMICH_MAX_PARALLEL_UPLOADS)).strip())))
+            except (TypeError, ValueError):
+                self.IMMICH_MAX_PARALLEL_UPLOADS = ClassImmichPhotos.IMMICH_MAX_PARALLEL_UPLOADS
+            try:
+                self.IMMICH_MAX_PARALLEL_DOWNLOADS = max(1, min(32, int(str(self.CONFIG.get(section_to_load).get('IMMICH_MAX_PARALLEL_DOWNLOADS', self.IMMICH_MAX_PARALLEL_DOWNLOADS)).strip())))
+            except (TypeError, ValueError):
+                self.IMMICH_MAX_PARALLEL_DOWNLOADS = ClassImmichPhotos.IMMICH_MAX_PARALLEL_DOWNLOADS
+            raw_inventory_cache = self.CONFIG.get(section_to_load).get('IMMICH_INVENTORY_CACHE', str(self.IMMICH_INVENTORY_CACHE))
+            self.IMMICH_INVENTORY_CACHE = str(raw_inventory_cache).strip().lower() in {"1", "true", "yes", "y", "on"}
 
             # Verify required parameters and prompt on screen if missing
             if not self.IMMICH_URL or self.IMMICH_URL.strip() == '':
@@ -252,7 +344,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 }
                 try:
                     LOGGER.info("Validating Immich user API key...")
-                    response = requests.post(
+                    response = self._get_worker_session().post(
                         url,
                         headers=headers,
                         data={},
@@ -282,7 +374,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 }
                 try:
                     LOGGER.info("Authenticating with Immich user/password...")
-                    response = requests.post(
+                    response = self._get_worker_session().post(
                         url,
                         headers=headers,
                         data=payload,
@@ -332,9 +424,77 @@ class ClassImmichPhotos(BaseMediaClient):
         with set_log_level(LOGGER, log_level):
             self.SESSION_TOKEN = None
             self.HEADERS_WITH_CREDENTIALS = {}
+            self._close_worker_sessions()
+            inventory_cache = getattr(self, "_inventory_cache", None)
+            if inventory_cache is not None:
+                self._inventory_cache = None
+                inventory_cache.close()
             LOGGER.info(f"Session closed locally (Bearer Token discarded).")
 
 
+    ###########################################################################
+    #                              HTTP TRANSPORT                             #
+    ###########################################################################
+    def _build_session(self):
+        """
+        Build a keep-alive session whose adapter pools connections to the Immich server.
+
+        Connection errors are retried for every method, because nothing reached the server.
+        Throttling and gateway errors (429/502/503/504) are only retried for idempotent
+        methods, with exponential backoff and honouring Retry-After; uploads keep their own
+        retry policy in the callers.
+        """
+        session = requests.Session()
+        retries = Retry(
+            total=self.IMMICH_HTTP_MAX_RETRIES,
+            connect=self.IMMICH_HTTP_MAX_RETRIES,
+            read=0,
+            status=self.IMMICH_HTTP_MAX_RETRIES,
+            other=0,
+            backoff_factor=self.IMMICH_HTTP_RETRY_BACKOFF,
+            status_forcelist=self.IMMICH_HTTP_RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.IMMICH_HTTP_POOL_SIZE,
+            pool_maxsize=self.IMMICH_HTTP_POOL_SIZE,
+            max_retries=retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_worker_session(self):
+        """Return the session of the calling thread, so concurrent workers never share one."""
+        if self._worker_local is None:
+            with _WORKER_SESSIONS_INIT_LOCK:
+                if self._worker_local is None:
+                    self._worker_local = threading.local()
+                    self._worker_sessions = weakref.WeakSet()
+        session = getattr(self._worker_local, "session", None)
+        if session is None:
+            session = self._build_session()
+            self._worker_local.session = session
+            with _WORKER_SESSIONS_INIT_LOCK:
+                self._worker_sessions.add(session)
+        return session
+
+    def _close_worker_sessions(self):
+        # Sessions of finished worker threads are dropped with their thread, so the
+        # registry only holds weak references to the ones still alive.
+        with _WORKER_SESSIONS_INIT_LOCK:
+            sessions = list(getattr(self, "_worker_sessions", None) or [])
+            self._worker_sessions = weakref.WeakSet()
+            self._worker_local = threading.local()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
     ###########################################################################
     #                           GENERAL UTILITY                               #
     ###########################################################################
@@ -377,7 +537,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/server/media-types"
             try:
-                resp = requests.get(
+                resp = self._get_worker_session().get(
                     url,
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     timeout=self.IMMICH_AUTH_TIMEOUT,
@@ -397,7 +557,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/users/me"
             try:
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, data={})
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, data={})
                 resp.raise_for_status()
                 data = resp.json() or {}
                 if isinstance(data, dict):
@@ -451,7 +611,7 @@ class ClassImmichPhotos(BaseMediaClient):
             url = f"{self.IMMICH_URL}/api/search/person"
             params = {"name": name}
             try:
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, params=params)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, params=params)
                 resp.raise_for_status()
                 data = resp.json()
                 if data:
@@ -648,7 +808,7 @@ class ClassImmichPhotos(BaseMediaClient):
         cached = self._takeout_people_tag_ids.get(tag_value)
         if cached:
             return cached
-        response = requests.put(
+        response = self._get_worker_session().put(
             f"{self.IMMICH_URL}/api/tags",
             headers=self.HEADERS_WITH_CREDENTIALS,
             json={"tags": [tag_value]},
@@ -692,7 +852,7 @@ class ClassImmichPhotos(BaseMediaClient):
                     tag_id = self._get_or_create_takeout_people_tag_id(name)
                     if not tag_id:
                         continue
-                    response = requests.put(
+                    response = self._get_worker_session().put(
                         f"{self.IMMICH_URL}/api/tags/{tag_id}/assets",
                         headers=self.HEADERS_WITH_CREDENTIALS,
                         json={"ids": [asset_id]},
@@ -735,7 +895,7 @@ class ClassImmichPhotos(BaseMediaClient):
             payload = json.dumps({"albumName": album_name})
 
             try:
-                resp = requests.post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
+                resp = self._get_worker_session().post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 album_id = data.get("id")
@@ -762,7 +922,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/albums/{album_id}"
             try:
-                response = requests.delete(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                response = self._get_worker_session().delete(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 if 200 <= response.status_code < 300:
                     LOGGER.info(f"Album '{album_name}' with ID={album_id} removed (status: {response.status_code}).")
                     return True
@@ -781,7 +941,7 @@ class ClassImmichPhotos(BaseMediaClient):
             return None
         with set_log_level(LOGGER, log_level):
             try:
-                response = requests.get(
+                response = self._get_worker_session().get(
                     f"{self.IMMICH_URL}/api/albums/{album_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     params={"withoutAssets": "true"},
@@ -817,7 +977,7 @@ class ClassImmichPhotos(BaseMediaClient):
 
     def _update_album_description(self, album_id, description, log_level=None):
         try:
-            response = requests.patch(
+            response = self._get_worker_session().patch(
                 f"{self.IMMICH_URL}/api/albums/{album_id}",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 json={"description": description},
@@ -833,7 +993,7 @@ class ClassImmichPhotos(BaseMediaClient):
     def _remove_album_shared_links(self, album_id, log_level=None):
         """Remove every public shared link attached to an album."""
         try:
-            response = requests.get(
+            response = self._get_worker_session().get(
                 f"{self.IMMICH_URL}/api/shared-links",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 params={"albumId": album_id},
@@ -846,7 +1006,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 link_id = str((link or {}).get("id") or "").strip()
                 if not link_id:
                     continue
-                response = requests.delete(
+                response = self._get_worker_session().delete(
                     f"{self.IMMICH_URL}/api/shared-links/{link_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -862,7 +1022,7 @@ class ClassImmichPhotos(BaseMediaClient):
         """Make direct album access match the supplied restrictive user set."""
         try:
             for user_id in sorted(set(current_users) - set(desired_users)):
-                response = requests.delete(
+                response = self._get_worker_session().delete(
                     f"{self.IMMICH_URL}/api/albums/{album_id}/user/{user_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -874,7 +1034,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 for user_id in sorted(set(desired_users) - set(current_users))
             ]
             if missing_users:
-                response = requests.put(
+                response = self._get_worker_session().put(
                     f"{self.IMMICH_URL}/api/albums/{album_id}/users",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     json={"albumUsers": missing_users},
@@ -885,7 +1045,7 @@ class ClassImmichPhotos(BaseMediaClient):
             for user_id in sorted(set(current_users) & set(desired_users)):
                 if current_users[user_id] == desired_users[user_id]:
                     continue
-                response = requests.put(
+                response = self._get_worker_session().put(
                     f"{self.IMMICH_URL}/api/albums/{album_id}/user/{user_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     json={"role": desired_users[user_id]},
@@ -995,7 +1155,7 @@ class ClassImmichPhotos(BaseMediaClient):
             url = f"{self.IMMICH_URL}/api/albums"
             try:
                 logger.info("Retrieving owned albums from Immich Photos. This may take some time, please be patient...")
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 resp.raise_for_status()
                 albums = resp.json()
                 user_id = self.get_user_id(log_level=logging.WARNING)
@@ -1042,7 +1202,7 @@ class ClassImmichPhotos(BaseMediaClient):
             url = f"{self.IMMICH_URL}/api/albums"
             try:
                 LOGGER.info("Retrieving owned and shared albums from Immich Photos. This may take some time, please be patient...")
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 resp.raise_for_status()
                 albums = resp.json()
                 albums_filtered = []
@@ -1341,7 +1501,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/assets/{asset_id}"
             try:
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 people_list = data.get("people", [])
@@ -1350,6 +1510,104 @@ class ClassImmichPhotos(BaseMediaClient):
                 LOGGER.error(f"Failed to retrieve assets info for '{asset_id}': {str(e)}")
                 return []
 
+    def _iter_assets_by_filters_pages(self, is_not_in_album=None, is_archived=None, with_deleted=None, log_level=logging.WARNING):
+        """
+        Yield the assets matching the configured filters, one 'POST /api/search/metadata' page at a time.
+
+        Raises:
+            Exception: Request/HTTP errors are propagated, so callers never mistake a partial listing for a complete one.
+        """
+        with set_log_level(LOGGER, log_level):
+            # Obtain the correct type for the API call
+            if self.type:
+                image_aliases = {"image", "images", "photo", "photos"}
+                video_aliases = {"video", "videos"}
+                type_lower = self.type.lower()
+                if type_lower in image_aliases:
+                    self.type = "IMAGE"
+                elif type_lower in video_aliases:
+                    self.type = "VIDEO"
+                elif type_lower == "all":
+                    self.type = None  # No filtering needed
+                else:
+                    self.type = None  # Unknown alias, treat as no filtering
+
+            # Obtain the person_ids_list to include in the API call
+            self.person_ids_list = []
+            if self.person:
+                self.person_ids_list = self.get_person_id(name=self.person, log_level=log_level)
+                # If person was provided but person_ids_list is empty means that the person does not exists, so there is nothing to list
+                if not self.person_ids_list:
+                    return
+
+            self.login(log_level=log_level)
+            url = f"{self.IMMICH_URL}/api/search/metadata"
+
+            next_page = 1
+            while True:
+                # Immich v3 returns ``nextPage`` as a string while its
+                # metadata-search endpoint validates ``page`` as an integer.
+                # Keep the global filtered search aligned with the album
+                # search paginator to avoid a 400 from the second page on.
+                payload_data = {
+                    "page": int(next_page),
+                    "order": "desc",
+                    # "withArchived": False,
+                    # "with_deleted": False,
+                    # "country": "string",
+                    # "city": "string",
+                    # "type": "IMAGE",
+                    # "is_not_in_album": False,
+                    # "is_archived": True,
+                    # "isOffline": isOffline,
+                    # "isEncoded": True,
+                    # "isFavorite": True,
+                    # "isMotion": True,
+                    # "isVisible": True,
+                    # "withRemoved": True,
+                    # "withExif": True,
+                    # "withPeople": True,
+                    # "withStacked": True,
+
+                    # "createdAfter": "string",
+                    # "createdBefore": "string",
+                    # "takenAfter": "string",
+                    # "takenBefore": "string",
+                    # "updatedAfter": "string",
+                    # "updatedBefore": "string",
+
+                    # "personIds": [
+                    #   "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+                    # ],
+                }
+                if with_deleted:
+                    payload_data["withDeleted"] = with_deleted
+                if is_not_in_album:
+                    payload_data["isNotInAlbum"] = is_not_in_album
+                if is_archived:
+                    payload_data["isArchived"] = is_archived
+
+                if self.from_date: payload_data["takenAfter"] = self.from_date
+                if self.to_date: payload_data["takenBefore"] = self.to_date
+                if self.country: payload_data["country"] = self.country
+                if self.city: payload_data["city"] = self.city
+                if self.person_ids_list: payload_data["personIds"] = [self.person_ids_list]
+                if self.type: payload_data["type"] = self.type
+
+                payload = json.dumps(payload_data)
+                resp = self._get_worker_session().post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
+                resp.raise_for_status()
+                data = resp.json()
+                items = data.get("assets", {}).get("items", [])
+                # Add new fields "time" with the same value as "fileCreatedAt" and "filename" with the same value as "originalFileName" to allign with Synology Photos
+                for asset in items:
+                    asset["time"] = asset["fileCreatedAt"]
+                    asset["filename"] = asset["originalFileName"]
+                yield items
+                next_page = data.get("assets", {}).get("nextPage", None)
+                if next_page is None:
+                    break
+
     def get_assets_by_filters(self, type='all', is_not_in_album=None, is_archived=None, with_deleted=None, log_level=logging.WARNING):
         """
         Lists all assets in Immich Photos that match with the specified filters.
@@ -1364,115 +1622,29 @@ class ClassImmichPhotos(BaseMediaClient):
             :param with_deleted:
         """
         with set_log_level(LOGGER, log_level):
-            try:
-                # Reuse global cache only for the default "global search" shape.
-                # Queries with is_not_in_album/is_archived/with_deleted are different datasets
-                # and must not poison the global cache.
-                use_global_cache = (is_not_in_album is None and is_archived is None and with_deleted is None)
-
-                if use_global_cache and self.all_assets_filtered is not None:
-                    return self.all_assets_filtered
-
-                # Obtain the correct type for the API call
-                if self.type:
-                    image_aliases = {"image", "images", "photo", "photos"}
-                    video_aliases = {"video", "videos"}
-                    type_lower = self.type.lower()
-                    if type_lower in image_aliases:
-                        self.type = "IMAGE"
-                    elif type_lower in video_aliases:
-                        self.type = "VIDEO"
-                    elif type_lower == "all":
-                        self.type = None  # No filtering needed
-                    else:
-                        self.type = None  # Unknown alias, treat as no filtering
+            # Reuse global cache only for the default "global search" shape.
+            # Queries with is_not_in_album/is_archived/with_deleted are different datasets
+            # and must not poison the global cache.
+            use_global_cache = (is_not_in_album is None and is_archived is None and with_deleted is None)
 
-                # Obtain the person_ids_list to include in the API call
-                self.person_ids_list = []
-                if self.person:
-                    self.person_ids_list = self.get_person_id(name=self.person, log_level=log_level)
-                    # If person was provided but person_ids_list is empty means that the person does not exists, so return []
-                    if not self.person_ids_list:
-                        if use_global_cache:
-                            self.all_assets_filtered = []
-                        return []
-
-
-                self.login(log_level=log_level)
-                url = f"{self.IMMICH_URL}/api/search/metadata"
-                all_filtered_assets = []
+            if use_global_cache and self.all_assets_filtered is not None:
+                return self.all_assets_filtered
 
-                next_page = 1
-                while True:
-                    # Immich v3 returns ``nextPage`` as a string while its
-                    # metadata-search endpoint validates ``page`` as an integer.
-                    # Keep the global filtered search aligned with the album
-                    # search paginator to avoid a 400 from the second page on.
-                    payload_data = {
-                        "page": int(next_page),
-                        "order": "desc",
-                        # "withArchived": False,
-                        # "with_deleted": False,
-                        # "country": "string",
-                        # "city": "string",
-                        # "type": "IMAGE",
-                        # "is_not_in_album": False,
-                        # "is_archived": True,
-                        # "isOffline": isOffline,
-                        # "isEncoded": True,
-                        # "isFavorite": True,
-                        # "isMotion": True,
-                        # "isVisible": True,
-                        # "withRemoved": True,
-                        # "withExif": True,
-                        # "withPeople": True,
-                        # "withStacked": True,
-
-                        # "createdAfter": "string",
-                        # "createdBefore": "string",
-                        # "takenAfter": "string",
-                        # "takenBefore": "string",
-                        # "updatedAfter": "string",
-                        # "updatedBefore": "string",
-
-                        # "personIds": [
-                        #   "3fa85f64-5717-4562-b3fc-2c963f66afa6"
-                        # ],
-                    }
-                    if with_deleted:
-                        payload_data["withDeleted"] = with_deleted
-                    if is_not_in_album:
-                        payload_data["isNotInAlbum"] = is_not_in_album
-                    if is_archived:
-                        payload_data["isArchived"] = is_archived
-
-                    if self.from_date: payload_data["takenAfter"] = self.from_date
-                    if self.to_date: payload_data["takenBefore"] = self.to_date
-                    if self.country: payload_data["country"] = self.country
-                    if self.city: payload_data["city"] = self.city
-                    if self.person_ids_list: payload_data["personIds"] = [self.person_ids_list]
-                    if self.type: payload_data["type"] = self.type
-
-                    payload = json.dumps(payload_data)
-                    resp = requests.post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    items = data.get("assets", {}).get("items", [])
+            all_filtered_assets = []
+            try:
+                for items in self._iter_assets_by_filters_pages(
+                    is_not_in_album=is_not_in_album,
+                    is_archived=is_archived,
+                    with_deleted=with_deleted,
+                    log_level=log_level,
+                ):
                     all_filtered_assets.extend(items)
-                    next_page = data.get("assets", {}).get("nextPage", None)
-                    if next_page is None:
-                        break
             except Exception as e:
                 LOGGER.error(f"Failed to retrieve assets: {str(e)}")
                 # A partial filtered result can silently omit albums and assets
                 # during Download All. Never cache or return it as complete.
                 return []
 
-            # Add new fields "time" with the same value as "fileCreatedAt" and "filename" with the same value as "originalFileName" to allign with Synology Photos
-            for asset in all_filtered_assets:
-                asset["time"] = asset["fileCreatedAt"]
-                asset["filename"] = asset["originalFileName"]
-
             if use_global_cache:
                 self.all_assets_filtered = all_filtered_assets  # Cache global filtered assets for future use
             return all_filtered_assets
@@ -1509,7 +1681,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 # Immich returns 'nextPage' as a string, but 'page' is validated as an
                 # integer (strictly, under v3's Zod validation), so coerce before sending.
                 payload = json.dumps({"albumIds": [album_id], "page": int(next_page), "order": "desc"})
-                resp = requests.post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
+                resp = self._get_worker_session().post(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 album_assets.extend(data.get("assets", {}).get("items", []))
@@ -1534,7 +1706,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/albums/{album_id}"
             try:
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 # Immich <= v2 returns the album's assets inline in AlbumResponseDto.
@@ -1583,7 +1755,7 @@ class ClassImmichPhotos(BaseMediaClient):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/albums/{album_id}"
             try:
-                resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
+                resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 # Immich <= v2 returns the album's assets inline in AlbumResponseDto.
@@ -1631,6 +1803,37 @@ class ClassImmichPhotos(BaseMediaClient):
             return assets_without_albums
 
 
+    def iter_all_assets_without_albums_pages(self, type="all", log_level=logging.WARNING):
+        """
+        Yield the assets not associated to any album, one search page at a time.
+
+        Each page is yielded as soon as Immich returns it, so a caller can start pulling
+        before the whole library has been enumerated.
+
+        Args:
+            log_level (logging.LEVEL): log_level for logs and console
+
+        Yields:
+            list: Assets without album of one search page.
+        """
+        with set_log_level(LOGGER, log_level):
+            # If assets_without_albums is already cached, there is nothing left to page through.
+            if self.assets_without_albums_filtered is not None:
+                if self.assets_without_albums_filtered:
+                    yield self.assets_without_albums_filtered
+                return
+
+            self.login(log_level=log_level)
+            LOGGER.info("Retrieving assets without associated albums from Immich Photos page by page...")
+            assets_without_albums = []
+            for items in self._iter_assets_by_filters_pages(is_not_in_album=True, log_level=log_level):
+                if items:
+                    assets_without_albums.extend(items)
+                    yield items
+            LOGGER.info(f"Number of all_assets without Albums associated: {len(assets_without_albums)}")
+            self.assets_without_albums_filtered = assets_without_albums  # Cache assets_without_albums for future use
+
+
     def get_all_assets_from_all_albums(self, log_level=logging.WARNING):
         """
         Gathers assets from all known albums, merges them into a single list.
@@ -1695,7 +1898,7 @@ class ClassImmichPhotos(BaseMediaClient):
             url = f"{self.IMMICH_URL}/api/albums/{album_id}/assets"
             payload = json.dumps({"ids": asset_ids})
             try:
-                resp = requests.put(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
+                resp = self._get_worker_session().put(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload, verify=False)
                 resp.raise_for_status()
                 data = resp.json()
                 total_added = sum(1 for item in data if item.get("success"))
@@ -1785,7 +1988,7 @@ class ClassImmichPhotos(BaseMediaClient):
 
             url = f"{self.IMMICH_URL}/api/albums/{album_id}/assets"
             try:
-                response = requests.delete(
+                response = self._get_worker_session().delete(
                     url,
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     data=json.dumps({"ids": asset_ids}),
@@ -2041,7 +2244,7 @@ class ClassImmichPhotos(BaseMediaClient):
         with set_log_level(LOGGER, log_level):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/duplicates"
-            resp = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS)
+            resp = self._get_worker_session().get(url, headers=self.HEADERS_WITH_CREDENTIALS)
             resp.raise_for_status()
             return resp.json()
 
@@ -2062,9 +2265,10 @@ class ClassImmichPhotos(BaseMediaClient):
             url = f"{self.IMMICH_URL}/api/assets"
             payload = json.dumps({"force": True, "ids": asset_ids})
             try:
-                response = requests.delete(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload)
+                response = self._get_worker_session().delete(url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload)
                 response.raise_for_status()
                 if response.ok:
+                    self._forget_inventory_assets(asset_ids)
                     return len(asset_ids)
                 else:
                     LOGGER.error(f"Failed to remove assets due to API error")
@@ -2079,7 +2283,7 @@ class ClassImmichPhotos(BaseMediaClient):
         with set_log_level(LOGGER, log_level):
             self.login(log_level=log_level)
             try:
-                response = requests.post(
+                response = self._get_worker_session().post(
                     f"{self.IMMICH_URL}/api/trash/empty",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -2175,7 +2379,7 @@ class ClassImmichPhotos(BaseMediaClient):
         if not asset_id:
             return None
         try:
-            response = requests.get(
+            response = self._get_worker_session().get(
                 f"{self.IMMICH_URL}/api/faces",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 params={"id": asset_id},
@@ -2299,7 +2503,7 @@ class ClassImmichPhotos(BaseMediaClient):
             )
             try:
                 response = self._metadata_merge_request(
-                    requests.get,
+                    self._get_worker_session().get,
                     f"{self.IMMICH_URL}/api/stacks/{stack_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -2351,7 +2555,7 @@ class ClassImmichPhotos(BaseMediaClient):
                     )
                     return False
                 self._metadata_merge_request(
-                    requests.post,
+                    self._get_worker_session().post,
                     f"{self.IMMICH_URL}/api/stacks",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     data=json.dumps({"assetIds": asset_ids}),
@@ -2443,7 +2647,7 @@ class ClassImmichPhotos(BaseMediaClient):
         try:
             if len(payload) > 1:
                 response = self._metadata_merge_request(
-                    requests.put,
+                    self._get_worker_session().put,
                     f"{self.IMMICH_URL}/api/assets",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     data=json.dumps(payload),
@@ -2460,7 +2664,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 return False
             for tag_id in tag_ids:
                 self._metadata_merge_request(
-                    requests.put,
+                    self._get_worker_session().put,
                     f"{self.IMMICH_URL}/api/tags/{tag_id}/assets",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     data=json.dumps({"ids": [keeper_id]}),
@@ -2487,7 +2691,7 @@ class ClassImmichPhotos(BaseMediaClient):
         if not asset_id:
             return None
         try:
-            response = requests.get(
+            response = self._get_worker_session().get(
                 f"{self.IMMICH_URL}/api/assets/{asset_id}",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 verify=False,
@@ -2505,7 +2709,7 @@ class ClassImmichPhotos(BaseMediaClient):
     def _get_duplicate_asset_albums(self, asset_id, log_level=None):
         """Fetch album memberships omitted from Immich's AssetResponseDto."""
         try:
-            response = requests.get(
+            response = self._get_worker_session().get(
                 f"{self.IMMICH_URL}/api/albums",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 params={"assetId": asset_id},
@@ -2714,7 +2918,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 if key == "people":
                     page = 1
                     while True:
-                        response = requests.get(
+                        response = self._get_worker_session().get(
                             f"{self.IMMICH_URL}/api/{endpoint}",
                             headers=self.HEADERS_WITH_CREDENTIALS,
                             params={"page": page, "size": 1000, "withHidden": True},
@@ -2725,7 +2929,7 @@ class ClassImmichPhotos(BaseMediaClient):
                         except requests.RequestException:
                             # Older Immich servers expose the same endpoint but
                             # reject the newer size/withHidden query parameters.
-                            response = requests.get(
+                            response = self._get_worker_session().get(
                                 f"{self.IMMICH_URL}/api/{endpoint}",
                                 headers=self.HEADERS_WITH_CREDENTIALS,
                                 params={"page": page},
@@ -2745,7 +2949,7 @@ class ClassImmichPhotos(BaseMediaClient):
                             break
                         page += 1
                 else:
-                    response = requests.get(
+                    response = self._get_worker_session().get(
                         f"{self.IMMICH_URL}/api/{endpoint}",
                         headers=self.HEADERS_WITH_CREDENTIALS,
                         verify=False,
@@ -2774,7 +2978,7 @@ class ClassImmichPhotos(BaseMediaClient):
         }
         for person_id in sorted(candidate_people):
             try:
-                response = requests.get(
+                response = self._get_worker_session().get(
                     f"{self.IMMICH_URL}/api/people/{person_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -2837,7 +3041,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 "and the number of duplicate groups detected..."
             )
             try:
-                response = requests.get(
+                response = self._get_worker_session().get(
                     f"{self.IMMICH_URL}/api/duplicates",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -2965,7 +3169,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 for item in batch
             ]
             try:
-                response = requests.post(
+                response = self._get_worker_session().post(
                     f"{self.IMMICH_URL}/api/duplicates/resolve",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     data=json.dumps({"groups": request_groups}),
@@ -3134,13 +3338,14 @@ class ClassImmichPhotos(BaseMediaClient):
 
                 started_at = time.perf_counter()
                 try:
-                    response = requests.delete(
+                    response = self._get_worker_session().delete(
                         f"{self.IMMICH_URL}/api/assets",
                         headers=self.HEADERS_WITH_CREDENTIALS,
                         data=json.dumps({"force": not trash_redundant_assets, "ids": asset_ids}),
                         verify=False,
                     )
                     response.raise_for_status()
+                    self._forget_inventory_assets(asset_ids)
                     return True, ""
                 except requests.RequestException as error:
                     response_text = str(getattr(getattr(error, "response", None), "text", "") or "").strip()
@@ -3261,10 +3466,123 @@ class ClassImmichPhotos(BaseMediaClient):
         with self._uploaded_asset_cache_lock:
             return self._uploaded_asset_cache.get(cache_key)
 
+    def _ensure_bulk_upload_check_state(self):
+        self._ensure_uploaded_asset_cache()
+        with self._uploaded_asset_cache_lock:
+            if not hasattr(self, "_bulk_checked_checksums"):
+                self._bulk_checked_checksums = set()
+            if not hasattr(self, "_bulk_upload_check_supported"):
+                self._bulk_upload_check_supported = True
+            if getattr(self, "_bulk_upload_check_batcher", None) is None:
+                self._bulk_upload_check_batcher = _BulkUploadCheckBatcher(
+                    send_batch=self._bulk_upload_check,
+                    batch_size=self.IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE,
+                    max_wait_seconds=self.IMMICH_BULK_UPLOAD_CHECK_MAX_WAIT_SECONDS,
+                )
+
+    def _bulk_upload_check(self, checksums):
+        """
+        Ask Immich which of the given SHA-1 checksums (hex) already exist in the library.
+
+        Returns a dict {checksum: asset_id} with the ones that exist. Assets in the trash
+        are not returned, so they are uploaded (and restored by Immich) as before. All the
+        checksums sent are remembered as checked, so push_asset does not ask again.
+        """
+        self._ensure_bulk_upload_check_state()
+        checksums = [checksum for checksum in dict.fromkeys(checksums) if checksum]
+        if not checksums or not self._bulk_upload_check_supported:
+            return {}
+        payload = {"assets": [{"id": str(index), "checksum": checksum} for index, checksum in enumerate(checksums)]}
+        response = self._get_worker_session().post(
+            f"{self.IMMICH_URL}/api/assets/bulk-upload-check",
+            headers=self.HEADERS_WITH_CREDENTIALS,
+            data=json.dumps(payload),
+            verify=False,
+            timeout=self.IMMICH_BULK_UPLOAD_CHECK_TIMEOUT,
+        )
+        if response.status_code in (404, 405):
+            LOGGER.warning(f"{MSG_TAGS['WARNING']}This Immich server does not support the bulk upload check. Assets will be uploaded without checking them first.")
+            self._bulk_upload_check_supported = False
+            return {}
+        response.raise_for_status()
+        found = {}
+        for result in (response.json() or {}).get("results", []):
+            try:
+                checksum = checksums[int(result.get("id"))]
+            except (TypeError, ValueError, IndexError):
+                continue
+            if (
+                result.get("action") == "reject"
+                and result.get("reason") == "duplicate"
+                and result.get("assetId")
+                and not result.get("isTrashed")
+            ):
+                found[checksum] = str(result["assetId"])
+        with self._uploaded_asset_cache_lock:
+            self._uploaded_asset_cache.update(found)
+            self._bulk_checked_checksums.update(checksums)
+        return found
+
+    def check_existing_assets(self, file_paths, log_level=None):
+        """
+        Check in bulk which local files already exist in Immich, before uploading them.
+
+        The SHA-1 of each supported media file is sent to Immich in batches of
+        IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE. The results are cached, so push_asset skips
+        the upload of the files found and returns their existing asset_id.
+
+        Args:
+            file_paths (list): Local files that are about to be pushed.
+            log_level (logging.LEVEL): log_level for logs and console
+
+        Returns:
+            dict: {file_path: asset_id} with the files that already exist in Immich.
+        """
+        with set_log_level(LOGGER, log_level):
+            self._ensure_bulk_upload_check_state()
+            if not self._bulk_upload_check_supported:
+                return {}
+            checksum_by_path = {}
+            for file_path in file_paths or []:
+                if os.path.splitext(file_path)[1].lower() not in self.ALLOWED_IMMICH_MEDIA_EXTENSIONS:
+                    continue
+                checksum = self._build_uploaded_asset_cache_key(file_path)
+                if checksum:
+                    checksum_by_path[file_path] = checksum
+            if not checksum_by_path:
+                return {}
+            self.login(log_level=log_level)
+            checksums = list(dict.fromkeys(checksum_by_path.values()))
+            found = {}
+            for start in range(0, len(checksums), self.IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE):
+                try:
+                    found.update(self._bulk_upload_check(checksums[start:start + self.IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE]))
+                except (requests.RequestException, ValueError) as error:
+                    LOGGER.warning(f"{MSG_TAGS['WARNING']}Immich bulk upload check failed; the remaining assets will be checked on upload: {error}")
+                    break
+            existing = {file_path: found[checksum] for file_path, checksum in checksum_by_path.items() if checksum in found}
+            LOGGER.debug(f"Immich bulk upload check: {len(existing)} of {len(checksum_by_path)} assets already exist in the library.")
+            return existing
+
+    def _find_existing_asset_before_upload(self, file_path):
+        """Return the asset_id of file_path if Immich already has it, checking with concurrent pushers in bulk."""
+        self._ensure_bulk_upload_check_state()
+        if not self._bulk_upload_check_supported:
+            return None
+        checksum = self._build_uploaded_asset_cache_key(file_path)
+        if not checksum:
+            return None
+        with self._uploaded_asset_cache_lock:
+            cached_asset_id = self._uploaded_asset_cache.get(checksum)
+            already_checked = checksum in self._bulk_checked_checksums
+        if cached_asset_id or already_checked:
+            return cached_asset_id
+        return self._bulk_upload_check_batcher.lookup(checksum)
+
     def _get_unfiltered_asset_inventory_total(self):
         """Return the user-visible asset total for an unfiltered metadata search."""
         try:
-            response = requests.post(
+            response = self._get_worker_session().post(
                 f"{self.IMMICH_URL}/api/search/statistics",
                 headers=self.HEADERS_WITH_CREDENTIALS,
                 data=json.dumps({}),
@@ -3294,11 +3612,21 @@ class ClassImmichPhotos(BaseMediaClient):
         with set_log_level(LOGGER, log_level):
             if hasattr(self, "_all_assets_unfiltered_cache") and self._all_assets_unfiltered_cache is not None:
                 return self._all_assets_unfiltered_cache
+            inventory_cache = self._sync_inventory_cache_locked(log_level=log_level, show_progress=show_progress)
+            if inventory_cache is not None:
+                self._all_assets_unfiltered_cache = list(inventory_cache.iter_assets())
+                return self._all_assets_unfiltered_cache
+            return self._download_asset_inventory(log_level=log_level, show_progress=show_progress)[0]
+
+    def _download_asset_inventory(self, log_level=None, show_progress=False):
+        """Download the whole asset inventory; return it with the server time at which the listing started."""
+        with set_log_level(LOGGER, log_level):
             self.login(log_level=log_level)
             url = f"{self.IMMICH_URL}/api/search/metadata"
             all_assets = []
             next_page = 1
             progress_bar = None
+            inventory_started_at = []
 
             def get_assets_page(page_number):
                 payload = json.dumps({
@@ -3310,7 +3638,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 last_error = None
                 for attempt in range(1, self.IMMICH_ASSET_INVENTORY_RETRIES + 1):
                     try:
-                        response = requests.post(
+                        response = self._get_worker_session().post(
                             url,
                             headers=self.HEADERS_WITH_CREDENTIALS,
                             data=payload,
@@ -3318,6 +3646,8 @@ class ClassImmichPhotos(BaseMediaClient):
                             timeout=self.IMMICH_ASSET_INVENTORY_TIMEOUT,
                         )
                         response.raise_for_status()
+                        if page_number == 1:
+                            inventory_started_at.append(parse_server_date(response) or datetime.now(timezone.utc))
                         data = response.json()
                         assets_page = data.get("assets", {})
                         return assets_page.get("items", []), assets_page.get("nextPage")
@@ -3388,7 +3718,7 @@ class ClassImmichPhotos(BaseMediaClient):
                         for page_number in range(1, total_pages + 1):
                             all_assets.extend(pages.get(page_number, []))
                         self._all_assets_unfiltered_cache = all_assets
-                        return all_assets
+                        return all_assets, (inventory_started_at or [None])[0]
 
                 while True:
                     items, next_page = get_assets_page(next_page)
@@ -3398,7 +3728,136 @@ class ClassImmichPhotos(BaseMediaClient):
                     if next_page is None:
                         break
             self._all_assets_unfiltered_cache = all_assets
-            return all_assets
+            return all_assets, (inventory_started_at or [None])[0]
+
+    def _get_inventory_cache(self):
+        """Return the on-disk inventory cache of this server and user, or None when IMMICH_INVENTORY_CACHE is off."""
+        if not getattr(self, "IMMICH_INVENTORY_CACHE", False):
+            return None
+        inventory_cache = getattr(self, "_inventory_cache", None)
+        if inventory_cache is None:
+            user_identity = getattr(self, "CLIENT_ID", None) or getattr(self, "IMMICH_USERNAME", None) or getattr(self, "IMMICH_USER_API_KEY", None)
+            cache_path = build_immich_inventory_cache_path(
+                resolve_external_path(f"./{IMMICH_INVENTORY_CACHE_FOLDER}"),
+                self.IMMICH_URL,
+                user_identity,
+            )
+            try:
+                inventory_cache = ImmichInventoryCache(cache_path)
+            except Exception as error:
+                LOGGER.warning(f"{MSG_TAGS['WARNING']}Unable to open the Immich inventory cache '{cache_path}'; it will not be used: {error}")
+                self.IMMICH_INVENTORY_CACHE = False
+                return None
+            self._inventory_cache = inventory_cache
+        return inventory_cache
+
+    def _get_synced_inventory_cache(self, log_level=None):
+        """Return the inventory cache once it has been refreshed in this run, or None when it is disabled."""
+        if not getattr(self, "IMMICH_INVENTORY_CACHE", False):
+            return None
+        if not hasattr(self, "_all_assets_unfiltered_cache_lock"):
+            self._all_assets_unfiltered_cache_lock = threading.Lock()
+        with self._all_assets_unfiltered_cache_lock:
+            return self._sync_inventory_cache_locked(log_level=log_level)
+
+    def _sync_inventory_cache_locked(self, log_level=None, show_progress=False):
+        """
+        Bring the on-disk inventory cache up to date, once per run.
+
+        Assets updated since the last sync (including the ones moved to the trash) are
+        requested with 'updatedAfter'. Assets deleted permanently by other clients are not
+        reported that way, so when the cached count differs from the server total the
+        whole inventory is downloaded again.
+        """
+        inventory_cache = self._get_inventory_cache()
+        if inventory_cache is None or getattr(self, "_inventory_cache_synced", False):
+            return inventory_cache
+        with set_log_level(LOGGER, log_level):
+            last_sync = inventory_cache.get_last_sync()
+            refreshed = False
+            if last_sync is not None:
+                try:
+                    updated_assets, synced_at = self._refresh_inventory_cache_since(inventory_cache, last_sync)
+                    server_total = self._get_unfiltered_asset_inventory_total()
+                    if server_total is not None and server_total != inventory_cache.count():
+                        LOGGER.info(
+                            f"Immich inventory cache has {inventory_cache.count()} assets but the server reports "
+                            f"{server_total}; downloading the whole inventory again."
+                        )
+                    else:
+                        inventory_cache.finish_sync(synced_at)
+                        refreshed = True
+                        LOGGER.info(f"Immich inventory cache refreshed: {updated_assets} asset(s) updated since {last_sync.isoformat()}.")
+                except (requests.RequestException, ValueError) as error:
+                    LOGGER.warning(f"{MSG_TAGS['WARNING']}Incremental refresh of the Immich inventory cache failed; downloading the whole inventory: {error}")
+            if not refreshed:
+                all_assets, synced_at = self._download_asset_inventory(log_level=log_level, show_progress=show_progress)
+                inventory_cache.begin_full_refresh()
+                inventory_cache.apply_page(all_assets)
+                inventory_cache.finish_sync(synced_at or datetime.now(timezone.utc))
+                # The cache keeps only the identity fields; serve callers from it, like later runs.
+                self._all_assets_unfiltered_cache = None
+            self._inventory_cache_synced = True
+            return inventory_cache
+
+    def _refresh_inventory_cache_since(self, inventory_cache, updated_after):
+        """Apply to the cache every asset updated after `updated_after`; return (count, server time of the first page)."""
+        self.login()
+        url = f"{self.IMMICH_URL}/api/search/metadata"
+        page_number = 1
+        updated_assets = 0
+        synced_at = None
+        while page_number:
+            response = self._get_worker_session().post(
+                url,
+                headers=self.HEADERS_WITH_CREDENTIALS,
+                data=json.dumps({
+                    "page": int(page_number),
+                    "size": self.IMMICH_ASSET_INVENTORY_PAGE_SIZE,
+                    "updatedAfter": updated_after.isoformat(),
+                    "withDeleted": True,
+                    "withExif": True,
+                }),
+                verify=False,
+                timeout=self.IMMICH_ASSET_INVENTORY_TIMEOUT,
+            )
+            response.raise_for_status()
+            if synced_at is None:
+                synced_at = parse_server_date(response) or datetime.now(timezone.utc)
+            assets_page = (response.json() or {}).get("assets", {})
+            items = assets_page.get("items", [])
+            inventory_cache.apply_page(items)
+            updated_assets += len(items)
+            next_page = assets_page.get("nextPage")
+            page_number = int(next_page) if next_page else None
+        return updated_assets, synced_at
+
+    def _forget_inventory_assets(self, asset_ids):
+        """Drop deleted assets from the inventory cache, so the next run does not need a full refresh."""
+        inventory_cache = getattr(self, "_inventory_cache", None)
+        if inventory_cache is not None:
+            inventory_cache.remove_assets(asset_ids)
+
+    def get_asset_inventory_identities(self, log_level=None):
+        """
+        Return the identity of every asset in the Immich library for pre-flight duplicate checks.
+
+        Each entry contains 'id', 'filename', 'size', 'time' (capture epoch) and 'checksum' (SHA-1, base64).
+        """
+        identities = []
+        for item in self._get_all_assets_unfiltered(log_level=log_level, show_progress=True) or []:
+            try:
+                capture_epoch = datetime.fromisoformat(str(item.get("fileCreatedAt", "")).replace("Z", "+00:00")).timestamp()
+            except Exception:
+                capture_epoch = None
+            identities.append({
+                "id": item.get("id"),
+                "filename": item.get("originalFileName"),
+                "size": self._duplicate_asset_size(item),
+                "time": capture_epoch,
+                "checksum": item.get("checksum"),
+            })
+        return identities
 
     def _resolve_existing_asset_id_from_metadata(self, filename, capture_epoch=None, file_size=None, log_level=None):
         """Resolve an existing asset using the identity retained after a duplicate upload."""
@@ -3421,22 +3880,27 @@ class ClassImmichPhotos(BaseMediaClient):
             # Duplicate resolution can be invoked hundreds of times in an
             # album-heavy migration. Index the cached destination library once
             # instead of walking every remote asset for every queued duplicate.
-            all_assets = self._get_all_assets_unfiltered(log_level=log_level)
-            library_identity = id(all_assets)
-            lookup_index = getattr(self, "_existing_asset_name_index", None)
-            if not isinstance(lookup_index, dict) or getattr(self, "_existing_asset_name_index_source", None) != library_identity:
-                lookup_index = {}
-                for candidate in all_assets:
-                    candidate_name = str(candidate.get("originalFileName", ""))
-                    if not candidate_name:
-                        continue
-                    exact_key = candidate_name.casefold()
-                    normalized_key = self._normalize_duplicate_lookup_name(candidate_name)
-                    lookup_index.setdefault(exact_key, []).append(candidate)
-                    if normalized_key != exact_key:
-                        lookup_index.setdefault(normalized_key, []).append(candidate)
-                self._existing_asset_name_index = lookup_index
-                self._existing_asset_name_index_source = library_identity
+            inventory_cache = self._get_synced_inventory_cache(log_level=log_level)
+            if inventory_cache is not None:
+                # The on-disk cache is indexed by exact and normalized name already.
+                lookup_index = {target_name_casefold: inventory_cache.find_by_name(target_name)}
+            else:
+                all_assets = self._get_all_assets_unfiltered(log_level=log_level)
+                library_identity = id(all_assets)
+                lookup_index = getattr(self, "_existing_asset_name_index", None)
+                if not isinstance(lookup_index, dict) or getattr(self, "_existing_asset_name_index_source", None) != library_identity:
+                    lookup_index = {}
+                    for candidate in all_assets:
+                        candidate_name = str(candidate.get("originalFileName", ""))
+                        if not candidate_name:
+                            continue
+                        exact_key = candidate_name.casefold()
+                        normalized_key = self._normalize_duplicate_lookup_name(candidate_name)
+                        lookup_index.setdefault(exact_key, []).append(candidate)
+                        if normalized_key != exact_key:
+                            lookup_index.setdefault(normalized_key, []).append(candidate)
+                    self._existing_asset_name_index = lookup_index
+                    self._existing_asset_name_index_source = library_identity
 
             candidate_items = []
             seen_candidate_ids = set()
@@ -3555,6 +4019,13 @@ class ClassImmichPhotos(BaseMediaClient):
                     LOGGER.warning(f"File '{file_path}' has an unsupported extension. Skipped.")
                     return None, None
 
+            # Skip the upload when Immich already has this content (bulk upload check).
+            existing_asset_id = self._find_existing_asset_before_upload(file_path)
+            if existing_asset_id:
+                self._import_takeout_people_after_push(file_path, existing_asset_id)
+                LOGGER.debug(f"Duplicated Asset: '{os.path.basename(file_path)}'. Upload skipped, existing asset_id={existing_asset_id}")
+                return existing_asset_id, True
+
             url = f"{self.IMMICH_URL}/api/assets"
 
             stats = os.stat(file_path)
@@ -3577,17 +4048,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 'isVisible': 'true',
             }
 
-            # Determine headers
-            if self.API_KEY_LOGIN:
-                header = {
-                    'Accept': 'application/json',
-                    'x-api-key': self.IMMICH_USER_API_KEY
-                }
-            else:
-                header = {
-                    'Accept': 'application/json',
-                    'Authorization': f'Bearer {self.SESSION_TOKEN}'
-                }
+            header = self._get_upload_headers()
 
             try:
                 with ExitStack() as stack:
@@ -3621,7 +4082,7 @@ class ClassImmichPhotos(BaseMediaClient):
 
                     multipart_data = MultipartEncoder(fields=fields)
                     header["Content-Type"] = multipart_data.content_type
-                    response = requests.post(
+                    response = self._get_worker_session().post(
                         url,
                         headers=header,
                         data=multipart_data,
@@ -3654,11 +4115,7 @@ class ClassImmichPhotos(BaseMediaClient):
                         return None, None
                 if asset_id:
                     self._remember_uploaded_asset_id(file_path, asset_id)
-                    if (ARGS or {}).get("import-people", False):
-                        # Automatic Migration normally suppresses upload chatter at ERROR.
-                        # Person import outcomes are operationally significant, so keep them visible.
-                        with set_log_level(LOGGER, logging.INFO):
-                            self.import_takeout_people_for_asset(file_path, asset_id, log_level=logging.INFO)
+                    self._import_takeout_people_after_push(file_path, asset_id)
                     if is_duplicated:
                         LOGGER.debug(f"Duplicated Asset: '{os.path.basename(file_path)}'. Existing asset_id={asset_id}")
                     else:
@@ -3669,7 +4126,10 @@ class ClassImmichPhotos(BaseMediaClient):
                 # its response reaches PhotoMigrator. Reuse a cached inventory only;
                 # do not trigger an expensive full-library scan on a failed upload.
                 recovered_asset_id = self._lookup_uploaded_asset_id(file_path)
-                if not recovered_asset_id and getattr(self, "_all_assets_unfiltered_cache", None) is not None:
+                if not recovered_asset_id and (
+                    getattr(self, "_all_assets_unfiltered_cache", None) is not None
+                    or getattr(self, "_inventory_cache_synced", False)
+                ):
                     recovered_asset_id = self._resolve_existing_asset_id(file_path, log_level=log_level)
                 if recovered_asset_id:
                     LOGGER.warning(
@@ -3683,6 +4143,106 @@ class ClassImmichPhotos(BaseMediaClient):
                 )
                 return None, None
 
+    def _import_takeout_people_after_push(self, file_path, asset_id):
+        if (ARGS or {}).get("import-people", False):
+            # Automatic Migration normally suppresses upload chatter at ERROR.
+            # Person import outcomes are operationally significant, so keep them visible.
+            with set_log_level(LOGGER, logging.INFO):
+                self.import_takeout_people_for_asset(file_path, asset_id, log_level=logging.INFO)
+
+    def _get_upload_headers(self):
+        if self.API_KEY_LOGIN:
+            return {
+                'Accept': 'application/json',
+                'x-api-key': self.IMMICH_USER_API_KEY
+            }
+        return {
+            'Accept': 'application/json',
+            'Authorization': f'Bearer {self.SESSION_TOKEN}'
+        }
+
+    def push_asset_stream(self, asset_stream, asset_filename, asset_time, log_level=None):
+        """
+        Uploads an asset to Immich Photos straight from a ResponseBodyStream, without a local file.
+
+        The capture time is sent as fileCreatedAt/fileModifiedAt, which Immich uses when the
+        file has no EXIF date, so the asset does not need a metadata rewrite on disk.
+
+        Args:
+            asset_stream (ResponseBodyStream): Open source stream with a known length.
+            asset_filename (str): Original filename of the asset.
+            asset_time (int | float): UNIX epoch of the asset.
+            log_level (logging.LEVEL): log_level for logs and console
+
+        Returns:
+            str: the asset_id if success, or None if it fails or is an unsupported extension.
+            bool: is_duplicated = False if success, or None if it fails or is an unsupported extension.
+        """
+        with set_log_level(LOGGER, log_level):
+            self.login(log_level=log_level)
+            asset_filename = os.path.basename(str(asset_filename or ""))
+            if os.path.splitext(asset_filename)[1].lower() not in self.ALLOWED_IMMICH_MEDIA_EXTENSIONS:
+                return None, None
+            try:
+                asset_datetime = datetime.fromtimestamp(float(asset_time))
+            except (TypeError, ValueError, OverflowError, OSError):
+                asset_datetime = datetime.fromtimestamp(0)
+            date_time_for_attributes = asset_datetime.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            mime_type = mimetypes.guess_type(asset_filename)[0] or "application/octet-stream"
+            multipart_data = MultipartEncoder(fields={
+                "deviceAssetId": f'{asset_datetime.strftime("%Y%m%d_%H%M%S")}_{asset_filename}',
+                "deviceId": "PhotoMigrator",
+                "fileCreatedAt": date_time_for_attributes,
+                "fileModifiedAt": date_time_for_attributes,
+                "fileSize": str(asset_stream.len),
+                "isFavorite": "false",
+                "isVisible": "true",
+                "assetData": (asset_filename, asset_stream, mime_type),
+            })
+            header = self._get_upload_headers()
+            header["Content-Type"] = multipart_data.content_type
+            try:
+                response = self._get_worker_session().post(
+                    f"{self.IMMICH_URL}/api/assets",
+                    headers=header,
+                    data=multipart_data,
+                    timeout=self._get_asset_upload_timeout(),
+                )
+                response.raise_for_status()
+                new_asset = response.json()
+            except Exception as e:
+                LOGGER.error(f"Failed to stream '{asset_filename}' to Immich: {e}")
+                return None, None
+            asset_id = new_asset.get("id")
+            is_duplicated = str(new_asset.get("status") or "").lower() == "duplicate"
+            if is_duplicated and not asset_id:
+                asset_id = self._resolve_existing_asset_id_from_metadata(
+                    filename=asset_filename,
+                    capture_epoch=asset_datetime.timestamp(),
+                    file_size=asset_stream.len,
+                    log_level=log_level,
+                )
+                if not asset_id:
+                    return None, None
+            return asset_id, is_duplicated
+
+    def open_asset_stream(self, asset_id, asset_filename, album_passphrase=None, album_id=None, album_scope=None, log_level=None):
+        """Open the original file of an Immich asset as a ResponseBodyStream, or None when its length is unknown."""
+        with set_log_level(LOGGER, log_level):
+            self.login(log_level=log_level)
+            response = self._get_worker_session().get(
+                f"{self.IMMICH_URL}/api/assets/{asset_id}/original",
+                headers=self.HEADERS_WITH_CREDENTIALS,
+                verify=False,
+                stream=True,
+            )
+            response.raise_for_status()
+            content_length = get_response_content_length(response)
+            if content_length is None:
+                response.close()
+                return None
+            return ResponseBodyStream(response, content_length)
+
     def _find_live_photo_video_companion(self, photo_file_path):
         """
         Find a companion video for a photo using same basename in the same folder.
@@ -3725,7 +4285,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 attempts = len(retry_delays) + 1
                 for attempt in range(attempts):
                     try:
-                        resp = requests.patch(url, headers=headers, data=payload, verify=False)
+                        resp = self._get_worker_session().patch(url, headers=headers, data=payload, verify=False)
                         resp.raise_for_status()
                         return True
                     except requests.HTTPError as e:
@@ -3845,7 +4405,7 @@ class ClassImmichPhotos(BaseMediaClient):
                 payload = json.dumps({"assetIds": asset_ids})
                 headers = dict(self.HEADERS_WITH_CREDENTIALS)
                 headers["Content-Type"] = "application/json"
-                resp = requests.post(
+                resp = self._get_worker_session().post(
                     url,
                     headers=headers,
                     data=payload,
@@ -3877,7 +4437,7 @@ class ClassImmichPhotos(BaseMediaClient):
         failures = {}
         for asset_id in asset_ids:
             try:
-                response = requests.get(
+                response = self._get_worker_session().get(
                     f"{self.IMMICH_URL}/api/assets/{asset_id}",
                     headers=self.HEADERS_WITH_CREDENTIALS,
                     verify=False,
@@ -4112,13 +4672,18 @@ class ClassImmichPhotos(BaseMediaClient):
             file_ext = os.path.splitext(asset_filename)[1].lower()
             url = f"{self.IMMICH_URL}/api/assets/{asset_id}/original"
 
+            def open_response(extra_headers):
+                return self._get_worker_session().get(
+                    url,
+                    headers={**self.HEADERS_WITH_CREDENTIALS, **extra_headers},
+                    verify=False,
+                    stream=True,
+                    timeout=self.IMMICH_ASSET_DOWNLOAD_TIMEOUT,
+                )
+
             try:
-                req = requests.get(url, headers=self.HEADERS_WITH_CREDENTIALS, verify=False, stream=True)
-                req.raise_for_status()
                 file_path = os.path.join(download_folder, asset_filename)
-                with open(file_path, 'wb') as f:
-                    for chunk in req.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                download_to_file(file_path, open_response, parallel_segments=DOWNLOAD_PARALLEL_SEGMENTS)
 
                 # Update timestamps using the asset_time
                 os.utime(file_path, (asset_time, asset_time))
@@ -4137,6 +4702,37 @@ class ClassImmichPhotos(BaseMediaClient):
     ###########################################################################
     #                  HIGH-LEVEL MAIN FUNCTIONS (UPLOAD/DOWNLOAD)            #
     ###########################################################################
+    def _plan_asset_uploads(self, file_paths):
+        """
+        Returns the uploads of file_paths as (file_path, live_photo_video_path, ext) tuples, in file order.
+
+        Live Photo companions are paired here, before any upload starts, so the video of a Live Photo
+        is never uploaded again on its own by another worker.
+        """
+        planned_uploads = []
+        consumed_live_companions = set()
+        for file_path in file_paths:
+            if os.path.normcase(os.path.normpath(file_path)) in consumed_live_companions:
+                continue
+            ext = os.path.splitext(file_path)[-1].lower()
+            if ext not in self.ALLOWED_IMMICH_EXTENSIONS:
+                LOGGER.debug(f"Unsopported Extension: '{ext}'. Skipped")
+                continue
+            live_photo_video_path = None
+            if ext in self.ALLOWED_IMMICH_PHOTO_EXTENSIONS:
+                live_photo_video_path = self._find_live_photo_video_companion(file_path)
+                if live_photo_video_path:
+                    consumed_live_companions.add(os.path.normcase(os.path.normpath(live_photo_video_path)))
+            planned_uploads.append((file_path, live_photo_video_path, ext))
+        return planned_uploads
+
+    def _push_planned_asset(self, planned_upload, log_level=None):
+        """Uploads one entry of _plan_asset_uploads() and returns (asset_id, is_duplicated)."""
+        file_path, live_photo_video_path, _ = planned_upload
+        if live_photo_video_path:
+            return self.push_live_photo(file_path, live_photo_video_path=live_photo_video_path, log_level=log_level)
+        return self.push_asset(file_path, log_level=log_level)
+
     def push_albums(self, input_folder, subfolders_exclusion=FOLDERNAME_NO_ALBUMS, subfolders_inclusion=None, remove_duplicates=True, log_level=logging.WARNING):
         """
         Traverses the subfolders of 'input_folder', creating an album for each valid subfolder (album name equals the subfolder name).
@@ -4252,34 +4848,20 @@ class ClassImmichPhotos(BaseMediaClient):
                             total_albums_skipped += 1
                             continue
 
-                        consumed_live_companions = set()
-                        album_file_paths = [os.path.join(subpath, file) for file in os.listdir(subpath)]
-                        for file_path in tqdm(
-                            album_file_paths,
+                        album_file_paths = [
+                            file_path
+                            for file_path in (os.path.join(subpath, file) for file in os.listdir(subpath))
+                            if os.path.isfile(file_path) and not matches_any_pattern(os.path.basename(file_path), effective_file_exclusions)
+                        ]
+                        self.check_existing_assets(album_file_paths, log_level=log_level)
+                        planned_uploads = self._plan_asset_uploads(album_file_paths)
+                        upload_results = run_transfers_in_pool(
+                            planned_uploads,
+                            lambda planned_upload: self._push_planned_asset(planned_upload, log_level=log_level),
+                            self.IMMICH_MAX_PARALLEL_UPLOADS,
                             desc=f"{MSG_TAGS['INFO']}   Uploading '{album_name}' Assets",
-                            unit=" assets",
-                        ):
-                            if not os.path.isfile(file_path):
-                                continue
-                            norm_file_path = os.path.normcase(os.path.normpath(file_path))
-                            if norm_file_path in consumed_live_companions:
-                                continue
-                            if matches_any_pattern(os.path.basename(file_path), effective_file_exclusions):
-                                continue
-                            ext = os.path.splitext(file_path)[-1].lower()
-                            if ext not in self.ALLOWED_IMMICH_EXTENSIONS:
-                                continue
-
-                            live_photo_video_path = None
-                            if ext in self.ALLOWED_IMMICH_PHOTO_EXTENSIONS:
-                                live_photo_video_path = self._find_live_photo_video_companion(file_path)
-                                if live_photo_video_path:
-                                    consumed_live_companions.add(os.path.normcase(os.path.normpath(live_photo_video_path)))
-                                    asset_id, is_dup = self.push_live_photo(file_path, live_photo_video_path=live_photo_video_path, log_level=log_level)
-                                else:
-                                    asset_id, is_dup = self.push_asset(file_path, log_level=log_level)
-                            else:
-                                asset_id, is_dup = self.push_asset(file_path, log_level=log_level)
+                        )
+                        for (file_path, _, ext), (asset_id, is_dup) in zip(planned_uploads, upload_results):
                             if is_dup:
                                 total_duplicates_assets_skipped += 1
                                 LOGGER.debug(f"Dupplicated Asset: {file_path}. Asset ID: {asset_id} upload skipped")
@@ -4433,41 +5015,28 @@ class ClassImmichPhotos(BaseMediaClient):
                 return flist
 
             file_paths = collect_files(input_folder, subfolders_inclusion)
-            total_files = len(file_paths)
             total_assets_uploaded = 0
             total_duplicated_assets_skipped = 0
             duplicates_assets_removed = 0
-            consumed_live_companions = set()
             uploaded_records = []
-
-            with tqdm(total=total_files, smoothing=0.1, desc=f"{MSG_TAGS['INFO']}Uploading Assets", unit=" asset") as pbar:
-                for f_idx, file_path in enumerate(file_paths, start=1):
-                    pbar.update(1)
-                    norm_file_path = os.path.normcase(os.path.normpath(file_path))
-                    if norm_file_path in consumed_live_companions:
-                        continue
-                    _, ext = os.path.splitext(file_path)
-                    ext = ext.lower()
-                    if ext not in self.ALLOWED_IMMICH_EXTENSIONS:
-                        LOGGER.debug(f"Unsopported Extension: '{ext}'. Skipped")
-                        continue
-
-                    if ext in self.ALLOWED_IMMICH_PHOTO_EXTENSIONS:
-                        live_photo_video_path = self._find_live_photo_video_companion(file_path)
-                        if live_photo_video_path:
-                            consumed_live_companions.add(os.path.normcase(os.path.normpath(live_photo_video_path)))
-                            asset_id, is_dup = self.push_live_photo(file_path, live_photo_video_path=live_photo_video_path, log_level=log_level)
-                        else:
-                            asset_id, is_dup = self.push_asset(file_path, log_level=log_level)
-                    else:
-                        asset_id, is_dup = self.push_asset(file_path, log_level=log_level)
-                    if is_dup:
-                        total_duplicated_assets_skipped += 1
-                        LOGGER.debug(f"Dupplicated Asset: {file_path}. Asset ID: {asset_id} skipped")
-                    elif asset_id:
-                        LOGGER.debug(f"Asset ID: {asset_id} uploaded to Immich Photos")
-                        total_assets_uploaded += 1
-                        uploaded_records.append(self._build_burst_record(asset_id=asset_id, file_path=file_path))
+            self.check_existing_assets(file_paths, log_level=log_level)
+
+            planned_uploads = self._plan_asset_uploads(file_paths)
+            upload_results = run_transfers_in_pool(
+                planned_uploads,
+                lambda planned_upload: self._push_planned_asset(planned_upload, log_level=log_level),
+                self.IMMICH_MAX_PARALLEL_UPLOADS,
+                desc=f"{MSG_TAGS['INFO']}Uploading Assets",
+                unit=" asset",
+            )
+            for (file_path, _, _), (asset_id, is_dup) in zip(planned_uploads, upload_results):
+                if is_dup:
+                    total_duplicated_assets_skipped += 1
+                    LOGGER.debug(f"Dupplicated Asset: {file_path}. Asset ID: {asset_id} skipped")
+                elif asset_id:
+                    LOGGER.debug(f"Asset ID: {asset_id} uploaded to Immich Photos")
+                    total_assets_uploaded += 1
+                    uploaded_records.append(self._build_burst_record(asset_id=asset_id, file_path=file_path))
 
             total_stacks_created = 0
             if ARGS.get("create-stacks", True):
@@ -4603,16 +5172,23 @@ class ClassImmichPhotos(BaseMediaClient):
                 os.makedirs(album_folder, exist_ok=True)
 
                 album_assets = self.get_all_assets_from_album(album_id, log_level=log_level)
-                for asset in tqdm(
-                    album_assets,
+                album_downloads = [
+                    {
+                        "asset_id": asset.get("id"),
+                        "asset_filename": os.path.basename(asset.get("originalFileName", "unknown")),
+                        "asset_time": asset.get('fileCreatedAt'),
+                        "download_folder": album_folder,
+                        "log_level": log_level,
+                    }
+                    for asset in album_assets
+                    if asset.get("id")
+                ]
+                total_assets_downloaded += run_downloads_in_pool(
+                    album_downloads,
+                    self.pull_asset,
+                    self.IMMICH_MAX_PARALLEL_DOWNLOADS,
                     desc=f"{MSG_TAGS['INFO']}   Downloading '{album_name}' Assets",
-                    unit=" assets",
-                ):
-                    asset_id = asset.get("id")
-                    asset_filename = os.path.basename(asset.get("originalFileName", "unknown"))
-                    if asset_id:
-                        asset_time = asset.get('fileCreatedAt')
-                        total_assets_downloaded += self.pull_asset(asset_id=asset_id, asset_filename=asset_filename, asset_time=asset_time, download_folder=album_folder, log_level=log_level)
+                )
 
                 total_albums_downloaded += 1
                 LOGGER.info(f"Downloaded Album [{total_albums_downloaded}/{total_albums}] - '{album_name}'. {len(album_assets)} asset(s) have been downloaded.")
@@ -4645,7 +5221,8 @@ class ClassImmichPhotos(BaseMediaClient):
             os.makedirs(no_albums_folder, exist_ok=True)
 
             LOGGER.info(f"Found {len(all_assets_without_albums)} asset(s) without any album associated.")
-            for asset in tqdm(all_assets_without_albums, desc=f"{MSG_TAGS['INFO']}Downloading assets without associated albums", unit=" assets"):
+            downloads = []
+            for asset in all_assets_without_albums:
                 asset_id = asset.get("id")
                 asset_filename = os.path.basename(asset.get("originalFileName", "unknown"))
                 if not asset_id:
@@ -4663,8 +5240,19 @@ class ClassImmichPhotos(BaseMediaClient):
                 target_folder = os.path.join(no_albums_folder, year_str, month_str)
                 os.makedirs(target_folder, exist_ok=True)
 
-                asset_time = asset.get('fileCreatedAt')
-                total_assets_downloaded += self.pull_asset(asset_id=asset_id, asset_filename=asset_filename, asset_time=asset_time, download_folder=target_folder, log_level=log_level)
+                downloads.append({
+                    "asset_id": asset_id,
+                    "asset_filename": asset_filename,
+                    "asset_time": asset.get('fileCreatedAt'),
+                    "download_folder": target_folder,
+                    "log_level": log_level,
+                })
+            total_assets_downloaded += run_downloads_in_pool(
+                downloads,
+                self.pull_asset,
+                self.IMMICH_MAX_PARALLEL_DOWNLOADS,
+                desc=f"{MSG_TAGS['INFO']}Downloading assets without associated albums",
+            )
 
             LOGGER.info(f"Download of assets without associated albums completed.")
             LOGGER.info(f"Total Assets downloaded: {total_assets_downloaded}")
@@ -4805,7 +5393,7 @@ class ClassImmichPhotos(BaseMediaClient):
                     "isActivityEnabled": True,
                     "order": "asc"
                 })
-                response = requests.request("PATCH", url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload)
+                response = self._get_worker_session().request("PATCH", url, headers=self.HEADERS_WITH_CREDENTIALS, data=payload)
                 response.raise_for_status()
                 if response.ok:
                     LOGGER.info(f"Album '{album_info['album_name']}' (ID={album_id}) renamed to '{album_info['new_name']}'.")
@@ -5267,7 +5855,7 @@ class ClassImmichPhotos(BaseMediaClient):
             # Immich removed /api/reports in newer versions (from v1.133.0).
             # Detect version first to avoid noisy 404 errors and abort gracefully.
             try:
-                server_info_response = requests.get(server_info_url, headers=headers, timeout=15)
+                server_info_response = self._get_worker_session().get(server_info_url, headers=headers, timeout=15)
                 if server_info_response.ok:
                     server_info = server_info_response.json() or {}
                     detected_version = (
@@ -5295,7 +5883,7 @@ class ClassImmichPhotos(BaseMediaClient):
 
             total_removed_assets = 0
             try:
-                response = requests.get(file_report_url, headers=headers)
+                response = self._get_worker_session().get(file_report_url, headers=headers)
                 response.raise_for_status()
                 spinner.succeed('Success!')
             except requests.exceptions.RequestException as e:
@@ -5345,7 +5933,7 @@ class ClassImmichPhotos(BaseMediaClient):
                     remove_payload = json.dumps({'force': True, 'ids': [entity_id]})
                     headers = {'Content-Type': 'application/json', 'x-api-key': self.IMMICH_USER_API_KEY}
                     try:
-                        response = requests.delete(asset_url, headers=headers, data=remove_payload)
+                        response = self._get_worker_session().delete(asset_url, headers=headers, data=remove_payload)
                         response.raise_for_status()
                     except requests.exceptions.HTTPError as e:
                         if response.status_code == 400:
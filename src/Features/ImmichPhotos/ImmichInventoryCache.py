@@ -0,0 +1,239 @@
+"""SQLite-backed, incrementally refreshed cache of an Immich asset inventory."""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+IMMICH_INVENTORY_CACHE_FOLDER = "Immich_Inventory_Cache"
+IMMICH_INVENTORY_CACHE_SCHEMA_VERSION = "1"
+# Assets updated while a sync is paging through the library may be returned with
+# their old values, so the next sync starts a little before the recorded watermark.
+IMMICH_INVENTORY_SYNC_OVERLAP = timedelta(minutes=1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inventory_assets (
+    asset_id TEXT PRIMARY KEY,
+    original_file_name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    normalized_name_key TEXT NOT NULL,
+    file_created_at TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    size INTEGER,
+    checksum TEXT,
+    asset_type TEXT
+);
+CREATE INDEX IF NOT EXISTS inventory_assets_name_key ON inventory_assets (name_key);
+CREATE INDEX IF NOT EXISTS inventory_assets_normalized_name_key ON inventory_assets (normalized_name_key);
+CREATE INDEX IF NOT EXISTS inventory_assets_checksum ON inventory_assets (checksum);
+CREATE TABLE IF NOT EXISTS inventory_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = "asset_id, original_file_name, file_created_at, created_at, updated_at, size, checksum, asset_type"
+
+
+def build_immich_inventory_cache_path(cache_folder, immich_url, user_identity):
+    """Return the cache file of one Immich server and user, without putting credentials in its name."""
+    identity = f"{str(immich_url or '').strip().rstrip('/').lower()}\n{str(user_identity or '').strip()}"
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+    return str(Path(cache_folder) / f"immich_inventory_{digest}.sqlite")
+
+
+def normalize_inventory_name(filename):
+    """Casefolded file name without a trailing '(n)' copy counter (e.g. 'IMG_1(1).JPG' -> 'img_1.jpg')."""
+    name = os.path.basename(str(filename or ""))
+    stem, ext = os.path.splitext(name)
+    stem = re.sub(r"\(\d+\)$", "", stem)
+    return f"{stem.casefold()}{ext.casefold()}"
+
+
+def parse_server_date(response):
+    """Return the server clock from a response 'Date' header (aware datetime), or None."""
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = parsedate_to_datetime(str(headers.get("Date") or ""))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class ImmichInventoryCache:
+    """
+    Keeps the fields PhotoMigrator uses from the Immich asset inventory on disk.
+
+    Only the identity of each asset is stored (id, original file name, capture and
+    upload dates, size, checksum and type), with indexes on the name and checksum,
+    so a later run refreshes the cache with the assets updated since the last sync
+    instead of downloading the whole library, and lookups do not need the full
+    inventory in memory.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = str(cache_path)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if self._get_meta("schema_version") != IMMICH_INVENTORY_CACHE_SCHEMA_VERSION:
+            self._conn.execute("DELETE FROM inventory_assets")
+            self._conn.execute("DELETE FROM inventory_meta")
+            self._set_meta("schema_version", IMMICH_INVENTORY_CACHE_SCHEMA_VERSION)
+        self._conn.commit()
+
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM inventory_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute("INSERT OR REPLACE INTO inventory_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_last_sync(self):
+        """Return the watermark of the last complete sync (aware datetime), or None if never synced."""
+        with self._lock:
+            value = self._get_meta("last_sync")
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    def begin_full_refresh(self):
+        """Forget every cached asset; the caller then stores the whole inventory again."""
+        with self._lock:
+            self._conn.execute("DELETE FROM inventory_assets")
+            self._set_meta("last_sync", "")
+            self._conn.commit()
+
+    def apply_page(self, items):
+        """Upsert the assets of one inventory page and drop the ones that are now trashed or deleted."""
+        rows = []
+        removed_ids = []
+        for item in items or []:
+            asset_id = str(item.get("id") or "").strip()
+            if not asset_id:
+                continue
+            if item.get("isTrashed") or item.get("deletedAt"):
+                removed_ids.append(asset_id)
+                continue
+            filename = str(item.get("originalFileName") or "")
+            rows.append((
+                asset_id,
+                filename,
+                filename.casefold(),
+                normalize_inventory_name(filename),
+                item.get("fileCreatedAt"),
+                item.get("createdAt"),
+                item.get("updatedAt"),
+                _inventory_item_size(item),
+                item.get("checksum"),
+                item.get("type"),
+            ))
+        with self._lock:
+            if rows:
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO inventory_assets (
+                        asset_id, original_file_name, name_key, normalized_name_key,
+                        file_created_at, created_at, updated_at, size, checksum, asset_type
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+            if removed_ids:
+                self._conn.executemany("DELETE FROM inventory_assets WHERE asset_id = ?", [(asset_id,) for asset_id in removed_ids])
+            self._conn.commit()
+
+    def finish_sync(self, synced_at):
+        """Record the watermark of a complete sync; the next one asks for assets updated after it."""
+        if synced_at is None:
+            return
+        if synced_at.tzinfo is None:
+            synced_at = synced_at.replace(tzinfo=timezone.utc)
+        with self._lock:
+            self._set_meta("last_sync", (synced_at - IMMICH_INVENTORY_SYNC_OVERLAP).isoformat())
+            self._conn.commit()
+
+    def remove_assets(self, asset_ids):
+        ids = [(str(asset_id),) for asset_id in asset_ids or [] if str(asset_id or "").strip()]
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM inventory_assets WHERE asset_id = ?", ids)
+            self._conn.commit()
+
+    def count(self):
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM inventory_assets").fetchone()
+        return int(row[0] or 0) if row else 0
+
+    def iter_assets(self):
+        """Yield every cached asset as an Immich-like dict (the fields of an inventory item that are kept)."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM inventory_assets ORDER BY file_created_at DESC").fetchall()
+        for row in rows:
+            yield _row_to_asset(row)
+
+    def find_by_name(self, filename):
+        """Return the cached assets whose name matches filename exactly or after normalization."""
+        name = os.path.basename(str(filename or ""))
+        if not name:
+            return []
+        name_key = name.casefold()
+        normalized_key = normalize_inventory_name(name)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT {_COLUMNS} FROM inventory_assets
+                WHERE name_key IN (?, ?) OR normalized_name_key IN (?, ?)
+                """,
+                (name_key, normalized_key, name_key, normalized_key),
+            ).fetchall()
+        return [_row_to_asset(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.commit()
+            finally:
+                self._conn.close()
+
+
+def _inventory_item_size(item):
+    exif_info = item.get("exifInfo") or {}
+    for size in (exif_info.get("fileSizeInByte"), exif_info.get("fileSize"), item.get("fileSize")):
+        try:
+            if size is not None:
+                return int(size)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _row_to_asset(row):
+    asset_id, filename, file_created_at, created_at, updated_at, size, checksum, asset_type = row
+    asset = {
+        "id": asset_id,
+        "originalFileName": filename,
+        "fileCreatedAt": file_created_at,
+        "createdAt": created_at,
+        "updatedAt": updated_at,
+        "checksum": checksum,
+        "type": asset_type,
+        "exifInfo": {},
+    }
+    if size is not None:
+        asset["exifInfo"]["fileSizeInByte"] = size
+    return asset
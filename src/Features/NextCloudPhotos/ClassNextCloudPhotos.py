@@ -6,7 +6,7 @@ import threading
 import unicodedata
 import xml.etree.ElementTree as ET
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -30,13 +30,23 @@ from Core.GlobalVariables import (
     VIDEO_EXT,
 )
 from Features.BaseMediaClient import BaseMediaClient
+from Features.NextCloudPhotos.NextCloudListingCache import NEXTCLOUD_LISTING_CACHE_FOLDER, NextCloudListingCache, build_nextcloud_listing_cache_path
 from Utils.FileUtils import get_all_files_paths, get_subfolders, merge_exclusion_patterns
 from Utils.DateUtils import guess_date_from_filename, is_date_outside_calendar_range
 from Utils.GeneralUtils import confirm_continue, convert_to_list, match_pattern, replace_pattern, tqdm, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, scan_album_consolidation_groups, print_album_consolidation_preview, print_remove_albums_preview, extract_asset_capture_years, extract_asset_capture_datetimes
 from Utils.DuplicateUtils import run_duplicate_asset_cleanup, select_people_then_chronology_keeper
+from Utils.DownloadUtils import download_to_file
+from Utils.StandaloneUtils import resolve_external_path
+from Utils.StreamUtils import ResponseBodyStream, get_response_content_length
 
 
 class ClassNextCloudPhotos(BaseMediaClient):
+    NEXTCLOUD_SEARCH_PAGE_SIZE = 5000
+    NEXTCLOUD_LISTING_WORKERS = 8
+    NEXTCLOUD_LISTING_CACHE = True
+    _dav_search_supported = None
+    _listing_cache = None
+
     def __init__(self, account_id: int = 1):
         self.account_id = int(account_id or 1)
         self.base_url = ""
@@ -129,6 +139,12 @@ class ClassNextCloudPhotos(BaseMediaClient):
             except Exception:
                 self.max_parallel_downloads = 12
             self.use_system_proxy = str(raw_use_proxy).strip().lower() in {"1", "true", "yes", "y", "on"}
+            try:
+                self.NEXTCLOUD_LISTING_WORKERS = max(1, min(32, int(str(section.get("NEXTCLOUD_LISTING_WORKERS", self.NEXTCLOUD_LISTING_WORKERS)).strip())))
+            except (TypeError, ValueError):
+                self.NEXTCLOUD_LISTING_WORKERS = ClassNextCloudPhotos.NEXTCLOUD_LISTING_WORKERS
+            raw_listing_cache = section.get("NEXTCLOUD_LISTING_CACHE", str(self.NEXTCLOUD_LISTING_CACHE))
+            self.NEXTCLOUD_LISTING_CACHE = str(raw_listing_cache).strip().lower() in {"1", "true", "yes", "y", "on"}
             # Accept host-only values in config and normalize to absolute URL.
             if self.base_url and not re.match(r"^https?://", self.base_url, flags=re.IGNORECASE):
                 LOGGER.warning(
@@ -190,6 +206,10 @@ class ClassNextCloudPhotos(BaseMediaClient):
                 self._ensured_dirs = {"/"}
             with self._native_album_lock:
                 self._native_album_cache = {}
+            listing_cache = self._listing_cache
+            if listing_cache is not None:
+                self._listing_cache = None
+                listing_cache.close()
             LOGGER.info(f"{MSG_TAGS['INFO']}Logged out from NextCloud account {self.account_id}.")
             return True
 
@@ -417,15 +437,24 @@ class ClassNextCloudPhotos(BaseMediaClient):
         rel = rel or "/"
         return unquote(rel)
 
-    def _propfind(self, remote_path: str, depth: int = 1, namespace: str = "files") -> List[Dict[str, str]]:
+    def _propfind(self, remote_path: str, depth: int = 1, namespace: str = "files", session: Optional[requests.Session] = None) -> List[Dict[str, str]]:
         xml_body = (
             '<?xml version="1.0"?>'
             '<d:propfind xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns"><d:prop>'
-            "<d:resourcetype/><d:getcontentlength/><d:getlastmodified/><oc:creationdate/>"
+            "<d:resourcetype/><d:getcontentlength/><d:getlastmodified/><d:getetag/><oc:creationdate/>"
             "</d:prop></d:propfind>"
         )
         namespace_value = "photos" if str(namespace or "").lower() == "photos" else "files"
-        if namespace_value == "photos":
+        if session is not None:
+            response = self._request_url_with_session(
+                session,
+                "PROPFIND",
+                self._dav_namespace_url(remote_path, namespace=namespace_value),
+                expected=(207,),
+                headers={"Depth": str(depth), "Content-Type": "application/xml"},
+                data=xml_body,
+            )
+        elif namespace_value == "photos":
             response = self._request_photos(
                 "PROPFIND",
                 remote_path,
@@ -441,7 +470,10 @@ class ClassNextCloudPhotos(BaseMediaClient):
                 headers={"Depth": str(depth), "Content-Type": "application/xml"},
                 data=xml_body,
             )
-        root = ET.fromstring(response.text)
+        return self._parse_multistatus(response.text, namespace_value)
+
+    def _parse_multistatus(self, body: str, namespace_value: str = "files") -> List[Dict[str, str]]:
+        root = ET.fromstring(body)
         ns = {"d": "DAV:", "oc": "http://owncloud.org/ns"}
         items: List[Dict[str, str]] = []
         for item in root.findall("d:response", ns):
@@ -457,6 +489,7 @@ class ClassNextCloudPhotos(BaseMediaClient):
             content_length = prop.find("d:getcontentlength", ns)
             last_modified = prop.find("d:getlastmodified", ns)
             creation_date = prop.find("oc:creationdate", ns)
+            etag = prop.find("d:getetag", ns)
             href = href_node.text or ""
             rel_path = self._split_relative_from_href(href, namespace=namespace_value)
             name = Path(rel_path.rstrip("/")).name
@@ -469,6 +502,7 @@ class ClassNextCloudPhotos(BaseMediaClient):
                     "size": (content_length.text or "0") if content_length is not None else "0",
                     "last_modified": (last_modified.text or "") if last_modified is not None else "",
                     "creation_date": (creation_date.text or "") if creation_date is not None else "",
+                    "etag": (etag.text or "").strip('"') if etag is not None else "",
                     "source_namespace": namespace_value,
                 }
             )
@@ -498,29 +532,170 @@ class ClassNextCloudPhotos(BaseMediaClient):
             with self._ensured_dirs_lock:
                 self._ensured_dirs.add(current)
 
-    def _iter_files_recursive(self, remote_path: str, namespace: str = "files") -> Iterable[Dict[str, str]]:
-        stack = [remote_path]
-        namespace_value = "photos" if str(namespace or "").lower() == "photos" else "files"
-        while stack:
-            current = stack.pop()
+    def _get_listing_cache(self) -> Optional[NextCloudListingCache]:
+        """Return the on-disk folder listing cache of this server and user, or None when NEXTCLOUD_LISTING_CACHE is off."""
+        if not getattr(self, "NEXTCLOUD_LISTING_CACHE", False):
+            return None
+        if self._listing_cache is None:
+            cache_path = build_nextcloud_listing_cache_path(
+                resolve_external_path(f"./{NEXTCLOUD_LISTING_CACHE_FOLDER}"),
+                self.base_url,
+                self.username,
+            )
             try:
-                entries = self._propfind(current, depth=1, namespace=namespace_value)
+                self._listing_cache = NextCloudListingCache(cache_path)
             except Exception as error:
-                if self._is_not_found_runtime_error(error):
-                    LOGGER.warning(
-                        f"{MSG_TAGS['WARNING']}NextCloud folder not found while listing '{current}' "
-                        f"(namespace={namespace_value}). Skipping. {error}"
-                    )
-                    continue
+                LOGGER.warning(f"{MSG_TAGS['WARNING']}Unable to open the NextCloud listing cache '{cache_path}'; it will not be used: {error}")
+                self.NEXTCLOUD_LISTING_CACHE = False
+                return None
+        return self._listing_cache
+
+    def _iter_files_recursive(self, remote_path: str, namespace: str = "files") -> Iterable[Dict[str, str]]:
+        """
+        Yield every file below remote_path as soon as it is listed.
+
+        Folders already walked in a previous run are listed with a parallel breadth-first
+        PROPFIND that only descends into the folders whose ETag changed (the others come
+        from the listing cache). Otherwise a single paged WebDAV SEARCH lists the whole
+        tree, falling back to the PROPFIND walk when the server does not support it.
+        """
+        namespace_value = "photos" if str(namespace or "").lower() == "photos" else "files"
+        root = self._normalize_dir_path(remote_path)
+        self._require_session()
+        listing_cache = self._get_listing_cache()
+        try:
+            if listing_cache is not None and listing_cache.get_folder_etag(namespace_value, root) is not None:
+                cached_files = listing_cache.get_subtree_files(namespace_value, root, self._get_folder_etag(root, namespace=namespace_value))
+                if cached_files is not None:
+                    yield from cached_files
+                    return
+            elif namespace_value == "files" and self._dav_search_supported is not False:
+                yielded = False
+                try:
+                    for entry in self._iter_files_by_search(root, listing_cache):
+                        yielded = True
+                        yield entry
+                    return
+                except Exception as error:
+                    if yielded or self._is_not_found_runtime_error(error):
+                        raise
+                    self._dav_search_supported = False
+                    LOGGER.debug(f"NextCloud WebDAV SEARCH is not available; listing folders with PROPFIND instead: {self._compact_runtime_error(error)}")
+        except Exception as error:
+            if not self._is_not_found_runtime_error(error):
                 raise
+            LOGGER.warning(
+                f"{MSG_TAGS['WARNING']}NextCloud folder not found while listing '{root}' "
+                f"(namespace={namespace_value}). Skipping. {error}"
+            )
+            return
+        yield from self._iter_files_by_propfind(root, namespace_value, listing_cache)
+
+    def _get_folder_etag(self, remote_path: str, namespace: str = "files") -> str:
+        for entry in self._propfind(remote_path, depth=0, namespace=namespace):
+            if entry["path"].rstrip("/") == remote_path.rstrip("/"):
+                return entry.get("etag", "")
+        return ""
+
+    def _iter_files_by_search(self, root: str, listing_cache: Optional[NextCloudListingCache] = None) -> Iterable[Dict[str, str]]:
+        dav_url = self._dav_url(root)
+        scope = dav_url[dav_url.find("/remote.php/dav/") + len("/remote.php/dav"):]
+        search_url = urljoin(f"{self.base_url}/", "remote.php/dav/")
+        page_size = max(1, int(self.NEXTCLOUD_SEARCH_PAGE_SIZE or 1))
+        # The root ETag changes if anything below it changes, so comparing it before and after
+        # the search tells whether the folder ETags collected while paging are consistent.
+        root_etag = self._get_folder_etag(root) if listing_cache is not None else ""
+        folders: Dict[str, Tuple[str, List[str], List[Dict[str, str]]]] = {root: (root_etag, [], [])}
+        offset = 0
+        while True:
+            xml_body = (
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<d:searchrequest xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns" xmlns:ns="https://github.com/icewind1991/SearchDAV/ns">'
+                "<d:basicsearch>"
+                "<d:select><d:prop>"
+                "<d:resourcetype/><d:getcontentlength/><d:getlastmodified/><d:getetag/><oc:creationdate/>"
+                "</d:prop></d:select>"
+                f"<d:from><d:scope><d:href>{scope}</d:href><d:depth>infinity</d:depth></d:scope></d:from>"
+                "<d:where><d:like><d:prop><d:getcontenttype/></d:prop><d:literal>%</d:literal></d:like></d:where>"
+                "<d:orderby><d:order><d:prop><oc:fileid/></d:prop><d:ascending/></d:order></d:orderby>"
+                f"<d:limit><d:nresults>{page_size}</d:nresults><ns:firstresult>{offset}</ns:firstresult></d:limit>"
+                "</d:basicsearch>"
+                "</d:searchrequest>"
+            )
+            response = self._request_url(
+                "SEARCH",
+                search_url,
+                expected=(207,),
+                headers={"Content-Type": "text/xml"},
+                data=xml_body.encode("utf-8"),
+            )
+            entries = self._parse_multistatus(response.text, "files")
             for entry in entries:
-                p = entry["path"]
-                if p.rstrip("/") == current.rstrip("/"):
+                path = entry["path"].rstrip("/") or "/"
+                if path == root or not (root == "/" or self._is_path_under(path, root)):
                     continue
+                parent = self._remote_parent(path)
                 if entry["is_dir"] == "true":
-                    stack.append(p)
+                    _, subfolders, files = folders.get(path, ("", [], []))
+                    folders[path] = (entry.get("etag", ""), subfolders, files)
+                    folders.setdefault(parent, ("", [], []))[1].append(path)
                 else:
+                    folders.setdefault(parent, ("", [], []))[2].append(entry)
                     yield entry
+            if len(entries) < page_size:
+                break
+            offset += len(entries)
+        if listing_cache is not None and root_etag and self._get_folder_etag(root) == root_etag:
+            listing_cache.store_folders("files", folders)
+
+    def _iter_files_by_propfind(self, root: str, namespace_value: str = "files", listing_cache: Optional[NextCloudListingCache] = None) -> Iterable[Dict[str, str]]:
+        def list_folder(folder):
+            entries = self._propfind(folder, depth=1, namespace=namespace_value, session=self._get_worker_session())
+            etag = ""
+            subfolders = []
+            files = []
+            for entry in entries:
+                if entry["path"].rstrip("/") == folder.rstrip("/"):
+                    etag = entry.get("etag", "")
+                elif entry["is_dir"] == "true":
+                    subfolders.append((entry["path"].rstrip("/"), entry.get("etag", "")))
+                else:
+                    files.append(entry)
+            return etag, subfolders, files
+
+        folders: Dict[str, Tuple[str, List[str], List[Dict[str, str]]]] = {}
+        workers = max(1, int(self.NEXTCLOUD_LISTING_WORKERS or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(list_folder, root): root}
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        current = pending.pop(future)
+                        try:
+                            etag, subfolders, files = future.result()
+                        except Exception as error:
+                            if self._is_not_found_runtime_error(error):
+                                LOGGER.warning(
+                                    f"{MSG_TAGS['WARNING']}NextCloud folder not found while listing '{current}' "
+                                    f"(namespace={namespace_value}). Skipping. {error}"
+                                )
+                                continue
+                            raise
+                        folders[current] = (etag, [path for path, _ in subfolders], files)
+                        for entry in files:
+                            yield entry
+                        for path, subfolder_etag in subfolders:
+                            cached_files = listing_cache.get_subtree_files(namespace_value, path, subfolder_etag) if listing_cache is not None else None
+                            if cached_files is None:
+                                pending[executor.submit(list_folder, path)] = path
+                            else:
+                                yield from cached_files
+            finally:
+                for future in pending:
+                    future.cancel()
+        if listing_cache is not None:
+            listing_cache.store_folders(namespace_value, folders)
 
     def _asset_type_from_name(self, name: str) -> str:
         if self._is_video(name):
@@ -559,11 +734,10 @@ class ClassNextCloudPhotos(BaseMediaClient):
 
     def _download_file(self, remote_path: str, local_path: str) -> str:
         self._ensure_local_parent(local_path)
-        response = self._request("GET", remote_path, expected=(200, 206), stream=True)
-        with open(local_path, "wb") as fp:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    fp.write(chunk)
+        download_to_file(
+            local_path,
+            lambda extra_headers: self._request("GET", remote_path, expected=(200, 206), stream=True, headers=extra_headers),
+        )
         return local_path
 
     def _download_file_with_session(
@@ -575,17 +749,18 @@ class ClassNextCloudPhotos(BaseMediaClient):
     ) -> str:
         self._ensure_local_parent(local_path)
         namespace_value = "photos" if str(namespace or "").lower() == "photos" else "files"
-        response = self._request_url_with_session(
-            session=session,
-            method="GET",
-            url=self._dav_namespace_url(remote_path=remote_path, namespace=namespace_value),
-            expected=(200, 206),
-            stream=True,
+        url = self._dav_namespace_url(remote_path=remote_path, namespace=namespace_value)
+        download_to_file(
+            local_path,
+            lambda extra_headers: self._request_url_with_session(
+                session=session,
+                method="GET",
+                url=url,
+                expected=(200, 206),
+                stream=True,
+                headers=extra_headers,
+            ),
         )
-        with open(local_path, "wb") as fp:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    fp.write(chunk)
         return local_path
 
     def _ensure_local_parent(self, local_path: str):
@@ -1257,6 +1432,26 @@ class ClassNextCloudPhotos(BaseMediaClient):
             )
             return output_file
 
+    def open_asset_stream(self, asset_id, asset_filename, album_passphrase=None, album_id=None, album_scope=None, log_level=None):
+        """Open a NextCloud file as a ResponseBodyStream, or None when its length is unknown."""
+        with set_log_level(LOGGER, log_level):
+            remote_path = str(asset_id)
+            response = self._request_url_with_session(
+                session=self._get_worker_session(),
+                method="GET",
+                url=self._dav_namespace_url(
+                    remote_path=remote_path,
+                    namespace="photos" if remote_path.startswith("/albums/") else "files",
+                ),
+                expected=(200,),
+                stream=True,
+            )
+            content_length = get_response_content_length(response)
+            if content_length is None:
+                response.close()
+                return None
+            return ResponseBodyStream(response, content_length)
+
     def _normalize_asset_time_for_metadata(self, asset_time) -> str:
         if isinstance(asset_time, (int, float)):
             return datetime.fromtimestamp(asset_time, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
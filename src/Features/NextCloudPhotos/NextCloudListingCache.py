@@ -0,0 +1,132 @@
+"""SQLite-backed cache of NextCloud WebDAV folder listings, validated by folder ETags."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+NEXTCLOUD_LISTING_CACHE_FOLDER = "NextCloud_Listing_Cache"
+NEXTCLOUD_LISTING_CACHE_SCHEMA_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listing_folders (
+    namespace TEXT NOT NULL,
+    path TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    dirs TEXT NOT NULL,
+    files TEXT NOT NULL,
+    PRIMARY KEY (namespace, path)
+);
+CREATE TABLE IF NOT EXISTS listing_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def build_nextcloud_listing_cache_path(cache_folder, base_url, username):
+    """Return the cache file of one NextCloud server and user, without putting credentials in its name."""
+    identity = f"{str(base_url or '').strip().rstrip('/').lower()}\n{str(username or '').strip()}"
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+    return str(Path(cache_folder) / f"nextcloud_listing_{digest}.sqlite")
+
+
+def normalize_listing_path(remote_path):
+    """Folder path as stored in the cache: '/'-separated, without trailing slash ('/' for the root)."""
+    path = "/".join(part for part in str(remote_path or "").replace("\\", "/").split("/") if part)
+    return f"/{path}"
+
+
+class NextCloudListingCache:
+    """
+    Keeps the last known listing of every NextCloud folder that was walked, keyed by its ETag.
+
+    NextCloud changes the ETag of a folder whenever anything below it changes, so a folder
+    whose ETag is the one stored here (and whose subfolders are all stored too) can be
+    listed from the cache without sending a single PROPFIND for its whole subtree.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = str(cache_path)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT value FROM listing_meta WHERE key = 'schema_version'").fetchone()
+        if not row or row[0] != NEXTCLOUD_LISTING_CACHE_SCHEMA_VERSION:
+            self._conn.execute("DELETE FROM listing_folders")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listing_meta (key, value) VALUES ('schema_version', ?)",
+                (NEXTCLOUD_LISTING_CACHE_SCHEMA_VERSION,),
+            )
+        self._conn.commit()
+
+    def get_folder_etag(self, namespace, remote_path):
+        """Return the ETag stored for a folder, or None if it was never listed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag FROM listing_folders WHERE namespace = ? AND path = ?",
+                (namespace, normalize_listing_path(remote_path)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_subtree_files(self, namespace, remote_path, etag):
+        """
+        Return every file below remote_path if the cached folder still has this ETag, or None.
+
+        None is also returned when one of the cached subfolders is missing, so the caller lists
+        the folder again instead of returning an incomplete subtree.
+        """
+        if not etag:
+            return None
+        root = normalize_listing_path(remote_path)
+        prefix = "/" if root == "/" else f"{root}/"
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag FROM listing_folders WHERE namespace = ? AND path = ?",
+                (namespace, root),
+            ).fetchone()
+            if not row or row[0] != etag:
+                return None
+            rows = self._conn.execute(
+                "SELECT path, dirs, files FROM listing_folders WHERE namespace = ? AND (path = ? OR substr(path, 1, ?) = ?)",
+                (namespace, root, len(prefix), prefix),
+            ).fetchall()
+        folders = {path: (json.loads(dirs), json.loads(files)) for path, dirs, files in rows}
+        subtree_files = []
+        pending = [root]
+        while pending:
+            folder = folders.get(pending.pop())
+            if folder is None:
+                return None
+            dirs, files = folder
+            subtree_files.extend(files)
+            pending.extend(normalize_listing_path(path) for path in dirs)
+        return subtree_files
+
+    def store_folders(self, namespace, folders):
+        """Store fresh listings: folders maps a folder path to (etag, subfolder paths, file entries)."""
+        rows = [
+            (namespace, normalize_listing_path(path), etag, json.dumps(list(dirs)), json.dumps(list(files)))
+            for path, (etag, dirs, files) in folders.items()
+            if etag
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO listing_folders (namespace, path, etag, dirs, files) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.commit()
+            finally:
+                self._conn.close()
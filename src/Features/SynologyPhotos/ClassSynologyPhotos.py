@@ -12,11 +12,13 @@ import threading
 import time
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from datetime import datetime
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
 from Core.CustomLogger import set_log_level
@@ -24,8 +26,10 @@ from Core.GlobalVariables import ARGS, LOGGER, MSG_TAGS, FOLDERNAME_NO_ALBUMS, C
 from Features.BaseMediaClient import BaseMediaClient
 from Utils.DateUtils import parse_text_datetime_to_epoch, is_date_outside_range, is_date_outside_calendar_range
 from Utils.FileUtils import matches_any_pattern, merge_exclusion_patterns
-from Utils.GeneralUtils import update_metadata, convert_to_list, get_unique_items, tqdm, match_pattern, replace_pattern, has_any_filter, confirm_continue, sha1_checksum, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, scan_album_consolidation_groups, print_album_consolidation_preview, print_remove_albums_preview, extract_asset_capture_years, extract_asset_capture_datetimes
+from Utils.GeneralUtils import update_metadata, convert_to_list, get_unique_items, tqdm, match_pattern, replace_pattern, has_any_filter, confirm_continue, sha1_checksum, find_reusable_album_candidate, build_reusable_album_group, canonicalize_album_name_for_reuse, prefer_canonical_album_names_enabled, consolidate_similar_albums_enabled, scan_album_consolidation_groups, print_album_consolidation_preview, print_remove_albums_preview, extract_asset_capture_years, extract_asset_capture_datetimes, run_transfers_in_pool, run_downloads_in_pool
 from Utils.DuplicateUtils import run_duplicate_asset_cleanup, select_people_then_chronology_keeper
+from Utils.DownloadUtils import download_to_file
+from Utils.StreamUtils import STREAM_CHUNK_SIZE, ResponseBodyStream, get_response_content_length
 
 """
 ----------------------
@@ -58,6 +62,11 @@ class ClassSynologyPhotos(BaseMediaClient):
     that uses a global LOGGER from GlobalVariables. It maintains original log messages
     and docstrings are now in English.
     """
+    SYNOLOGY_MAX_PARALLEL_UPLOADS = 4
+    SYNOLOGY_MAX_PARALLEL_DOWNLOADS = 8
+    SYNOLOGY_LIST_PAGE_SIZE = 5000
+    SYNOLOGY_LIST_WORKERS = 4
+    SYNOLOGY_HTTP_POOL_SIZE = 32
 
     def __init__(self, account_id=1):
         """
@@ -78,6 +87,7 @@ class ClassSynologyPhotos(BaseMediaClient):
         self.SESSION = None
         self.SID = None
         self.SYNO_TOKEN_HEADER = {}
+        self._login_lock = threading.RLock()  # Serializes login/logout, so only one thread authenticates at a time
 
         self.use_OTP = ARGS.get('one-time-password', None)
 
@@ -105,6 +115,8 @@ class ClassSynologyPhotos(BaseMediaClient):
         self.albums_assets_filtered = None
         self.shared_album_access_cache = {}
         self.album_runtime_details_cache = {}
+        self.album_items_cache = {}
+        self._album_items_lock = threading.Lock()  # Pull workers list albums concurrently
 
         # Get the values from the arguments (if exists)
         self.type = ARGS.get('filter-by-type', None)
@@ -365,6 +377,57 @@ class ClassSynologyPhotos(BaseMediaClient):
             return None
         return parsed_value if parsed_value >= 0 else None
 
+    def _iter_list_pages(self, fetch_page, limit=None, total=None):
+        """
+        Yield the pages of a Synology 'list' API in listing order, fetching them concurrently.
+
+        fetch_page(offset) returns the 'data' object of one response ({"list": [...], "total": n}).
+        The first page is fetched alone. The next ones are fetched SYNOLOGY_LIST_WORKERS at a
+        time: up to the total when it is known (from `total` or from the first response), or
+        probed otherwise, until a page shorter than `limit` marks the end of the listing.
+        """
+        limit = limit or self.SYNOLOGY_LIST_PAGE_SIZE
+        page_data = fetch_page(0) or {}
+        page = list(page_data.get("list") or [])
+        yield page
+        if total is None:
+            total = self._parse_album_expected_count(page_data.get("total"))
+        workers = max(1, int(self.SYNOLOGY_LIST_WORKERS or 1))
+        offset = limit
+        while len(page) >= limit:
+            if total is not None and offset < total:
+                offsets = list(range(offset, min(total, offset + workers * limit), limit))
+            elif total is not None:
+                offsets = [offset]
+            else:
+                offsets = [offset + index * limit for index in range(workers)]
+            with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as executor:
+                pages = [list((data or {}).get("list") or []) for data in executor.map(fetch_page, offsets)]
+            for page in pages:
+                yield page
+                if len(page) < limit:
+                    break
+            offset = offsets[-1] + limit
+
+    def _get_cached_album_items(self, cache_key):
+        """Return a copy of the cached item listing of an album, or None when it is not cached."""
+        with self._album_items_lock:
+            cached_assets = self.album_items_cache.get(cache_key)
+            return list(cached_assets) if cached_assets is not None else None
+
+    def _cache_album_items(self, cache_key, album_assets):
+        with self._album_items_lock:
+            self.album_items_cache[cache_key] = list(album_assets)
+
+    def _forget_album_items(self, album_id=None):
+        """Drop the cached item listing of album_id, or of every album when album_id is None."""
+        with self._album_items_lock:
+            if album_id is None:
+                self.album_items_cache.clear()
+                return
+            for key in [key for key in self.album_items_cache if key[0] == str(album_id)]:
+                self.album_items_cache.pop(key, None)
+
     @staticmethod
     def _iter_entry_transport_variants(prefer_post=False):
         if prefer_post:
@@ -409,9 +472,46 @@ class ClassSynologyPhotos(BaseMediaClient):
             f"-> status={status_code} success={success} stream={stream} content_type={content_type or 'unknown'}"
         )
 
+    def _build_session(self):
+        """
+        Build the session shared by every worker, with a connection pool sized for them.
+
+        The default urllib3 pool keeps 10 connections per host, so with more concurrent
+        push/pull workers than that, connections are discarded and reopened on every call.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.SYNOLOGY_HTTP_POOL_SIZE,
+            pool_maxsize=self.SYNOLOGY_HTTP_POOL_SIZE,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _with_auth_headers(self, headers=None):
+        """Add the SynoToken of the current session (if any) to the headers of a request."""
+        syno_token_header = getattr(self, "SYNO_TOKEN_HEADER", None)
+        if not syno_token_header:
+            return headers
+        merged_headers = dict(syno_token_header)
+        merged_headers.update(headers or {})
+        return merged_headers
+
+    def _get_session(self):
+        """Return the shared session, logging in first if there is none yet."""
+        session = self.SESSION
+        if session is None:
+            self.login()
+            session = self.SESSION
+        if session is None:
+            raise requests.ConnectionError("Not logged in to Synology Photos")
+        return session
+
     def _session_get(self, url, *, params=None, headers=None, verify=False, stream=False):
+        session = self._get_session()
+        headers = self._with_auth_headers(headers)
         try:
-            response = self.SESSION.get(url, params=params, headers=headers, verify=verify, stream=stream)
+            response = session.get(url, params=params, headers=headers, verify=verify, stream=stream)
         except Exception as error:
             self._log_api_request_debug("get", url, "params", params, error=error)
             raise
@@ -419,8 +519,10 @@ class ClassSynologyPhotos(BaseMediaClient):
         return response
 
     def _session_post(self, url, *, data=None, headers=None, verify=False, stream=False):
+        session = self._get_session()
+        headers = self._with_auth_headers(headers)
         try:
-            response = self.SESSION.post(url, data=data, headers=headers, verify=verify, stream=stream)
+            response = session.post(url, data=data, headers=headers, verify=verify, stream=stream)
         except Exception as error:
             self._log_api_request_debug("post", url, "data", data, error=error)
             raise
@@ -656,10 +758,9 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if self.SYNO_TOKEN_HEADER:
                     headers.update(self.SYNO_TOKEN_HEADER)
 
-                offset = 0
-                limit = 5000
-                album_list = []
-                while True:
+                limit = self.SYNOLOGY_LIST_PAGE_SIZE
+
+                def fetch_page(offset):
                     params = {
                         'api': 'SYNO.Foto.Browse.Album',
                         'version': '4',
@@ -671,19 +772,22 @@ class ClassSynologyPhotos(BaseMediaClient):
                         "offset": offset,
                         "limit": limit
                     }
-
                     response = self._request_entry_api(url, params, headers=headers, prefer_post=True)
                     data = response.json()
                     if not data.get("success"):
-                        LOGGER.error(f"Failed to list shared albums with current user: {data}")
-                        return None
-                    album_list.extend([
-                        self._hydrate_album_payload(album, fallback_scope="shared_with_me")
-                        for album in data["data"]["list"]
-                    ])
-                    if len(data["data"]["list"]) < limit:
-                        break
-                    offset += limit
+                        raise RuntimeError(f"Failed to list shared albums with current user: {data}")
+                    return data["data"]
+
+                album_list = []
+                try:
+                    for page in self._iter_list_pages(fetch_page, limit=limit):
+                        album_list.extend([
+                            self._hydrate_album_payload(album, fallback_scope="shared_with_me")
+                            for album in page
+                        ])
+                except RuntimeError as e:
+                    LOGGER.error(str(e))
+                    return None
                 return album_list
             except Exception as e:
                 LOGGER.error(f"Exception while listing shared albums with current user. {e}")
@@ -727,6 +831,18 @@ class ClassSynologyPhotos(BaseMediaClient):
             self.SYNOLOGY_URL = self.CONFIG.get(section_to_load).get('SYNOLOGY_URL', None)
             self.SYNOLOGY_USERNAME = self.CONFIG.get(section_to_load).get(f'SYNOLOGY_USERNAME_{self.ACCOUNT_ID}', None)      # Read the configuration for the user account given by the suffix ACCAUNT_ID
             self.SYNOLOGY_PASSWORD = self.CONFIG.get(section_to_load).get(f'SYNOLOGY_PASSWORD_{self.ACCOUNT_ID}', None)      # Read the configuration for the user account given by the suffix ACCAUNT_ID
+            try:
+                self.SYNOLOGY_MAX_PARALLEL_UPLOADS = max(1, min(32, int(str(self.CONFIG.get(section_to_load).get('SYNOLOGY_MAX_PARALLEL_UPLOADS', self.SYNOLOGY_MAX_PARALLEL_UPLOADS)).strip())))
+            except (TypeError, ValueError):
+                self.SYNOLOGY_MAX_PARALLEL_UPLOADS = ClassSynologyPhotos.SYNOLOGY_MAX_PARALLEL_UPLOADS
+            try:
+                self.SYNOLOGY_MAX_PARALLEL_DOWNLOADS = max(1, min(32, int(str(self.CONFIG.get(section_to_load).get('SYNOLOGY_MAX_PARALLEL_DOWNLOADS', self.SYNOLOGY_MAX_PARALLEL_DOWNLOADS)).strip())))
+            except (TypeError, ValueError):
+                self.SYNOLOGY_MAX_PARALLEL_DOWNLOADS = ClassSynologyPhotos.SYNOLOGY_MAX_PARALLEL_DOWNLOADS
+            try:
+                self.SYNOLOGY_HTTP_POOL_SIZE = max(1, min(256, int(str(self.CONFIG.get(section_to_load).get('SYNOLOGY_HTTP_POOL_SIZE', self.SYNOLOGY_HTTP_POOL_SIZE)).strip())))
+            except (TypeError, ValueError):
+                self.SYNOLOGY_HTTP_POOL_SIZE = ClassSynologyPhotos.SYNOLOGY_HTTP_POOL_SIZE
 
             if not self.SYNOLOGY_URL or self.SYNOLOGY_URL.strip() == '':
                 LOGGER.warning(f"SYNOLOGY_URL not found. It will be requested on screen.")
@@ -774,58 +890,72 @@ class ClassSynologyPhotos(BaseMediaClient):
             use_OTP = self.use_OTP
         with set_log_level(LOGGER, log_level):
             try:
-                if self.SESSION and self.SID and self.SYNO_TOKEN_HEADER:
-                    return (self.SESSION, self.SID, self.SYNO_TOKEN_HEADER)
-                elif self.SESSION and self.SID:
-                    return (self.SESSION, self.SID)
+                session = self._get_logged_in_session()
+                if session:
+                    return session
+
+                # Workers share one session, so only the first thread that finds it logged out authenticates;
+                # the others wait here and reuse its SID instead of each opening a new one.
+                with self._login_lock:
+                    session = self._get_logged_in_session()
+                    if session:
+                        return session
+
+                    self.read_config_file(log_level=log_level)
+                    LOGGER.info(f"")
+                    LOGGER.info(f"Authenticating on Synology Photos and getting Session...")
 
-                self.read_config_file(log_level=log_level)
-                LOGGER.info(f"")
-                LOGGER.info(f"Authenticating on Synology Photos and getting Session...")
+                    self.SESSION = self._build_session()
+                    url = f"{self.SYNOLOGY_URL}/webapi/auth.cgi"
 
-                self.SESSION = requests.Session()
-                url = f"{self.SYNOLOGY_URL}/webapi/auth.cgi"
+                    params = {
+                        "api": "SYNO.API.Auth",
+                        "version": "6",
+                        "method": "login",
+                        "account": self.SYNOLOGY_USERNAME,
+                        "passwd": self.SYNOLOGY_PASSWORD,
+                        "format": "sid",
+                    }
+                    if use_syno_token:
+                        params.update({"enable_syno_token": "yes"})
 
-                params = {
-                    "api": "SYNO.API.Auth",
-                    "version": "6",
-                    "method": "login",
-                    "account": self.SYNOLOGY_USERNAME,
-                    "passwd": self.SYNOLOGY_PASSWORD,
-                    "format": "sid",
-                }
-                if use_syno_token:
-                    params.update({"enable_syno_token": "yes"})
-
-                if use_OTP:
-                    LOGGER.warning(f"SYNOLOGY OTP TOKEN required (flag -OTP, --one-time-password detected). OTP Token will be requested on screen...")
-                    OTP = input(f"{MSG_TAGS['INFO']}Enter SYNOLOGY OTP Token: ")
-                    if os.environ.get("PHOTOMIGRATOR_WEB_MODE"):
-                        print()
-                    params.update({"otp_code": OTP})
-                    params.update({"enable_device_token": "yes"})
-                    params.update({"device_name": "PhotoMigrator"})
-
-                response = self._session_get(url, params=params, verify=False)
-                response.raise_for_status()
-                data = response.json()
+                    if use_OTP:
+                        LOGGER.warning(f"SYNOLOGY OTP TOKEN required (flag -OTP, --one-time-password detected). OTP Token will be requested on screen...")
+                        OTP = input(f"{MSG_TAGS['INFO']}Enter SYNOLOGY OTP Token: ")
+                        if os.environ.get("PHOTOMIGRATOR_WEB_MODE"):
+                            print()
+                        params.update({"otp_code": OTP})
+                        params.update({"enable_device_token": "yes"})
+                        params.update({"device_name": "PhotoMigrator"})
 
-                if data.get("success"):
-                    self.SID = data["data"]["sid"]
-                    self.SESSION.cookies.set("id", self.SID)
-                    LOGGER.info(f"Authentication Successfully with user/password found in Config file. Cookie properly set with session id.")
-                    if use_syno_token:
-                        LOGGER.info(f"SYNO_TOKEN_HEADER created as global variable. You must include 'SYNO_TOKEN_HEADER' in your request to work with this session.")
-                        self.SYNO_TOKEN_HEADER = {"X-SYNO-TOKEN": data["data"]["synotoken"],}
-                        return (self.SESSION, self.SID, self.SYNO_TOKEN_HEADER)
+                    response = self._session_get(url, params=params, verify=False)
+                    response.raise_for_status()
+                    data = response.json()
+
+                    if data.get("success"):
+                        self.SESSION.cookies.set("id", data["data"]["sid"])
+                        if use_syno_token:
+                            self.SYNO_TOKEN_HEADER = {"X-SYNO-TOKEN": data["data"]["synotoken"],}
+                        # SID is published last: other threads take the session as ready as soon as it is set.
+                        self.SID = data["data"]["sid"]
+                        LOGGER.info(f"Authentication Successfully with user/password found in Config file. Cookie properly set with session id.")
+                        if use_syno_token:
+                            LOGGER.info(f"SYNO_TOKEN_HEADER created as global variable. It is added to every request sent with this session.")
+                            return (self.SESSION, self.SID, self.SYNO_TOKEN_HEADER)
+                        else:
+                            return (self.SESSION, self.SID)
                     else:
-                        return (self.SESSION, self.SID)
-                else:
-                    LOGGER.error(f"Unable to authenticate with the provided Synology Photos data: {data}")
-                    sys.exit(-1)
+                        LOGGER.error(f"Unable to authenticate with the provided Synology Photos data: {data}")
+                        sys.exit(-1)
             except Exception as e:
                 LOGGER.error(f"Exception while login into Synology Photos!. {e}")
-            
+
+    def _get_logged_in_session(self):
+        if self.SESSION and self.SID and self.SYNO_TOKEN_HEADER:
+            return (self.SESSION, self.SID, self.SYNO_TOKEN_HEADER)
+        elif self.SESSION and self.SID:
+            return (self.SESSION, self.SID)
+        return None
 
     def logout(self, log_level=None):
         """
@@ -836,26 +966,29 @@ class ClassSynologyPhotos(BaseMediaClient):
         """
         with set_log_level(LOGGER, log_level):
             try:
-                if self.SESSION and self.SID:
-                    url = f"{self.SYNOLOGY_URL}/webapi/auth.cgi"
-                    params = {
-                        "api": "SYNO.API.Auth",
-                        "version": "3",
-                        "method": "logout",
-                    }
-                    response = self._session_get(url, params=params, verify=False)
-                    response.raise_for_status()
-                    data = response.json()
-                    if data.get("success"):
-                        LOGGER.info(f"Session closed successfully.")
-                        self.SESSION = None
-                        self.SID = None
-                        self.SYNO_TOKEN_HEADER = {}
-                    else:
-                        LOGGER.error(f"Unable to close session in Synology NAS.")
+                with self._login_lock:
+                    if self.SESSION and self.SID:
+                        url = f"{self.SYNOLOGY_URL}/webapi/auth.cgi"
+                        params = {
+                            "api": "SYNO.API.Auth",
+                            "version": "3",
+                            "method": "logout",
+                        }
+                        response = self._session_get(url, params=params, verify=False)
+                        response.raise_for_status()
+                        data = response.json()
+                        if data.get("success"):
+                            LOGGER.info(f"Session closed successfully.")
+                            # The session object is kept (only its pooled connections are closed), because other
+                            # workers may still be sending requests through it. Without SID the next login builds a new one.
+                            self.SID = None
+                            self.SYNO_TOKEN_HEADER = {}
+                            self.SESSION.close()
+                        else:
+                            LOGGER.error(f"Unable to close session in Synology NAS.")
             except Exception as e:
                 LOGGER.error(f"Exception while logout from Synology Photos!. {e}")
-            
+
 
     ###########################################################################
     #                           GENERAL UTILITY                               #
@@ -1048,6 +1181,7 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if self.SYNO_TOKEN_HEADER:
                     headers.update(self.SYNO_TOKEN_HEADER)
 
+                self._forget_album_items(album_id)
                 params = {
                     "api": "SYNO.Foto.Browse.Album",
                     "method": "delete",
@@ -1092,10 +1226,9 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if self.SYNO_TOKEN_HEADER:
                     headers.update(self.SYNO_TOKEN_HEADER)
 
-                offset = 0
-                limit = 5000
-                album_list = []
-                while True:
+                limit = self.SYNOLOGY_LIST_PAGE_SIZE
+
+                def fetch_page(offset):
                     params = {
                         "api": "SYNO.Foto.Browse.NormalAlbum",
                         "method": "list",
@@ -1110,16 +1243,17 @@ class ClassSynologyPhotos(BaseMediaClient):
                     resp = self._request_entry_api(url, params, headers=headers, prefer_post=True)
                     resp.raise_for_status()
                     data = resp.json()
+                    if not data["success"]:
+                        raise RuntimeError(f"Failed to list albums: {data}")
+                    return data["data"]
 
-                    if data["success"]:
-                        album_list.extend(data["data"]["list"])
-                    else:
-                        LOGGER.error(f"Failed to list albums: {data}")
-                        return None
-
-                    if len(data["data"]["list"]) < limit:
-                        break
-                    offset += limit
+                album_list = []
+                try:
+                    for page in self._iter_list_pages(fetch_page, limit=limit):
+                        album_list.extend(page)
+                except RuntimeError as e:
+                    LOGGER.error(str(e))
+                    return None
 
                 albums_filtered = []
                 for album in album_list:
@@ -1252,12 +1386,10 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if self.SYNO_TOKEN_HEADER:
                     headers.update(self.SYNO_TOKEN_HEADER)
 
-                offset = 0
-                limit = 5000
+                limit = self.SYNOLOGY_LIST_PAGE_SIZE
                 album_size = 0
-                album_items = []
 
-                while True:
+                def fetch_page(offset):
                     params = {
                         "api": "SYNO.Foto.Browse.Item",
                         "method": "list",
@@ -1269,19 +1401,17 @@ class ClassSynologyPhotos(BaseMediaClient):
                     resp = self._session_get(url, params=params, headers=headers, verify=False)
                     resp.raise_for_status()
                     data = resp.json()
-
                     if not data["success"]:
-                        LOGGER.warning(f"Cannot list files for album: '{album_name}' due to API call error. Skipped!")
-                        return -1
-
-                    album_items.append(data["data"]["list"])
-                    if len(data["data"]["list"]) < limit:
-                        break
-                    offset += limit
+                        raise RuntimeError(f"response={data}")
+                    return data["data"]
 
-                for sets in album_items:
-                    for item in sets:
-                        album_size += item.get("filesize", 0)
+                try:
+                    for page in self._iter_list_pages(fetch_page, limit=limit):
+                        for item in page:
+                            album_size += item.get("filesize", 0)
+                except RuntimeError:
+                    LOGGER.warning(f"Cannot list files for album: '{album_name}' due to API call error. Skipped!")
+                    return -1
 
                 return album_size
             except Exception as e:
@@ -1563,6 +1693,121 @@ class ClassSynologyPhotos(BaseMediaClient):
     ###########################################################################
     #                        ASSETS (PHOTOS/VIDEOS)                           #
     ###########################################################################
+    def _build_global_item_base_params(self, log_level=None):
+        """
+        Build the 'SYNO.Foto.Browse.Item' list parameters for the configured filters.
+
+        Returns None when a place or person filter cannot match any asset.
+        """
+        # Convert the values from iso to epoch
+        self.from_date = parse_text_datetime_to_epoch(self.from_date)
+        self.to_date = parse_text_datetime_to_epoch(self.to_date)
+
+        # Obtain the place_ids for country and city
+        self.geocoding_country_ids_list = []
+        self.geocoding_city_ids_list = []
+        if self.country: self.geocoding_country_ids_list = self.get_geocoding_ids(place=self.country, log_level=log_level)
+        if self.city: self.geocoding_city_ids_list = self.get_geocoding_ids(place=self.city, log_level=log_level)
+        self.geocoding_ids_list = self.geocoding_country_ids_list + self.geocoding_city_ids_list
+
+        # If city or country filter was provided but geocoding_ids_list is empty means that the place does not exists, so return None
+        if (self.city or self.country) and not self.geocoding_ids_list:
+            return None
+
+        # Obtain the person_ids_list for person
+        self.person_ids_list = []
+        if self.person:
+            self.person_ids_list = self.get_person_ids(self.person, log_level=log_level)
+            # If person was provided but person_ids_list is empty means that the person does not exists, so return None
+            if not self.person_ids_list:
+                return None
+
+        base_params = {
+            'api': 'SYNO.Foto.Browse.Item',
+            # 'version': '4',
+            # 'method': 'list',
+            'version': '2',
+            'method': 'list_with_filter',
+            'additional': '["thumbnail","resolution","orientation","video_convert","video_meta","address"]',
+        }
+
+        # Add time to params only if from_date or to_date have some values
+        time_dic = {}
+        if self.from_date:  time_dic["start_time"] = self.from_date
+        if self.to_date: time_dic["end_time"] = self.to_date
+        if time_dic: base_params["time"] = json.dumps([time_dic])
+
+        # Add geocoding key if geocoding_ids_list has some value
+        if self.geocoding_ids_list: base_params["geocoding"] = json.dumps(self.geocoding_ids_list)
+
+        # Add person key if person_ids_list has some value
+        if self.person_ids_list:
+            base_params["person"] = json.dumps(self.person_ids_list)
+            base_params["person_policy"] = '"or"'
+
+        # Add types to params if have been providen
+        types = []
+        if self.type:
+            if self.type.lower() in ['photo', 'photos', 'image', 'images']:
+                types.append(0)
+            if self.type.lower() in ['video', 'videos']:
+                types.append(1)
+        if types: base_params["item_type"] = json.dumps(types)
+        LOGGER.debug(f"base_params: {json.dumps(base_params, indent=4)}")
+        return base_params
+
+    def _iter_global_item_pages(self, variant, headers, limit=None):
+        """
+        Yield the pages of one global item list variant, in listing order.
+
+        Raises:
+            RuntimeError: When Synology rejects the request, so the caller can try the next variant.
+        """
+        url = f"{self.SYNOLOGY_URL}/webapi/entry.cgi"
+        endpoint_api = variant.get("endpoint_api")
+        request_url = f"{url}/{endpoint_api}" if endpoint_api else url
+        limit = limit or self.SYNOLOGY_LIST_PAGE_SIZE
+
+        def fetch_page(offset):
+            params = dict(variant["params"])
+            params['offset'] = offset
+            params['limit'] = limit
+            resp = self._request_entry_api(
+                request_url,
+                params,
+                headers=headers,
+                prefer_post=variant.get("prefer_post", False),
+            )
+            data = resp.json()
+            if not data.get("success"):
+                raise RuntimeError(f"response={data}")
+            return data.get("data") or {}
+
+        yield from self._iter_list_pages(fetch_page, limit=limit)
+
+    def _prepare_global_item_page(self, variant, page, log_level=None):
+        # Synology's list variants do not interpret every filter
+        # parameter consistently. In particular, the v7 personal
+        # fallback can ignore the legacy `time` shape and return
+        # out-of-range personal assets. Reapply the configured
+        # criteria to every variant before they are merged.
+        has_local_filters = bool(
+            self.from_date
+            or self.to_date
+            or (self.type and str(self.type).lower() != "all")
+            or self.country
+            or self.city
+            or self.person
+        )
+        if has_local_filters:
+            page = self.filter_assets_old(page, log_level=log_level)
+
+        if variant.get("endpoint_api") == "SYNO.FotoTeam.Browse.Item":
+            for asset in page:
+                if isinstance(asset, dict):
+                    asset["_synology_download_api"] = "SYNO.FotoTeam.Download"
+        return page
+
     def get_assets_by_filters(self, type='all', is_not_in_album=None, is_archived=None, with_deleted=None, log_level=logging.WARNING):
         """
         Lists all assets in Synology Photos.
@@ -1579,127 +1824,31 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if self.all_assets_filtered is not None:
                     return self.all_assets_filtered
 
-                # Convert the values from iso to epoch
-                self.from_date = parse_text_datetime_to_epoch(self.from_date)
-                self.to_date = parse_text_datetime_to_epoch(self.to_date)
-
-                # Obtain the place_ids for country and city
-                self.geocoding_country_ids_list = []
-                self.geocoding_city_ids_list = []
-                if self.country: self.geocoding_country_ids_list = self.get_geocoding_ids(place=self.country, log_level=log_level)
-                if self.city: self.geocoding_city_ids_list = self.get_geocoding_ids(place=self.city, log_level=log_level)
-                self.geocoding_ids_list = self.geocoding_country_ids_list + self.geocoding_city_ids_list
-
-                # If city or country filter was provided but geocoding_ids_list is empty means that the place does not exists, so return []
-                if (self.city or self.country) and not self.geocoding_ids_list:
+                base_params = self._build_global_item_base_params(log_level=log_level)
+                if base_params is None:
                     self.all_assets_filtered = []
                     return []
 
-                # Obtain the person_ids_list for person
-                self.person_ids_list = []
-                if self.person:
-                    self.person_ids_list = self.get_person_ids(self.person, log_level=log_level)
-                    # If person was provided but person_ids_list is empty means that the person does not exists, so return []
-                    if not self.person_ids_list:
-                        self.all_assets_filtered = []
-                        return []
-
                 self.login(log_level=log_level)
-                url = f"{self.SYNOLOGY_URL}/webapi/entry.cgi"
                 headers = {}
                 if self.SYNO_TOKEN_HEADER:
                     headers.update(self.SYNO_TOKEN_HEADER)
 
-                base_params = {
-                    'api': 'SYNO.Foto.Browse.Item',
-                    # 'version': '4',
-                    # 'method': 'list',
-                    'version': '2',
-                    'method': 'list_with_filter',
-                    'additional': '["thumbnail","resolution","orientation","video_convert","video_meta","address"]',
-                }
-
-                # Add time to params only if from_date or to_date have some values
-                time_dic = {}
-                if self.from_date:  time_dic["start_time"] = self.from_date
-                if self.to_date: time_dic["end_time"] = self.to_date
-                if time_dic: base_params["time"] = json.dumps([time_dic])
-
-                # Add geocoding key if geocoding_ids_list has some value
-                if self.geocoding_ids_list: base_params["geocoding"] = json.dumps(self.geocoding_ids_list)
-
-                # Add person key if person_ids_list has some value
-                if self.person_ids_list:
-                    base_params["person"] = json.dumps(self.person_ids_list)
-                    base_params["person_policy"] = '"or"'
-
-                # Add types to params if have been providen
-                types = []
-                if self.type:
-                    if self.type.lower() in ['photo', 'photos', 'image', 'images']:
-                        types.append(0)
-                    if self.type.lower() in ['video', 'videos']:
-                        types.append(1)
-                if types: base_params["item_type"] = json.dumps(types)
-                LOGGER.debug(f"base_params: {json.dumps(base_params, indent=4)}")
-
                 variant_results = []
                 variant_failures = []
                 for variant in self._iter_global_item_request_variants(base_params):
-                    offset = 0
-                    limit = 5000
                     variant_assets = []
-                    while True:
-                        params = dict(variant["params"])
-                        params['offset'] = offset
-                        params['limit'] = limit
-                        endpoint_api = variant.get("endpoint_api")
-                        request_url = f"{url}/{endpoint_api}" if endpoint_api else url
-                        try:
-                            resp = self._request_entry_api(
-                                request_url,
-                                params,
-                                headers=headers,
-                                prefer_post=variant.get("prefer_post", False),
-                            )
-                            data = resp.json()
-                            if not data.get("success"):
-                                variant_failures.append(f"{variant['label']} response={data}")
-                                variant_assets = None
-                                break
-                            page = list((data.get("data") or {}).get("list") or [])
+                    try:
+                        for page in self._iter_global_item_pages(variant, headers):
                             variant_assets.extend(page)
-                            if len(page) < limit:
-                                break
-                            offset += limit
-                        except Exception as e:
-                            variant_failures.append(f"{variant['label']} error={e}")
-                            variant_assets = None
-                            break
-
-                    if variant_assets is None:
+                    except RuntimeError as e:
+                        variant_failures.append(f"{variant['label']} {e}")
+                        continue
+                    except Exception as e:
+                        variant_failures.append(f"{variant['label']} error={e}")
                         continue
 
-                    # Synology's list variants do not interpret every filter
-                    # parameter consistently. In particular, the v7 personal
-                    # fallback can ignore the legacy `time` shape and return
-                    # out-of-range personal assets. Reapply the configured
-                    # criteria to every variant before they are merged.
-                    has_local_filters = bool(
-                        self.from_date
-                        or self.to_date
-                        or (self.type and str(self.type).lower() != "all")
-                        or self.country
-                        or self.city
-                        or self.person
-                    )
-                    if has_local_filters:
-                        variant_assets = self.filter_assets_old(variant_assets, log_level=log_level)
-
-                    if variant.get("endpoint_api") == "SYNO.FotoTeam.Browse.Item":
-                        for asset in variant_assets:
-                            if isinstance(asset, dict):
-                                asset["_synology_download_api"] = "SYNO.FotoTeam.Download"
+                    variant_assets = self._prepare_global_item_page(variant, variant_assets, log_level=log_level)
 
                     summary = self._summarize_assets_debug(variant_assets)
                     LOGGER.debug(
@@ -1864,39 +2013,43 @@ class ClassSynologyPhotos(BaseMediaClient):
             failure_messages = []
             saw_successful_empty_response = False
             expected_count = self._parse_album_expected_count(album_expected_count)
+            cache_key = (str(album_id), str(album_scope or ""), str(album_passphrase or ""))
+            cached_assets = self._get_cached_album_items(cache_key)
+            if cached_assets is not None:
+                return self.filter_assets(assets=cached_assets, log_level=log_level)
+
+            limit = self.SYNOLOGY_LIST_PAGE_SIZE
             variants = list(self._iter_album_item_request_variants(album_id=album_id, album_scope=album_scope, album_passphrase=album_passphrase))
             for index, base_params in enumerate(variants):
-                offset = 0
-                limit = 5000
-                album_assets = []
-                while True:
+                base_params = dict(base_params)
+                prefer_post = bool(base_params.pop("prefer_post", False)) or album_scope in {"owned_shared_space", "shared_with_me"}
+                endpoint_api = base_params.pop("endpoint_api", None)
+                request_url = f"{url}/{endpoint_api}" if endpoint_api else url
+                variant_label = f"{base_params.get('version')}/{base_params.get('method')}"
+
+                def fetch_page(offset):
                     params = dict(base_params)
                     params["offset"] = offset
                     params["limit"] = limit
-                    try:
-                        prefer_post = bool(params.pop("prefer_post", False)) or album_scope in {"owned_shared_space", "shared_with_me"}
-                        endpoint_api = params.pop("endpoint_api", None)
-                        request_url = f"{url}/{endpoint_api}" if endpoint_api else url
-                        resp = self._request_entry_api(request_url, params, headers=headers, prefer_post=prefer_post)
-                        data = resp.json()
-                        if not data.get("success"):
-                            failure_messages.append(f"variant={params.get('version')}/{params.get('method')} response={data}")
-                            album_assets = None
-                            break
-                        page = list((data.get("data") or {}).get("list") or [])
-                        if page:
-                            album_assets.extend(page)
-                        if len(page) < limit:
-                            break
-                        offset += limit
-                    except Exception as e:
-                        failure_messages.append(f"variant={params.get('version')}/{params.get('method')} error={e}")
-                        album_assets = None
-                        break
+                    resp = self._request_entry_api(request_url, params, headers=headers, prefer_post=prefer_post)
+                    data = resp.json()
+                    if not data.get("success"):
+                        raise RuntimeError(f"response={data}")
+                    return data.get("data") or {}
 
-                if album_assets is None:
+                album_assets = []
+                try:
+                    for page in self._iter_list_pages(fetch_page, limit=limit, total=expected_count or None):
+                        album_assets.extend(page)
+                except RuntimeError as e:
+                    failure_messages.append(f"variant={variant_label} {e}")
+                    continue
+                except Exception as e:
+                    failure_messages.append(f"variant={variant_label} error={e}")
                     continue
+
                 if album_assets:
+                    self._cache_album_items(cache_key, album_assets)
                     return self.filter_assets(assets=album_assets, log_level=log_level)
 
                 saw_successful_empty_response = True
@@ -2017,6 +2170,72 @@ class ClassSynologyPhotos(BaseMediaClient):
                 LOGGER.error(f"Exception while getting No-Albums Assets from Synology Photos. {e}")
 
 
+    def iter_all_assets_without_albums_pages(self, type="all", log_level=logging.WARNING):
+        """
+        Yield the assets not associated to any album, one Synology list page at a time.
+
+        Unlike get_all_assets_without_albums, each page is yielded as soon as it is listed,
+        so a caller can start pulling before the whole library has been enumerated. The
+        album members are still listed first because they must be excluded from every page.
+
+        Args:
+            log_level (logging.LEVEL): log_level for logs and console
+
+        Yields:
+            list: Assets without album of one page (pages without such assets are skipped).
+        """
+        with set_log_level(LOGGER, log_level):
+            # If assets_without_albums is already cached, there is nothing left to page through.
+            if self.assets_without_albums_filtered is not None:
+                if self.assets_without_albums_filtered:
+                    yield self.assets_without_albums_filtered
+                return
+            base_params = self._build_global_item_base_params(log_level=log_level)
+            if base_params is None:
+                self.assets_without_albums_filtered = []
+                return
+            self.login(log_level=log_level)
+            headers = {}
+            if self.SYNO_TOKEN_HEADER:
+                headers.update(self.SYNO_TOKEN_HEADER)
+            album_asset_ids = {
+                str(asset.get("id"))
+                for asset in (self.get_all_assets_from_all_albums(log_level=logging.INFO) or [])
+                if isinstance(asset, dict) and asset.get("id")
+            }
+            if getattr(self, "_synology_download_api_by_asset_id", None) is None:
+                self._synology_download_api_by_asset_id = {}
+            seen_asset_ids = set()
+            assets_without_albums = []
+            listed_variants = 0
+            for variant in self._iter_global_item_request_variants(base_params):
+                try:
+                    for page in self._iter_global_item_pages(variant, headers):
+                        page_assets = []
+                        for asset in self._prepare_global_item_page(variant, page, log_level=log_level) or []:
+                            if not isinstance(asset, dict):
+                                continue
+                            asset_id = str(asset.get("id") or "").strip()
+                            if asset_id and (asset_id in album_asset_ids or asset_id in seen_asset_ids):
+                                continue
+                            if asset_id:
+                                seen_asset_ids.add(asset_id)
+                                if asset.get("_synology_download_api"):
+                                    self._synology_download_api_by_asset_id[asset_id] = str(asset["_synology_download_api"])
+                            page_assets.append(asset)
+                        if page_assets:
+                            assets_without_albums.extend(page_assets)
+                            yield page_assets
+                    listed_variants += 1
+                except Exception as e:
+                    LOGGER.debug(f"Synology global assets variant '{variant['label']}' failed while paging: {e}")
+            if not listed_variants:
+                LOGGER.error("Failed to list assets")
+                return
+            LOGGER.info(f"Number of all_assets without Albums associated: {len(assets_without_albums)}")
+            self.assets_without_albums_filtered = assets_without_albums # Cache assets_without_albums for future use
+
+
     def get_all_assets_from_all_albums(self, log_level=logging.WARNING):
         """
         Gathers assets from all known albums, merges them into a single list.
@@ -2107,6 +2326,7 @@ class ClassSynologyPhotos(BaseMediaClient):
                     else:
                         LOGGER.warning(f"No assets found to add to Album ID: '{album_id}'. Skipped!")
                     return -1
+                self._forget_album_items(album_id)
                 confirmed_total = 0
                 chunk_size = 500
                 for start in range(0, len(asset_ids), chunk_size):
@@ -2163,6 +2383,7 @@ class ClassSynologyPhotos(BaseMediaClient):
                 self.login(log_level=log_level)
                 url = f"{self.SYNOLOGY_URL}/webapi/entry.cgi"
                 headers = dict(self.SYNO_TOKEN_HEADER or {})
+                self._forget_album_items(album_id)
                 for start in range(0, len(asset_ids), 500):
                     chunk = [int(asset_id) if asset_id.isdigit() else asset_id for asset_id in asset_ids[start:start + 500]]
                     response = self._session_get(
@@ -2460,6 +2681,8 @@ class ClassSynologyPhotos(BaseMediaClient):
                 if not isinstance(asset_ids, list):
                     asset_ids = [asset_ids]
 
+                # Removed assets may belong to any album.
+                self._forget_album_items()
                 params = {
                     'api': 'SYNO.Foto.BackgroundTask.File',
                     'version': '1',
@@ -2549,10 +2772,28 @@ class ClassSynologyPhotos(BaseMediaClient):
                 'method': 'list_with_filter',
                 'additional': '["thumbnail","resolution","orientation","video_convert","video_meta","address"]',
             }
-            offset = 0
-            limit = 5000
+            limit = self.SYNOLOGY_LIST_PAGE_SIZE
             all_assets = []
             progress_bar = None
+
+            def fetch_page(offset):
+                params = base_params.copy()
+                params["offset"] = offset
+                params["limit"] = limit
+                resp = self._session_get(url, headers=headers, params=params, verify=False)
+                resp.raise_for_status()
+                data = resp.json()
+                if not data.get("success"):
+                    raise RuntimeError("Failed to list assets while resolving Synology duplicate IDs")
+                response_data = data.get("data", {})
+                if offset == 0 and progress_bar is not None and progress_bar.total is None:
+                    total_assets = self._parse_album_expected_count(response_data.get("total"))
+                    if total_assets is not None and total_assets >= len(response_data.get("list", [])):
+                        progress_bar.total = total_assets
+                        progress_bar.refresh()
+                        LOGGER.info(f"Found {total_assets} Synology asset(s) to analyze.")
+                return response_data
+
             with ExitStack() as stack:
                 if show_progress:
                     LOGGER.info(f"Downloading the Synology asset inventory in pages of up to {limit} assets...")
@@ -2561,36 +2802,42 @@ class ClassSynologyPhotos(BaseMediaClient):
                         desc=f"{MSG_TAGS['INFO']}Retrieving Synology asset inventory",
                         unit=" assets",
                     ))
-                while True:
-                    params = base_params.copy()
-                    params["offset"] = offset
-                    params["limit"] = limit
-                    resp = self._session_get(url, headers=headers, params=params, verify=False)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    if not data.get("success"):
-                        LOGGER.error("Failed to list assets while resolving Synology duplicate IDs")
-                        return []
-                    response_data = data.get("data", {})
-                    batch = response_data.get("list", [])
-                    if progress_bar is not None and progress_bar.total is None:
-                        try:
-                            total_assets = int(response_data.get("total"))
-                        except (TypeError, ValueError):
-                            total_assets = None
-                        if total_assets is not None and total_assets >= len(batch):
-                            progress_bar.total = total_assets
-                            progress_bar.refresh()
-                            LOGGER.info(f"Found {total_assets} Synology asset(s) to analyze.")
-                    all_assets.extend(batch)
-                    if progress_bar is not None:
-                        progress_bar.update(len(batch))
-                    if len(batch) < limit:
-                        break
-                    offset += limit
+                try:
+                    for batch in self._iter_list_pages(fetch_page, limit=limit):
+                        all_assets.extend(batch)
+                        if progress_bar is not None:
+                            progress_bar.update(len(batch))
+                except RuntimeError as e:
+                    LOGGER.error(str(e))
+                    return []
             self._all_assets_unfiltered_cache = all_assets
             return all_assets
 
+    def get_asset_inventory_identities(self, log_level=None):
+        """
+        Return the identity of every asset in the Synology library for pre-flight duplicate checks.
+
+        Each entry contains 'id', 'filename', 'size' and 'time' (capture epoch). Synology does not list checksums.
+        """
+        identities = []
+        for item in self._get_all_assets_unfiltered(log_level=log_level, show_progress=True) or []:
+            try:
+                file_size = int(item.get("filesize")) if item.get("filesize") is not None else None
+            except (TypeError, ValueError):
+                file_size = None
+            try:
+                capture_epoch = int(item.get("time")) if item.get("time") is not None else None
+            except (TypeError, ValueError):
+                capture_epoch = None
+            identities.append({
+                "id": item.get("id"),
+                "filename": item.get("filename") or item.get("name"),
+                "size": file_size,
+                "time": capture_epoch,
+                "checksum": None,
+            })
+        return identities
+
     def _resolve_existing_asset_id(self, file_path, log_level=None):
         with set_log_level(LOGGER, log_level):
             cached_asset_id = self._lookup_uploaded_asset_id(file_path)
@@ -2753,6 +3000,100 @@ class ClassSynologyPhotos(BaseMediaClient):
                 return None, None
             
 
+    def _open_asset_download_response(self, asset_id, album_passphrase=None, album_id=None, album_scope=None, extra_headers=None):
+        """
+        Opens the streamed download response of an asset, trying the request variants
+        DSM accepts for personal, Shared Space and shared-with-me albums.
+
+        extra_headers (e.g. a Range header to resume a download) are added to each request.
+
+        Returns:
+            tuple: (response or None, download API that produced it).
+        """
+        url = f"{self.SYNOLOGY_URL}/webapi/entry.cgi"
+        headers = {}
+        if self.SYNO_TOKEN_HEADER:
+            headers.update(self.SYNO_TOKEN_HEADER)
+        headers.update(extra_headers or {})
+
+        download_api = getattr(self, "_synology_download_api_by_asset_id", {}).get(str(asset_id))
+        download_api = str(download_api or "SYNO.Foto.Download")
+
+        params = {
+            'api': download_api,
+            'version': '2',
+            'method': 'download',
+            'force_download': 'true',
+            'download_type': 'source',
+            "item_id": f"[{asset_id}]",
+        }
+        if album_id is not None:
+            params["album_id"] = str(album_id)
+
+        request_variants = [dict(params)]
+        if download_api == "SYNO.FotoTeam.Download":
+            personal_fallback = dict(params)
+            personal_fallback["api"] = "SYNO.Foto.Download"
+            request_variants.append(personal_fallback)
+        if album_passphrase:
+            request_with_passphrase = dict(params)
+            # Shared-album downloads accept either the album context
+            # or the passphrase. DSM rejects the combination with
+            # error 120, so the passphrase fallback must be contextless.
+            request_with_passphrase.pop("album_id", None)
+            request_with_passphrase['passphrase'] = f'"{album_passphrase}"'
+            request_variants.append(request_with_passphrase)
+
+        # Synology's browser download flow for Shared Space albums uses
+        # `album_id` without passphrase. True shared-with-me albums may
+        # still require passphrase, so we try the browser-like context
+        # first and only then fall back to the passphrase variant.
+        for request_params in request_variants:
+            request_download_api = str(request_params.get("api") or download_api)
+            prefer_post = request_download_api == "SYNO.FotoTeam.Download" or album_scope in {"owned_shared_space", "shared_with_me"}
+            candidate_resp = self._request_entry_api(
+                url,
+                request_params,
+                headers=headers,
+                prefer_post=prefer_post,
+                stream=True,
+            )
+            response_content_type = str(candidate_resp.headers.get("Content-Type", "")).lower()
+            if candidate_resp.status_code in (200, 206) and "json" not in response_content_type and "text/html" not in response_content_type:
+                return candidate_resp, request_download_api
+            candidate_resp.close()
+        return None, download_api
+
+    def open_asset_stream(self, asset_id, asset_filename, album_passphrase=None, album_id=None, album_scope=None, log_level=None):
+        """
+        Opens an asset download as a ResponseBodyStream for disk-less transfers.
+
+        Returns None when the payload cannot be streamed as-is: unknown length, or a
+        ZIP bundle (Live Photos) or error document that pull_asset must handle on disk.
+        """
+        with set_log_level(LOGGER, log_level):
+            self.login(log_level=log_level)
+            resp, _ = self._open_asset_download_response(
+                asset_id,
+                album_passphrase=album_passphrase,
+                album_id=album_id,
+                album_scope=album_scope,
+            )
+            if resp is None:
+                return None
+            content_type = str(resp.headers.get("Content-Type", "")).lower()
+            content_disp = str(resp.headers.get("Content-Disposition", "")).lower()
+            content_length = get_response_content_length(resp)
+            if content_length is None or "zip" in content_type or ".zip" in content_disp:
+                resp.close()
+                return None
+            chunks = resp.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            first_chunk = next((chunk for chunk in chunks if chunk), b"")
+            if not first_chunk or first_chunk.startswith(b"PK\x03\x04") or first_chunk.lstrip().startswith((b"{", b"[", b"<")):
+                resp.close()
+                return None
+            return ResponseBodyStream(resp, content_length, chunk_iterator=chunks, prefix=first_chunk)
+
     def pull_asset(self, asset_id, asset_filename, asset_time, download_folder="Downloaded_Synology", album_passphrase=None, album_id=None, album_scope=None, log_level=None):
         """
         Downloads an asset (photo/video) from Synology Photos to a local folder,
@@ -2797,60 +3138,12 @@ class ClassSynologyPhotos(BaseMediaClient):
                 file_ext = os.path.splitext(asset_filename)[1].lower()
                 file_path = os.path.join(download_folder, asset_filename)
 
-                url = f"{self.SYNOLOGY_URL}/webapi/entry.cgi"
-                headers = {}
-                if self.SYNO_TOKEN_HEADER:
-                    headers.update(self.SYNO_TOKEN_HEADER)
-
-                download_api = getattr(self, "_synology_download_api_by_asset_id", {}).get(str(asset_id))
-                download_api = str(download_api or "SYNO.Foto.Download")
-
-                params = {
-                    'api': download_api,
-                    'version': '2',
-                    'method': 'download',
-                    'force_download': 'true',
-                    'download_type': 'source',
-                    "item_id": f"[{asset_id}]",
-                }
-                if album_id is not None:
-                    params["album_id"] = str(album_id)
-
-                request_variants = [dict(params)]
-                if download_api == "SYNO.FotoTeam.Download":
-                    personal_fallback = dict(params)
-                    personal_fallback["api"] = "SYNO.Foto.Download"
-                    request_variants.append(personal_fallback)
-                if album_passphrase:
-                    request_with_passphrase = dict(params)
-                    # Shared-album downloads accept either the album context
-                    # or the passphrase. DSM rejects the combination with
-                    # error 120, so the passphrase fallback must be contextless.
-                    request_with_passphrase.pop("album_id", None)
-                    request_with_passphrase['passphrase'] = f'"{album_passphrase}"'
-                    request_variants.append(request_with_passphrase)
-
-                # Synology's browser download flow for Shared Space albums uses
-                # `album_id` without passphrase. True shared-with-me albums may
-                # still require passphrase, so we try the browser-like context
-                # first and only then fall back to the passphrase variant.
-                selected_download_api = download_api
-                for request_params in request_variants:
-                    request_download_api = str(request_params.get("api") or download_api)
-                    prefer_post = request_download_api == "SYNO.FotoTeam.Download" or album_scope in {"owned_shared_space", "shared_with_me"}
-                    candidate_resp = self._request_entry_api(
-                        url,
-                        request_params,
-                        headers=headers,
-                        prefer_post=prefer_post,
-                        stream=True,
-                    )
-                    response_content_type = str(candidate_resp.headers.get("Content-Type", "")).lower()
-                    if candidate_resp.status_code == 200 and "json" not in response_content_type and "text/html" not in response_content_type:
-                        resp = candidate_resp
-                        selected_download_api = request_download_api
-                        break
-                    candidate_resp.close()
+                resp, download_api = self._open_asset_download_response(
+                    asset_id,
+                    album_passphrase=album_passphrase,
+                    album_id=album_id,
+                    album_scope=album_scope,
+                )
                 if resp is None:
                     LOGGER.error(f"Failed to download asset '{asset_filename}' with ID [{asset_id}]. No media response received.")
                     return 0
@@ -2859,27 +3152,32 @@ class ClassSynologyPhotos(BaseMediaClient):
                     LOGGER.error(f"Failed to download asset '{asset_filename}' with ID [{asset_id}]. Status code: {resp.status_code}")
                     return 0
 
-                download_api = selected_download_api
-
                 content_type = str(resp.headers.get("Content-Type", "")).lower()
                 content_disp = str(resp.headers.get("Content-Disposition", "")).lower()
                 zip_by_headers = ("zip" in content_type) or (".zip" in content_disp)
 
                 tmp_dir = os.path.join(download_folder, ".photomigrator_tmp")
                 os.makedirs(tmp_dir, exist_ok=True)
-                tmp_name = f"{asset_id}_{uuid.uuid4().hex}.part"
+                # download_to_file writes to its own '.part' file and renames it to this path once complete.
+                tmp_name = f"{asset_id}_{uuid.uuid4().hex}"
                 download_tmp_path = os.path.join(tmp_dir, tmp_name)
 
-                first_bytes = b""
-                bytes_written = 0
-                with open(download_tmp_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        if not chunk:
-                            continue
-                        if not first_bytes:
-                            first_bytes = chunk[:4]
-                        f.write(chunk)
-                        bytes_written += len(chunk)
+                def open_response(extra_headers):
+                    resumed_resp, _ = self._open_asset_download_response(
+                        asset_id,
+                        album_passphrase=album_passphrase,
+                        album_id=album_id,
+                        album_scope=album_scope,
+                        extra_headers=extra_headers,
+                    )
+                    if resumed_resp is None:
+                        raise requests.ConnectionError(f"No media response received for asset ID [{asset_id}]")
+                    return resumed_resp
+
+                bytes_written = download_to_file(download_tmp_path, open_response, response=resp)
+                resp = None
+                with open(download_tmp_path, "rb") as f:
+                    first_bytes = f.read(4)
 
                 if bytes_written <= 0:
                     LOGGER.error(f"Downloaded empty payload for asset '{asset_filename}' (ID [{asset_id}]).")
@@ -3416,21 +3714,21 @@ class ClassSynologyPhotos(BaseMediaClient):
                             total_albums_skipped += 1
                             continue
 
-                        album_file_paths = [os.path.join(subpath, file) for file in os.listdir(subpath)]
-                        for file_path in tqdm(
+                        album_file_paths = [
+                            file_path
+                            for file_path in (os.path.join(subpath, file) for file in os.listdir(subpath))
+                            if os.path.isfile(file_path)
+                            and not matches_any_pattern(os.path.basename(file_path), effective_file_exclusions)
+                            and os.path.splitext(file_path)[-1].lower() in self.ALLOWED_EXTENSIONS
+                        ]
+                        upload_results = run_transfers_in_pool(
                             album_file_paths,
+                            lambda file_path: self.push_asset(file_path, log_level=logging.WARNING),
+                            self.SYNOLOGY_MAX_PARALLEL_UPLOADS,
                             desc=f"{MSG_TAGS['INFO']}   Uploading '{album_name}' Assets",
-                            unit=" assets",
-                        ):
-                            if not os.path.isfile(file_path):
-                                continue
-                            if matches_any_pattern(os.path.basename(file_path), effective_file_exclusions):
-                                continue
+                        )
+                        for file_path, (asset_id, is_dup) in zip(album_file_paths, upload_results):
                             ext = os.path.splitext(file_path)[-1].lower()
-                            if ext not in self.ALLOWED_EXTENSIONS:
-                                continue
-
-                            asset_id, is_dup = self.push_asset(file_path, log_level=logging.WARNING)
                             if is_dup:
                                 total_duplicates_assets_skipped += 1
                                 LOGGER.debug(f"Dupplicated Asset: {file_path}. Asset ID: {asset_id} upload skipped")
@@ -3573,21 +3871,24 @@ class ClassSynologyPhotos(BaseMediaClient):
 
             try:
                 file_paths = collect_files(input_folder, subfolders_inclusion)
-                total_files = len(file_paths)
                 total_assets_uploaded = 0
                 total_duplicated_assets_skipped = 0
                 duplicates_assets_removed = 0
 
-                with tqdm(total=total_files, smoothing=0.1, desc=f"{MSG_TAGS['INFO']}Uploading Assets", unit=" asset") as pbar:
-                    for file_ in file_paths:
-                        asset_id, is_dup = self.push_asset(file_, log_level=logging.WARNING)
-                        if is_dup:
-                            total_duplicated_assets_skipped += 1
-                            LOGGER.debug(f"Duplicated Asset: {file_}. Asset ID: {asset_id} skipped")
-                        elif asset_id:
-                            LOGGER.debug(f"Asset ID: {asset_id} uploaded to Immich Photos")
-                            total_assets_uploaded += 1
-                        pbar.update(1)
+                upload_results = run_transfers_in_pool(
+                    file_paths,
+                    lambda file_: self.push_asset(file_, log_level=logging.WARNING),
+                    self.SYNOLOGY_MAX_PARALLEL_UPLOADS,
+                    desc=f"{MSG_TAGS['INFO']}Uploading Assets",
+                    unit=" asset",
+                )
+                for file_, (asset_id, is_dup) in zip(file_paths, upload_results):
+                    if is_dup:
+                        total_duplicated_assets_skipped += 1
+                        LOGGER.debug(f"Duplicated Asset: {file_}. Asset ID: {asset_id} skipped")
+                    elif asset_id:
+                        LOGGER.debug(f"Asset ID: {asset_id} uploaded to Immich Photos")
+                        total_assets_uploaded += 1
 
                 LOGGER.info(f"Uploaded {total_assets_uploaded} files (without album) from '{input_folder}'.")
                 LOGGER.info(f"Skipped {total_duplicated_assets_skipped} duplicated asset(s) from '{input_folder}'.")
@@ -3742,25 +4043,25 @@ class ClassSynologyPhotos(BaseMediaClient):
                     album_folder_name = f'{album_name}'
                     album_folder_path = os.path.join(output_folder, album_folder_name)
 
-                    for asset in tqdm(
-                        album_assets,
+                    album_downloads = [
+                        {
+                            "asset_id": asset.get('id'),
+                            "asset_filename": asset.get('filename'),
+                            "asset_time": asset.get('time'),
+                            "download_folder": album_folder_path,
+                            "album_passphrase": album_passphrase if is_shared else None,
+                            "album_id": album_id,
+                            "album_scope": album_scope,
+                            "log_level": logging.INFO,
+                        }
+                        for asset in album_assets
+                    ]
+                    assets_downloaded += run_downloads_in_pool(
+                        album_downloads,
+                        self.pull_asset,
+                        self.SYNOLOGY_MAX_PARALLEL_DOWNLOADS,
                         desc=f"{MSG_TAGS['INFO']}   Downloading '{album_name}' Assets",
-                        unit=" assets",
-                    ):
-                        asset_id = asset.get('id')
-                        asset_time = asset.get('time')
-                        asset_filename = asset.get('filename')
-                        # Download
-                        assets_downloaded += self.pull_asset(
-                            asset_id=asset_id,
-                            asset_filename=asset_filename,
-                            asset_time=asset_time,
-                            download_folder=album_folder_path,
-                            album_passphrase=album_passphrase if is_shared else None,
-                            album_id=album_id,
-                            album_scope=album_scope,
-                            log_level=logging.INFO,
-                        )
+                    )
 
                 LOGGER.info(f"Album(s) downloaded successfully. You can find them in '{output_folder}'")
                 # self.logout(log_level=log_level)
@@ -3796,7 +4097,8 @@ class ClassSynologyPhotos(BaseMediaClient):
                     LOGGER.warning(f"No assets without Albums associated to download.")
                     return 0
 
-                for asset in tqdm(assets_without_albums, desc=f"{MSG_TAGS['INFO']}Downloading Assets without associated Albums", unit=" assets"):
+                downloads = []
+                for asset in assets_without_albums:
                     asset_id = asset.get('id')
                     asset_filename = asset.get('filename')
                     asset_time = asset.get('time')
@@ -3814,14 +4116,19 @@ class ClassSynologyPhotos(BaseMediaClient):
                     target_folder = os.path.join(output_folder, year_str, month_str)
                     os.makedirs(target_folder, exist_ok=True)
 
-
-                    total_assets_downloaded += self.pull_asset(
-                        asset_id=asset_id,
-                        asset_filename=asset_filename,
-                        asset_time=asset_time,
-                        download_folder=target_folder,
-                        log_level=logging.INFO,
-                    )
+                    downloads.append({
+                        "asset_id": asset_id,
+                        "asset_filename": asset_filename,
+                        "asset_time": asset_time,
+                        "download_folder": target_folder,
+                        "log_level": logging.INFO,
+                    })
+                total_assets_downloaded += run_downloads_in_pool(
+                    downloads,
+                    self.pull_asset,
+                    self.SYNOLOGY_MAX_PARALLEL_DOWNLOADS,
+                    desc=f"{MSG_TAGS['INFO']}Downloading Assets without associated Albums",
+                )
 
                 LOGGER.info(f"Album(s) downloaded successfully. You can find them in '{output_folder}'")
                 # self.logout(log_level=log_level)
@@ -155,8 +155,9 @@ def _feature_optional_dests(feature_name: str, module_name: str | None, args: di
     """Return optional flags owned by the selected feature/module."""
     if feature_name == "Automatic Migration":
         result = [
-            "move-assets", "dashboard", "parallel-migration", "prefer-canonical-album-names",
-            "consolidate-similar-albums",
+            "move-assets", "dashboard", "parallel-migration", "resume", "preflight-target-diff", "plan-only", "streaming-transfer",
+            "incremental-source-listing",
+            "prefer-canonical-album-names", "consolidate-similar-albums",
         ]
         endpoints = f"{args.get('source', '')} {args.get('target', '')}".lower()
         if "synology" in endpoints:
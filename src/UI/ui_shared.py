@@ -92,6 +92,19 @@ UI_FIELD_LABELS = {
     "create-stacks": "Create Stacks",
     "push-asset-max-size-mb": "Push Asset Max Size (MB)",
     "immich-upload-timeout-seconds": "Immich Upload Timeout (seconds)",
+    "pull-workers": "Pull Workers",
+    "adaptive-push-concurrency": "Adaptive Push Concurrency",
+    "google-unzip-workers": "Unzip Workers",
+    "google-unzip-dedup": "Deduplicate Unzipped Files",
+    "google-incremental": "Incremental Processing",
+    "staging-budget-mb": "Staging Budget (MB)",
+    "staging-budget-files": "Staging Budget (files)",
+    "metrics-file": "Metrics File",
+    "resume": "Resume Migration",
+    "preflight-target-diff": "Pre-flight Target Diff",
+    "plan-only": "Plan Only",
+    "streaming-transfer": "Streaming Transfer",
+    "incremental-source-listing": "Incremental Source Listing",
     "foldername-all-photos": "ALL_PHOTOS Folder Name",
 }
 TAKEOUT_FOLDER_STRUCTURE_DESTS = (
@@ -157,6 +170,11 @@ BOOL_VALUE_DESTS = {
     "move-assets",
     "dashboard",
     "parallel-migration",
+    "resume",
+    "preflight-target-diff",
+    "plan-only",
+    "streaming-transfer",
+    "incremental-source-listing",
     "show-gpth-info",
     "show-gpth-errors",
     "google-process-people",
@@ -179,8 +197,18 @@ AUTOMATION_DESTS = {
     "move-assets",
     "dashboard",
     "parallel-migration",
+    "resume",
+    "preflight-target-diff",
+    "plan-only",
+    "streaming-transfer",
+    "incremental-source-listing",
     "push-asset-max-size-mb",
     "immich-upload-timeout-seconds",
+    "pull-workers",
+    "adaptive-push-concurrency",
+    "staging-budget-mb",
+    "staging-budget-files",
+    "metrics-file",
     "prefer-canonical-album-names",
     "consolidate-similar-albums",
     "one-time-password",
@@ -203,6 +231,9 @@ GOOGLE_DESTS = {
     "google-skip-preprocess",
     "google-skip-postprocess",
     "google-keep-takeout-folder",
+    "google-unzip-workers",
+    "google-unzip-dedup",
+    "google-incremental",
     "google-process-people",
     "show-gpth-info",
     "show-gpth-errors",
@@ -0,0 +1,213 @@
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from urllib3.exceptions import ProtocolError
+
+import Core.GlobalVariables as GV
+from Utils.StreamUtils import get_response_content_length
+
+DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+DOWNLOAD_MAX_RESUME_ATTEMPTS = 5
+DOWNLOAD_PARALLEL_SEGMENTS = 4
+DOWNLOAD_SEGMENT_MIN_BYTES = 64 * 1024 * 1024
+DOWNLOAD_PART_SUFFIX = ".part"
+
+CONTENT_RANGE_RE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+class IncompleteDownloadError(IOError):
+    """The response body ended before the announced number of bytes."""
+
+
+class RangeNotSupportedError(IOError):
+    """The server answered a Range request with the whole body (or another range)."""
+
+
+# Errors after which the download can continue from the bytes already written.
+RESUMABLE_DOWNLOAD_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ProtocolError,
+    IncompleteDownloadError,
+)
+
+
+# ==============================================================================
+#                              DOWNLOAD FUNCTIONS
+# ==============================================================================
+def get_content_range_start(response):
+    """Return the first byte position of a 206 response's Content-Range, or None."""
+    headers = getattr(response, "headers", None) or {}
+    match = CONTENT_RANGE_RE.match(str(headers.get("Content-Range", "") or ""))
+    return int(match.group(1)) if match else None
+
+
+def response_accepts_ranges(response):
+    headers = getattr(response, "headers", None) or {}
+    return str(headers.get("Accept-Ranges", "") or "").strip().lower() == "bytes"
+
+
+def download_to_file(
+    file_path,
+    open_response,
+    response=None,
+    chunk_size=DOWNLOAD_BUFFER_SIZE,
+    max_resume_attempts=DOWNLOAD_MAX_RESUME_ATTEMPTS,
+    parallel_segments=1,
+    segment_min_bytes=DOWNLOAD_SEGMENT_MIN_BYTES,
+    part_path=None,
+):
+    """
+    Download an HTTP body to file_path through a '.part' file, resuming with Range requests.
+
+    The body is written to part_path (file_path + '.part' by default) in chunk_size blocks
+    and renamed to file_path only once it is complete, so an interrupted download never
+    leaves a truncated file under the final name. When the connection drops, the
+    download continues from the last byte written with 'Range: bytes=N-'; if the server
+    ignores the range, it starts again from zero. Large files whose server accepts
+    ranges can be fetched as `parallel_segments` byte ranges at the same time.
+
+    Args:
+        file_path (str): Final path of the downloaded file.
+        open_response (callable | None): open_response(headers) -> streamed requests.Response.
+            It is called with the extra headers (e.g. Range) of each new request. None
+            disables resume and segments.
+        response (requests.Response): Response already opened for the whole body (optional).
+        chunk_size (int): Size of the blocks read from the response and written to disk.
+        max_resume_attempts (int): How many times a dropped download is resumed.
+        parallel_segments (int): Number of byte ranges downloaded in parallel for large files.
+        segment_min_bytes (int): Files smaller than this are always downloaded in one stream.
+        part_path (str): Temporary path used while downloading (optional).
+
+    Returns:
+        int: Number of bytes written to file_path.
+    """
+    part_path = part_path or f"{file_path}{DOWNLOAD_PART_SUFFIX}"
+    os.makedirs(os.path.dirname(os.path.abspath(part_path)), exist_ok=True)
+    try:
+        if response is None:
+            response = open_response({})
+        response.raise_for_status()
+        total_size = get_response_content_length(response) if response.status_code == 200 else None
+        bytes_written = None
+        if (
+            open_response is not None
+            and parallel_segments > 1
+            and total_size is not None
+            and total_size >= max(segment_min_bytes, parallel_segments)
+            and response_accepts_ranges(response)
+        ):
+            response.close()
+            response = None
+            try:
+                bytes_written = _download_segments(
+                    open_response, part_path, total_size, parallel_segments, chunk_size, max_resume_attempts,
+                )
+            except RangeNotSupportedError as error:
+                GV.LOGGER.debug(f"Parallel segments not available for '{os.path.basename(file_path)}'; downloading it in one stream: {error}")
+        if bytes_written is None:
+            bytes_written = _download_sequential(
+                open_response, part_path, response, total_size, chunk_size, max_resume_attempts,
+            )
+            response = None
+        os.replace(part_path, file_path)
+        return bytes_written
+    except BaseException:
+        if response is not None:
+            response.close()
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+def _download_sequential(open_response, part_path, response, total_size, chunk_size, max_resume_attempts):
+    offset = 0
+    attempt = 0
+    with open(part_path, "wb") as part_file:
+        while True:
+            try:
+                if response is None:
+                    response = open_response({"Range": f"bytes={offset}-"} if offset else {})
+                    response.raise_for_status()
+                    if offset and not (response.status_code == 206 and get_content_range_start(response) == offset):
+                        # The server sent the whole body again: start over.
+                        offset = 0
+                    if total_size is None and response.status_code == 200:
+                        total_size = get_response_content_length(response)
+                part_file.seek(offset)
+                part_file.truncate()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        part_file.write(chunk)
+                        offset += len(chunk)
+                response.close()
+                response = None
+                if total_size is not None and offset < total_size:
+                    raise IncompleteDownloadError(f"Download ended after {offset} of {total_size} bytes")
+                return offset
+            except RESUMABLE_DOWNLOAD_ERRORS as error:
+                if response is not None:
+                    response.close()
+                    response = None
+                attempt += 1
+                if open_response is None or attempt > max_resume_attempts:
+                    raise
+                part_file.flush()
+                delay = min(2 ** (attempt - 1), 30)
+                GV.LOGGER.debug(
+                    f"Download of '{os.path.basename(part_path)}' interrupted at byte {offset}; "
+                    f"resuming in {delay}s (attempt {attempt}/{max_resume_attempts}): {error}"
+                )
+                time.sleep(delay)
+
+
+def _download_segments(open_response, part_path, total_size, segment_count, chunk_size, max_resume_attempts):
+    with open(part_path, "wb") as part_file:
+        part_file.truncate(total_size)
+    segment_size = -(-total_size // segment_count)
+    segments = [
+        (start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+
+    def download_segment(first_byte, last_byte):
+        offset = first_byte
+        attempt = 0
+        with open(part_path, "r+b") as part_file:
+            while offset <= last_byte:
+                response = None
+                try:
+                    response = open_response({"Range": f"bytes={offset}-{last_byte}"})
+                    response.raise_for_status()
+                    if response.status_code != 206 or get_content_range_start(response) != offset:
+                        raise RangeNotSupportedError(f"Expected bytes {offset}-{last_byte}, got HTTP {response.status_code}")
+                    part_file.seek(offset)
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+                        chunk = chunk[:last_byte - offset + 1]
+                        part_file.write(chunk)
+                        offset += len(chunk)
+                        if offset > last_byte:
+                            break
+                    if offset <= last_byte:
+                        raise IncompleteDownloadError(f"Segment ended at byte {offset} of {first_byte}-{last_byte}")
+                except RESUMABLE_DOWNLOAD_ERRORS:
+                    attempt += 1
+                    if attempt > max_resume_attempts:
+                        raise
+                    time.sleep(min(2 ** (attempt - 1), 30))
+                finally:
+                    if response is not None:
+                        response.close()
+        return last_byte - first_byte + 1
+
+    with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+        futures = [executor.submit(download_segment, first_byte, last_byte) for first_byte, last_byte in segments]
+        return sum(future.result() for future in futures)
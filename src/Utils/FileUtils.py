@@ -1,9 +1,14 @@
+import filecmp
 import fnmatch
+import hashlib
 import os
 import re
 import shutil
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 import unicodedata
 import logging
@@ -26,6 +31,9 @@ DEFAULT_FILE_EXCLUSION_PATTERNS = [
     "._*",
 ]
 
+UNZIP_MAX_WORKERS = 8
+UNZIP_BUFFER_SIZE = 4 * 1024 * 1024
+
 GENERATED_STAGE_SUFFIX_RE = re.compile(r"_(?P<stage>[A-Za-z0-9-]+)_(?P<timestamp>\d{8}-\d{6})$")
 
 
@@ -38,6 +46,144 @@ class _RuntimeLoggerProxy:
 LOGGER = _RuntimeLoggerProxy()
 
 
+class FolderTreeIndex:
+    """
+    In-memory index of a folder tree, built once with os.scandir().
+
+    It maps every directory path to the names of its subdirectories and files, so several
+    processing steps can walk the same tree without listing the disk again. Each step that
+    renames, copies or deletes entries on disk must report it through rename_file(),
+    add_file(), rename_dir() or remove_dir() to keep the index in sync.
+
+    Directory classification matches os.walk(followlinks=False): symlinks to directories are
+    listed as subdirectories but never descended into.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.normpath(str(root))
+        self._dirs = {}
+        self.has_symlinked_dirs = False
+        self._scan(self.root)
+
+    def _scan(self, top):
+        pending = [top]
+        while pending:
+            current = pending.pop()
+            subdirs, files = {}, {}
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            files[entry.name] = None
+                            continue
+                        subdirs[entry.name] = None
+                        if entry.is_symlink():
+                            self.has_symlinked_dirs = True
+                        else:
+                            pending.append(entry.path)
+            except OSError as e:
+                LOGGER.warning(f"Error scanning {current}: {e}")
+            self._dirs[current] = (subdirs, files)
+
+    def _key(self, path):
+        return os.path.normpath(str(path))
+
+    def __contains__(self, path):
+        return self._key(path) in self._dirs
+
+    def files(self, dir_path):
+        """Return the file names of a directory (empty if it is not indexed)."""
+        entry = self._dirs.get(self._key(dir_path))
+        return list(entry[1]) if entry else []
+
+    def subdirs(self, dir_path):
+        entry = self._dirs.get(self._key(dir_path))
+        return list(entry[0]) if entry else []
+
+    def walk(self, topdown=True, root=None):
+        """
+        Yield (dirpath, dirnames, filenames) like os.walk(), from the index.
+
+        The name lists are snapshots, so the caller may rename or delete entries while walking;
+        as with os.walk(), pruning dirnames in place when topdown=True skips those subtrees.
+        If root is given, yielded paths are rebased on it instead of the indexed root (useful
+        when the same folder is reached through another spelling of its path).
+        """
+        def rebase(path):
+            if root is None:
+                return path
+            relative = os.path.relpath(path, self.root)
+            return str(root) if relative == os.curdir else os.path.join(str(root), relative)
+
+        pending = [self.root]
+        bottom_up = []
+        while pending:
+            current = pending.pop()
+            entry = self._dirs.get(current)
+            if entry is None:
+                continue
+            dirnames, filenames = list(entry[0]), list(entry[1])
+            if topdown:
+                yield rebase(current), dirnames, filenames
+            else:
+                bottom_up.append((rebase(current), dirnames, filenames))
+            pending.extend(os.path.join(current, name) for name in reversed(dirnames))
+        for item in reversed(bottom_up):
+            yield item
+
+    def count_files(self, extensions=None):
+        """Count indexed files, optionally only those whose lower-cased extension is in extensions."""
+        if extensions is None:
+            return sum(len(files) for _, files in self._dirs.values())
+        return sum(
+            1
+            for _, files in self._dirs.values()
+            for name in files
+            if os.path.splitext(name)[1].lower() in extensions
+        )
+
+    def count_dirs(self):
+        return sum(len(subdirs) for subdirs, _ in self._dirs.values())
+
+    def add_file(self, dir_path, name):
+        entry = self._dirs.get(self._key(dir_path))
+        if entry is not None:
+            entry[1][name] = None
+
+    def rename_file(self, dir_path, old_name, new_name):
+        entry = self._dirs.get(self._key(dir_path))
+        if entry is not None:
+            entry[1].pop(old_name, None)
+            entry[1][new_name] = None
+
+    def rename_dir(self, old_path, new_path):
+        """Move a directory and all indexed descendants to new_path (in the same or another parent)."""
+        old_path, new_path = self._key(old_path), self._key(new_path)
+        old_parent = self._dirs.get(os.path.dirname(old_path))
+        if old_parent is not None:
+            old_parent[0].pop(os.path.basename(old_path), None)
+        new_parent = self._dirs.get(os.path.dirname(new_path))
+        if new_parent is not None:
+            new_parent[0][os.path.basename(new_path)] = None
+        prefix = old_path + os.sep
+        for path in [p for p in self._dirs if p == old_path or p.startswith(prefix)]:
+            self._dirs[new_path + path[len(old_path):]] = self._dirs.pop(path)
+
+    def remove_dir(self, dir_path):
+        """Forget a deleted directory and everything below it."""
+        dir_path = self._key(dir_path)
+        parent = self._dirs.get(os.path.dirname(dir_path))
+        if parent is not None:
+            parent[0].pop(os.path.basename(dir_path), None)
+        prefix = dir_path + os.sep
+        for path in [p for p in self._dirs if p == dir_path or p.startswith(prefix)]:
+            del self._dirs[path]
+
+
 # ---------------------------------------------------------------------------------------------------------------------------
 # FILES & FOLDERS MANAGEMENT FUNCTIONS:
 # ---------------------------------------------------------------------------------------------------------------------------
@@ -217,7 +363,7 @@ def get_all_files_paths(input_folder, exclusion_folders=None, exclusion_files=No
         return files
 
 
-def delete_subfolders(input_folder, folder_name_to_delete, step_name="", log_level=None):
+def delete_subfolders(input_folder, folder_name_to_delete, step_name="", log_level=None, tree_index=None):
     """
     Deletes all subdirectories (and their contents) inside the given base directory and all its subdirectories,
     whose names match dir_name_to_delete, including hidden directories.
@@ -227,19 +373,27 @@ def delete_subfolders(input_folder, folder_name_to_delete, step_name="", log_lev
         folder_name_to_delete (str): The name of the subdirectories to delete.
         :param step_name:
         :param log_level:
+        tree_index (FolderTreeIndex): Index of input_folder to walk instead of the disk (optional). Deleted folders are removed from it.
     """
     with set_log_level(LOGGER, log_level):  # Change Log Level to log_level for this function
         # Count total number of folders
-        total_dirs = sum([len(dirs) for _, dirs, _ in os.walk(input_folder)])
+        if tree_index is not None:
+            total_dirs = tree_index.count_dirs()
+            walker = tree_index.walk(topdown=False)
+        else:
+            total_dirs = sum([len(dirs) for _, dirs, _ in os.walk(input_folder)])
+            walker = os.walk(input_folder, topdown=False)
         # Show progress bar based on folders
         with tqdm(total=total_dirs, smoothing=0.1, desc=f"{MSG_TAGS['INFO']}{step_name}Deleting files within subfolders '{folder_name_to_delete}' in '{input_folder}'", unit=" subfolders") as pbar:
-            for path, dirs, files in os.walk(input_folder, topdown=False):
+            for path, dirs, files in walker:
                 for folder in dirs:
                     pbar.update(1)
                     if folder == folder_name_to_delete:
                         dir_path = os.path.join(path, folder)
                         try:
                             shutil.rmtree(dir_path)
+                            if tree_index is not None:
+                                tree_index.remove_dir(dir_path)
                             # LOGGER.info(f"Deleted directory: {dir_path}")
                         except Exception as e:
                             LOGGER.error(f"{step_name}Error deleting {dir_path}: {e}")
@@ -308,6 +462,81 @@ def flatten_subfolders(input_folder, exclude_subfolders=[], max_depth=0, flatten
                     os.rmdir(dir_path)
 
 
+def merge_folders(src_folder, dst_folder, step_name="", log_level=None):
+    """
+    Move the content of src_folder into dst_folder, keeping what dst_folder already has.
+
+    A file that already exists in dst_folder with identical content is dropped from src_folder;
+    a different file with the same name is moved with a ' (n)' suffix. Relative symlinks that
+    point inside src_folder are recreated in dst_folder pointing to where their target landed,
+    so album links keep working after a renamed merge. src_folder is removed once empty.
+
+    Returns a dict with the number of 'moved', 'identical', 'renamed' and 'symlinks' entries.
+    """
+    logger = GV.LOGGER or LOGGER or logging.getLogger(__name__)
+    src_root = os.path.abspath(src_folder)
+    dst_root = os.path.abspath(dst_folder)
+    counters = {'moved': 0, 'identical': 0, 'renamed': 0, 'symlinks': 0}
+    landed = {}  # absolute src path -> absolute dst path of every moved regular file
+
+    def free_path(path):
+        base, ext = os.path.splitext(path)
+        n = 1
+        candidate = path
+        while os.path.lexists(candidate):
+            n += 1
+            candidate = f"{base} ({n}){ext}"
+        return candidate
+
+    with set_log_level(logger, log_level):
+        links = []
+        # 1) Regular files first, so the symlinks can be pointed to where their targets landed
+        for path, dirs, files in os.walk(src_root):
+            rel_dir = os.path.relpath(path, src_root)
+            dst_dir = os.path.normpath(os.path.join(dst_root, rel_dir))
+            for name in files + [d for d in dirs if os.path.islink(os.path.join(path, d))]:
+                src_path = os.path.join(path, name)
+                if os.path.islink(src_path):
+                    links.append((src_path, os.path.join(dst_dir, name)))
+                    continue
+                dst_path = os.path.join(dst_dir, name)
+                os.makedirs(dst_dir, exist_ok=True)
+                if os.path.lexists(dst_path):
+                    if os.path.isfile(dst_path) and not os.path.islink(dst_path) and filecmp.cmp(src_path, dst_path, shallow=False):
+                        os.remove(src_path)
+                        landed[src_path] = dst_path
+                        counters['identical'] += 1
+                        continue
+                    dst_path = free_path(dst_path)
+                    counters['renamed'] += 1
+                shutil.move(src_path, dst_path)
+                landed[src_path] = dst_path
+                counters['moved'] += 1
+        # 2) Symlinks, re-targeted relative to their new location
+        for src_link, dst_link in links:
+            target = os.readlink(src_link)
+            absolute_target = os.path.normpath(os.path.join(os.path.dirname(src_link), target))
+            if not os.path.isabs(target) and (absolute_target == src_root or absolute_target.startswith(src_root + os.sep)):
+                new_target = landed.get(absolute_target) or os.path.join(dst_root, os.path.relpath(absolute_target, src_root))
+                target = os.path.relpath(new_target, os.path.dirname(dst_link))
+            if os.path.lexists(dst_link):
+                if os.path.islink(dst_link) and os.path.realpath(dst_link) == os.path.realpath(os.path.join(os.path.dirname(dst_link), target)):
+                    os.remove(src_link)
+                    counters['identical'] += 1
+                    continue
+                dst_link = free_path(dst_link)
+                counters['renamed'] += 1
+            os.makedirs(os.path.dirname(dst_link), exist_ok=True)
+            os.symlink(target, dst_link)
+            os.remove(src_link)
+            counters['symlinks'] += 1
+        for path, _, _ in os.walk(src_root, topdown=False):
+            with suppress(OSError):
+                os.rmdir(path)
+        logger.info(f"{step_name}Merged '{src_folder}' into '{dst_folder}': {counters['moved']} files moved, {counters['symlinks']} symlinks recreated, {counters['identical']} already present, {counters['renamed']} renamed to avoid a name collision.")
+    return counters
+
+
 def remove_empty_dirs(input_folder, log_level=None):
     """
     Remove empty directories recursively.
@@ -593,8 +822,36 @@ def unzip_flatten(zipfile_path, dest_folder):
 
 
 
-def sanitize_and_unpack_zips(input_folder, unzip_folder, step_name="", log_level=None):
-    """ Unzips all ZIP files from a folder into another (per-entry sanitized to avoid _ADMIN_*_WhiteSpaceConflict). """
+def resolve_unzip_workers(max_workers, archive_count):
+    """Number of archives extracted at once: max_workers, or min(CPU count, UNZIP_MAX_WORKERS) if 0, never more than the archives."""
+    try:
+        workers = int(max_workers or 0)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        workers = min(os.cpu_count() or 1, UNZIP_MAX_WORKERS)
+    return max(1, min(workers, archive_count))
+
+
+def sanitize_and_unpack_zips(input_folder, unzip_folder, step_name="", log_level=None, max_workers=0, zip_names=None, member_filter=None, dedupe=False):
+    """
+    Unzips all ZIP files from a folder into another (per-entry sanitized to avoid _ADMIN_*_WhiteSpaceConflict).
+
+    The archives are extracted in parallel by max_workers threads (0 = automatic), which overlap the zlib
+    decompression and disk writes of different archives. Destination paths are planned beforehand from the
+    central directories, in archive name order, so the ' (n)' suffix given to colliding sanitized names is
+    the same whatever archive finishes first. Progress is reported in bytes for all archives together.
+
+    zip_names restricts the extraction to those archive names, and member_filter(zip_file, info) can
+    return False to leave a member out (used by incremental Takeout processing).
+
+    With dedupe=True, non-JSON members with the same CRC32 and size in the central directories (the same
+    photo in an album folder and in its year folder, often in different archives) are written only once:
+    the first one in archive order is extracted, and every other one is hashed from its archive stream
+    and, if its SHA-1 matches, created as a hard link to it (or a local copy where hard links are not
+    supported). Every member still gets its own path, so album folders keep all their files.
+    Returns a dict with the number of 'linked' members and 'linked_bytes' not written.
+    """
     logger = GV.LOGGER or LOGGER or logging.getLogger(__name__)
 
     # ------------------------------- minimal helpers (inline) -------------------------------
@@ -622,32 +879,106 @@ def sanitize_and_unpack_zips(input_folder, unzip_folder, step_name="", log_level
             tgt = Path(root_dir) / "_unsafe" / Path(*parts)
         return tgt
 
+    def is_taken(path):
+        return os.path.normcase(str(path)) in claimed_paths or path.exists()
+
     def unique_path(parent, name, is_dir):
         # Resolve collisions by appending ' (n)' before extension (files) or at end (dirs)
         base, ext = (name, '') if is_dir else os.path.splitext(name)
         candidate = name
         n = 1
-        while (parent / candidate).exists():
+        while is_taken(parent / candidate):
             n += 1
             candidate = f"{base} ({n}){ext}"
         return parent / candidate
+
+    def read_member(zip_ref, info, out=None, digest=None, report_progress=True):
+        # Stream the member content into out and/or digest
+        with zip_ref.open(info, 'r') as src:
+            while True:
+                chunk = src.read(UNZIP_BUFFER_SIZE)
+                if not chunk:
+                    break
+                if out is not None:
+                    out.write(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+                if report_progress:
+                    with progress_lock:
+                        pbar.update(len(chunk))
+
+    def extract_archive(plan):
+        zip_file, zip_path, members = plan
+        try:
+            with zipfile.ZipFile(zip_path, 'r', allowZip64=True) as zip_ref:
+                logger.info(f"{step_name}Unzipping: {zip_file}")
+                for info, dst_path in members:
+                    key = os.path.normcase(str(dst_path))
+                    digest = hashlib.sha1() if key in link_sources else None
+                    with open(dst_path, 'wb') as out:
+                        read_member(zip_ref, info, out=out, digest=digest)
+                    if digest is not None:
+                        with progress_lock:
+                            source_digests[key] = digest.hexdigest()
+            logger.debug(f"{step_name}Done: {zip_file}")
+        except zipfile.BadZipFile:
+            logger.warning(f"{step_name}Could not unzip file (BadZipFile): {zip_file}")
+        except Exception as e:
+            logger.warning(f"{step_name}Unzip error for {zip_file}: {e}")
+
+    def link_duplicates(plan):
+        zip_file, zip_path, duplicates = plan
+        try:
+            with zipfile.ZipFile(zip_path, 'r', allowZip64=True) as zip_ref:
+                for info, dst_path, source_path in duplicates:
+                    digest = hashlib.sha1()
+                    read_member(zip_ref, info, digest=digest, report_progress=False)
+                    source_digest = source_digests.get(os.path.normcase(str(source_path)))
+                    if source_digest == digest.hexdigest() and source_path.exists():
+                        try:
+                            os.link(source_path, dst_path)
+                        except OSError:
+                            shutil.copyfile(source_path, dst_path)
+                        with progress_lock:
+                            pbar.update(info.file_size)
+                            dedupe_stats['linked'] += 1
+                            dedupe_stats['linked_bytes'] += info.file_size
+                    else:
+                        # Same CRC32 and size but different content (or its source failed): extract it
+                        with open(dst_path, 'wb') as out:
+                            read_member(zip_ref, info, out=out)
+        except zipfile.BadZipFile:
+            logger.warning(f"{step_name}Could not unzip file (BadZipFile): {zip_file}")
+        except Exception as e:
+            logger.warning(f"{step_name}Unzip error for {zip_file}: {e}")
     # ---------------------------------------------------------------------------------------
 
+    dedupe_stats = {'linked': 0, 'linked_bytes': 0}
+    link_sources = set()
+    source_digests = {}
+
     with set_log_level(logger, log_level):
         if not os.path.exists(input_folder):
             logger.warning(f"{step_name}ZIP folder '{input_folder}' does not exist.")
-            return
+            return dedupe_stats
         os.makedirs(unzip_folder, exist_ok=True)
 
-        for zip_file in os.listdir(input_folder):
-            if not zip_file.lower().endswith(".zip"):
-                continue
-
+        # 1) Plan every destination path from the central directories, in a fixed archive order
+        zip_files = sorted((f for f in os.listdir(input_folder) if f.lower().endswith(".zip")), key=lambda f: (f.casefold(), f))
+        if zip_names is not None:
+            selected_zip_names = set(zip_names)
+            zip_files = [f for f in zip_files if f in selected_zip_names]
+        claimed_paths = set()
+        plans = []
+        total_bytes = 0
+        for zip_file in zip_files:
             zip_path = os.path.join(input_folder, zip_file)
             try:
                 with zipfile.ZipFile(zip_path, 'r', allowZip64=True) as zip_ref:
-                    logger.info(f"{step_name}Unzipping: {zip_file}")
+                    members = []
                     for info in zip_ref.infolist():
+                        if member_filter is not None and not info.is_dir() and not member_filter(zip_file, info):
+                            continue
                         # Split path into components and sanitize each one independently
                         raw_parts = Path(info.filename).parts
                         is_dir = info.is_dir()
@@ -667,17 +998,50 @@ def sanitize_and_unpack_zips(input_folder, unzip_folder, step_name="", log_level
                                 dst_path.mkdir(parents=True, exist_ok=True)
                             continue
 
-                        # Handle file collisions
-                        if dst_path.exists():
+                        # Handle file collisions (against files on disk and files planned from earlier members)
+                        if is_taken(dst_path):
                             dst_path = unique_path(parent, dst_path.name, is_dir=False)
-
-                        # Stream copy file content
-                        with zip_ref.open(info, 'r') as src, open(dst_path, 'wb') as out:
-                            shutil.copyfileobj(src, out, length=1024 * 1024)
-
-                logger.debug(f"{step_name}Done: {zip_file}")
-
+                        claimed_paths.add(os.path.normcase(str(dst_path)))
+                        members.append((info, dst_path))
+                        total_bytes += info.file_size
+                plans.append((zip_file, zip_path, members))
             except zipfile.BadZipFile:
                 logger.warning(f"{step_name}Could not unzip file (BadZipFile): {zip_file}")
             except Exception as e:
                 logger.warning(f"{step_name}Unzip error for {zip_file}: {e}")
+
+        if not plans:
+            return dedupe_stats
+
+        # 2) Group identical members by (CRC32, size): only the first one of each group is extracted
+        link_plans = []
+        if dedupe:
+            groups = {}
+            for zip_file, zip_path, members in plans:
+                for info, dst_path in members:
+                    if info.file_size > 0 and not info.filename.lower().endswith('.json'):
+                        groups.setdefault((info.CRC, info.file_size), []).append((zip_file, info, dst_path))
+            duplicates_by_zip = {}
+            for group in groups.values():
+                source_path = group[0][2]
+                for zip_file, info, dst_path in group[1:]:
+                    duplicates_by_zip.setdefault(zip_file, []).append((info, dst_path, source_path))
+                if len(group) > 1:
+                    link_sources.add(os.path.normcase(str(source_path)))
+            if duplicates_by_zip:
+                duplicated_infos = {id(info) for duplicates in duplicates_by_zip.values() for info, _, _ in duplicates}
+                plans = [(zip_file, zip_path, [(info, dst_path) for info, dst_path in members if id(info) not in duplicated_infos]) for zip_file, zip_path, members in plans]
+                link_plans = [(zip_file, zip_path, duplicates_by_zip[zip_file]) for zip_file, zip_path, _ in plans if zip_file in duplicates_by_zip]
+
+        # 3) Extract the archives in parallel; each file has its own planned destination.
+        #    Then create the duplicates from the extracted copies once their content hash is confirmed.
+        workers = resolve_unzip_workers(max_workers, len(plans))
+        logger.info(f"{step_name}Unzipping {len(plans)} ZIP file(s) with {workers} worker(s)...")
+        progress_lock = threading.Lock()
+        with tqdm(total=total_bytes, smoothing=0.1, desc=f"{MSG_TAGS['INFO']}{step_name}Unzipping Takeout", unit="B", unit_scale=True, unit_divisor=1024) as pbar:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(extract_archive, plans))
+                list(executor.map(link_duplicates, link_plans))
+        if dedupe:
+            logger.info(f"{step_name}{dedupe_stats['linked']} duplicated files ({dedupe_stats['linked_bytes'] / (1024 ** 2):.1f} MB) across the ZIP files were linked to a single extracted copy instead of being extracted again.")
+        return dedupe_stats
@@ -11,8 +11,11 @@ import shutil
 import stat
 import subprocess
 import sys
+import threading
 import time
 import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import is_dataclass, asdict
 from datetime import datetime
 
@@ -995,20 +998,102 @@ def convert_asset_ids_to_str(asset_ids):
         return [str(asset_ids)]
 
 
+def run_transfers_in_pool(tasks, transfer, max_workers, desc, unit=" assets"):
+    """
+    Runs transfer(task) for every task with at most max_workers threads and returns the results in task order.
+
+    The progress bar advances as transfers finish, but results[i] always belongs to tasks[i], so callers
+    can associate the uploaded assets with their album in the original file order. The first exception
+    raised by a transfer cancels the pending ones and is re-raised once the running ones have finished.
+    """
+    tasks = list(tasks)
+    results = [None] * len(tasks)
+    if not tasks:
+        return results
+    workers = max(1, min(int(max_workers or 1), len(tasks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(transfer, task): index for index, task in enumerate(tasks)}
+        try:
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc, unit=unit):
+                results[futures[future]] = future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
+
+
+def run_downloads_in_pool(downloads, pull_asset, max_workers, desc, unit=" assets"):
+    """
+    Calls pull_asset(**download) for every download (a dict of pull_asset keyword arguments) with at most
+    max_workers threads and returns the sum of the results (the number of assets downloaded).
+
+    Downloads that target the same local file (same 'download_folder' and 'asset_filename') run one after the
+    other in the same worker, so two assets with the same name never write the same file at once.
+    """
+    groups = OrderedDict()
+    for download in downloads:
+        target = os.path.normcase(os.path.join(str(download.get("download_folder") or ""), str(download.get("asset_filename") or "")))
+        groups.setdefault(target, []).append(download)
+
+    def pull_group(group):
+        return sum(pull_asset(**download) or 0 for download in group)
+
+    return sum(run_transfers_in_pool(list(groups.values()), pull_group, max_workers, desc=desc, unit=unit))
+
+
+SHA1_CHECKSUM_READ_SIZE = 1024 * 1024
+SHA1_CHECKSUM_CACHE_MAX_ENTRIES = 65536
+_SHA1_CHECKSUM_CACHE = OrderedDict()
+_SHA1_CHECKSUM_CACHE_LOCK = threading.Lock()
+
+
+def _sha1_checksum_cache_key(file_stat, file_path):
+    # Some filesystems (e.g. FAT or network shares on Windows) report inode 0,
+    # so the path keeps those files apart. ctime is part of the key because staged
+    # files get their mtime set to the capture date, and a deleted file's inode can
+    # be reused by the next one.
+    inode = file_stat.st_ino or os.path.normcase(os.path.abspath(file_path))
+    return file_stat.st_dev, inode, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns
+
+
 def sha1_checksum(file_path):
-    """Computes the SHA-1 hash of a file and returns both HEX and Base64 formats."""
-    sha1 = hashlib.sha1()  # Create a SHA-1 object
+    """
+    Computes the SHA-1 hash of a file and returns both HEX and Base64 formats.
+
+    Results are cached by (device, inode, size, mtime_ns, ctime_ns), so a file that has not
+    changed is hashed at most once per run, whichever client asks for it.
+    """
+    file_stat = os.stat(file_path)
+    cache_key = _sha1_checksum_cache_key(file_stat, file_path)
+    with _SHA1_CHECKSUM_CACHE_LOCK:
+        cached = _SHA1_CHECKSUM_CACHE.get(cache_key)
+        if cached is not None:
+            _SHA1_CHECKSUM_CACHE.move_to_end(cache_key)
+            return cached
 
+    sha1 = hashlib.sha1()  # Create a SHA-1 object
     with open(file_path, "rb") as f:  # Read the file in binary mode
-        while chunk := f.read(8192):  # Read in 8 KB chunks for efficiency
+        while chunk := f.read(SHA1_CHECKSUM_READ_SIZE):
             sha1.update(chunk)
 
     sha1_hex = sha1.hexdigest()  # Get HEX format
     sha1_base64 = base64.b64encode(sha1.digest()).decode("utf-8")  # Convert to Base64
 
+    with _SHA1_CHECKSUM_CACHE_LOCK:
+        _SHA1_CHECKSUM_CACHE[cache_key] = (sha1_hex, sha1_base64)
+        _SHA1_CHECKSUM_CACHE.move_to_end(cache_key)
+        while len(_SHA1_CHECKSUM_CACHE) > SHA1_CHECKSUM_CACHE_MAX_ENTRIES:
+            _SHA1_CHECKSUM_CACHE.popitem(last=False)
     return sha1_hex, sha1_base64
 
 
+def clear_sha1_checksum_cache():
+    """Forget every checksum cached by sha1_checksum."""
+    with _SHA1_CHECKSUM_CACHE_LOCK:
+        _SHA1_CHECKSUM_CACHE.clear()
+
+
 def match_pattern(string, pattern):
     """
     Returns True if pattern matches the given string.
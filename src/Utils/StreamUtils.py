@@ -0,0 +1,74 @@
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+# ==============================================================================
+#                               STREAM FUNCTIONS
+# ==============================================================================
+def get_response_content_length(response):
+    """
+    Returns the body length announced by a streamed HTTP response, or None.
+
+    The length is only trusted when the body is sent as-is: with a Content-Encoding
+    (e.g. gzip) requests decodes the body and the announced length no longer matches.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+
+    Returns:
+        int | None: The Content-Length in bytes, or None when unknown or unreliable.
+    """
+    headers = getattr(response, "headers", None) or {}
+    content_encoding = str(headers.get("Content-Encoding", "") or "").strip().lower()
+    if content_encoding and content_encoding != "identity":
+        return None
+    try:
+        content_length = int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+    return content_length if content_length >= 0 else None
+
+
+class ResponseBodyStream:
+    """
+    Read-only file-like view over a streamed HTTP response body of known length.
+
+    It lets an upload (e.g. a requests_toolbelt MultipartEncoder) consume a download
+    directly, without writing it to disk. At most one chunk of the response is held
+    in memory at a time. `len` and `tell()` are what MultipartEncoder uses to compute
+    the size of the multipart body before sending it.
+    """
+
+    def __init__(self, response, content_length, chunk_size=STREAM_CHUNK_SIZE, chunk_iterator=None, prefix=b""):
+        self.response = response
+        self.len = int(content_length)
+        self._chunks = chunk_iterator if chunk_iterator is not None else response.iter_content(chunk_size=chunk_size)
+        self._buffer = bytearray(prefix or b"")
+        self._position = 0
+
+    def tell(self):
+        return self._position
+
+    def read(self, size=-1):
+        remaining = self.len - self._position
+        if remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                raise IOError(
+                    f"Source stream ended after {self._position + len(self._buffer)} of {self.len} announced bytes"
+                )
+            self._buffer.extend(chunk)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(data)
+        return data
+
+    def close(self):
+        self._buffer.clear()
+        try:
+            self.response.close()
+        except Exception:
+            pass
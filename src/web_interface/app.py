@@ -118,6 +118,11 @@ BOOL_VALUE_DESTS = {
     "move-assets",
     "dashboard",
     "parallel-migration",
+    "resume",
+    "preflight-target-diff",
+    "plan-only",
+    "streaming-transfer",
+    "incremental-source-listing",
     "show-gpth-info",
     "show-gpth-errors",
     "google-process-people",
@@ -141,8 +146,18 @@ AUTOMATION_DESTS = {
     "move-assets",
     "dashboard",
     "parallel-migration",
+    "resume",
+    "preflight-target-diff",
+    "plan-only",
+    "streaming-transfer",
+    "incremental-source-listing",
     "push-asset-max-size-mb",
     "immich-upload-timeout-seconds",
+    "pull-workers",
+    "adaptive-push-concurrency",
+    "staging-budget-mb",
+    "staging-budget-files",
+    "metrics-file",
     "prefer-canonical-album-names",
     "consolidate-similar-albums",
     "one-time-password",
@@ -166,6 +181,9 @@ GOOGLE_DESTS = {
     "google-skip-preprocess",
     "google-skip-postprocess",
     "google-keep-takeout-folder",
+    "google-unzip-workers",
+    "google-unzip-dedup",
+    "google-incremental",
     "google-process-people",
     "show-gpth-info",
     "show-gpth-errors",
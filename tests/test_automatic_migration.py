@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 import tempfile
 import threading
@@ -10,6 +11,8 @@ from pathlib import Path
 from queue import PriorityQueue
 from unittest.mock import patch
 
+import requests
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = PROJECT_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
@@ -107,6 +110,8 @@ class TestAutomaticMigrationHelpers(unittest.TestCase):
                 "assets_in_queue": 7,
                 "album_assoc_queue_size": 4,
                 "delayed_assets_pending": 3,
+                "push_concurrency": 5,
+                "push_concurrency_max": 32,
             },
             counters={
                 "total_assets_blocked": 9,
@@ -167,6 +172,8 @@ class TestAutomaticMigrationHelpers(unittest.TestCase):
         self.assertEqual(snapshot["assetsInQueue"], 7)
         self.assertEqual(snapshot["albumAssocQueue"], 4)
         self.assertEqual(snapshot["delayedRetriesQueue"], 3)
+        self.assertEqual(snapshot["pushConcurrency"], 5)
+        self.assertEqual(snapshot["pushConcurrencyMax"], 32)
         self.assertEqual(snapshot["blockedAssets"], 9)
         self.assertEqual(snapshot["pushRetryRecovered"], 8)
         self.assertEqual(snapshot["pushRetryFailed"], 2)
@@ -176,6 +183,8 @@ class TestAutomaticMigrationHelpers(unittest.TestCase):
         self.assertEqual(snapshot["albumAssocRetryScheduled"], 7)
         self.assertEqual(snapshot["albumAssocRetryRecovered"], 5)
         self.assertEqual(snapshot["albumAssocUnconfirmed"], 1)
+        self.assertEqual(snapshot["stageMetrics"], {})
+        self.assertEqual(snapshot["queueDepths"], {})
         self.assertIn("updatedAt", snapshot)
 
     def test_web_dashboard_snapshot_uses_the_same_physical_totals_for_pull_and_push(self):
@@ -654,6 +663,49 @@ class TestAutomaticMigrationHelpers(unittest.TestCase):
             self.assertTrue((queue_root / "Albums" / "Album1" / "IMG_0001.JPG").is_file())
             self.assertFalse((queue_root / "Albums" / "Album1" / "IMG_0001.JPG").is_symlink())
 
+    def test_stage_local_asset_hardlinks_when_source_keeps_asset_time_and_copies_otherwise(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_root = Path(tmpdir) / "source"
+            first_photo = source_root / "ALL_PHOTOS" / "IMG_0001.JPG"
+            second_photo = source_root / "ALL_PHOTOS" / "IMG_0002.JPG"
+            first_photo.parent.mkdir(parents=True)
+            first_photo.write_text("photo-1", encoding="utf-8")
+            second_photo.write_text("photo-2", encoding="utf-8")
+            os.utime(first_photo, (1600000000, 1600000000))
+            local_client = object.__new__(automatic_module.ClassLocalPhotosFolder)
+            local_client.base_folder = source_root
+            queue_root = Path(tmpdir) / "Automatic_Migration" / "Push_Queue"
+            staging_methods = []
+
+            linked_staged = automatic_module._stage_local_asset_for_automatic_migration(
+                local_client, str(first_photo), first_photo.name, 1600000000, str(queue_root), on_staged=staging_methods.append,
+            )
+            copied_staged = automatic_module._stage_local_asset_for_automatic_migration(
+                local_client, str(second_photo), second_photo.name, 1500000000, str(queue_root), on_staged=staging_methods.append,
+            )
+
+            self.assertEqual(staging_methods[0], "hardlink")
+            self.assertTrue(os.path.samefile(linked_staged, first_photo))
+            self.assertNotEqual(staging_methods[1], "hardlink")
+            self.assertFalse(os.path.samefile(copied_staged, second_photo))
+            self.assertEqual(Path(copied_staged).read_text(encoding="utf-8"), "photo-2")
+            self.assertEqual(int(os.stat(copied_staged).st_mtime), 1500000000)
+            self.assertNotEqual(int(os.stat(second_photo).st_mtime), 1500000000)
+
+    def test_stage_local_file_falls_back_to_plain_copy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_path = Path(tmpdir) / "source.jpg"
+            destination_path = Path(tmpdir) / "staged.jpg"
+            source_path.write_bytes(b"photo")
+
+            with patch.object(automatic_module.os, "link", side_effect=OSError("cross-device link")), \
+                    patch.object(automatic_module, "_reflink_file", side_effect=OSError("not supported")), \
+                    patch.object(automatic_module, "_copy_file_range_file", side_effect=OSError("not supported")):
+                method_name = automatic_module._stage_local_file(source_path, destination_path)
+
+            self.assertEqual(method_name, "copy")
+            self.assertEqual(destination_path.read_bytes(), b"photo")
+
     def test_finalize_album_assoc_failed_asset_safely_returns_none_when_cleanup_raises(self):
         logger = unittest.mock.Mock()
 
@@ -734,6 +786,336 @@ class TestAutomaticMigrationHelpers(unittest.TestCase):
 
         self.assertTrue(reserved)
 
+    def test_asset_path_index_tracks_paths_through_put_and_get(self):
+        class IndexedPriorityQueue(automatic_module._AssetPathIndexMixin, PriorityQueue):
+            pass
+
+        queue = IndexedPriorityQueue()
+        queue.put((0, 1, {"asset_file_path": "/tmp/Album/IMG_2088.MP4"}))
+        queue.put((1, 2, {"asset_file_path": "/tmp/album/img_2088.mp4"}))
+        queue.put((2, 3, None))
+
+        self.assertTrue(automatic_module._queue_contains_asset_path(queue, "/TMP/Album/IMG_2088.MP4"))
+        queue.get()
+        self.assertTrue(automatic_module._queue_contains_asset_path(queue, "/tmp/Album/IMG_2088.MP4"))
+        queue.get()
+        self.assertFalse(automatic_module._queue_contains_asset_path(queue, "/tmp/Album/IMG_2088.MP4"))
+        self.assertIsNone(queue.get()[2])
+        self.assertEqual(dict(queue._asset_path_counts), {})
+
+    def test_resolve_pull_worker_count_honours_configuration_and_caps_automatic_value(self):
+        self.assertEqual(automatic_module._resolve_pull_worker_count(6, cpu_total_threads=2), 6)
+        self.assertEqual(automatic_module._resolve_pull_worker_count(0, cpu_total_threads=2), 2)
+        self.assertEqual(
+            automatic_module._resolve_pull_worker_count(None, cpu_total_threads=32),
+            automatic_module.AUTOMATIC_MIGRATION_MAX_AUTO_PULL_WORKERS,
+        )
+        self.assertEqual(automatic_module._resolve_pull_worker_count("bad", cpu_total_threads=None), 1)
+
+    def test_group_albums_for_pull_workers_keeps_same_name_albums_together(self):
+        albums = [
+            {"id": "1", "albumName": "Trip"},
+            {"id": "2", "albumName": "Family"},
+            {"id": "3", "albumName": "Trip"},
+        ]
+
+        groups = automatic_module._group_albums_for_pull_workers(albums)
+
+        self.assertEqual([[album["id"] for album in group] for group in groups], [["1", "3"], ["2"]])
+
+    def test_pull_claim_tracker_hands_each_asset_to_one_worker(self):
+        tracker = automatic_module.PullClaimTracker()
+        winners = []
+        winners_lock = threading.Lock()
+
+        def _claim():
+            if tracker.claim("Album", "/Source/Album/IMG_0001.JPG"):
+                with winners_lock:
+                    winners.append(threading.get_ident())
+
+        threads = [threading.Thread(target=_claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(winners), 1)
+        self.assertTrue(tracker.is_claimed("Album", "/source/album/img_0001.jpg"))
+        self.assertTrue(tracker.claim(None, "/Source/Album/IMG_0001.JPG"))
+        self.assertIs(tracker.stem_lock("IMG_0001.HEIC"), tracker.stem_lock("img_0001.mov"))
+
+    def test_adaptive_push_concurrency_grows_additively_and_halves_on_throttling(self):
+        changes = []
+        controller = automatic_module.AdaptivePushConcurrency(
+            initial_limit=4,
+            max_limit=6,
+            window_size=2,
+            on_change=lambda previous, current: changes.append((previous, current)),
+        )
+
+        for _ in range(6):
+            controller.record_push(latency_ms=100.0, size_bytes=1024)
+        self.assertEqual(controller.limit, 6)
+
+        controller.record_push(latency_ms=100.0)
+        controller.record_push(failed=True, throttled=True)
+        self.assertEqual(controller.limit, 3)
+
+        controller.record_retry()
+        controller.record_push(latency_ms=100.0)
+        controller.record_push(latency_ms=100.0)
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(changes, [(4, 5), (5, 6), (6, 3), (3, 1)])
+
+    def test_adaptive_push_concurrency_backs_off_on_latency_and_gates_slots(self):
+        controller = automatic_module.AdaptivePushConcurrency(initial_limit=4, max_limit=8, window_size=1)
+        controller.record_push(latency_ms=100.0, size_bytes=4 * 1024 * 1024)
+        self.assertEqual(controller.limit, 5)
+        self.assertEqual(controller.baseline_latency_ms, 25.0)
+
+        controller.record_push(latency_ms=1000.0, size_bytes=4 * 1024 * 1024)
+        self.assertEqual(controller.limit, 3)
+
+        controller.configure(initial_limit=1, max_limit=2)
+        controller.acquire()
+        acquired = threading.Event()
+
+        def _acquire_second_slot():
+            controller.acquire()
+            acquired.set()
+
+        waiter = threading.Thread(target=_acquire_second_slot)
+        waiter.start()
+        self.assertFalse(acquired.wait(0.1))
+        controller.release()
+        self.assertTrue(acquired.wait(1.0))
+        controller.release()
+        waiter.join()
+
+    def test_adaptive_push_concurrency_keeps_limit_when_disabled(self):
+        controller = automatic_module.AdaptivePushConcurrency(initial_limit=3, max_limit=8, enabled=False, window_size=1)
+        controller.record_push(latency_ms=10.0)
+        controller.record_push(failed=True, throttled=True)
+        self.assertEqual(controller.limit, 3)
+
+    def test_live_photo_pair_stems_only_reports_photo_and_video_with_same_stem(self):
+        stems = automatic_module._live_photo_pair_stems([
+            {"filename": "IMG_0001.HEIC", "type": "photo"},
+            {"filename": "IMG_0001.MOV", "type": "video"},
+            {"filename": "IMG_0002.JPG", "type": "photo"},
+            {"filename": "IMG_0002.xmp", "type": "photo"},
+            {"filename": "VID_0003.MP4", "type": "video"},
+        ])
+
+        self.assertEqual(stems, {"img_0001"})
+
+    def test_pages_with_neighbour_context_include_previous_and_next_pages(self):
+        pages = iter([[1, 2], [3], [4, 5]])
+
+        windows = list(automatic_module._iter_pages_with_neighbour_context(pages))
+
+        self.assertEqual(
+            windows,
+            [
+                ([1, 2], [1, 2, 3]),
+                ([3], [1, 2, 3, 4, 5]),
+                ([4, 5], [3, 4, 5]),
+            ],
+        )
+        self.assertEqual(list(automatic_module._iter_pages_with_neighbour_context([])), [])
+
+    def test_migration_metrics_reports_stage_percentiles_and_throughput(self):
+        now = [100.0]
+        metrics = automatic_module.MigrationMetrics(clock=lambda: now[0])
+        for elapsed_ms in range(1, 101):
+            metrics.observe_stage("upload", elapsed_ms * 10, size_bytes=1000)
+        metrics.observe_stage("upload", None)
+        now[0] = 110.0
+
+        stage = metrics.snapshot()["stages"]["upload"]
+
+        self.assertEqual(stage["count"], 100)
+        self.assertEqual(stage["bytes"], 100000)
+        self.assertEqual(stage["maxMs"], 1000.0)
+        self.assertEqual(stage["bytesPerSecond"], 10000.0)
+        self.assertTrue(250 <= stage["p50Ms"] <= 500)
+        self.assertTrue(500 <= stage["p95Ms"] <= 1000)
+        self.assertLessEqual(stage["p95Ms"], stage["p99Ms"])
+        self.assertLessEqual(stage["p99Ms"], 1000.0)
+
+    def test_migration_metrics_tracks_time_weighted_queue_depth(self):
+        now = [0.0]
+        metrics = automatic_module.MigrationMetrics(clock=lambda: now[0])
+        metrics.record_queue_depth("push", 4)
+        now[0] = 5.0
+        metrics.record_queue_depth("push", 0)
+        now[0] = 10.0
+
+        queue = metrics.snapshot()["queues"]["push"]
+
+        self.assertEqual(queue, {"current": 0, "max": 4, "mean": 2.0})
+
+    def test_migration_metrics_writes_prometheus_and_json_files(self):
+        metrics = automatic_module.MigrationMetrics()
+        metrics.observe_stage("pull", 30, size_bytes=2048)
+        metrics.record_queue_depth("pull", 3)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prom_path = metrics.write(os.path.join(tmp_dir, "metrics", "migration.prom"))
+            json_path = metrics.write(os.path.join(tmp_dir, "migration.json"))
+            prom_text = Path(prom_path).read_text(encoding="utf-8")
+            json_text = Path(json_path).read_text(encoding="utf-8")
+            leftovers = [name for name in os.listdir(tmp_dir) if name.endswith(".tmp")]
+
+        self.assertIn('photomigrator_stage_latency_seconds_bucket{stage="pull",le="0.05"} 1', prom_text)
+        self.assertIn('photomigrator_stage_latency_seconds_bucket{stage="pull",le="+Inf"} 1', prom_text)
+        self.assertIn('photomigrator_stage_bytes_total{stage="pull"} 2048', prom_text)
+        self.assertIn('photomigrator_queue_depth_max{queue="pull"} 3', prom_text)
+        self.assertIn('"samples"', json_text)
+        self.assertEqual(leftovers, [])
+
+    def test_staging_budget_blocks_pulls_until_staged_files_are_released(self):
+        temp_folder = os.path.join(os.sep, "tmp", "migration")
+        queued_path = os.path.join(temp_folder, automatic_module.AUTOMATIC_MIGRATION_PUSH_QUEUE_FOLDER, "Trip", "a.jpg")
+        failed_path = os.path.join(temp_folder, automatic_module.AUTOMATIC_MIGRATION_PUSH_FAILED_FOLDER, "Trip", "a.jpg")
+        key = automatic_module._staging_budget_key(temp_folder, queued_path)
+        self.assertEqual(key, automatic_module._staging_budget_key(temp_folder, failed_path))
+
+        budget = automatic_module.StagingBudget(max_bytes=100, max_files=2)
+        self.assertFalse(budget.acquire())
+        budget.commit({key: 150})
+        self.assertEqual((budget.used_files, budget.used_bytes), (1, 150))
+
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (budget.acquire(poll_seconds=0.05), acquired.set()))
+        waiter.start()
+        self.assertFalse(acquired.wait(0.2))
+        budget.release([key])
+        self.assertTrue(acquired.wait(1.0))
+        waiter.join()
+        budget.commit({})
+        self.assertEqual((budget.used_files, budget.used_bytes, budget.pending_pulls), (0, 0, 0))
+
+    def test_staging_budget_release_by_fast_pusher_before_puller_commit_is_not_leaked(self):
+        budget = automatic_module.StagingBudget(max_bytes=1000, max_files=2)
+        self.assertFalse(budget.acquire())
+        # The puller registers the staged file before queueing it ...
+        budget.register({"Push_Queue/IMG_0001.jpg": 150})
+        self.assertEqual((budget.used_files, budget.used_bytes), (1, 150))
+        # ... a fast pusher uploads (or drops) it and releases it before the puller finishes its reservation ...
+        budget.release(["Push_Queue/IMG_0001.jpg"])
+        budget.commit()
+        self.assertEqual((budget.used_files, budget.used_bytes, budget.pending_pulls), (0, 0, 0))
+
+    def test_staging_budget_bypasses_when_push_pipeline_is_idle_and_when_disabled(self):
+        budget = automatic_module.StagingBudget(max_files=1)
+        budget.commit({"a.jpg": 10})
+        self.assertTrue(budget.acquire(can_bypass=lambda: True, poll_seconds=0.01))
+        self.assertEqual(budget.pending_pulls, 1)
+
+        unlimited = automatic_module.StagingBudget()
+        self.assertFalse(unlimited.enabled)
+        unlimited.commit({"a.jpg": 10})
+        self.assertFalse(unlimited.acquire())
+        self.assertEqual(unlimited.used_files, 0)
+
+    def test_is_throttling_push_error_detects_status_codes_and_timeouts(self):
+        response = types.SimpleNamespace(status_code=429)
+        self.assertTrue(automatic_module._is_throttling_push_error(types.SimpleNamespace(response=response)))
+        self.assertTrue(automatic_module._is_throttling_push_error(
+            requests.HTTPError("503 Server Error", response=types.SimpleNamespace(status_code=503))
+        ))
+        self.assertTrue(automatic_module._is_throttling_push_error(requests.exceptions.ReadTimeout("Read timed out.")))
+        self.assertFalse(automatic_module._is_throttling_push_error(
+            requests.HTTPError("400 Bad Request", response=types.SimpleNamespace(status_code=400))
+        ))
+        # Status numbers or words inside the message of another error are not throttling
+        self.assertFalse(automatic_module._is_throttling_push_error(Exception("IMG_0503.jpg: upload timeout setting ignored")))
+
+    def test_migration_journal_completes_asset_once_every_variant_is_pushed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal_path = automatic_module.build_migration_journal_path(tmpdir, "immich-1", "synology-1")
+            journal = automatic_module.MigrationJournal(journal_path)
+            try:
+                # The pusher may finish a variant before the puller journals the variant count.
+                journal.record_pushed("Trip", "asset-1", target_asset_id="target-1", album_associated=True)
+                journal.record_pulled("Trip", "asset-1", variants=2)
+                self.assertFalse(journal.is_completed("Trip", "asset-1"))
+
+                journal.record_pushed("Trip", "asset-1", target_asset_id="target-2", album_associated=True)
+
+                self.assertTrue(journal.is_completed("Trip", "asset-1"))
+                self.assertFalse(journal.is_completed(None, "asset-1"))
+                state = journal.get_state("Trip", "asset-1")
+                self.assertEqual(state["target_asset_id"], "target-2")
+                self.assertTrue(state["album_associated"])
+            finally:
+                journal.close()
+
+    def test_target_inventory_index_matches_by_checksum_or_name_size_and_capture_time(self):
+        index = automatic_module.TargetInventoryIndex([
+            # base64 SHA-1 of b"test", as listed by Immich.
+            {"id": "by-checksum", "filename": "other.jpg", "size": 1, "time": None, "checksum": "qUqP5cyxm6YcTAhz05Hph5gvu9M="},
+            {"id": "by-identity", "filename": "IMG_0001.JPG", "size": 2048, "time": 1700000000, "checksum": None},
+        ])
+
+        self.assertEqual(index.total_assets, 2)
+        self.assertEqual(index.find(checksum="a94a8fe5ccb19ba61c4c0873d391e987982fbbd3"), "by-checksum")
+        self.assertEqual(index.find(filename="img_0001.jpg", size=2048, capture_epoch=1700000000), "by-identity")
+        # The same capture time reported in another time zone still matches.
+        self.assertEqual(index.find(filename="IMG_0001.JPG", size=2048, capture_epoch=1700000000 + 2 * 3600), "by-identity")
+        self.assertIsNone(index.find(filename="IMG_0001.JPG", size=2049, capture_epoch=1700000000))
+        self.assertIsNone(index.find(filename="IMG_0001.JPG", size=2048, capture_epoch=1700000000 + 1234))
+        self.assertIsNone(index.find(filename="IMG_0001.JPG", capture_epoch=1700000000))
+        # A missing capture time on either side is not a match by name and size.
+        self.assertIsNone(index.find(filename="IMG_0001.JPG", size=2048, capture_epoch=None))
+        no_time_index = automatic_module.TargetInventoryIndex([
+            {"id": "no-time", "filename": "IMG_0002.JPG", "size": 4096, "time": None, "checksum": None},
+        ])
+        self.assertIsNone(no_time_index.find(filename="IMG_0002.JPG", size=4096, capture_epoch=1700000000))
+
+    def test_source_asset_size_reads_listing_fields(self):
+        self.assertEqual(automatic_module.source_asset_size({"filesize": "10"}), 10)
+        self.assertEqual(automatic_module.source_asset_size({"exifInfo": {"fileSizeInByte": 20}}), 20)
+        self.assertIsNone(automatic_module.source_asset_size({"filename": "a.jpg"}))
+
+    def test_migration_journal_is_kept_on_resume_and_reset_otherwise(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal_path = automatic_module.build_migration_journal_path(tmpdir, "/photos", "immich-1")
+            self.assertEqual(journal_path, automatic_module.build_migration_journal_path(tmpdir, "/photos", "immich-1"))
+            self.assertNotEqual(journal_path, automatic_module.build_migration_journal_path(tmpdir, "/photos", "immich-2"))
+
+            journal = automatic_module.MigrationJournal(journal_path)
+            journal.record_pulled(None, "/photos/IMG_0001.JPG", variants=1)
+            journal.record_pushed(None, "/photos/IMG_0001.JPG", target_asset_id="target-1")
+            journal.close()
+
+            resumed_journal = automatic_module.MigrationJournal(journal_path, resume=True)
+            self.assertTrue(resumed_journal.is_completed(None, "/photos/IMG_0001.JPG"))
+            self.assertEqual(resumed_journal.count_completed(), 1)
+            resumed_journal.close()
+
+            fresh_journal = automatic_module.MigrationJournal(journal_path)
+            self.assertFalse(fresh_journal.is_completed(None, "/photos/IMG_0001.JPG"))
+            fresh_journal.close()
+
+    def test_plan_only_run_leaves_existing_migration_journal_intact(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal_path = automatic_module.build_migration_journal_path(tmpdir, "/photos", "immich-1")
+            journal = automatic_module.MigrationJournal(journal_path)
+            journal.record_pulled(None, "/photos/IMG_0001.JPG", variants=1)
+            journal.record_pushed(None, "/photos/IMG_0001.JPG", target_asset_id="target-1")
+            journal.close()
+
+            with patch.object(automatic_module, "resolve_external_path", return_value=tmpdir):
+                self.assertIsNone(automatic_module._open_migration_journal("/photos", "immich-1", plan_only=True))
+                resumed_journal = automatic_module._open_migration_journal("/photos", "immich-1", resume=True)
+            try:
+                self.assertEqual(resumed_journal.journal_path, journal_path)
+                self.assertTrue(resumed_journal.is_completed(None, "/photos/IMG_0001.JPG"))
+            finally:
+                resumed_journal.close()
+
     def test_mark_album_pushed_if_ready_counts_album_once_when_folder_is_drained(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             album_folder = Path(tmpdir) / "Album A"
@@ -0,0 +1,137 @@
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import requests
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+try:
+    from Utils.DownloadUtils import download_to_file
+    DOWNLOAD_UTILS_IMPORT_ERROR = None
+except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
+    DOWNLOAD_UTILS_IMPORT_ERROR = exc
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200, headers=None, fail_after=None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.fail_after = fail_after
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        sent = 0
+        while sent < len(self.body):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise requests.exceptions.ChunkedEncodingError("connection reset")
+            chunk = self.body[sent:sent + min(chunk_size, 3)]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeServer:
+    """Serves one body, honouring 'Range: bytes=a-b' when supports_ranges is set."""
+
+    def __init__(self, body, supports_ranges=True, fail_first_after=None):
+        self.body = body
+        self.supports_ranges = supports_ranges
+        self.fail_first_after = fail_first_after
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def open(self, extra_headers):
+        with self._lock:
+            self.requests.append(dict(extra_headers))
+            fail_after = self.fail_first_after
+            self.fail_first_after = None
+        range_header = extra_headers.get("Range")
+        headers = {"Accept-Ranges": "bytes"} if self.supports_ranges else {}
+        if range_header and self.supports_ranges:
+            first, last = re.match(r"bytes=(\d+)-(\d*)", range_header).groups()
+            first = int(first)
+            last = int(last) if last else len(self.body) - 1
+            headers.update({
+                "Content-Range": f"bytes {first}-{last}/{len(self.body)}",
+                "Content-Length": str(last - first + 1),
+            })
+            return FakeResponse(self.body[first:last + 1], status_code=206, headers=headers, fail_after=fail_after)
+        headers["Content-Length"] = str(len(self.body))
+        return FakeResponse(self.body, headers=headers, fail_after=fail_after)
+
+
+@patch("Utils.DownloadUtils.GV.LOGGER", new_callable=MagicMock)
+@patch("Utils.DownloadUtils.time.sleep")
+class TestDownloadUtils(unittest.TestCase):
+    def setUp(self):
+        if DOWNLOAD_UTILS_IMPORT_ERROR is not None:
+            self.skipTest(f"Download utils dependencies are not installed in this environment: {DOWNLOAD_UTILS_IMPORT_ERROR}")
+
+    def test_dropped_download_resumes_from_last_byte_with_range(self, _mock_sleep, _mock_logger):
+        server = FakeServer(b"0123456789abcdef", fail_first_after=6)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "video.mp4")
+
+            written = download_to_file(file_path, server.open)
+
+            self.assertEqual(written, 16)
+            self.assertEqual(Path(file_path).read_bytes(), b"0123456789abcdef")
+            self.assertFalse(os.path.exists(f"{file_path}.part"))
+        self.assertEqual(server.requests, [{}, {"Range": "bytes=6-"}])
+
+    def test_download_restarts_when_server_ignores_range(self, _mock_sleep, _mock_logger):
+        server = FakeServer(b"0123456789abcdef", supports_ranges=False, fail_first_after=6)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "video.mp4")
+
+            download_to_file(file_path, server.open)
+
+            self.assertEqual(Path(file_path).read_bytes(), b"0123456789abcdef")
+
+    def test_large_download_is_fetched_in_parallel_segments(self, _mock_sleep, _mock_logger):
+        body = bytes(range(256)) * 4
+        server = FakeServer(body, fail_first_after=None)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "video.mp4")
+
+            written = download_to_file(file_path, server.open, parallel_segments=4, segment_min_bytes=100)
+
+            self.assertEqual(written, len(body))
+            self.assertEqual(Path(file_path).read_bytes(), body)
+        self.assertEqual(
+            sorted(request.get("Range", "") for request in server.requests),
+            ["", "bytes=0-255", "bytes=256-511", "bytes=512-767", "bytes=768-1023"],
+        )
+
+    def test_failed_download_leaves_no_partial_file(self, _mock_sleep, _mock_logger):
+        def open_response(extra_headers):
+            return FakeResponse(b"0123456789", headers={"Content-Length": "10"}, fail_after=4)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "photo.jpg")
+
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                download_to_file(file_path, open_response, max_resume_attempts=2)
+
+            self.assertEqual(os.listdir(temp_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import sys
 import tempfile
 import unittest
@@ -112,6 +113,82 @@ class TestExclusionPatterns(unittest.TestCase):
         self.assertTrue((unzip_root / "Album" / "Test File.jpg").exists())
         runtime_logger.info.assert_any_call("[test] Unzipping: sample.zip")
 
+    def test_sanitize_and_unpack_zips_extracts_archives_in_parallel_with_deterministic_collision_names(self):
+        for part, payloads in (("takeout-002.zip", (b"b1", b"b2")), ("takeout-001.zip", (b"a1", b"a2"))):
+            with zipfile.ZipFile(self.root / part, "w") as zip_ref:
+                zip_ref.writestr("Takeout/Album/photo?.jpg", payloads[0])
+                zip_ref.writestr("Takeout/Album/photo:.jpg", payloads[1])
+
+        unzip_root = self.root / "unzipped"
+        with patch.object(FileUtils.GV, "LOGGER", MagicMock()):
+            FileUtils.sanitize_and_unpack_zips(
+                input_folder=str(self.root),
+                unzip_folder=str(unzip_root),
+                max_workers=2,
+            )
+
+        album = unzip_root / "Takeout" / "Album"
+        self.assertEqual(
+            {path.name: path.read_bytes() for path in album.iterdir()},
+            {
+                "photo_.jpg": b"a1",
+                "photo_ (2).jpg": b"a2",
+                "photo_ (3).jpg": b"b1",
+                "photo_ (4).jpg": b"b2",
+            },
+        )
+
+    def test_sanitize_and_unpack_zips_extracts_identical_members_once_and_links_the_copies(self):
+        with zipfile.ZipFile(self.root / "takeout-001.zip", "w") as zip_ref:
+            zip_ref.writestr("Takeout/Google Photos/Photos from 2024/photo.jpg", b"same photo")
+            zip_ref.writestr("Takeout/Google Photos/Photos from 2024/photo.jpg.json", b"{}")
+        with zipfile.ZipFile(self.root / "takeout-002.zip", "w") as zip_ref:
+            zip_ref.writestr("Takeout/Google Photos/Trip/photo.jpg", b"same photo")
+            zip_ref.writestr("Takeout/Google Photos/Trip/photo.jpg.json", b"{}")
+            zip_ref.writestr("Takeout/Google Photos/Trip/other.jpg", b"other photo")
+
+        unzip_root = self.root / "unzipped"
+        with patch.object(FileUtils.GV, "LOGGER", MagicMock()):
+            stats = FileUtils.sanitize_and_unpack_zips(
+                input_folder=str(self.root),
+                unzip_folder=str(unzip_root),
+                max_workers=2,
+                dedupe=True,
+            )
+
+        photos = unzip_root / "Takeout" / "Google Photos"
+        year_copy = photos / "Photos from 2024" / "photo.jpg"
+        album_copy = photos / "Trip" / "photo.jpg"
+        self.assertEqual(album_copy.read_bytes(), b"same photo")
+        self.assertTrue(os.path.samefile(year_copy, album_copy))
+        self.assertEqual((photos / "Trip" / "other.jpg").read_bytes(), b"other photo")
+        self.assertFalse(os.path.samefile(photos / "Trip" / "photo.jpg.json", photos / "Photos from 2024" / "photo.jpg.json"))
+        self.assertEqual(stats, {"linked": 1, "linked_bytes": len(b"same photo")})
+
+    def test_merge_folders_keeps_identical_files_once_and_retargets_album_symlinks(self):
+        src = self.root / "new_output"
+        dst = self.root / "previous_output"
+        for folder in (src, dst):
+            (folder / "ALL_PHOTOS" / "2024").mkdir(parents=True)
+            (folder / "Albums" / "Trip").mkdir(parents=True)
+        (dst / "ALL_PHOTOS" / "2024" / "same.jpg").write_bytes(b"same")
+        (dst / "ALL_PHOTOS" / "2024" / "name.jpg").write_bytes(b"old")
+        (src / "ALL_PHOTOS" / "2024" / "same.jpg").write_bytes(b"same")
+        (src / "ALL_PHOTOS" / "2024" / "name.jpg").write_bytes(b"new")
+        (src / "Albums" / "Trip" / "name.jpg").symlink_to(Path("..", "..", "ALL_PHOTOS", "2024", "name.jpg"))
+
+        with patch.object(FileUtils.GV, "LOGGER", MagicMock()):
+            counters = FileUtils.merge_folders(str(src), str(dst))
+
+        self.assertFalse(src.exists())
+        self.assertEqual((dst / "ALL_PHOTOS" / "2024" / "same.jpg").read_bytes(), b"same")
+        self.assertEqual((dst / "ALL_PHOTOS" / "2024" / "name.jpg").read_bytes(), b"old")
+        self.assertEqual((dst / "ALL_PHOTOS" / "2024" / "name (2).jpg").read_bytes(), b"new")
+        album_link = dst / "Albums" / "Trip" / "name.jpg"
+        self.assertTrue(album_link.is_symlink())
+        self.assertEqual(album_link.read_bytes(), b"new")
+        self.assertEqual(counters, {"moved": 1, "identical": 1, "renamed": 1, "symlinks": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
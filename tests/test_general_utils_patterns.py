@@ -1,9 +1,12 @@
+import hashlib
 import sys
 import types
 import unittest
 from zoneinfo import ZoneInfo
 import logging
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -43,6 +46,10 @@ try:
         scan_album_consolidation_groups,
         print_album_consolidation_preview,
         print_remove_albums_preview,
+        sha1_checksum,
+        clear_sha1_checksum_cache,
+        run_transfers_in_pool,
+        run_downloads_in_pool,
     )
     GENERAL_UTILS_IMPORT_ERROR = None
 except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
@@ -647,6 +654,64 @@ class TestGeneralUtilsPatterns(unittest.TestCase):
         with patch.object(GV, "ARGS", {"filter-by-type": "photos"}):
             self.assertTrue(has_any_filter())
 
+    def test_sha1_checksum_hashes_unchanged_file_once_and_rehashes_after_change(self):
+        clear_sha1_checksum_cache()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "asset.jpg"
+            file_path.write_bytes(b"first content")
+
+            with patch("Utils.GeneralUtils.hashlib.sha1", wraps=hashlib.sha1) as mock_sha1:
+                first = sha1_checksum(str(file_path))
+                self.assertEqual(sha1_checksum(str(file_path)), first)
+                self.assertEqual(mock_sha1.call_count, 1)
+
+                file_path.write_bytes(b"other content")
+                second = sha1_checksum(str(file_path))
+
+            self.assertEqual(mock_sha1.call_count, 2)
+            self.assertNotEqual(second, first)
+            self.assertEqual(second[0], hashlib.sha1(b"other content").hexdigest())
+
+    def test_run_transfers_in_pool_runs_concurrently_and_keeps_task_order(self):
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def transfer(task):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.01 * (5 - task))
+            with lock:
+                active["now"] -= 1
+            return task * 10
+
+        results = run_transfers_in_pool(range(5), transfer, max_workers=3, desc="Uploading")
+
+        self.assertEqual(results, [0, 10, 20, 30, 40])
+        self.assertEqual(active["max"], 3)
+
+    def test_run_downloads_in_pool_serializes_downloads_to_the_same_file(self):
+        calls = []
+        lock = threading.Lock()
+
+        def pull_asset(asset_id, asset_filename, download_folder):
+            with lock:
+                calls.append((threading.get_ident(), asset_id))
+            return 1
+
+        downloads = [
+            {"asset_id": "a1", "asset_filename": "IMG_1.jpg", "download_folder": "Album"},
+            {"asset_id": "a2", "asset_filename": "IMG_2.jpg", "download_folder": "Album"},
+            {"asset_id": "a3", "asset_filename": "IMG_1.jpg", "download_folder": "Album"},
+        ]
+
+        downloaded = run_downloads_in_pool(downloads, pull_asset, max_workers=4, desc="Downloading")
+
+        self.assertEqual(downloaded, 3)
+        same_file_calls = [call for call in calls if call[1] in {"a1", "a3"}]
+        self.assertEqual([asset_id for _, asset_id in same_file_calls], ["a1", "a3"])
+        self.assertEqual(same_file_calls[0][0], same_file_calls[1][0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -108,7 +108,7 @@ class TestGooglePhotosUnit(unittest.TestCase):
         manager = self._build_manager()
         manager.get_albums_owned_by_user = MagicMock(return_value=[])
         manager.create_album = MagicMock(side_effect=["album-1", "album-2"])
-        manager.push_asset = MagicMock(side_effect=[("media-1", False), ("media-1", True)])
+        manager._push_assets = MagicMock(side_effect=[[("media-1", False)], [("media-1", True)]])
         manager.add_assets_to_album = MagicMock(return_value=1)
 
         with (
@@ -132,13 +132,12 @@ class TestGooglePhotosUnit(unittest.TestCase):
         self.assertEqual(skipped_albums, 0)
         self.assertEqual(uploaded_assets, 1)
         self.assertEqual(duplicate_assets, 1)
-        self.assertEqual(manager.add_assets_to_album.call_count, 2)
-        first_call = manager.add_assets_to_album.call_args_list[0].kwargs
-        second_call = manager.add_assets_to_album.call_args_list[1].kwargs
-        self.assertEqual(first_call["album_id"], "album-1")
-        self.assertEqual(first_call["asset_ids"], ["media-1"])
-        self.assertEqual(second_call["album_id"], "album-2")
-        self.assertEqual(second_call["asset_ids"], ["media-1"])
+        # The new item is added to album-1 by batchCreate; the duplicate is added to album-2 by id.
+        self.assertEqual(manager._push_assets.call_args_list[0].kwargs["album_id"], "album-1")
+        self.assertEqual(manager._push_assets.call_args_list[1].kwargs["album_id"], "album-2")
+        manager.add_assets_to_album.assert_called_once()
+        self.assertEqual(manager.add_assets_to_album.call_args.kwargs["album_id"], "album-2")
+        self.assertEqual(manager.add_assets_to_album.call_args.kwargs["asset_ids"], ["media-1"])
 
     @patch("Features.GooglePhotos.ClassGooglePhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
     def test_push_albums_reuses_similar_existing_album_when_flag_enabled(self, _mock_tqdm):
@@ -147,7 +146,7 @@ class TestGooglePhotosUnit(unittest.TestCase):
             return_value=[{"id": "album-existing", "albumName": "2026-07-06 - Viaje a Roma"}]
         )
         manager.create_album = MagicMock()
-        manager.push_asset = MagicMock(return_value=("media-1", False))
+        manager._push_assets = MagicMock(return_value=[("media-1", False)])
         manager.add_assets_to_album = MagicMock(return_value=1)
 
         with (
@@ -170,15 +169,16 @@ class TestGooglePhotosUnit(unittest.TestCase):
         self.assertEqual(uploaded_assets, 1)
         self.assertEqual(duplicate_assets, 0)
         manager.create_album.assert_not_called()
-        manager.add_assets_to_album.assert_called_once()
-        self.assertEqual(manager.add_assets_to_album.call_args.kwargs["album_id"], "album-existing")
+        manager._push_assets.assert_called_once()
+        self.assertEqual(manager._push_assets.call_args.kwargs["album_id"], "album-existing")
+        manager.add_assets_to_album.assert_not_called()
 
     @patch("Features.GooglePhotos.ClassGooglePhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
     def test_push_albums_normalizes_new_album_name_when_flag_enabled_even_without_existing_redundancy(self, _mock_tqdm):
         manager = self._build_manager()
         manager.get_albums_owned_by_user = MagicMock(return_value=[])
         manager.create_album = MagicMock(return_value="album-new")
-        manager.push_asset = MagicMock(return_value=("media-1", False))
+        manager._push_assets = MagicMock(return_value=[("media-1", False)])
         manager.add_assets_to_album = MagicMock(return_value=1)
 
         with (
@@ -203,7 +203,7 @@ class TestGooglePhotosUnit(unittest.TestCase):
         manager = self._build_manager()
         manager.get_albums_owned_by_user = MagicMock(return_value=[])
         manager.create_album = MagicMock(return_value="album-new")
-        manager.push_asset = MagicMock(return_value=("media-1", False))
+        manager._push_assets = MagicMock(return_value=[("media-1", False)])
         manager.add_assets_to_album = MagicMock(return_value=1)
 
         with (
@@ -223,6 +223,87 @@ class TestGooglePhotosUnit(unittest.TestCase):
 
         manager.create_album.assert_called_once_with(album_name="Huelva_1", log_level=unittest.mock.ANY)
 
+    @patch("Features.GooglePhotos.ClassGooglePhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
+    def test_push_assets_uploads_in_parallel_and_creates_items_in_batches_of_50(self, _mock_tqdm):
+        manager = self._build_manager()
+        manager._require_session = MagicMock()
+        manager._remember_uploaded_media_item_id = MagicMock()
+        file_paths = [f"/photos/photo_{index:02d}.jpg" for index in range(53)]
+
+        def create_upload_token(file_path):
+            if file_path.endswith("photo_07.jpg"):
+                raise RuntimeError("connection reset")
+            return f"token-{os.path.basename(file_path)}"
+
+        def batch_create(method, url, expected=(200,), json=None):
+            results = []
+            for item in json["newMediaItems"]:
+                token = item["simpleMediaItem"]["uploadToken"]
+                if token == "token-photo_30.jpg":
+                    results.append({"uploadToken": token, "status": {"code": 3, "message": "Invalid media"}})
+                else:
+                    results.append({"uploadToken": token, "status": {"message": "Success"}, "mediaItem": {"id": token.replace("token-", "media-")}})
+            response = MagicMock()
+            # Results are not guaranteed to come back in request order.
+            response.json.return_value = {"newMediaItemResults": list(reversed(results))}
+            return response
+
+        manager._create_upload_token = MagicMock(side_effect=create_upload_token)
+        manager._request = MagicMock(side_effect=batch_create)
+
+        with patch("Features.GooglePhotos.ClassGooglePhotos.LOGGER", MagicMock()) as mock_logger:
+            results = manager._push_assets(file_paths, album_id="album-1")
+
+        self.assertEqual(manager._request.call_count, 2)
+        first_payload = manager._request.call_args_list[0].kwargs["json"]
+        second_payload = manager._request.call_args_list[1].kwargs["json"]
+        self.assertEqual(len(first_payload["newMediaItems"]), 50)
+        self.assertEqual(len(second_payload["newMediaItems"]), 2)
+        self.assertEqual(first_payload["albumId"], "album-1")
+        self.assertEqual(len(results), 53)
+        self.assertEqual(results[0], ("media-photo_00.jpg", False))
+        self.assertEqual(results[7], (None, False))
+        self.assertEqual(results[30], (None, False))
+        self.assertEqual(results[52], ("media-photo_52.jpg", False))
+        error_messages = " ".join(call.args[0] for call in mock_logger.error.call_args_list)
+        self.assertIn("photo_07.jpg", error_messages)
+        self.assertIn("photo_30.jpg", error_messages)
+
+
+    @patch("Features.GooglePhotos.ClassGooglePhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
+    def test_push_assets_creates_items_without_album_when_batch_create_rejects_the_album(self, _mock_tqdm):
+        manager = self._build_manager()
+        manager._require_session = MagicMock()
+        manager._remember_uploaded_media_item_id = MagicMock()
+        manager._create_upload_token = MagicMock(side_effect=lambda file_path: f"token-{os.path.basename(file_path)}")
+        manager.add_assets_to_album = MagicMock(return_value=2)
+
+        def batch_create(method, url, expected=(200,), json=None):
+            if "albumId" in json:
+                raise RuntimeError("Google Photos API POST failed (status=400, body=No permission to add media items to this album.)")
+            response = MagicMock()
+            response.json.return_value = {"newMediaItemResults": [
+                {"uploadToken": item["simpleMediaItem"]["uploadToken"], "status": {"message": "Success"},
+                 "mediaItem": {"id": item["simpleMediaItem"]["uploadToken"].replace("token-", "media-")}}
+                for item in json["newMediaItems"]
+            ]}
+            return response
+
+        manager._request = MagicMock(side_effect=batch_create)
+
+        with patch("Features.GooglePhotos.ClassGooglePhotos.LOGGER", MagicMock()):
+            results = manager._push_assets(["/photos/a.jpg", "/photos/b.jpg"], album_id="album-1")
+
+        self.assertEqual(results, [("media-a.jpg", False), ("media-b.jpg", False)])
+        self.assertEqual(manager._request.call_count, 2)
+        retry_payload = manager._request.call_args_list[1].kwargs["json"]
+        self.assertNotIn("albumId", retry_payload)
+        self.assertEqual(
+            [item["simpleMediaItem"]["uploadToken"] for item in retry_payload["newMediaItems"]],
+            ["token-a.jpg", "token-b.jpg"],
+        )
+        manager.add_assets_to_album.assert_called_once_with(album_id="album-1", asset_ids=["media-a.jpg", "media-b.jpg"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ import builtins
 import io
 import json
 import logging
+import os
 import sys
 import tempfile
 import unittest
@@ -113,6 +114,121 @@ class TestGoogleTakeoutHelpers(unittest.TestCase):
         self.assertFalse(detected)
         self.assertFalse(details["is_takeout"])
 
+    def test_pre_process_steps_share_one_tree_index_without_walking_the_disk(self):
+        def snapshot(walker):
+            return sorted((Path(root).as_posix(), sorted(dirs), sorted(files)) for root, dirs, files in walker)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            album_dir = root / "Google Photos" / "Album. "
+            (album_dir / "@eaDir").mkdir(parents=True)
+            (album_dir / "@eaDir" / "thumb.jpg").write_bytes(b"t")
+            (album_dir / "photo?.jpg").write_bytes(b"p")
+            year_dir = root / "Google Photos" / "Photos from 2024"
+            year_dir.mkdir(parents=True)
+            (year_dir / "clip.MP4").write_bytes(b"v")
+            (year_dir / "clip.HEIC").write_bytes(b"i")
+            (year_dir / "clip.HEIC.supplemental-metadata.json").write_text("{}", encoding="utf-8")
+
+            tree_index = takeout_module.FolderTreeIndex(str(root))
+            with patch.object(takeout_module, "LOGGER", MagicMock()), \
+                    patch("os.walk", side_effect=AssertionError("os.walk must not be called")):
+                takeout_module.sanitize_names(str(root), log_level=logging.INFO, tree_index=tree_index)
+                takeout_module.delete_subfolders(str(root), "@eaDir", log_level=logging.INFO, tree_index=tree_index)
+                fixed_videos = takeout_module.fix_mp4_files(str(root), log_level=logging.INFO, tree_index=tree_index)
+                truncations = takeout_module.fix_truncations(str(root), log_level=logging.INFO, tree_index=tree_index)
+
+            self.assertEqual(fixed_videos, 1)
+            self.assertEqual(truncations["total_files"], 5)
+            self.assertTrue((root / "Google Photos" / "Album" / "photo_.jpg").is_file())
+            self.assertFalse((root / "Google Photos" / "Album" / "@eaDir").exists())
+            self.assertTrue((year_dir / "clip.MP4.json").is_file())
+            self.assertEqual(snapshot(tree_index.walk()), snapshot(os.walk(str(root))))
+
+    def test_incremental_plan_skips_recorded_archives_and_members_of_resplit_archives(self):
+        import zipfile
+        from Features.GoogleTakeout.TakeoutManifest import TakeoutManifest
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            takeout_folder = root / "Takeout_zips"
+            takeout_folder.mkdir()
+            previous_output = root / "Takeout_processed"
+            previous_output.mkdir()
+            with zipfile.ZipFile(takeout_folder / "takeout-001.zip", "w") as zip_ref:
+                zip_ref.writestr("Takeout/Google Photos/Photos from 2024/a.jpg", b"a")
+                zip_ref.writestr("Takeout/Google Photos/Photos from 2024/a.jpg.json", b"{}")
+
+            takeout = takeout_module.ClassTakeoutFolder.__new__(takeout_module.ClassTakeoutFolder)
+            takeout.takeout_folder = takeout_folder
+            with patch.object(takeout_module, "resolve_external_path", return_value=str(root / "manifest")), \
+                    patch.object(takeout_module, "LOGGER", MagicMock()):
+                takeout.takeout_zip_inventory = takeout_module.TakeoutZipInventory(takeout_folder)
+                first_plan = takeout.plan_incremental_unzip()
+                takeout.takeout_manifest.record(first_plan["archives"], first_plan["members"], previous_output)
+                takeout.takeout_manifest.close()
+
+                # A new export: the first part again, plus a re-split part holding a known and a new photo
+                with zipfile.ZipFile(takeout_folder / "takeout-002.zip", "w") as zip_ref:
+                    zip_ref.writestr("Takeout/Google Photos/Photos from 2024/a.jpg", b"a")
+                    zip_ref.writestr("Takeout/Google Photos/Photos from 2024/b.jpg", b"b")
+                    zip_ref.writestr("Takeout/Google Photos/Photos from 2024/b.jpg.json", b"{}")
+                takeout.takeout_zip_inventory = takeout_module.TakeoutZipInventory(takeout_folder)
+                second_plan = takeout.plan_incremental_unzip()
+                takeout.takeout_manifest.close()
+
+                manifest = TakeoutManifest(takeout.takeout_manifest.manifest_path)
+                self.assertEqual(manifest.get_output_folder(), str(previous_output))
+                manifest.close()
+
+        self.assertIsNone(first_plan["previous_output"])
+        self.assertFalse(first_plan["nothing_new"])
+        self.assertEqual(len(first_plan["members"]), 2)
+        self.assertEqual(second_plan["previous_output"], str(previous_output))
+        # Only the sidecar is taken again from the recorded part
+        self.assertEqual(second_plan["zip_names"], ["takeout-001.zip", "takeout-002.zip"])
+        self.assertEqual(
+            sorted(info.filename.rsplit("/", 1)[-1] for _, info in second_plan["members"]),
+            ["a.jpg.json", "b.jpg", "b.jpg.json"],
+        )
+        self.assertFalse(second_plan["nothing_new"])
+
+    def test_incremental_plan_extracts_sidecars_of_new_media_from_recorded_archives(self):
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            takeout_folder = root / "Takeout_zips"
+            takeout_folder.mkdir()
+            previous_output = root / "Takeout_processed"
+            previous_output.mkdir()
+            # Google split the sidecar of c.jpg into the first part, and c.jpg itself into a part downloaded later
+            with zipfile.ZipFile(takeout_folder / "takeout-001.zip", "w") as zip_ref:
+                zip_ref.writestr("Takeout/Google Photos/Photos from 2024/a.jpg", b"a")
+                zip_ref.writestr("Takeout/Google Photos/Photos from 2024/a.jpg.json", b"{}")
+                zip_ref.writestr("Takeout/Google Photos/Photos from 2024/c.jpg.json", b"{}")
+
+            takeout = takeout_module.ClassTakeoutFolder.__new__(takeout_module.ClassTakeoutFolder)
+            takeout.takeout_folder = takeout_folder
+            with patch.object(takeout_module, "resolve_external_path", return_value=str(root / "manifest")), \
+                    patch.object(takeout_module, "LOGGER", MagicMock()):
+                takeout.takeout_zip_inventory = takeout_module.TakeoutZipInventory(takeout_folder)
+                first_plan = takeout.plan_incremental_unzip()
+                takeout.takeout_manifest.record(first_plan["archives"], first_plan["members"], previous_output)
+                takeout.takeout_manifest.close()
+
+                with zipfile.ZipFile(takeout_folder / "takeout-002.zip", "w") as zip_ref:
+                    zip_ref.writestr("Takeout/Google Photos/Photos from 2024/c.jpg", b"c")
+                takeout.takeout_zip_inventory = takeout_module.TakeoutZipInventory(takeout_folder)
+                second_plan = takeout.plan_incremental_unzip()
+                takeout.takeout_manifest.close()
+
+        planned = {(zip_name, info.filename.rsplit("/", 1)[-1]) for zip_name, info in second_plan["members"]}
+        self.assertIn(("takeout-002.zip", "c.jpg"), planned)
+        self.assertIn(("takeout-001.zip", "c.jpg.json"), planned)
+        self.assertNotIn(("takeout-001.zip", "a.jpg"), planned)
+        self.assertFalse(second_plan["nothing_new"])
+
     def test_get_output_folder_strips_generated_unzipped_suffix_from_takeout_root(self):
         takeout = takeout_module.ClassTakeoutFolder.__new__(takeout_module.ClassTakeoutFolder)
         takeout.ARGS = {
@@ -76,6 +76,7 @@ if "tzlocal" not in sys.modules:
 
 try:
     from Features.ImmichPhotos.ClassImmichPhotos import ClassImmichPhotos
+    from Features.ImmichPhotos.ImmichInventoryCache import ImmichInventoryCache
     IMMICH_IMPORT_ERROR = None
 except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
     ClassImmichPhotos = None
@@ -114,7 +115,87 @@ class TestImmichPhotosUnit(unittest.TestCase):
     def test_asset_upload_timeout_uses_configured_read_timeout(self):
         self.assertEqual(self.manager._get_asset_upload_timeout(), (10, 1800))
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    def test_worker_sessions_are_pooled_per_thread_and_closed_on_logout(self):
+        self.manager.IMMICH_HTTP_POOL_SIZE = 8
+        self.manager.IMMICH_HTTP_MAX_RETRIES = 2
+        main_session = self.manager._get_worker_session()
+        other_sessions = []
+        worker = threading.Thread(target=lambda: other_sessions.append(self.manager._get_worker_session()))
+        worker.start()
+        worker.join()
+
+        self.assertIs(self.manager._get_worker_session(), main_session)
+        self.assertIsNot(other_sessions[0], main_session)
+        adapter = main_session.get_adapter("https://immich.local/api/assets")
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+        with patch.object(main_session, "close") as mock_close:
+            self.manager._close_worker_sessions()
+        mock_close.assert_called_once_with()
+        self.assertIsNot(self.manager._get_worker_session(), main_session)
+
+    def test_inventory_cache_indexes_names_and_drops_trashed_assets(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImmichInventoryCache(os.path.join(temp_dir, "inventory.sqlite"))
+            cache.apply_page([
+                {"id": "a1", "originalFileName": "IMG_0001.JPG", "fileCreatedAt": "2024-01-01T00:00:00.000Z", "exifInfo": {"fileSizeInByte": 10}},
+                {"id": "a2", "originalFileName": "IMG_0001(1).JPG", "checksum": "abc"},
+                {"id": "a3", "originalFileName": "other.jpg"},
+            ])
+            cache.apply_page([{"id": "a3", "originalFileName": "other.jpg", "isTrashed": True}])
+            cache.finish_sync(datetime(2024, 5, 1, tzinfo=timezone.utc))
+            cache.close()
+
+            cache = ImmichInventoryCache(os.path.join(temp_dir, "inventory.sqlite"))
+            self.assertEqual(cache.count(), 2)
+            self.assertEqual(sorted(asset["id"] for asset in cache.find_by_name("img_0001.jpg")), ["a1", "a2"])
+            cached_by_id = {asset["id"]: asset for asset in cache.find_by_name("IMG_0001.JPG")}
+            self.assertEqual(cached_by_id["a1"]["exifInfo"], {"fileSizeInByte": 10})
+            self.assertEqual(cached_by_id["a2"]["checksum"], "abc")
+            self.assertLess(cache.get_last_sync(), datetime(2024, 5, 1, tzinfo=timezone.utc))
+            cache.remove_assets(["a2"])
+            self.assertEqual([asset["id"] for asset in cache.iter_assets()], ["a1"])
+            cache.close()
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    def test_inventory_cache_refreshes_only_assets_updated_since_last_sync(self, mock_post, _mock_logger):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImmichInventoryCache(os.path.join(temp_dir, "inventory.sqlite"))
+            cache.apply_page([
+                {"id": "kept", "originalFileName": "kept.jpg"},
+                {"id": "trashed", "originalFileName": "trashed.jpg"},
+            ])
+            last_sync = datetime(2024, 5, 1, tzinfo=timezone.utc)
+            cache.finish_sync(last_sync)
+            self.manager.IMMICH_INVENTORY_CACHE = True
+            self.manager._inventory_cache = cache
+
+            search_response = MagicMock(headers={"Date": "Wed, 01 May 2024 12:00:00 GMT"})
+            search_response.json.return_value = {"assets": {"items": [
+                {"id": "new", "originalFileName": "IMG_0002.JPG", "fileCreatedAt": "2024-04-30T10:00:00.000Z"},
+                {"id": "trashed", "originalFileName": "trashed.jpg", "isTrashed": True},
+            ], "nextPage": None}}
+            statistics_response = MagicMock()
+            statistics_response.json.return_value = {"total": 2}
+            mock_post.side_effect = [search_response, statistics_response]
+
+            asset_id = self.manager._resolve_existing_asset_id_from_metadata("IMG_0002.JPG")
+
+            self.assertEqual(asset_id, "new")
+            payload = json.loads(mock_post.call_args_list[0].kwargs["data"])
+            self.assertEqual(payload["updatedAfter"], "2024-04-30T23:59:00+00:00")
+            self.assertTrue(payload["withDeleted"])
+            self.assertEqual(sorted(asset["id"] for asset in cache.iter_assets()), ["kept", "new"])
+            self.assertEqual(cache.get_last_sync(), datetime(2024, 5, 1, 11, 59, tzinfo=timezone.utc))
+            # Later lookups in the same run do not refresh again.
+            self.assertIsNone(self.manager._resolve_existing_asset_id_from_metadata("missing.jpg"))
+            self.assertEqual(mock_post.call_count, 2)
+            cache.close()
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     def test_push_asset_recovers_existing_cached_target_after_transport_failure(self, mock_logger, mock_post):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -140,7 +221,26 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertTrue(is_duplicate)
         self.assertIn("existing target asset was recovered", mock_logger.warning.call_args.args[0])
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    def test_asset_inventory_identities_expose_name_size_time_and_checksum(self):
+        self.manager._all_assets_unfiltered_cache = [{
+            "id": "existing-asset",
+            "originalFileName": "IMG_0001.JPG",
+            "fileCreatedAt": "2024-01-02T03:04:05Z",
+            "checksum": "qUqP5cyxm6YcTAhz05Hph5gvu9M=",
+            "exifInfo": {"fileSizeInByte": 1234},
+        }]
+
+        identities = self.manager.get_asset_inventory_identities()
+
+        self.assertEqual(identities, [{
+            "id": "existing-asset",
+            "filename": "IMG_0001.JPG",
+            "size": 1234,
+            "time": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp(),
+            "checksum": "qUqP5cyxm6YcTAhz05Hph5gvu9M=",
+        }])
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_empty_trash_uses_immich_trash_endpoint(self, mock_post):
         response = MagicMock()
         response.content = b'{"count": 3}'
@@ -202,7 +302,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertIn("could not disambiguate", mock_logger.warning.call_args.args[0])
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_takeout_people_import_records_confirmed_assignment_count(self, mock_put, _mock_logger):
         self.manager._takeout_people_map = {"photo.jpg": [{"people": ["Ana", "Luis"]}]}
         self.manager._takeout_people_import_lock = threading.Lock()
@@ -474,7 +574,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertIn("Not found or no asset.update access", warning)
         self.assertNotIn("asset-2", warning)
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     def test_create_stack_logs_immich_response_body(self, mock_logger, mock_post):
         response = MagicMock()
@@ -507,7 +607,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
 
         self.assertEqual(self.manager._get_album_owner_id(album), "owner-from-v3")
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_get_album_assets_via_search_paginates_and_coerces_page_to_int(self, mock_post):
         first_response = MagicMock()
         first_response.raise_for_status.return_value = None
@@ -535,7 +635,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertIn('"page": 1', first_payload)
         self.assertIn('"page": 2', second_payload)
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_get_assets_by_filters_paginates_with_immich_string_next_page(self, mock_post):
         self.manager.all_assets_filtered = None
         self.manager.type = None
@@ -570,8 +670,44 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertEqual(assets[1]["time"], "2025-12-02T00:00:00Z")
         self.assertEqual(assets[1]["filename"], "two.jpg")
 
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    def test_iter_all_assets_without_albums_pages_yields_each_search_page(self, _mock_logger, mock_post):
+        self.manager.assets_without_albums_filtered = None
+        self.manager.type = None
+        self.manager.from_date = None
+        self.manager.to_date = None
+        self.manager.country = None
+        self.manager.city = None
+        self.manager.person = None
+
+        first_response = MagicMock()
+        first_response.json.return_value = {
+            "assets": {
+                "items": [{"id": "a1", "fileCreatedAt": "2025-12-01T00:00:00Z", "originalFileName": "one.jpg"}],
+                "nextPage": "2",
+            }
+        }
+        second_response = MagicMock()
+        second_response.json.return_value = {
+            "assets": {
+                "items": [{"id": "a2", "fileCreatedAt": "2025-12-02T00:00:00Z", "originalFileName": "two.jpg"}],
+                "nextPage": None,
+            }
+        }
+        mock_post.side_effect = [first_response, second_response]
+
+        pages = self.manager.iter_all_assets_without_albums_pages()
+        first_page = next(pages)
+
+        self.assertEqual([asset["id"] for asset in first_page], ["a1"])
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertTrue(json.loads(mock_post.call_args.kwargs["data"])["isNotInAlbum"])
+        self.assertEqual([[asset["id"] for asset in page] for page in pages], [["a2"]])
+        self.assertEqual([asset["id"] for asset in self.manager.assets_without_albums_filtered], ["a1", "a2"])
+
     @patch("Features.ImmichPhotos.ClassImmichPhotos.tqdm")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     def test_unfiltered_asset_inventory_uses_large_pages_and_reports_progress(self, _mock_logger, mock_post, mock_tqdm):
         statistics_response = MagicMock()
@@ -604,7 +740,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         progress_bar.update.assert_called_once_with(1)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.time.sleep")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     def test_unfiltered_asset_inventory_retries_a_closed_connection(self, _mock_logger, mock_post, mock_sleep):
         response = MagicMock()
@@ -624,7 +760,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertEqual(mock_post.call_args.kwargs["timeout"], self.manager.IMMICH_ASSET_INVENTORY_TIMEOUT)
         mock_sleep.assert_called_once_with(1)
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_unfiltered_asset_inventory_coalesces_concurrent_requests(self, mock_post):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -664,7 +800,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.has_any_filter", return_value=False)
     @patch.object(ClassImmichPhotos, "_get_album_assets_via_search")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_get_all_assets_from_album_falls_back_to_search_when_inline_assets_missing(
         self, mock_get, mock_search, _mock_filters
     ):
@@ -682,7 +818,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         mock_search.assert_called_once_with("album-1", log_level=None)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.has_any_filter", return_value=False)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_get_albums_owned_by_user_uses_v3_owner_resolution(self, mock_get, _mock_filters):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -706,7 +842,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertEqual([album["id"] for album in albums], ["owned"])
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.has_any_filter", return_value=False)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_get_albums_owned_by_user_ignores_unknown_owner_when_user_id_missing(self, mock_get, _mock_filters):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -725,7 +861,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertEqual(albums, [])
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_add_assets_to_album_treats_duplicate_failures_as_already_associated(self, mock_put, mock_logger):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -740,7 +876,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         mock_logger.warning.assert_not_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_add_assets_to_album_warns_only_for_non_duplicate_failures(self, mock_put, mock_logger):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -759,7 +895,7 @@ class TestImmichPhotosUnit(unittest.TestCase):
         self.assertIn("confirmed 2/3", warning_message)
         self.assertIn("permission denied", warning_message)
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_remove_assets_from_album_removes_memberships_without_deleting_assets(self, mock_delete):
         response = MagicMock()
         response.raise_for_status.return_value = None
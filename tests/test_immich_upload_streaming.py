@@ -2,6 +2,7 @@ import os
 import json
 import sys
 import tempfile
+import threading
 import types
 import unittest
 from datetime import datetime, timezone
@@ -77,7 +78,10 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 
+import Features.ImmichPhotos.ClassImmichPhotos as ClassImmichPhotosModule
 from Features.ImmichPhotos.ClassImmichPhotos import ClassImmichPhotos
+from Utils.GeneralUtils import sha1_checksum
+from Utils.StreamUtils import ResponseBodyStream, get_response_content_length
 
 
 class TestImmichStreamingUpload(unittest.TestCase):
@@ -91,11 +95,13 @@ class TestImmichStreamingUpload(unittest.TestCase):
         manager.SESSION_TOKEN = None
         manager.HEADERS_WITH_CREDENTIALS = {"x-api-key": "test-api-key"}
         manager.login = lambda log_level=None: True
+        # These tests exercise the upload itself; the bulk upload check has its own tests.
+        manager._bulk_upload_check_supported = False
         return manager
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     @patch("Features.ImmichPhotos.ClassImmichPhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_remove_duplicates_by_name_and_size_keeps_oldest_upload(self, mock_delete, _mock_tqdm, _mock_logger):
         manager = self._build_manager()
         response = MagicMock()
@@ -133,7 +139,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     @patch("Features.ImmichPhotos.ClassImmichPhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_manual_duplicate_cleanup_batches_deletions_across_groups(self, mock_delete, _mock_tqdm, _mock_logger):
         manager = self._build_manager()
         response = MagicMock()
@@ -165,7 +171,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_group_metadata_is_loaded_only_for_candidates(self, mock_get, _mock_logger):
         manager = self._build_manager()
         response = MagicMock()
@@ -191,7 +197,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.tqdm")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     def test_unfiltered_inventory_fetches_known_pages_in_parallel(self, _mock_logger, mock_post, mock_tqdm):
         manager = self._build_manager()
@@ -277,7 +283,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(keeper["id"], "native-people")
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_native_duplicate_detection_preserves_immich_quality_suggestion(self, mock_get, _mock_logger):
         manager = self._build_manager()
         response = MagicMock()
@@ -306,7 +312,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_merge_duplicate_metadata_preserves_visibility_date_and_location(
         self, mock_put, _mock_logger
     ):
@@ -341,7 +347,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_merge_duplicate_metadata_does_not_copy_conflicting_location(
         self, mock_put, _mock_logger
     ):
@@ -362,7 +368,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertFalse(mock_put.called)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.put")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.put")
     def test_merge_duplicate_metadata_does_not_send_invalid_zero_rating(
         self, mock_put, _mock_logger
     ):
@@ -377,7 +383,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         mock_put.assert_not_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_guarded_duplicate_cleanup_trashes_only_after_successful_merge(self, mock_delete, _mock_logger):
         manager = self._build_manager()
         manager.login = MagicMock(return_value=True)
@@ -400,7 +406,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         })
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_guarded_duplicate_cleanup_never_deletes_when_keeper_merge_verification_fails(self, mock_delete, _mock_logger):
         manager = self._build_manager()
         manager.login = MagicMock(return_value=True)
@@ -418,8 +424,8 @@ class TestImmichStreamingUpload(unittest.TestCase):
         mock_delete.assert_not_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_merge_duplicate_stacks_recreates_stack_with_keeper_and_survivors(
         self, mock_get, mock_post, _mock_logger
     ):
@@ -449,8 +455,8 @@ class TestImmichStreamingUpload(unittest.TestCase):
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     @patch("Features.ImmichPhotos.ClassImmichPhotos.time.sleep")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_merge_duplicate_stacks_retries_transient_connection_reset(
         self, mock_get, mock_post, mock_sleep, _mock_logger
     ):
@@ -470,8 +476,8 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(mock_post.call_count, 2)
         mock_sleep.assert_called_once_with(1)
 
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_merge_duplicate_stacks_does_not_recreate_stack_for_redundant_child(
         self, mock_get, mock_post
     ):
@@ -488,7 +494,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         mock_post.assert_not_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_merge_duplicate_stacks_reports_asset_names_and_immich_error_body(
         self, mock_get, mock_logger
     ):
@@ -513,7 +519,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertNotIn("stack-1", warning)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_merge_duplicate_stacks_skips_group_when_stack_assets_cannot_be_verified(
         self, mock_get, mock_logger
     ):
@@ -547,7 +553,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertNotIn("stack-1", warning)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_display_names_resolves_album_tag_and_person_names(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -580,7 +586,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_display_names_falls_back_to_candidate_person_lookup(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -604,7 +610,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(mock_get.call_args_list[3].args[0], "http://immich.local/api/people/person-1")
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_display_names_retries_legacy_people_pagination(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -629,7 +635,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(mock_get.call_args_list[3].kwargs["params"], {"page": 1})
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_hydration_loads_album_memberships(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -652,7 +658,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_hydration_resolves_people_through_faces(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -685,7 +691,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
     @patch("Features.ImmichPhotos.ClassImmichPhotos.tqdm", side_effect=lambda iterable, **kwargs: iterable)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.delete")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.delete")
     def test_manual_duplicate_cleanup_skips_repeated_asset_ids(self, mock_delete, _mock_tqdm, _mock_logger):
         manager = self._build_manager()
 
@@ -697,7 +703,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         mock_delete.assert_not_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.get")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.get")
     def test_duplicate_metadata_hydration_resolves_scalar_people_ids_through_faces(self, mock_get, _mock_logger):
         manager = self._build_manager()
 
@@ -718,7 +724,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(hydrated["people"], [{"id": "person-1", "name": "Yoli"}])
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_immich_native_duplicate_resolution_uses_selected_keeper(self, mock_post, _mock_logger):
         manager = self._build_manager()
         response = MagicMock()
@@ -746,7 +752,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         )
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_uses_streaming_multipart_without_files_arg(
         self, mock_post, _mock_logger
     ):
@@ -774,7 +780,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertEqual(kwargs["timeout"], manager.IMMICH_ASSET_UPLOAD_TIMEOUT)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_attaches_sidecar_in_multipart_fields(
         self, mock_post, _mock_logger
     ):
@@ -799,7 +805,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertIn("sidecarData", encoder.fields)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_returns_existing_id_for_duplicate_response(
         self, mock_post, _mock_logger
     ):
@@ -821,7 +827,102 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertTrue(is_duplicated)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    def test_push_asset_skips_upload_of_assets_found_by_bulk_upload_check(self, mock_post, _mock_logger):
+        manager = self._build_manager()
+        manager._bulk_upload_check_supported = True
+        manager.IMMICH_BULK_UPLOAD_CHECK_BATCH_SIZE = 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for index in range(3):
+                path = os.path.join(tmpdir, f"photo{index}.jpg")
+                with open(path, "wb") as f:
+                    f.write(f"binary-data-{index}".encode())
+                paths.append(path)
+
+            def bulk_check(url, **kwargs):
+                self.assertEqual(url, "http://immich.local/api/assets/bulk-upload-check")
+                assets = json.loads(kwargs["data"])["assets"]
+                response = MagicMock(status_code=200)
+                response.json.return_value = {
+                    "results": [
+                        {"id": asset["id"], "action": "reject", "reason": "duplicate", "assetId": "existing-0"}
+                        if asset["checksum"] == sha1_checksum(paths[0])[0]
+                        else {"id": asset["id"], "action": "accept"}
+                        for asset in assets
+                    ]
+                }
+                return response
+
+            mock_post.side_effect = bulk_check
+            existing = manager.check_existing_assets(paths)
+            self.assertEqual(existing, {paths[0]: "existing-0"})
+            self.assertEqual(mock_post.call_count, 2)
+
+            asset_id, is_duplicated = manager.push_asset(paths[0])
+
+        self.assertEqual((asset_id, is_duplicated), ("existing-0", True))
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    def test_bulk_upload_check_batcher_coalesces_concurrent_lookups(self, _mock_logger):
+        sent_batches = []
+
+        def send_batch(checksums):
+            sent_batches.append(list(checksums))
+            return {"c1": "asset-1"}
+
+        batcher = ClassImmichPhotosModule._BulkUploadCheckBatcher(send_batch, batch_size=3, max_wait_seconds=0.2)
+        results = {}
+        threads = [
+            threading.Thread(target=lambda checksum=checksum: results.update({checksum: batcher.lookup(checksum)}))
+            for checksum in ("c1", "c2", "c3", "c4")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(results, {"c1": "asset-1", "c2": None, "c3": None, "c4": None})
+        self.assertEqual(sorted(len(batch) for batch in sent_batches), [1, 3])
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.ARGS", {"create-stacks": False})
+    @patch("Utils.GeneralUtils.tqdm", side_effect=lambda iterable, **kwargs: iterable)
+    def test_push_no_albums_uploads_in_worker_pool_and_pairs_live_photos_first(self, _mock_tqdm, _mock_logger):
+        manager = self._build_manager()
+        manager.ALLOWED_IMMICH_PHOTO_EXTENSIONS = [".jpg"]
+        manager.ALLOWED_IMMICH_VIDEO_EXTENSIONS = [".mov"]
+        manager.ALLOWED_IMMICH_EXTENSIONS = [".jpg", ".mov"]
+        manager.IMMICH_MAX_PARALLEL_UPLOADS = 3
+        upload_threads = set()
+        lock = threading.Lock()
+
+        def push_asset(file_path, log_level=None):
+            with lock:
+                upload_threads.add(threading.get_ident())
+            return f"id-{os.path.basename(file_path)}", os.path.basename(file_path) == "dup.jpg"
+
+        manager.push_asset = MagicMock(side_effect=push_asset)
+        manager.push_live_photo = MagicMock(return_value=("id-live.jpg", False))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("live.jpg", "live.mov", "b.jpg", "c.jpg", "dup.jpg", "notes.txt"):
+                with open(os.path.join(tmpdir, name), "wb") as f:
+                    f.write(name.encode())
+
+            uploaded, skipped, _removed = manager.push_no_albums(tmpdir)
+
+            manager.push_live_photo.assert_called_once()
+            self.assertEqual(manager.push_live_photo.call_args.kwargs["live_photo_video_path"], os.path.join(tmpdir, "live.mov"))
+            pushed = sorted(os.path.basename(call.args[0]) for call in manager.push_asset.call_args_list)
+            self.assertEqual(pushed, ["b.jpg", "c.jpg", "dup.jpg"])
+        self.assertEqual((uploaded, skipped), (3, 1))
+        self.assertTrue(all(thread != threading.get_ident() for thread in upload_threads))
+
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_rejects_duplicate_response_without_existing_id(
         self, mock_post, mock_logger
     ):
@@ -847,7 +948,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         mock_logger.error.assert_called()
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_resolves_existing_id_from_remote_search_for_preexisting_duplicate(
         self, mock_post, _mock_logger
     ):
@@ -889,7 +990,7 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertTrue(is_duplicated)
 
     @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
-    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.post")
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
     def test_push_asset_reuses_cached_existing_id_for_duplicate_response_without_id(
         self, mock_post, _mock_logger
     ):
@@ -912,5 +1013,64 @@ class TestImmichStreamingUpload(unittest.TestCase):
         self.assertTrue(is_duplicated)
 
 
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.LOGGER", new_callable=MagicMock)
+    @patch("Features.ImmichPhotos.ClassImmichPhotos.requests.Session.post")
+    def test_push_asset_stream_uploads_source_stream_with_capture_time(
+        self, mock_post, _mock_logger
+    ):
+        manager = self._build_manager()
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {"id": "asset-id", "status": "created"}
+        mock_post.return_value = response
+        source_response = MagicMock()
+        source_response.iter_content.return_value = iter([b"binary-", b"data"])
+        asset_stream = ResponseBodyStream(source_response, 11)
+
+        asset_id, is_duplicated = manager.push_asset_stream(asset_stream, "photo.jpg", 1577934245)
+
+        self.assertEqual((asset_id, is_duplicated), ("asset-id", False))
+        encoder = mock_post.call_args.kwargs["data"]
+        self.assertIsInstance(encoder, MultipartEncoder)
+        self.assertEqual(encoder.fields["fileSize"], "11")
+        self.assertEqual(
+            encoder.fields["fileCreatedAt"],
+            datetime.fromtimestamp(1577934245).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        )
+        self.assertIs(encoder.fields["assetData"][1], asset_stream)
+
+    def test_push_asset_stream_rejects_unsupported_extension(self):
+        manager = self._build_manager()
+
+        self.assertEqual(manager.push_asset_stream(MagicMock(len=3), "notes.txt", 0), (None, None))
+
+    def test_response_body_stream_reads_exact_length_across_chunks(self):
+        source_response = MagicMock()
+        source_response.iter_content.return_value = iter([b"abc", b"defg", b"h"])
+        stream = ResponseBodyStream(source_response, 8)
+
+        self.assertEqual(stream.read(2), b"ab")
+        self.assertEqual(stream.tell(), 2)
+        self.assertEqual(stream.read(), b"cdefgh")
+        self.assertEqual(stream.read(), b"")
+        stream.close()
+        source_response.close.assert_called_once()
+
+    def test_response_body_stream_raises_when_body_is_shorter_than_announced(self):
+        source_response = MagicMock()
+        source_response.iter_content.return_value = iter([b"abc"])
+        stream = ResponseBodyStream(source_response, 5)
+
+        with self.assertRaises(IOError):
+            stream.read()
+
+    def test_response_content_length_is_ignored_for_encoded_bodies(self):
+        self.assertEqual(get_response_content_length(MagicMock(headers={"Content-Length": "42"})), 42)
+        self.assertIsNone(get_response_content_length(
+            MagicMock(headers={"Content-Length": "42", "Content-Encoding": "gzip"})
+        ))
+        self.assertIsNone(get_response_content_length(MagicMock(headers={})))
+
+
 if __name__ == "__main__":
     unittest.main()
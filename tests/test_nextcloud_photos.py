@@ -0,0 +1,136 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+try:
+    from Features.NextCloudPhotos.ClassNextCloudPhotos import ClassNextCloudPhotos
+    from Features.NextCloudPhotos.NextCloudListingCache import NextCloudListingCache
+    NEXTCLOUD_IMPORT_ERROR = None
+except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
+    ClassNextCloudPhotos = None
+    NEXTCLOUD_IMPORT_ERROR = exc
+
+
+SEARCH_RESPONSE = """<?xml version="1.0"?>
+<d:multistatus xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns">
+  <d:response>
+    <d:href>/remote.php/dav/files/user/Photos/ALL_Photos/2024/</d:href>
+    <d:propstat><d:prop><d:resourcetype><d:collection/></d:resourcetype><d:getetag>"etag-2024"</d:getetag></d:prop></d:propstat>
+  </d:response>
+  <d:response>
+    <d:href>/remote.php/dav/files/user/Photos/ALL_Photos/2024/IMG_0001.jpg</d:href>
+    <d:propstat><d:prop><d:resourcetype/><d:getcontentlength>1234</d:getcontentlength><d:getetag>"etag-img"</d:getetag></d:prop></d:propstat>
+  </d:response>
+  <d:response>
+    <d:href>/remote.php/dav/files/user/Photos/ALL_Photos/top.mp4</d:href>
+    <d:propstat><d:prop><d:resourcetype/><d:getcontentlength>99</d:getcontentlength></d:prop></d:propstat>
+  </d:response>
+</d:multistatus>
+"""
+
+
+class FakeDavTree:
+    """Answers _propfind() for an in-memory folder tree: {folder: {"etag": ..., "dirs": [...], "files": [...]}}."""
+
+    def __init__(self, folders):
+        self.folders = folders
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def propfind(self, remote_path, depth=1, namespace="files", session=None):
+        path = remote_path.rstrip("/") or "/"
+        with self._lock:
+            self.calls.append((path, depth))
+        folder = self.folders.get(path)
+        if folder is None:
+            raise RuntimeError(f"NextCloud WebDAV PROPFIND failed for '{path}' (status=404, body=)")
+        entries = [{"path": f"{path}/", "name": os.path.basename(path), "is_dir": "true", "etag": folder["etag"]}]
+        if depth == 0:
+            return entries
+        for subfolder in folder.get("dirs", []):
+            entries.append({"path": f"{subfolder}/", "name": os.path.basename(subfolder), "is_dir": "true", "etag": self.folders[subfolder]["etag"]})
+        for name in folder.get("files", []):
+            entries.append({"path": f"{path}/{name}", "name": name, "is_dir": "false", "size": "1", "etag": f"file-{name}"})
+        return entries
+
+
+class TestNextCloudListing(unittest.TestCase):
+    def setUp(self):
+        if NEXTCLOUD_IMPORT_ERROR is not None:
+            self.skipTest(f"NextCloud dependencies are not installed in this environment: {NEXTCLOUD_IMPORT_ERROR}")
+
+    def _build_manager(self):
+        manager = ClassNextCloudPhotos.__new__(ClassNextCloudPhotos)
+        manager.base_url = "http://nextcloud.local"
+        manager.username = "user"
+        manager.session = MagicMock()
+        manager._get_worker_session = MagicMock()
+        manager.NEXTCLOUD_LISTING_CACHE = False
+        return manager
+
+    def test_listing_uses_a_single_webdav_search_for_the_whole_tree(self):
+        manager = self._build_manager()
+        response = MagicMock()
+        response.text = SEARCH_RESPONSE
+        manager._request_url = MagicMock(return_value=response)
+        manager._propfind = MagicMock()
+
+        entries = list(manager._iter_files_recursive("/Photos/ALL_Photos"))
+
+        self.assertEqual([entry["path"] for entry in entries], ["/Photos/ALL_Photos/2024/IMG_0001.jpg", "/Photos/ALL_Photos/top.mp4"])
+        manager._request_url.assert_called_once()
+        self.assertEqual(manager._request_url.call_args.args[:2], ("SEARCH", "http://nextcloud.local/remote.php/dav/"))
+        self.assertIn(b"<d:href>/files/user/Photos/ALL_Photos</d:href>", manager._request_url.call_args.kwargs["data"])
+        manager._propfind.assert_not_called()
+
+    @patch("Features.NextCloudPhotos.ClassNextCloudPhotos.LOGGER", new_callable=MagicMock)
+    def test_propfind_fallback_walks_in_parallel_and_only_descends_into_changed_folders(self, _mock_logger):
+        tree = FakeDavTree({
+            "/Photos": {"etag": "root-1", "dirs": ["/Photos/A", "/Photos/B"], "files": ["x.jpg"]},
+            "/Photos/A": {"etag": "a-1", "files": ["a.jpg"]},
+            "/Photos/B": {"etag": "b-1", "dirs": ["/Photos/B/C"], "files": ["b.jpg"]},
+            "/Photos/B/C": {"etag": "c-1", "files": ["c.jpg"]},
+        })
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._build_manager()
+            manager.NEXTCLOUD_LISTING_CACHE = True
+            manager._listing_cache = NextCloudListingCache(os.path.join(temp_dir, "listing.sqlite"))
+            manager._request_url = MagicMock(side_effect=RuntimeError("NextCloud WebDAV SEARCH failed (status=501, body=)"))
+            manager._propfind = MagicMock(side_effect=tree.propfind)
+
+            try:
+                first_run = sorted(entry["path"] for entry in manager._iter_files_recursive("/Photos"))
+                self.assertEqual(first_run, ["/Photos/A/a.jpg", "/Photos/B/C/c.jpg", "/Photos/B/b.jpg", "/Photos/x.jpg"])
+                # ("/Photos", 0) is the root ETag read before the (unsupported) SEARCH.
+                self.assertEqual(sorted(tree.calls), [("/Photos", 0), ("/Photos", 1), ("/Photos/A", 1), ("/Photos/B", 1), ("/Photos/B/C", 1)])
+                self.assertFalse(manager._dav_search_supported)
+
+                # Nothing changed: the root ETag alone proves the cached listing is current.
+                tree.calls.clear()
+                second_run = sorted(entry["path"] for entry in manager._iter_files_recursive("/Photos"))
+                self.assertEqual(second_run, first_run)
+                self.assertEqual(tree.calls, [("/Photos", 0)])
+
+                # A file was added to /Photos/A: only the root and A are listed again.
+                tree.folders["/Photos/A"] = {"etag": "a-2", "files": ["a.jpg", "a2.jpg"]}
+                tree.folders["/Photos"]["etag"] = "root-2"
+                tree.calls.clear()
+                third_run = sorted(entry["path"] for entry in manager._iter_files_recursive("/Photos"))
+                self.assertEqual(third_run, ["/Photos/A/a.jpg", "/Photos/A/a2.jpg", "/Photos/B/C/c.jpg", "/Photos/B/b.jpg", "/Photos/x.jpg"])
+                self.assertEqual(sorted(tree.calls), [("/Photos", 0), ("/Photos", 1), ("/Photos/A", 1)])
+            finally:
+                manager._listing_cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
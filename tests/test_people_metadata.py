@@ -3,6 +3,7 @@ import os
 import sys
 import tempfile
 import unittest
+import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
 from Features.GoogleTakeout.PeopleMetadata import build_people_map, load_people_map
+from Features.GoogleTakeout.TakeoutZipInventory import TakeoutZipInventory
 
 try:
     from Features.ImmichPhotos.ClassImmichPhotos import ClassImmichPhotos
@@ -43,6 +45,76 @@ class TestPeopleMetadata(unittest.TestCase):
         self.assertEqual(entries[0]["people"], ["Ana"])
         self.assertEqual(entries[1]["people"], ["Luis"])
 
+    def test_zip_inventory_reads_sidecars_and_albums_without_extracting(self):
+        members = {
+            "takeout-001.zip": {
+                "Takeout/Google Photos/Photos from 2024/IMG_0001.jpg": b"jpeg",
+                "Takeout/Google Photos/Photos from 2024/IMG_0001.jpg.json": json.dumps({
+                    "title": "IMG_0001.jpg", "photoTakenTime": {"timestamp": "100"}, "people": [{"name": "Ana"}],
+                }),
+            },
+            "takeout-002.zip": {
+                "Takeout/Google Photos/Trip/IMG_0001.jpg.json": json.dumps({
+                    "title": "IMG_0001.jpg", "photoTakenTime": {"timestamp": "100"}, "people": [{"name": "Luis"}],
+                }),
+                "Takeout/Google Photos/Trip/metadata.json": json.dumps({"title": "Trip"}),
+            },
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_folder = Path(temp_dir) / "zips"
+            extracted = Path(temp_dir) / "extracted"
+            zip_folder.mkdir()
+            for zip_name, files in members.items():
+                with zipfile.ZipFile(zip_folder / zip_name, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+                    for name, data in files.items():
+                        zip_ref.writestr(name, data)
+                with zipfile.ZipFile(zip_folder / zip_name) as zip_ref:
+                    zip_ref.extractall(extracted)
+
+            inventory = TakeoutZipInventory(zip_folder)
+
+            self.assertEqual(len(inventory.members), 4)
+            self.assertEqual(len(inventory.sidecar_members()), 3)
+            self.assertEqual(inventory.album_folders(), ["Trip"])
+            self.assertEqual(inventory.total_uncompressed_bytes, sum(len(data) for files in members.values() for data in files.values()))
+            self.assertEqual(inventory.build_people_map(), build_people_map(extracted))
+            self.assertEqual(inventory.build_people_map()["img_0001.jpg"][0]["people"], ["Ana", "Luis"])
+
+    def test_zip_inventory_yields_sidecars_in_the_same_order_as_the_extracted_takeout(self):
+        members = {
+            "takeout-001.zip": {
+                "Takeout/Google Photos/Zoo/IMG_0001.jpg.json": json.dumps({
+                    "title": "IMG_0001.jpg", "photoTakenTime": {"timestamp": "300"}, "people": [{"name": "Zoe"}],
+                }),
+            },
+            "takeout-002.zip": {
+                "Takeout/Google Photos/beach/IMG_0001.jpg.json": json.dumps({
+                    "title": "IMG_0001.jpg", "photoTakenTime": {"timestamp": "200"}, "people": [{"name": "Bea"}],
+                }),
+                "Takeout/Google Photos/Album/IMG_0001.jpg.json": json.dumps({
+                    "title": "IMG_0001.jpg", "photoTakenTime": {"timestamp": "100"}, "people": [{"name": "Ana"}],
+                }),
+            },
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_folder = Path(temp_dir) / "zips"
+            extracted = Path(temp_dir) / "extracted"
+            zip_folder.mkdir()
+            for zip_name, files in members.items():
+                with zipfile.ZipFile(zip_folder / zip_name, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+                    for name, data in files.items():
+                        zip_ref.writestr(name, data)
+                with zipfile.ZipFile(zip_folder / zip_name) as zip_ref:
+                    zip_ref.extractall(extracted)
+
+            inventory = TakeoutZipInventory(zip_folder)
+
+            self.assertEqual(
+                [path.parent.name for path, _ in inventory.iter_sidecars()],
+                ["Album", "beach", "Zoo"],
+            )
+            self.assertEqual(inventory.build_people_map(), build_people_map(extracted))
+
     def test_load_people_map_collapses_album_copies_with_same_capture_time(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             Path(temp_dir, "takeout_people_metadata.json").write_text(json.dumps({
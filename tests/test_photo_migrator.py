@@ -45,6 +45,13 @@ class TestPhotoMigratorCLIParsing(unittest.TestCase):
             with self.assertRaises(SystemExit):
                 checkArgs(args, parser)
 
+    def test_check_args_rejects_google_incremental_with_album_rename_or_duplicate_removal(self):
+        for flag in ("-graf", "-grdf"):
+            with self.subTest(flag=flag), patch.object(sys, "argv", ["photomigrator", "-gIncremental", flag]):
+                args, parser = parse_arguments()
+                with self.assertRaises(SystemExit):
+                    checkArgs(args, parser)
+
     def test_check_args_allows_disabled_native_deletion_with_disabled_detection(self):
         argv = [
             "photomigrator",
@@ -120,6 +127,117 @@ class TestPhotoMigratorCLIParsing(unittest.TestCase):
             with self.assertRaises(SystemExit):
                 parse_arguments()
 
+    def test_pull_workers_defaults_to_automatic_and_rejects_negative_values(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["pull-workers"], 0)
+
+        with patch.object(sys, "argv", ["photomigrator", "--pull-workers=3"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["pull-workers"], 3)
+
+        with patch.object(sys, "argv", ["photomigrator", "--pull-workers=-1"]):
+            with self.assertRaises(SystemExit):
+                parse_arguments()
+
+    def test_adaptive_push_concurrency_defaults_to_true_and_accepts_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["adaptive-push-concurrency"])
+
+        with patch.object(sys, "argv", ["photomigrator", "--adaptive-push-concurrency=false"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["adaptive-push-concurrency"])
+
+    def test_google_unzip_workers_defaults_to_automatic_and_rejects_negative_values(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["google-unzip-workers"], 0)
+
+        with patch.object(sys, "argv", ["photomigrator", "-gUnzipWorkers=4"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["google-unzip-workers"], 4)
+
+        with patch.object(sys, "argv", ["photomigrator", "--google-unzip-workers=-1"]):
+            with self.assertRaises(SystemExit):
+                parse_arguments()
+
+    def test_google_unzip_dedup_defaults_to_true_and_accepts_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["google-unzip-dedup"])
+
+        with patch.object(sys, "argv", ["photomigrator", "--google-unzip-dedup=false"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["google-unzip-dedup"])
+
+    def test_google_incremental_defaults_to_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["google-incremental"])
+
+        with patch.object(sys, "argv", ["photomigrator", "-gIncremental"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["google-incremental"])
+
+    def test_staging_budget_defaults_to_unlimited_and_rejects_negative_values(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["staging-budget-mb"], 0)
+        self.assertEqual(args["staging-budget-files"], 0)
+
+        with patch.object(sys, "argv", ["photomigrator", "--staging-budget-mb=2048", "--staging-budget-files=500"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["staging-budget-mb"], 2048)
+        self.assertEqual(args["staging-budget-files"], 500)
+
+        with patch.object(sys, "argv", ["photomigrator", "--staging-budget-files=-1"]):
+            with self.assertRaises(SystemExit):
+                parse_arguments()
+
+    def test_preflight_target_diff_and_plan_only_default_to_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["preflight-target-diff"])
+        self.assertFalse(args["plan-only"])
+
+        with patch.object(sys, "argv", ["photomigrator", "--preflight-target-diff", "--plan-only=true"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["preflight-target-diff"])
+        self.assertTrue(args["plan-only"])
+
+    def test_streaming_transfer_defaults_to_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["streaming-transfer"])
+
+        with patch.object(sys, "argv", ["photomigrator", "-stream"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["streaming-transfer"])
+
+    def test_incremental_source_listing_defaults_to_false(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["incremental-source-listing"])
+
+        with patch.object(sys, "argv", ["photomigrator", "-incrementalListing"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["incremental-source-listing"])
+
+    def test_metrics_file_defaults_to_empty(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertEqual(args["metrics-file"], "")
+
+    def test_resume_defaults_to_false_and_accepts_bare_flag(self):
+        with patch.object(sys, "argv", ["photomigrator"]):
+            args, _ = parse_arguments()
+        self.assertFalse(args["resume"])
+
+        with patch.object(sys, "argv", ["photomigrator", "--resume"]):
+            args, _ = parse_arguments()
+        self.assertTrue(args["resume"])
+
     def test_immich_native_duplicate_detection_defaults_to_people_tags_then_quality(self):
         with patch.object(sys, "argv", ["photomigrator"]):
             args, parser = parse_arguments()
@@ -1,6 +1,8 @@
 import os
 import sys
 import tempfile
+import threading
+import time
 import types
 import unittest
 import json
@@ -8,6 +10,8 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 import logging
 
+import requests
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = PROJECT_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
@@ -54,6 +58,7 @@ if "requests_toolbelt" not in sys.modules:
     sys.modules["requests_toolbelt.multipart"] = requests_toolbelt_multipart_stub
     sys.modules["requests_toolbelt.multipart.encoder"] = requests_toolbelt_encoder_stub
 
+import Features.SynologyPhotos.ClassSynologyPhotos as synology_module
 from Features.SynologyPhotos.ClassSynologyPhotos import ClassSynologyPhotos
 
 
@@ -161,6 +166,67 @@ class TestSynologyPhotosUnit(unittest.TestCase):
         self.assertIn('"api": "SYNO.Foto.Browse.Item"', debug_message)
         self.assertIn('"passphrase": "***"', debug_message)
 
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_concurrent_login_authenticates_once_and_injects_syno_token(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.SESSION = None
+        manager.SID = None
+        manager.SYNO_TOKEN_HEADER = {}
+        manager._login_lock = threading.RLock()
+        manager.SYNOLOGY_URL = "http://synology.local"
+        manager.SYNOLOGY_USERNAME = "user"
+        manager.SYNOLOGY_PASSWORD = "secret"
+        manager.SYNOLOGY_HTTP_POOL_SIZE = 24
+        manager.use_OTP = None
+        manager.read_config_file = MagicMock()
+
+        login_response = MagicMock()
+        login_response.status_code = 200
+        login_response.json.return_value = {"success": True, "data": {"sid": "sid-1", "synotoken": "token-1"}}
+        auth_calls = []
+
+        def slow_login(self_session, url, **kwargs):
+            auth_calls.append(url)
+            time.sleep(0.05)
+            return login_response
+
+        with patch.object(requests.Session, "get", autospec=True, side_effect=slow_login):
+            threads = [threading.Thread(target=manager.login, kwargs={"use_syno_token": True}) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(auth_calls, ["http://synology.local/webapi/auth.cgi"])
+        self.assertEqual(manager.SID, "sid-1")
+        self.assertEqual(manager.SESSION.cookies.get("id"), "sid-1")
+        self.assertEqual(manager.SESSION.get_adapter("https://synology.local")._pool_maxsize, 24)
+
+        with patch.object(requests.Session, "post", autospec=True, return_value=login_response) as mock_post:
+            manager._session_post("http://synology.local/webapi/entry.cgi", data={"api": "SYNO.Foto.Browse.Item"}, headers={"Accept": "application/json"})
+
+        self.assertEqual(mock_post.call_args.kwargs["headers"], {"X-SYNO-TOKEN": "token-1", "Accept": "application/json"})
+
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_logout_keeps_the_session_object_for_workers_still_sending_requests(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.SYNOLOGY_URL = "http://synology.local"
+        manager.SID = "sid-1"
+        manager.SYNO_TOKEN_HEADER = {"X-SYNO-TOKEN": "token-1"}
+        manager._login_lock = threading.RLock()
+        manager.SESSION = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {"success": True}
+        manager.SESSION.get.return_value = response
+
+        manager.logout()
+
+        self.assertIsNone(manager.SID)
+        self.assertEqual(manager.SYNO_TOKEN_HEADER, {})
+        manager.SESSION.close.assert_called_once()
+        # A worker that was already past login() still has a session to send its request through.
+        self.assertIs(manager._session_get("http://synology.local/webapi/entry.cgi", params={}), response)
+
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_get_assets_by_filters_merges_variant_results_by_id(self, _mock_logger):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
@@ -263,6 +329,38 @@ class TestSynologyPhotosUnit(unittest.TestCase):
 
         self.assertEqual([asset["id"] for asset in assets_without_albums], ["20"])
 
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_iter_all_assets_without_albums_pages_skips_album_members_and_variant_duplicates(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.assets_without_albums_filtered = None
+        manager.from_date = None
+        manager.to_date = None
+        manager.country = None
+        manager.city = None
+        manager.person = None
+        manager.type = "all"
+        manager.SYNOLOGY_URL = "http://synology.local"
+        manager.SYNO_TOKEN_HEADER = {}
+        manager.login = lambda log_level=None: True
+        manager.get_all_assets_from_all_albums = MagicMock(return_value=[{"id": "1", "type": "PHOTO"}])
+        manager._request_entry_api = MagicMock(side_effect=[
+            MagicMock(json=lambda: {"success": True, "data": {"list": [
+                {"id": "1", "filename": "one.jpg", "type": "PHOTO"},
+                {"id": "2", "filename": "two.jpg", "type": "PHOTO"},
+            ]}}),
+            MagicMock(json=lambda: {"success": False, "error": {"code": 120}}),
+            MagicMock(json=lambda: {"success": True, "data": {"list": [
+                {"id": "2", "filename": "two.jpg", "type": "PHOTO"},
+                {"id": "3", "filename": "three.jpg", "type": "PHOTO"},
+            ]}}),
+        ])
+
+        pages = [[asset["id"] for asset in page] for page in manager.iter_all_assets_without_albums_pages(log_level=logging.INFO)]
+
+        self.assertEqual(pages, [["2"], ["3"]])
+        self.assertEqual([asset["id"] for asset in manager.assets_without_albums_filtered], ["2", "3"])
+        self.assertEqual(manager._synology_download_api_by_asset_id, {"3": "SYNO.FotoTeam.Download"})
+
     def _prepare_push_manager(self):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
         manager.ALLOWED_MEDIA_EXTENSIONS = [".jpg"]
@@ -271,8 +369,35 @@ class TestSynologyPhotosUnit(unittest.TestCase):
         manager.SYNO_TOKEN_HEADER = {}
         manager.SESSION = MagicMock()
         manager.login = lambda log_level=None: True
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
         return manager
 
+    def test_album_items_cache_can_be_forgotten_while_other_workers_fill_it(self):
+        manager = self._prepare_push_manager()
+        errors = []
+
+        def fill(worker):
+            for index in range(2000):
+                manager._cache_album_items((str(index % 7), f"scope-{worker}", str(index)), [{"id": index}])
+
+        def forget():
+            try:
+                for index in range(500):
+                    manager._forget_album_items(str(index % 7))
+            except RuntimeError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(4)] + [threading.Thread(target=forget)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        manager._forget_album_items()
+        self.assertIsNone(manager._get_cached_album_items(("1", "scope-0", "1")))
+
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_push_asset_returns_existing_id_for_duplicate_response(self, _mock_logger):
         manager = self._prepare_push_manager()
@@ -631,6 +756,8 @@ class TestSynologyPhotosUnit(unittest.TestCase):
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_get_all_assets_from_album_shared_uses_browser_passphrase_context(self, _mock_logger):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
         manager.SYNOLOGY_URL = "http://synology.local"
         manager.SYNO_TOKEN_HEADER = {}
         manager.SESSION = MagicMock()
@@ -665,6 +792,8 @@ class TestSynologyPhotosUnit(unittest.TestCase):
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_get_all_assets_from_album_uses_team_shared_space_variant_first(self, _mock_logger):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
         manager.SYNOLOGY_URL = "http://synology.local"
         manager.SYNO_TOKEN_HEADER = {}
         manager.SESSION = MagicMock()
@@ -702,6 +831,8 @@ class TestSynologyPhotosUnit(unittest.TestCase):
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_get_all_assets_from_album_tries_next_variant_after_empty_success_when_count_unknown(self, _mock_logger):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
         manager.SYNOLOGY_URL = "http://synology.local"
         manager.SYNO_TOKEN_HEADER = {}
         manager.SESSION = MagicMock()
@@ -734,9 +865,65 @@ class TestSynologyPhotosUnit(unittest.TestCase):
         self.assertEqual(first_params["version"], "7")
         self.assertEqual(second_params["version"], "7")
 
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_album_listing_fetches_known_pages_concurrently_and_is_cached_until_changed(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
+        manager.SYNOLOGY_URL = "http://synology.local"
+        manager.SYNO_TOKEN_HEADER = {}
+        manager.SESSION = MagicMock()
+        manager.login = lambda log_level=None: True
+        manager.filter_assets = lambda assets, log_level=None: assets
+        manager.SYNOLOGY_LIST_PAGE_SIZE = 2
+        requested_offsets = []
+
+        def list_page(url, params=None, **kwargs):
+            requested_offsets.append(params["offset"])
+            items = [{"id": str(index)} for index in range(5)][params["offset"]:params["offset"] + params["limit"]]
+            response = MagicMock()
+            response.json.return_value = {"success": True, "data": {"list": items}}
+            return response
+
+        manager.SESSION.get.side_effect = list_page
+        add_response = MagicMock()
+        add_response.json.return_value = {"success": True}
+
+        first = manager.get_all_assets_from_album("album-1", "Trip", album_expected_count=5)
+        second = manager.get_all_assets_from_album("album-1", "Trip", album_expected_count=5)
+
+        self.assertEqual([asset["id"] for asset in first], ["0", "1", "2", "3", "4"])
+        self.assertEqual(second, first)
+        self.assertEqual(sorted(requested_offsets), [0, 2, 4])
+
+        manager.SESSION.get.side_effect = None
+        manager.SESSION.get.return_value = add_response
+        manager.add_assets_to_album("album-1", ["9"], album_name="Trip")
+        manager.SESSION.get.side_effect = list_page
+        manager.get_all_assets_from_album("album-1", "Trip", album_expected_count=5)
+
+        self.assertEqual(sorted(requested_offsets), [0, 0, 2, 2, 4, 4])
+
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_list_pages_probe_in_waves_when_total_is_unknown(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.SYNOLOGY_LIST_WORKERS = 3
+        requested_offsets = []
+
+        def fetch_page(offset):
+            requested_offsets.append(offset)
+            return {"list": list(range(10))[offset:offset + 2]}
+
+        pages = list(manager._iter_list_pages(fetch_page, limit=2))
+
+        self.assertEqual(pages, [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9], []])
+        self.assertEqual(sorted(requested_offsets), [0, 2, 4, 6, 8, 10, 12])
+
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_get_all_assets_from_ambiguous_album_retries_team_endpoint_after_error_609(self, _mock_logger):
         manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.album_items_cache = {}
+        manager._album_items_lock = threading.Lock()
         manager.SYNOLOGY_URL = "http://synology.local"
         manager.SYNO_TOKEN_HEADER = {}
         manager.SESSION = MagicMock()
@@ -863,6 +1050,39 @@ class TestSynologyPhotosUnit(unittest.TestCase):
         self.assertEqual(downloaded, 1)
         self.assertEqual(manager.SESSION.post.call_args.kwargs["data"]["api"], "SYNO.FotoTeam.Download")
 
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.update_metadata", lambda *args, **kwargs: None)
+    @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
+    def test_pull_asset_lets_download_engine_manage_the_part_file(self, _mock_logger):
+        manager = ClassSynologyPhotos.__new__(ClassSynologyPhotos)
+        manager.SYNOLOGY_URL = "http://synology.local"
+        manager.SYNO_TOKEN_HEADER = {}
+        manager.SESSION = MagicMock()
+        manager.login = lambda log_level=None: True
+        manager.ALLOWED_MEDIA_EXTENSIONS = [".jpg", ".jpeg", ".mp4", ".mov", ".heic"]
+
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Type": "image/jpeg"}
+        response.iter_content = lambda chunk_size=8192: [b"jpg-data"]
+        manager.SESSION.post.return_value = response
+
+        real_download_to_file = synology_module.download_to_file
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+            synology_module, "download_to_file", side_effect=real_download_to_file,
+        ) as mock_download:
+            downloaded = manager.pull_asset(
+                "6083", "photo.jpg", 0, download_folder=tmpdir,
+                album_id="43", album_scope="owned_shared_space", log_level=logging.INFO,
+            )
+            remaining_files = sorted(os.listdir(tmpdir))
+            with open(os.path.join(tmpdir, "photo.jpg"), "rb") as f:
+                content = f.read()
+
+        self.assertEqual(downloaded, 1)
+        self.assertFalse(mock_download.call_args.args[0].endswith(".part"))
+        self.assertEqual(remaining_files, ["photo.jpg"])
+        self.assertEqual(content, b"jpg-data")
+
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.update_metadata", lambda *args, **kwargs: None)
     @patch("Features.SynologyPhotos.ClassSynologyPhotos.LOGGER", new_callable=MagicMock)
     def test_pull_asset_from_shared_space_timeline_falls_back_after_team_json_error(self, _mock_logger):